@@ -199,9 +199,9 @@ def get_flow_metrics(db: FiligreeDB, *, days: int = 30) -> FlowMetrics:
     page_size = 1000
     recent_by_id: dict[str, Issue] = {}
     for status_filter in ("closed", "archived"):
-        offset = 0
+        cursor: str | None = None
         while True:
-            page = db.list_issues(status=status_filter, limit=page_size, offset=offset)
+            page = db.list_issues(status=status_filter, limit=page_size, cursor=cursor)
             for i in page:
                 if i.closed_at and i.id not in recent_by_id:
                     closed_dt = _parse_iso(i.closed_at)
@@ -209,7 +209,7 @@ def get_flow_metrics(db: FiligreeDB, *, days: int = 30) -> FlowMetrics:
                         recent_by_id[i.id] = i
             if len(page) < page_size:
                 break
-            offset += page_size
+            cursor = db.issue_list_cursor(page[-1])
     recent_closed = list(recent_by_id.values())
 
     cycle_times: list[float] = []
@@ -737,6 +737,20 @@ def compact(keep: int, as_json: bool) -> None:
                 click.echo("Vacuumed database")
 
 
+@click.command("rebuild-blocker-counts")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def rebuild_blocker_counts(as_json: bool) -> None:
+    """Recompute the cached open-blocker counters used by ready/blocked queries."""
+    with get_db() as db:
+        repaired = db.rebuild_blocker_counts()
+        if as_json:
+            click.echo(json_mod.dumps({"repaired": repaired}))
+        elif repaired:
+            click.echo(f"Repaired blocker counters on {repaired} issue(s)")
+        else:
+            click.echo("Blocker counters are consistent")
+
+
 def register(cli: click.Group) -> None:
     """Register admin commands with the CLI group."""
     cli.add_command(init)
@@ -752,3 +766,4 @@ def register(cli: click.Group) -> None:
     cli.add_command(archive)
     cli.add_command(clean_stale_findings)
     cli.add_command(compact)
+    cli.add_command(rebuild_blocker_counts)
@@ -547,7 +547,7 @@ def _changes_impl(
 @click.option("--issue-id", default=None, help="Only include events for this issue")
 @click.option("--label", default=None, help="Only include events for issues currently carrying this label")
 @click.option("--type", "event_type", default=None, help="Only include events of this event type")
-@click.option("--include-heartbeats", is_flag=True, help="Include heartbeat events (excluded by default)")
+@click.option("--include-heartbeats", is_flag=True, help="Include heartbeat events recorded by older versions (excluded by default)")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def changes(
     since: str,
@@ -587,7 +587,7 @@ def changes(
 @click.option("--issue-id", default=None, help="Only include events for this issue")
 @click.option("--label", default=None, help="Only include events for issues currently carrying this label")
 @click.option("--type", "event_type", default=None, help="Only include events of this event type")
-@click.option("--include-heartbeats", is_flag=True, help="Include heartbeat events (excluded by default)")
+@click.option("--include-heartbeats", is_flag=True, help="Include heartbeat events recorded by older versions (excluded by default)")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def get_changes(
     since: str,
@@ -16,9 +16,12 @@ import shutil
 import sqlite3
 import sys
 import tempfile
+import threading
 import uuid as _uuid
+from collections.abc import Iterator
+from contextvars import ContextVar
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from filigree.db_annotations import (
     VALID_ANNOTATION_INTENTS,
@@ -44,6 +47,8 @@ from filigree.db_planning import PlanningMixin
 from filigree.db_scans import ScansMixin
 from filigree.db_schema import CURRENT_SCHEMA_VERSION, SCHEMA_SQL
 from filigree.db_workflow import WorkflowMixin
+from filigree.dep_graph import DependencyGraph
+from filigree.leases import DEFAULT_CLAIM_REAP_SECONDS, DEFAULT_HEARTBEAT_FLUSH_SECONDS, ClaimReaper, LeaseBuffer
 from filigree.models import _EMPTY_TS, FileRecord, Issue, ScanFinding
 from filigree.types.core import (
     AssocType,
@@ -101,6 +106,11 @@ SUMMARY_FILENAME = "context.md"
 # Schema version for .filigree.conf — bump if the file format changes incompatibly.
 CONF_VERSION = 1
 
+# Default upper bound on idle read-only connections retained by
+# ``FiligreeDB.read_connection``. Extra connections opened under burst load
+# are closed on release instead of being pooled.
+DEFAULT_READ_POOL_SIZE = 4
+
 
 def read_schema_version(conn: sqlite3.Connection) -> int:
     """Return the on-disk schema version for *conn*.
@@ -422,6 +432,31 @@ def read_config(filigree_dir: Path) -> ProjectConfig:
         return defaults
 
 
+def _resolve_seconds(filigree_dir: Path, env_var: str, config_key: str, default: float) -> float:
+    """Resolve a per-project interval in seconds.
+
+    Precedence: *env_var*, then *config_key* in config.json, then *default*.
+    Unparseable or negative values are ignored with a warning.
+    """
+    candidates: list[tuple[str, object]] = []
+    env_raw = os.getenv(env_var)
+    if env_raw is not None and env_raw.strip():
+        candidates.append((env_var, env_raw.strip()))
+    config_raw = read_config(filigree_dir).get(config_key)
+    if config_raw is not None:
+        candidates.append((config_key, config_raw))
+    for source, raw in candidates:
+        try:
+            value = float(raw)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            value = -1.0
+        if isinstance(raw, bool) or not value >= 0:
+            logger.warning("Ignoring invalid %s=%r; expected a non-negative number of seconds", source, raw)
+            continue
+        return value
+    return default
+
+
 def write_config(filigree_dir: Path, config: dict[str, Any] | ProjectConfig) -> None:
     """Write .filigree/config.json."""
     config_path = filigree_dir / CONFIG_FILENAME
@@ -551,6 +586,43 @@ def _seed_builtin_packs(conn: sqlite3.Connection, now: str) -> int:
     return count
 
 
+_ATOMIC_SAVEPOINT = "filigree_atomic"
+# Marks where an ``atomic()`` block joined a caller's transaction; the
+# per-method savepoint above moves forward, this one stays put.
+_ATOMIC_JOIN_SAVEPOINT = "filigree_atomic_join"
+
+
+class _AtomicConnection:
+    """The writer connection as seen inside ``FiligreeDB.atomic()``.
+
+    Mixin methods commit and roll back their own work. Here ``commit()``
+    only moves a savepoint forward and ``rollback()`` returns to it, so
+    each method keeps its all-or-nothing behaviour while the enclosing
+    transaction, and its one commit, belong to ``atomic()``. Everything
+    else is forwarded to the real connection.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def commit(self) -> None:
+        self._conn.execute(f"RELEASE SAVEPOINT {_ATOMIC_SAVEPOINT}")
+        self._conn.execute(f"SAVEPOINT {_ATOMIC_SAVEPOINT}")
+
+    def rollback(self) -> None:
+        self._conn.execute(f"ROLLBACK TO SAVEPOINT {_ATOMIC_SAVEPOINT}")
+
+
+# Open ``atomic()`` blocks by handle, scoped to the thread or asyncio task
+# that opened them, so other callers sharing the handle keep the plain
+# writer connection instead of being folded into someone else's block.
+# Replaced, never mutated, so ``reset`` restores the enclosing scope.
+_atomic_conns: ContextVar[dict[FiligreeDB, _AtomicConnection] | None] = ContextVar("filigree_atomic_conns", default=None)
+
+
 # ---------------------------------------------------------------------------
 # FiligreeDB — the core
 # ---------------------------------------------------------------------------
@@ -579,6 +651,7 @@ class FiligreeDB(
         template_registry: TemplateRegistry | None = None,
         check_same_thread: bool = True,
         project_root: str | Path | None = None,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
     ) -> None:
         self.db_path = Path(db_path)
         self.prefix = prefix
@@ -600,9 +673,31 @@ class FiligreeDB(
         self._conn: sqlite3.Connection | None = None
         self._check_same_thread = check_same_thread
         self._template_registry: TemplateRegistry | None = template_registry
+        # Read-only connection pool (see ``read_connection``). Pooled handles
+        # are bound to the borrowing thread via ``_read_local`` so every mixin
+        # method that goes through ``self.conn`` transparently reads from the
+        # borrowed connection instead of the shared writer connection.
+        self._read_pool: list[sqlite3.Connection] = []
+        self._read_pool_lock = threading.Lock()
+        self._read_pool_size = read_pool_size
+        self._read_local = threading.local()
+        # Cached dependency graphs keyed by ``id(conn)`` (see
+        # ``dependency_graph``). Each entry keeps its connection so a reused
+        # id from a closed connection never matches.
+        self._dep_graphs: dict[int, tuple[sqlite3.Connection, int, DependencyGraph]] = {}
+        # Write-behind heartbeats (see ``enable_heartbeat_buffer``); None
+        # means heartbeat_work writes through.
+        self._lease_buffer: LeaseBuffer | None = None
+        # Expired-claim reaper (see ``enable_claim_reaper``) and the handle
+        # its thread writes through.
+        self._claim_reaper: ClaimReaper | None = None
+        self._reaper_db: FiligreeDB | None = None
+        # Long-lived users of a shared handle (see ``lease``).
+        self._leases = 0
+        self._leases_lock = threading.Lock()
 
     @classmethod
-    def from_filigree_dir(cls, filigree_dir: Path, *, check_same_thread: bool = True) -> FiligreeDB:
+    def from_filigree_dir(cls, filigree_dir: Path, *, check_same_thread: bool = True, initialize: bool = True) -> FiligreeDB:
         """Create a FiligreeDB from an existing ``.filigree/`` directory.
 
         When ``config.json`` is missing or omits the ``prefix`` key, fall back
@@ -611,6 +706,10 @@ class FiligreeDB(
         (prefix defaults to ``cwd.name``) and prevents a legacy install from
         silently opening with the wrong identity — every write to its own
         pre-existing issues would otherwise raise ``WrongProjectError``.
+
+        ``initialize=False`` skips :meth:`initialize` (schema creation,
+        migration and seeding) and opens no connection, for callers that
+        only read through :meth:`read_connection`.
         """
         config = read_config(filigree_dir)
         # ``read_config`` backfills a "filigree" prefix into its return value
@@ -625,6 +724,8 @@ class FiligreeDB(
             check_same_thread=check_same_thread,
             project_root=filigree_dir.resolve().parent,
         )
+        if not initialize:
+            return db
         try:
             db.initialize()
         except BaseException:
@@ -638,10 +739,11 @@ class FiligreeDB(
         return db
 
     @classmethod
-    def from_conf(cls, conf_path: Path, *, check_same_thread: bool = True) -> FiligreeDB:
+    def from_conf(cls, conf_path: Path, *, check_same_thread: bool = True, initialize: bool = True) -> FiligreeDB:
         """Create a FiligreeDB from a ``.filigree.conf`` anchor file (v2.0).
 
         Resolves the DB path relative to the conf file's directory.
+        ``initialize`` is as for :meth:`from_filigree_dir`.
         """
         data = read_conf(conf_path)
         db_path = (conf_path.parent / data["db"]).resolve()
@@ -659,6 +761,10 @@ class FiligreeDB(
             check_same_thread=check_same_thread,
             project_root=conf_path.resolve().parent,
         )
+        if not initialize:
+            if enabled_packs_from_project_config:
+                db._enabled_packs_override = None
+            return db
         try:
             db.initialize()
             if enabled_packs_from_project_config:
@@ -703,6 +809,12 @@ class FiligreeDB(
 
     @property
     def conn(self) -> sqlite3.Connection:
+        pooled: sqlite3.Connection | None = getattr(self._read_local, "conn", None)
+        if pooled is not None:
+            return pooled
+        atomic_conn = self._atomic_conn
+        if atomic_conn is not None:
+            return cast(sqlite3.Connection, atomic_conn)
         if self._conn is None:
             self._conn = sqlite3.connect(
                 str(self.db_path),
@@ -715,6 +827,232 @@ class FiligreeDB(
             self._conn.execute("PRAGMA busy_timeout=5000")
         return self._conn
 
+    @property
+    def read_pool_enabled(self) -> bool:
+        """Whether ``read_connection`` hands out separate pooled connections.
+
+        In-memory databases are private to their connection, so a second
+        connection would see an empty database — those fall back to the
+        writer connection.
+        """
+        return self._read_pool_size > 0 and str(self.db_path) != ":memory:"
+
+    def _open_read_connection(self) -> sqlite3.Connection:
+        """Open a pooled read-only connection.
+
+        ``query_only`` makes an accidental write on a read path fail loudly
+        instead of racing the writer. WAL mode (set by the writer connection)
+        lets these readers run concurrently with an in-flight write.
+        """
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextlib.contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for the current thread.
+
+        While the context is active, ``self.conn`` on this thread returns the
+        borrowed connection, so any read-only ``FiligreeDB`` method can run
+        concurrently with other threads' reads and with the writer. Re-entrant:
+        a nested call on the same thread reuses the outer connection. When the
+        pool is disabled (see :attr:`read_pool_enabled`) this yields the writer
+        connection unchanged.
+        """
+        bound: sqlite3.Connection | None = getattr(self._read_local, "conn", None)
+        if bound is not None:
+            yield bound
+            return
+        if not self.read_pool_enabled:
+            yield self.conn
+            return
+        with self._read_pool_lock:
+            conn = self._read_pool.pop() if self._read_pool else None
+        if conn is None:
+            conn = self._open_read_connection()
+        self._read_local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._read_local.conn = None
+            self._release_read_connection(conn)
+
+    def _release_read_connection(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            logger.warning("Discarding pooled read connection after rollback failure", exc_info=True)
+            self._dep_graphs.pop(id(conn), None)
+            conn.close()
+            return
+        with self._read_pool_lock:
+            if len(self._read_pool) < self._read_pool_size:
+                self._read_pool.append(conn)
+                return
+        self._dep_graphs.pop(id(conn), None)
+        conn.close()
+
+    def _close_read_pool(self) -> None:
+        with self._read_pool_lock:
+            pooled, self._read_pool = self._read_pool, []
+        for conn in pooled:
+            self._dep_graphs.pop(id(conn), None)
+            try:
+                conn.close()
+            except sqlite3.Error:
+                logger.warning("Error closing pooled read connection", exc_info=True)
+
+    @contextlib.contextmanager
+    def lease(self) -> Iterator[FiligreeDB]:
+        """Mark this handle in use for the duration of the block.
+
+        Owners that close shared handles (the dashboard's ``ProjectStore``)
+        leave a leased handle open until its last lease ends. Take one
+        wherever the handle outlives the request that resolved it: streamed
+        responses, SSE streams, deferred background work.
+        """
+        self.acquire_lease()
+        try:
+            yield self
+        finally:
+            self.release_lease()
+
+    def acquire_lease(self) -> None:
+        """Take a lease without a ``with`` block; pair with ``release_lease``."""
+        with self._leases_lock:
+            self._leases += 1
+
+    def release_lease(self) -> None:
+        with self._leases_lock:
+            if self._leases <= 0:
+                msg = "release_lease() without a matching acquire_lease()"
+                raise RuntimeError(msg)
+            self._leases -= 1
+
+    @property
+    def leased(self) -> bool:
+        """Whether any lease on this handle is outstanding."""
+        return self._leases > 0
+
+    @property
+    def _atomic_conn(self) -> _AtomicConnection | None:
+        """The connection of the ``atomic()`` block open in this thread or task, if any."""
+        open_blocks = _atomic_conns.get()
+        return open_blocks.get(self) if open_blocks else None
+
+    @contextlib.contextmanager
+    def atomic(self) -> Iterator[None]:
+        """Run a sequence of mutations as one transaction with one commit.
+
+        The block takes the write lock (``BEGIN IMMEDIATE``) up front.
+        Commits issued by methods called inside it are absorbed (see
+        ``_AtomicConnection``), the whole block is committed once on exit,
+        and it is rolled back entirely if the block raises. A nested block
+        joins the outer one. Opened inside a transaction the caller already
+        holds, the block only releases its savepoint on exit, or rolls back
+        to it on error, and leaves the commit to that caller. The block is
+        local to the thread or asyncio task that opened it. Methods that
+        require a fresh transaction of their own (observation triage, scan
+        reservation) cannot run inside.
+        """
+        if self._atomic_conn is not None:
+            yield
+            return
+        conn = self.conn
+        owns_transaction = not conn.in_transaction
+        conn.execute("BEGIN IMMEDIATE" if owns_transaction else f"SAVEPOINT {_ATOMIC_JOIN_SAVEPOINT}")
+        conn.execute(f"SAVEPOINT {_ATOMIC_SAVEPOINT}")
+        atomic_conn = _AtomicConnection(conn)
+        token = _atomic_conns.set({**(_atomic_conns.get() or {}), self: atomic_conn})
+        try:
+            yield
+        except BaseException:
+            _atomic_conns.reset(token)
+            if owns_transaction:
+                conn.rollback()
+            else:
+                conn.execute(f"ROLLBACK TO SAVEPOINT {_ATOMIC_JOIN_SAVEPOINT}")
+                conn.execute(f"RELEASE SAVEPOINT {_ATOMIC_JOIN_SAVEPOINT}")
+            raise
+        else:
+            _atomic_conns.reset(token)
+            if owns_transaction:
+                conn.commit()
+            else:
+                conn.execute(f"RELEASE SAVEPOINT {_ATOMIC_JOIN_SAVEPOINT}")
+        finally:
+            # Write paths patch the cached dependency graph of the connection
+            # they wrote through; neither graph is right for the outcome.
+            self._dep_graphs.pop(id(atomic_conn), None)
+            self._dep_graphs.pop(id(conn), None)
+
+    def enable_heartbeat_buffer(self, window: float = DEFAULT_HEARTBEAT_FLUSH_SECONDS) -> None:
+        """Buffer ``heartbeat_work`` writes and flush them every *window* seconds.
+
+        For long-running servers (the MCP server, the dashboard) where many
+        agents heartbeat through one process; one-shot CLI commands keep the
+        write-through default. Idempotent. In-memory databases cannot be
+        reached from the flush connection, so they stay write-through.
+        """
+        if self._lease_buffer is None and str(self.db_path) != ":memory:":
+            self._lease_buffer = LeaseBuffer(self.db_path, window=window)
+
+    def flush_heartbeats(self) -> int:
+        """Write any buffered heartbeats now. Returns how many were written."""
+        return self._lease_buffer.flush() if self._lease_buffer is not None else 0
+
+    def _close_lease_buffer(self) -> None:
+        buffer, self._lease_buffer = self._lease_buffer, None
+        if buffer is not None:
+            buffer.close()
+
+    def enable_claim_reaper(self, interval: float = DEFAULT_CLAIM_REAP_SECONDS) -> None:
+        """Release expired claims every *interval* seconds on a background thread.
+
+        For long-running servers, so claims abandoned by dead agents return
+        to the ready queue on their own. The thread writes through a second
+        handle on the same database and never touches this handle's
+        connection. Idempotent; ``0`` and in-memory databases are no-ops.
+        """
+        if self._claim_reaper is not None or interval <= 0 or str(self.db_path) == ":memory:":
+            return
+        # Built here, not on the reaper thread: ``templates`` loads through
+        # this handle's connection.
+        self._reaper_db = FiligreeDB(
+            self.db_path,
+            prefix=self.prefix,
+            enabled_packs=list(self.enabled_packs),
+            template_registry=self.templates,
+            check_same_thread=False,
+            project_root=self.project_root,
+            read_pool_size=0,
+        )
+        self._claim_reaper = ClaimReaper(self._reap_expired_batch, interval=interval)
+        self._claim_reaper.start()
+
+    def claim_reaper_stats(self) -> dict[str, Any] | None:
+        """The reaper's running totals (see ``ClaimReaper.stats``), or None when disabled."""
+        return self._claim_reaper.stats() if self._claim_reaper is not None else None
+
+    def _reap_expired_batch(self, limit: int) -> int:
+        reaper_db = self._reaper_db
+        if reaper_db is None:
+            return 0
+        # Heartbeats buffered on this handle are invisible to the reaper's.
+        self.flush_heartbeats()
+        return len(reaper_db.reap_expired_claims(limit=limit))
+
+    def _close_claim_reaper(self) -> None:
+        reaper, self._claim_reaper = self._claim_reaper, None
+        if reaper is not None:
+            reaper.close()
+        reaper_db, self._reaper_db = self._reaper_db, None
+        if reaper_db is not None:
+            reaper_db.close()
+
     def _check_id_prefix(self, issue_id: str) -> None:
         """Reject IDs whose prefix doesn't match this DB's prefix.
 
@@ -774,6 +1112,7 @@ class FiligreeDB(
             apply_pending_migrations(self.conn, CURRENT_SCHEMA_VERSION)
 
         self._seed_templates()
+        self._sync_status_categories()
         self._seed_future_release()
         self.conn.commit()
 
@@ -832,6 +1171,7 @@ class FiligreeDB(
         """
         try:
             if self._conn is not None:
+                self._dep_graphs.pop(id(self._conn), None)
                 try:
                     if self._conn.in_transaction:
                         logger.warning("reconnect: rolling back in-flight transaction")
@@ -851,8 +1191,14 @@ class FiligreeDB(
         warning — all mixin methods commit their own transactions, so this
         indicates a bug rather than normal operation.  When no transaction
         is active, a final commit is issued (a no-op in practice).
+        Pooled read connections are closed as well; the claim reaper is
+        stopped and buffered heartbeats are flushed first.
         """
+        self._close_claim_reaper()
+        self._close_lease_buffer()
+        self._close_read_pool()
         if self._conn is not None:
+            self._dep_graphs.pop(id(self._conn), None)
             try:
                 if self._conn.in_transaction:
                     logger.warning("close: rolling back in-flight transaction")
@@ -867,7 +1213,11 @@ class FiligreeDB(
 
     def _close_no_commit(self) -> None:
         """Close the connection without committing (used after rollback)."""
+        self._close_claim_reaper()
+        self._close_lease_buffer()
+        self._close_read_pool()
         if self._conn is not None:
+            self._dep_graphs.pop(id(self._conn), None)
             try:
                 self._conn.close()
             finally:
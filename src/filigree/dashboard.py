@@ -21,6 +21,7 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import os
@@ -30,12 +31,13 @@ import sys
 import threading
 import time
 import webbrowser
+from collections import OrderedDict
 from contextvars import ContextVar
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from fastapi import APIRouter
     from starlette.middleware.base import RequestResponseEndpoint
@@ -43,9 +45,12 @@ if TYPE_CHECKING:
     from starlette.responses import Response
     from starlette.types import ASGIApp, Receive, Scope, Send
 
+    from filigree.server import ServerConfig
+
 from filigree import __version__
 from filigree.core import (
     CONF_FILENAME,
+    DB_FILENAME,
     FILIGREE_DIR_NAME,
     FiligreeDB,
     ProjectNotInitialisedError,
@@ -55,7 +60,9 @@ from filigree.core import (
 
 # Re-export so test imports continue to work.
 from filigree.dashboard_routes.common import _safe_bounded_int as _safe_bounded_int
+from filigree.db_schema import CURRENT_SCHEMA_VERSION
 from filigree.install_support.version_marker import format_schema_mismatch_guidance
+from filigree.leases import claim_reap_seconds
 from filigree.types.api import SchemaVersionMismatchError
 
 STATIC_DIR = Path(__file__).parent / "static"
@@ -91,11 +98,48 @@ def _open_db_for_filigree_dir(filigree_dir: Path, *, check_same_thread: bool = T
     Without this, the dashboard silently opened ``.filigree/filigree.db`` while
     the CLI/MCP — which goes through ``cli_common.py`` — opened the conf-
     declared path, producing a split-brain view. (filigree-da8d5aba0f)
+
+    The dashboard is long-running and fronts every agent using its ``/mcp``
+    endpoint, so heartbeats are buffered (``enable_heartbeat_buffer``) and
+    flushed when the handle closes, and expired claims are released in the
+    background (``enable_claim_reaper``) while the handle stays open.
+    """
+    conf_path = filigree_dir.parent / CONF_FILENAME
+    if conf_path.is_file():
+        db = FiligreeDB.from_conf(conf_path, check_same_thread=check_same_thread)
+    else:
+        db = FiligreeDB.from_filigree_dir(filigree_dir, check_same_thread=check_same_thread)
+    db.enable_heartbeat_buffer()
+    db.enable_claim_reaper(claim_reap_seconds(filigree_dir))
+    return db
+
+
+def _open_readonly_for_filigree_dir(filigree_dir: Path) -> FiligreeDB | None:
+    """Open *filigree_dir*'s DB for one read-only query, or None if it needs migrating.
+
+    Resolves the DB like :func:`_open_db_for_filigree_dir` but skips
+    ``initialize()`` and enables neither the heartbeat buffer nor the claim
+    reaper, so the open costs one pooled read connection. Read through
+    ``read_connection()`` only and close the handle when done. Raises
+    ``SchemaVersionMismatchError`` for a DB written by a newer filigree.
     """
     conf_path = filigree_dir.parent / CONF_FILENAME
     if conf_path.is_file():
-        return FiligreeDB.from_conf(conf_path, check_same_thread=check_same_thread)
-    return FiligreeDB.from_filigree_dir(filigree_dir, check_same_thread=check_same_thread)
+        db = FiligreeDB.from_conf(conf_path, check_same_thread=False, initialize=False)
+    else:
+        db = FiligreeDB.from_filigree_dir(filigree_dir, check_same_thread=False, initialize=False)
+    try:
+        with db.read_connection():
+            version = db.get_schema_version()
+        if version > CURRENT_SCHEMA_VERSION:
+            raise SchemaVersionMismatchError(installed=CURRENT_SCHEMA_VERSION, database=version)
+    except BaseException:
+        db.close()
+        raise
+    if version < CURRENT_SCHEMA_VERSION:
+        db.close()
+        return None
+    return db
 
 
 class ProjectStore:
@@ -103,19 +147,47 @@ class ProjectStore:
 
     Reads ``server.json`` via :func:`read_server_config`, maps project
     prefixes to ``.filigree/`` paths, and lazily opens DB connections.
+
+    Open handles are bounded. At most ``max_open`` stay cached, least
+    recently used evicted first; :meth:`sweep` (run by the sweeper thread)
+    closes handles idle for ``idle_seconds``; :meth:`warm` pre-opens the
+    most recently written projects. A handle with an outstanding
+    ``FiligreeDB.lease()`` is never idle-evicted, and once evicted it is
+    only closed after its last lease ends. The limits come from ``server.json``
+    on every ``load()`` / ``reload()``. :meth:`stats` reports open handles,
+    hit rate and open latency for ``/api/health``.
     """
 
     def __init__(self) -> None:
+        from filigree.server import DEFAULT_MAX_OPEN_PROJECTS, DEFAULT_PROJECT_IDLE_SECONDS
+
         self._projects: dict[str, dict[str, str]] = {}  # key -> {name, path}
-        self._dbs: dict[str, FiligreeDB] = {}
-        # Handles evicted by reload() (removed/path-changed projects). They are
-        # NOT closed at eviction time because a concurrent request handler may
-        # still be using one. A short grace-period drain bounds long-lived
-        # server processes without closing under the request that just lost
-        # the cache race.
+        # Open handles in LRU order (most recently used last).
+        self._dbs: OrderedDict[str, FiligreeDB] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self.max_open = DEFAULT_MAX_OPEN_PROJECTS  # 0 = unbounded
+        self.idle_seconds = DEFAULT_PROJECT_IDLE_SECONDS  # 0 = never close idle handles
+        self.warm_count = 0
+        # Handles evicted by reload(), LRU overflow or the idle sweep. They
+        # are NOT closed at eviction time because a concurrent request
+        # handler may still be using one. A short grace-period drain bounds
+        # long-lived server processes without closing under the request that
+        # just lost the cache race.
         self._evicted_dbs: list[FiligreeDB] = []
         self._evicted_at: dict[FiligreeDB, float] = {}
         self._evicted_close_grace_seconds = 60.0
+        # Counters behind stats().
+        self._hits = 0
+        self._misses = 0
+        self._lru_evictions = 0
+        self._idle_evictions = 0
+        self._warmed = 0
+        self._opens = 0
+        self._open_seconds_total = 0.0
+        self._open_seconds_max = 0.0
+        self._transient_opens = 0
+        self._sweeper: threading.Thread | None = None
+        self._sweeper_stop = threading.Event()
         # Serialises ALL reads and writes of (_projects, _dbs, _evicted_dbs):
         # - get_db lazy-open and cache lookup (filigree-732f6b31e4: serialise
         #   first opens; filigree-e43edbc067: removed unlocked fast path so a
@@ -130,7 +202,7 @@ class ProjectStore:
         retained: list[FiligreeDB] = []
         for db in self._evicted_dbs:
             evicted_at = self._evicted_at.get(db, now)
-            if force or now - evicted_at >= self._evicted_close_grace_seconds:
+            if force or (now - evicted_at >= self._evicted_close_grace_seconds and not db.leased):
                 drainable.append(db)
                 self._evicted_at.pop(db, None)
             else:
@@ -150,10 +222,71 @@ class ProjectStore:
             drainable = self._pop_drainable_evicted_locked()
         self._close_evicted_handles(drainable)
 
+    def _evict_locked(self, key: str) -> None:
+        """Move *key*'s open handle (if any) to the grace-period close list."""
+        self._last_used.pop(key, None)
+        handle = self._dbs.pop(key, None)
+        if handle is not None:
+            self._evicted_dbs.append(handle)
+            self._evicted_at[handle] = time.monotonic()
+
+    def _evict_overflow_locked(self) -> None:
+        while self.max_open and len(self._dbs) > self.max_open:
+            self._evict_locked(next(iter(self._dbs)))
+            self._lru_evictions += 1
+
+    def _apply_limits_locked(self, config: ServerConfig) -> None:
+        self.max_open = config.max_open_projects
+        self.idle_seconds = config.project_idle_seconds
+        self.warm_count = config.warm_projects
+        self._evict_overflow_locked()
+
+    def _open_locked(self, key: str) -> FiligreeDB:
+        info = self._projects[key]
+        filigree_path = Path(info["path"])
+        db: FiligreeDB | None = None
+        started = time.monotonic()
+        try:
+            db = _open_db_for_filigree_dir(filigree_path, check_same_thread=False)
+        except SchemaVersionMismatchError as exc:
+            # Operator-visible expected condition (project DB written by a
+            # newer filigree); log at WARNING and re-raise so the FastAPI
+            # exception handler converts it to a 409 SCHEMA_MISMATCH for
+            # this project only — other projects in the server keep
+            # working.
+            logger.warning(
+                "Project DB schema mismatch for key=%r path=%s: installed=v%d database=v%d",
+                key,
+                filigree_path,
+                exc.installed,
+                exc.database,
+            )
+            if db is not None:
+                db.close()
+            raise
+        except _EXPECTED_PROJECT_CONFIG_ERRORS:
+            logger.warning("Invalid project configuration for key=%r path=%s", key, filigree_path)
+            if db is not None:
+                db.close()
+            raise
+        except Exception:
+            logger.error("Failed to open project DB for key=%r path=%s", key, filigree_path, exc_info=True)
+            if db is not None:
+                db.close()
+            raise
+        elapsed = time.monotonic() - started
+        self._opens += 1
+        self._open_seconds_total += elapsed
+        self._open_seconds_max = max(self._open_seconds_max, elapsed)
+        self._dbs[key] = db
+        self._last_used[key] = time.monotonic()
+        self._evict_overflow_locked()
+        return db
+
     # -- public API --
 
-    def _compute_projects(self) -> dict[str, dict[str, str]]:
-        """Read server.json and return a fresh project map.
+    def _compute_projects(self) -> tuple[dict[str, dict[str, str]], ServerConfig]:
+        """Read server.json and return a fresh project map plus the config.
 
         Pure: never assigns to self. ``load()`` and ``reload()`` use this to
         decouple "build the new map" (slow, can fail) from the atomic state
@@ -190,17 +323,18 @@ class ProjectStore:
             proj_config = read_config(filigree_path)
             display_name = proj_config.get("name") or prefix
             projects[prefix] = {"name": display_name, "path": filigree_path_str}
-        return projects
+        return projects, config
 
     def load(self) -> None:
-        """Read server.json and populate the project map.
+        """Read server.json and populate the project map and handle limits.
 
         Skips directories that don't exist (logs warning).
         Raises ``ValueError`` on prefix collision or corrupt JSON.
         """
-        new_projects = self._compute_projects()
+        new_projects, config = self._compute_projects()
         with self._lock:
             self._projects = new_projects
+            self._apply_limits_locked(config)
 
     def get_db(self, key: str) -> FiligreeDB:
         """Return (lazily opening) the DB for *key*. Raises ``KeyError``.
@@ -212,6 +346,9 @@ class ProjectStore:
         torn view where ``_projects[key]`` points at a new path while
         ``_dbs[key]`` is still the handle for the old path.
         (filigree-e43edbc067)
+
+        A hit marks the handle most recently used; an open that takes the
+        store past ``max_open`` evicts the least recently used handle.
         """
         self._drain_evicted_dbs()
         with self._lock:
@@ -219,40 +356,49 @@ class ProjectStore:
                 raise KeyError(key)
             cached = self._dbs.get(key)
             if cached is not None:
+                self._hits += 1
+                self._dbs.move_to_end(key)
+                self._last_used[key] = time.monotonic()
                 return cached
-            info = self._projects[key]
-            filigree_path = Path(info["path"])
-            db: FiligreeDB | None = None
+            self._misses += 1
+            return self._open_locked(key)
+
+    @contextlib.contextmanager
+    def borrow_db(self, key: str) -> Iterator[FiligreeDB]:
+        """Lend *key*'s DB for one read without touching the cache. Raises ``KeyError``.
+
+        For queries that visit every project at once (``/api/federated``).
+        An open handle is leased for the block, and its LRU position and
+        idle clock are left alone, so a fan-out does not evict the projects
+        actually in use. A project with no open handle gets a transient
+        read-only handle (:func:`_open_readonly_for_filigree_dir`), opened
+        outside the store lock and closed on exit. Only a DB that still
+        needs migrating is opened through :meth:`get_db`.
+        """
+        with self._lock:
+            if key not in self._projects:
+                raise KeyError(key)
+            cached = self._dbs.get(key)
+            if cached is not None:
+                cached.acquire_lease()
+            filigree_path = Path(self._projects[key]["path"])
+        if cached is not None:
             try:
-                db = _open_db_for_filigree_dir(filigree_path, check_same_thread=False)
-                self._dbs[key] = db
-            except SchemaVersionMismatchError as exc:
-                # Operator-visible expected condition (project DB written by a
-                # newer filigree); log at WARNING and re-raise so the FastAPI
-                # exception handler converts it to a 409 SCHEMA_MISMATCH for
-                # this project only — other projects in the server keep
-                # working.
-                logger.warning(
-                    "Project DB schema mismatch for key=%r path=%s: installed=v%d database=v%d",
-                    key,
-                    filigree_path,
-                    exc.installed,
-                    exc.database,
-                )
-                if db is not None:
-                    db.close()
-                raise
-            except _EXPECTED_PROJECT_CONFIG_ERRORS:
-                logger.warning("Invalid project configuration for key=%r path=%s", key, filigree_path)
-                if db is not None:
-                    db.close()
-                raise
-            except Exception:
-                logger.error("Failed to open project DB for key=%r path=%s", key, filigree_path, exc_info=True)
-                if db is not None:
-                    db.close()
-                raise
-            return self._dbs[key]
+                yield cached
+            finally:
+                cached.release_lease()
+            return
+        transient = _open_readonly_for_filigree_dir(filigree_path)
+        if transient is None:
+            with self.get_db(key).lease() as db:
+                yield db
+            return
+        with self._lock:
+            self._transient_opens += 1
+        try:
+            yield transient
+        finally:
+            transient.close()
 
     def list_projects(self) -> list[dict[str, str]]:
         """Return ``[{key, name, path}]`` for the frontend."""
@@ -264,12 +410,13 @@ class ProjectStore:
         """Re-read server.json. On read failure, retains existing state.
 
         Atomic: builds the new project map locally, then under one lock
-        acquisition (a) drains older evicted handles, (b) swaps ``_projects``,
-        and (c) evicts stale ``_dbs`` entries. Newly evicted handles get a
-        short grace period before later runtime calls close them.
+        acquisition (a) drains older evicted handles, (b) swaps ``_projects``
+        and the handle limits, and (c) evicts stale ``_dbs`` entries. Newly
+        evicted handles get a short grace period before later runtime calls
+        close them.
         """
         try:
-            new_projects = self._compute_projects()
+            new_projects, config = self._compute_projects()
         except Exception as exc:
             logger.error("Failed to reload server.json — retaining existing state", exc_info=True)
             return {"added": [], "removed": [], "error": str(exc)}
@@ -283,10 +430,8 @@ class ProjectStore:
             path_changed = sorted(key for key in (old_keys & new_keys) if old_projects[key].get("path") != new_projects[key].get("path"))
             self._projects = new_projects
             for key in [*removed, *path_changed]:
-                handle = self._dbs.pop(key, None)
-                if handle is not None:
-                    self._evicted_dbs.append(handle)
-                    self._evicted_at[handle] = time.monotonic()
+                self._evict_locked(key)
+            self._apply_limits_locked(config)
         self._close_evicted_handles(drainable)
 
         return {
@@ -295,17 +440,127 @@ class ProjectStore:
             "error": "",
         }
 
+    def sweep(self) -> None:
+        """Evict handles idle for ``idle_seconds`` and close evictions past their grace period."""
+        now = time.monotonic()
+        with self._lock:
+            if self.idle_seconds > 0:
+                for key, handle in self._dbs.items():
+                    if handle.leased:
+                        # In use by a stream or background job: idle time
+                        # starts counting once it is released.
+                        self._last_used[key] = now
+                for key in [k for k, used in self._last_used.items() if now - used >= self.idle_seconds]:
+                    self._evict_locked(key)
+                    self._idle_evictions += 1
+            drainable = self._pop_drainable_evicted_locked()
+        self._close_evicted_handles(drainable)
+
+    def start_sweeper(self, interval: float = 30.0) -> None:
+        """Run :meth:`sweep` every *interval* seconds on a daemon thread until ``close_all``.
+
+        Without it, idle handles and evictions are only reaped when a
+        request arrives, so a quiet server would keep them open.
+        """
+        if self._sweeper is not None:
+            return
+        self._sweeper_stop.clear()
+
+        def run() -> None:
+            while not self._sweeper_stop.wait(interval):
+                try:
+                    self.sweep()
+                except Exception:
+                    logger.warning("Project store sweep failed", exc_info=True)
+
+        self._sweeper = threading.Thread(target=run, name="filigree-project-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def _recency(self, key: str) -> float:
+        # The DB, its WAL and context.md (rewritten after every mutation)
+        # are touched by any writer, so their newest mtime ranks projects
+        # across restarts without any bookkeeping of our own.
+        filigree_dir = Path(self._projects[key]["path"])
+        newest = 0.0
+        for name in (DB_FILENAME, f"{DB_FILENAME}-wal", "context.md"):
+            try:
+                newest = max(newest, (filigree_dir / name).stat().st_mtime)
+            except OSError:
+                continue
+        return newest
+
+    def warm(self, count: int | None = None) -> list[str]:
+        """Open the *count* most recently written projects (default ``warm_count``).
+
+        Capped at ``max_open``. Returns the keys opened; projects that fail
+        to open are logged and skipped, and are retried by their first
+        request as usual.
+        """
+        with self._lock:
+            keys = list(self._projects)
+            limit = self.warm_count if count is None else count
+            if self.max_open:
+                limit = min(limit, self.max_open)
+        ranked = sorted(keys, key=self._recency, reverse=True)[:limit]
+        opened: list[str] = []
+        for key in ranked:
+            with self._lock:
+                if key not in self._projects or key in self._dbs:
+                    continue
+                try:
+                    self._open_locked(key)
+                except Exception:
+                    logger.warning("Could not pre-open project %r", key, exc_info=True)
+                    continue
+                self._warmed += 1
+            opened.append(key)
+        return opened
+
+    def start_warmup(self) -> threading.Thread:
+        """Run :meth:`warm` on a daemon thread so startup does not wait for it."""
+        thread = threading.Thread(target=self.warm, name="filigree-project-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> dict[str, Any]:
+        """Open-handle count, limits, cache hit rate and open latency."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "open": len(self._dbs),
+                "max_open": self.max_open,
+                "idle_seconds": self.idle_seconds,
+                "pending_close": len(self._evicted_dbs),
+                "leased": sum(1 for db in [*self._dbs.values(), *self._evicted_dbs] if db.leased),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else None,
+                "lru_evictions": self._lru_evictions,
+                "idle_evictions": self._idle_evictions,
+                "warmed": self._warmed,
+                "opens": self._opens,
+                "open_ms_avg": round(self._open_seconds_total / self._opens * 1000, 1) if self._opens else None,
+                "open_ms_max": round(self._open_seconds_max * 1000, 1),
+                "transient_opens": self._transient_opens,
+                "claims_reaped": sum((db.claim_reaper_stats() or {}).get("reaped", 0) for db in self._dbs.values()),
+            }
+
     def close_all(self) -> None:
         """Close all open DB connections, including handles previously
-        evicted by ``reload()``.
+        evicted by ``reload()``, and stop the sweeper.
 
         Shutdown drain for SQLite handles managed by the store. Runtime calls
         also drain evicted handles after a grace period.
         """
+        self._sweeper_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=5)
+            self._sweeper = None
         with self._lock:
             handles: list[tuple[str, FiligreeDB]] = list(self._dbs.items())
             evicted = self._pop_drainable_evicted_locked(force=True)
             self._dbs.clear()
+            self._last_used.clear()
             self._evicted_at.clear()
         for key, db in handles:
             try:
@@ -397,7 +652,7 @@ def _create_project_router() -> APIRouter:
     """
     from fastapi import APIRouter
 
-    from filigree.dashboard_routes import analytics, entities, files, issues, releases
+    from filigree.dashboard_routes import analytics, entities, files, issues, live, releases
 
     router = APIRouter()
 
@@ -407,6 +662,7 @@ def _create_project_router() -> APIRouter:
     router.include_router(files.create_classic_router())
     router.include_router(releases.create_classic_router())
     router.include_router(entities.create_classic_router())
+    router.include_router(live.create_classic_router())
 
     # Loom generation — new in 2.0 under /loom. Empty in Phase B.
     router.include_router(analytics.create_loom_router(), prefix="/loom")
@@ -437,7 +693,7 @@ def create_app(*, server_mode: bool = False) -> ASGIApp:
     from collections.abc import AsyncIterator
 
     from fastapi import FastAPI
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.responses import JSONResponse
 
     from filigree.types.api import ErrorCode
 
@@ -463,13 +719,19 @@ def create_app(*, server_mode: bool = False) -> ASGIApp:
     except ImportError:
         logger.debug("MCP streamable-HTTP not available (SDK not installed or import error)", exc_info=True)
 
+    from filigree.dashboard_routes.common import _federated_executor, _read_executor
+
     @contextlib.asynccontextmanager
     async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
-        if _mcp_lifespan_factory is not None:
-            async with _mcp_lifespan_factory():
+        try:
+            if _mcp_lifespan_factory is not None:
+                async with _mcp_lifespan_factory():
+                    yield
+            else:
                 yield
-        else:
-            yield
+        finally:
+            _read_executor.shutdown()
+            _federated_executor.shutdown()
 
     app = FastAPI(title="Filigree Dashboard", docs_url=None, redoc_url=None, lifespan=_lifespan)
 
@@ -537,6 +799,21 @@ def create_app(*, server_mode: bool = False) -> ASGIApp:
         allow_headers=["*"],
     )
 
+    # Response compression. Streaming endpoints (the change stream, the
+    # federated NDJSON streams, MCP's streamable HTTP) bypass it: gzip
+    # buffers, which would stall events.
+    from starlette.middleware.gzip import GZipMiddleware
+
+    class StreamAwareGZipMiddleware(GZipMiddleware):
+        async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+            path = scope.get("path", "") if scope["type"] == "http" else ""
+            if path.endswith("/stream") or path.startswith("/mcp"):
+                await self.app(scope, receive, send)
+                return
+            await super().__call__(scope, receive, send)
+
+    app.add_middleware(StreamAwareGZipMiddleware, minimum_size=1024)
+
     # Idle-tracking middleware (ethereal mode only — server mode runs indefinitely)
     if not server_mode:
         from starlette.middleware.base import BaseHTTPMiddleware
@@ -552,6 +829,11 @@ def create_app(*, server_mode: bool = False) -> ASGIApp:
     router = _create_project_router()
 
     if server_mode:
+        from filigree.dashboard_routes import federated
+
+        # Cross-project reads, answered from every registered project.
+        app.include_router(federated.create_router(), prefix="/api/federated")
+
         # Dual mount: /api/p/{key}/… for explicit project, /api/… for default
         app.include_router(router, prefix="/api/p/{project_key}")
         app.include_router(router, prefix="/api")
@@ -580,13 +862,16 @@ def create_app(*, server_mode: bool = False) -> ASGIApp:
 
     # Root-level endpoints (not project-scoped)
 
-    @app.get("/", response_class=HTMLResponse)
-    async def index() -> HTMLResponse:
-        html = (STATIC_DIR / "dashboard.html").read_text()
-        return HTMLResponse(html)
+    # Fingerprint and precompress the page and its scripts once, up front.
+    from filigree.dashboard_routes import assets
+
+    asset_manifest = assets.load_manifest(STATIC_DIR)
+    app.include_router(assets.create_router(asset_manifest))
 
     @app.get("/api/health")
     async def api_health() -> JSONResponse:
+        # ``read_executor`` shows whether dashboard reads are queueing for a
+        # worker (``queued`` > 0 means every worker is busy).
         if server_mode and _project_store is not None:
             return JSONResponse(
                 {
@@ -594,9 +879,20 @@ def create_app(*, server_mode: bool = False) -> ASGIApp:
                     "mode": "server",
                     "projects": len(_project_store.list_projects()),
                     "version": __version__,
+                    "read_executor": _read_executor.stats(),
+                    "federated_executor": _federated_executor.stats(),
+                    "project_store": _project_store.stats(),
                 }
             )
-        return JSONResponse({"status": "ok", "mode": "ethereal", "version": __version__})
+        return JSONResponse(
+            {
+                "status": "ok",
+                "mode": "ethereal",
+                "version": __version__,
+                "read_executor": _read_executor.stats(),
+                "claim_reaper": _db.claim_reaper_stats() if _db is not None else None,
+            }
+        )
 
     @app.get("/api/projects")
     async def api_projects() -> JSONResponse:
@@ -637,10 +933,9 @@ def create_app(*, server_mode: bool = False) -> ASGIApp:
                 }
             )
 
-    # Serve static JS modules (ES modules for dashboard components)
-    from starlette.staticfiles import StaticFiles
-
-    app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+    # Serve static JS modules (ES modules for dashboard components):
+    # fingerprinted URLs from memory, anything else from disk.
+    app.mount("/static", assets.FingerprintedStaticFiles(directory=STATIC_DIR, manifest=asset_manifest), name="static")
 
     # Mount MCP streamable-HTTP endpoint.
     if _mcp_handler is not None:
@@ -730,6 +1025,9 @@ def main(port: int = DEFAULT_PORT, *, no_browser: bool = False, server_mode: boo
             _exit_dashboard_config_error(exc)
         n = len(store.list_projects())
         logger.info("Server mode: loaded %d project(s)", n)
+        store.start_sweeper()
+        if store.warm_count:
+            store.start_warmup()
     else:
         try:
             project_root, _conf_path = find_filigree_anchor()
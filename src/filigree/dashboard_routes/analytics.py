@@ -2,57 +2,50 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from collections import deque
 from datetime import UTC, datetime, timedelta
 from time import perf_counter
 from typing import TYPE_CHECKING, Any, get_args
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping, Sequence
 
     from fastapi import APIRouter
     from fastapi.responses import JSONResponse
 
+    from filigree.dep_graph import DependencyGraph
+
 from starlette.requests import Request
 
 from filigree.core import FiligreeDB
 from filigree.dashboard_routes.common import (
     _GRAPH_STATUS_CATEGORIES,
     _coerce_graph_mode,
+    _columnar_table,
+    _conditional_get,
     _error_response,
     _get_bool_param,
+    _offload_read,
     _parse_csv_param,
+    _parse_response_format,
     _resolve_graph_runtime,
     _safe_bounded_int,
 )
-from filigree.models import Issue
-from filigree.types.api import ErrorCode, StatsWithPrefix
+from filigree.types.api import ColumnarTable, ErrorCode, StatsWithPrefix
 from filigree.types.events import EventType
 
 logger = logging.getLogger(__name__)
 
-# Page size used when streaming every issue into the graph endpoint. Exposed
-# at module scope so tests can shrink it to exercise pagination boundaries.
-_GRAPH_LIST_PAGE_SIZE = 1000
 
+def _graph_runtime_key(db: FiligreeDB) -> str:
+    """ETag component for ``/graph``: its default mode and limits come from config and env."""
+    return json.dumps(_resolve_graph_runtime(db), sort_keys=True, default=str)
 
-def _fetch_all_issues(db: FiligreeDB) -> list[Issue]:
-    """Return every issue in the DB by paginating list_issues.
 
-    The graph endpoint previously called list_issues(limit=10000), which
-    silently truncated large projects and caused scope_root false-404s for
-    any issue beyond the cap. Pagination removes the hidden ceiling.
-    """
-    all_issues: list[Issue] = []
-    offset = 0
-    while True:
-        page = db.list_issues(limit=_GRAPH_LIST_PAGE_SIZE, offset=offset)
-        all_issues.extend(page)
-        if len(page) < _GRAPH_LIST_PAGE_SIZE:
-            break
-        offset += _GRAPH_LIST_PAGE_SIZE
-    return all_issues
+def _graph_uses_clock(request: Request) -> bool:
+    """``window_days`` filters against ``now()``, so the same URL can change with no write."""
+    return "window_days" in request.query_params
 
 
 # ---------------------------------------------------------------------------
@@ -97,8 +90,7 @@ class _GraphV2Params:
 
 def _parse_graph_v2_params(
     params: Mapping[str, str],
-    issues: list[Issue],
-    issue_map: dict[str, Issue],
+    issue_exists: Callable[[str], bool],
     registered_types: set[str],
 ) -> _GraphV2Params | JSONResponse:
     """Parse and validate all graph v2 query parameters.
@@ -153,7 +145,7 @@ def _parse_graph_v2_params(
 
     # Scope
     gp.scope_root = params.get("scope_root") or None
-    if gp.scope_root and gp.scope_root not in issue_map:
+    if gp.scope_root and not issue_exists(gp.scope_root):
         return _error_response(
             f"Unknown scope_root issue id: {gp.scope_root}",
             ErrorCode.VALIDATION,
@@ -220,111 +212,15 @@ def _parse_graph_v2_params(
     return gp
 
 
-def _issue_updated_at_utc(issue: Issue) -> datetime | None:
-    """Parse an issue's updated_at (or created_at) into a UTC datetime."""
-    raw = issue.updated_at or issue.created_at
-    if not raw or not isinstance(raw, str):
-        return None
-    try:
-        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
-    except ValueError:
-        return None
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=UTC)
-    return parsed.astimezone(UTC)
-
-
-def _graph_status_category(issue: Issue) -> str:
-    """Status category for graph filtering and serialization.
-
-    archive_closed() preserves closed_at but writes status='archived',
-    which is not a workflow done state — so the raw status_category
-    resolves to 'open' (filigree-42045dd065). For graph queries that
-    surface terminal-state filters (include_done, status_categories,
-    blocker counts), an archived issue must read as 'done'.
-    """
-    if issue.status == "archived":
-        return "done"
-    return issue.status_category
-
-
-def _filter_graph_nodes(
-    issues: list[Issue],
-    issue_map: dict[str, Issue],
-    gp: _GraphV2Params,
-    scoped_ids: set[str] | None,
-    critical_path_ids: set[str],
-) -> list[dict[str, Any]]:
-    """Apply all graph v2 filters and return node dicts."""
-
-    def _open_blocker_count(issue_id: str) -> int:
-        issue = issue_map[issue_id]
-        total = 0
-        for blocker_id in issue.blocked_by:
-            blocker = issue_map.get(blocker_id)
-            if blocker and _graph_status_category(blocker) != "done":
-                total += 1
-        return total
-
-    def _open_blocks_count(issue_id: str) -> int:
-        issue = issue_map[issue_id]
-        total = 0
-        for blocked_id in issue.blocks:
-            blocked_issue = issue_map.get(blocked_id)
-            if blocked_issue and _graph_status_category(blocked_issue) != "done":
-                total += 1
-        return total
-
-    filtered: list[dict[str, Any]] = []
-    for issue in issues:
-        category = _graph_status_category(issue)
-        if scoped_ids is not None and issue.id not in scoped_ids:
-            continue
-        if not gp.include_done and category == "done":
-            continue
-        if gp.type_filter and issue.type not in gp.type_filter:
-            continue
-        if gp.status_filter and category not in gp.status_filter:
-            continue
-        if gp.assignee_filter is not None and issue.assignee != gp.assignee_filter:
-            continue
-        if gp.window_cutoff is not None:
-            ts = _issue_updated_at_utc(issue)
-            if ts is None or ts < gp.window_cutoff:
-                continue
-
-        blocker_count = _open_blocker_count(issue.id)
-        blocks_count = _open_blocks_count(issue.id)
-        if gp.blocked_only and blocker_count == 0:
-            continue
-        if gp.ready_only and not issue.is_ready:
-            continue
-        if gp.critical_path_only and issue.id not in critical_path_ids:
-            continue
-
-        filtered.append(
-            {
-                "id": issue.id,
-                "title": issue.title,
-                "status": issue.status,
-                "status_category": category,
-                "priority": issue.priority,
-                "type": issue.type,
-                "assignee": issue.assignee,
-                "is_ready": issue.is_ready,
-                "blocked_by_open_count": blocker_count,
-                "blocks_open_count": blocks_count,
-            }
-        )
-    return filtered
-
-
 def _filter_graph_edges(
-    deps: list[dict[str, Any]],
-    visible_ids: set[str],
+    graph: DependencyGraph,
+    node_ids: list[str],
     critical_path_edges: set[tuple[str, str]],
 ) -> list[dict[str, Any]]:
-    """Build edge dicts for visible nodes.
+    """Build edge dicts between the visible *node_ids*.
+
+    Walks only the visible nodes' outgoing edges in the dependency graph
+    index, in node order, rather than every edge in the project.
 
     ``critical_path_edges`` is the set of adjacent ``(source, target)``
     pairs along the ordered critical path chain — only those edges may
@@ -332,17 +228,40 @@ def _filter_graph_edges(
     incorrectly flagged shortcut edges between non-adjacent path nodes
     (filigree-c9b08d1363).
     """
+    visible_ids = set(node_ids)
     return [
         {
-            "id": f"{dep['to']}->{dep['from']}",
-            "source": dep["to"],
-            "target": dep["from"],
-            "kind": dep["type"],
-            "is_critical_path": (dep["to"], dep["from"]) in critical_path_edges,
+            "id": f"{depends_on_id}->{issue_id}",
+            "source": depends_on_id,
+            "target": issue_id,
+            "kind": dep_type,
+            "is_critical_path": (depends_on_id, issue_id) in critical_path_edges,
         }
-        for dep in deps
-        if dep["to"] in visible_ids and dep["from"] in visible_ids
+        for issue_id, depends_on_id, dep_type in graph.edges(node_ids)
+        if depends_on_id in visible_ids
+    ]
+
+
+# Low-cardinality node attributes sent as dictionary indexes in columnar form.
+_GRAPH_INTERNED_COLUMNS = ("status", "status_category", "type", "assignee")
+
+
+def _columnar_graph(nodes: Sequence[Mapping[str, Any]], edges: list[dict[str, Any]]) -> dict[str, ColumnarTable]:
+    """Encode a graph payload for ``?format=columnar``.
+
+    Edge ``source``/``target`` become row indexes into the node table, and
+    the derivable v2 edge ``id`` (``"source->target"``) is dropped.
+    """
+    position = {node["id"]: i for i, node in enumerate(nodes)}
+    indexed_edges = [
+        {**{k: v for k, v in edge.items() if k != "id"}, "source": position[edge["source"]], "target": position[edge["target"]]}
+        for edge in edges
+        if edge["source"] in position and edge["target"] in position
     ]
+    return {
+        "nodes": _columnar_table(nodes, _GRAPH_INTERNED_COLUMNS),
+        "edges": _columnar_table(indexed_edges, ("kind",)),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -354,9 +273,15 @@ def create_classic_router() -> APIRouter:
     """Build the classic-generation APIRouter for analytics, graph, and
     metrics endpoints.
 
-    NOTE: All handlers are intentionally async despite doing synchronous
-    SQLite I/O. This serializes DB access on the event loop thread,
-    avoiding concurrent multi-thread access to the shared DB connection.
+    NOTE: Handlers are async and do synchronous SQLite I/O. ``/graph``,
+    ``/stats``, ``/metrics``, ``/critical-path`` and ``/activity`` are
+    wrapped in ``@_offload_read`` and run on ``_read_executor`` worker
+    threads, each bound to a pooled ``query_only`` connection from
+    ``db.read_connection()``. That is safe because they only read: they
+    never touch the shared writer connection, and WAL lets them overlap a
+    write. The remaining handlers run on the event loop thread, which
+    serializes their use of the writer connection. When the read pool is
+    disabled (in-memory databases) every handler runs on the loop.
     """
     from fastapi import APIRouter, Depends
     from fastapi.responses import JSONResponse
@@ -378,79 +303,85 @@ def create_classic_router() -> APIRouter:
         )
 
     @router.get("/graph")
+    @_conditional_get(vary=_graph_runtime_key, skip=_graph_uses_clock)
+    @_offload_read
     async def api_graph(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
-        """Graph data API with legacy and v2 compatibility modes."""
+        """Graph data API with legacy and v2 compatibility modes.
+
+        ``?format=columnar`` swaps ``nodes``/``edges`` for column-major
+        tables with interned status/type/assignee and edges as node indexes.
+        """
         mode = _coerce_graph_mode(request.query_params.get("mode"), db)
         if isinstance(mode, JSONResponse):
             return mode
+        fmt = _parse_response_format(request.query_params)
+        if isinstance(fmt, JSONResponse):
+            return fmt
 
-        issues = _fetch_all_issues(db)
-        deps = db.get_all_dependencies()
+        graph = db.dependency_graph()
 
         # Legacy behavior remains the default compatibility path.
         if mode == "legacy":
+            all_nodes, _ = db.get_graph_nodes()
             nodes = [
                 {
-                    "id": i.id,
-                    "title": i.title,
-                    "status": i.status,
-                    "status_category": i.status_category,
-                    "priority": i.priority,
-                    "type": i.type,
+                    "id": n["id"],
+                    "title": n["title"],
+                    "status": n["status"],
+                    "status_category": n["status_category"],
+                    "priority": n["priority"],
+                    "type": n["type"],
                 }
-                for i in issues
+                for n in all_nodes
             ]
-            edges = [{"source": d["to"], "target": d["from"]} for d in deps]
+            edges = [{"source": dst, "target": src} for src, dst, _type in graph.edges()]
+            if fmt == "columnar":
+                return JSONResponse({"format": "columnar", **_columnar_graph(nodes, edges)})
             return JSONResponse({"nodes": nodes, "edges": edges})
 
-        # Graph v2 query model
+        # Graph v2 query model: scope and critical path narrow the id set from
+        # the in-memory graph index; every other filter and the node limit
+        # run in SQL, so only the returned nodes are ever materialised.
         started = perf_counter()
-        issue_map = {i.id: i for i in issues}
 
         registered_types = {t.type for t in db.templates.list_types()}
-        gp = _parse_graph_v2_params(request.query_params, issues, issue_map, registered_types)
+        gp = _parse_graph_v2_params(
+            request.query_params,
+            lambda issue_id: bool(db.get_issues([issue_id], include=())),
+            registered_types,
+        )
         if isinstance(gp, JSONResponse):
             return gp
 
-        critical_path_ids: set[str] = set()
+        candidate_ids: set[str] | None = None
         critical_path_edges: set[tuple[str, str]] = set()
         if gp.critical_path_only:
             ordered_path = [node["id"] for node in db.get_critical_path()]
-            critical_path_ids = set(ordered_path)
+            candidate_ids = set(ordered_path)
             # Adjacent (source=blocker, target=blocked) pairs only — shortcut
             # edges between non-adjacent path nodes are not part of the chain
             # and must not be flagged is_critical_path (filigree-c9b08d1363).
             critical_path_edges = {(ordered_path[i], ordered_path[i + 1]) for i in range(len(ordered_path) - 1)}
 
         # Scope neighborhood (undirected BFS around scope_root)
-        scoped_ids: set[str] | None = None
         if gp.scope_root:
-            neighbors: dict[str, set[str]] = {}
-            for dep in deps:
-                neighbors.setdefault(dep["to"], set()).add(dep["from"])
-                neighbors.setdefault(dep["from"], set()).add(dep["to"])
-
-            scoped_ids = {gp.scope_root}
-            queue: deque[tuple[str, int]] = deque([(gp.scope_root, 0)])
-            while queue:
-                current, dist = queue.popleft()
-                if dist >= gp.scope_radius:
-                    continue
-                for nxt in neighbors.get(current, set()):
-                    if nxt not in scoped_ids:
-                        scoped_ids.add(nxt)
-                        queue.append((nxt, dist + 1))
-
-        filtered_nodes = _filter_graph_nodes(issues, issue_map, gp, scoped_ids, critical_path_ids)
-
-        total_nodes_before_limit = len(filtered_nodes)
-        truncated = False
-        if len(filtered_nodes) > gp.node_limit:
-            filtered_nodes = filtered_nodes[: gp.node_limit]
-            truncated = True
+            scoped_ids = graph.neighbourhood(gp.scope_root, gp.scope_radius)
+            candidate_ids = scoped_ids if candidate_ids is None else candidate_ids & scoped_ids
+
+        filtered_nodes, total_nodes_before_limit = db.get_graph_nodes(
+            issue_ids=candidate_ids,
+            include_done=gp.include_done,
+            types=gp.type_filter,
+            status_categories=gp.status_filter,
+            assignee=gp.assignee_filter,
+            updated_since=gp.window_cutoff.isoformat() if gp.window_cutoff is not None else None,
+            blocked_only=gp.blocked_only,
+            ready_only=gp.ready_only,
+            limit=gp.node_limit,
+        )
+        truncated = total_nodes_before_limit > len(filtered_nodes)
 
-        visible_ids = {node["id"] for node in filtered_nodes}
-        filtered_edges = _filter_graph_edges([dict(d) for d in deps], visible_ids, critical_path_edges)
+        filtered_edges = _filter_graph_edges(graph, [node["id"] for node in filtered_nodes], critical_path_edges)
 
         total_edges_before_limit = len(filtered_edges)
         if len(filtered_edges) > gp.edge_limit:
@@ -459,43 +390,47 @@ def create_classic_router() -> APIRouter:
 
         query_ms = int((perf_counter() - started) * 1000)
         runtime = _resolve_graph_runtime(db)
-        return JSONResponse(
-            {
-                "mode": "v2",
-                "compatibility_mode": runtime["compatibility_mode"],
-                "query": {
-                    "scope_root": gp.scope_root,
-                    "scope_radius": gp.scope_radius if gp.scope_root else None,
-                    "include_done": gp.include_done,
-                    "types": sorted(gp.type_filter) if gp.type_filter else [],
-                    "status_categories": sorted(gp.status_filter) if gp.status_filter else [],
-                    "assignee": gp.assignee_filter,
-                    "blocked_only": gp.blocked_only,
-                    "ready_only": gp.ready_only,
-                    "critical_path_only": gp.critical_path_only,
-                    "window_days": gp.window_days,
-                },
-                "limits": {
-                    "node_limit": gp.node_limit,
-                    "edge_limit": gp.edge_limit,
-                    "truncated": truncated,
-                },
-                "telemetry": {
-                    "query_ms": query_ms,
-                    "total_nodes_before_limit": total_nodes_before_limit,
-                    "total_edges_before_limit": total_edges_before_limit,
-                },
-                "nodes": filtered_nodes,
-                "edges": filtered_edges,
-            }
-        )
+        body: dict[str, Any] = {
+            "mode": "v2",
+            "compatibility_mode": runtime["compatibility_mode"],
+            "query": {
+                "scope_root": gp.scope_root,
+                "scope_radius": gp.scope_radius if gp.scope_root else None,
+                "include_done": gp.include_done,
+                "types": sorted(gp.type_filter) if gp.type_filter else [],
+                "status_categories": sorted(gp.status_filter) if gp.status_filter else [],
+                "assignee": gp.assignee_filter,
+                "blocked_only": gp.blocked_only,
+                "ready_only": gp.ready_only,
+                "critical_path_only": gp.critical_path_only,
+                "window_days": gp.window_days,
+            },
+            "limits": {
+                "node_limit": gp.node_limit,
+                "edge_limit": gp.edge_limit,
+                "truncated": truncated,
+            },
+            "telemetry": {
+                "query_ms": query_ms,
+                "total_nodes_before_limit": total_nodes_before_limit,
+                "total_edges_before_limit": total_edges_before_limit,
+            },
+            "nodes": filtered_nodes,
+            "edges": filtered_edges,
+        }
+        if fmt == "columnar":
+            body.update(format="columnar", **_columnar_graph(filtered_nodes, filtered_edges))
+        return JSONResponse(body)
 
     @router.get("/stats")
-    async def api_stats(db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
+    @_conditional_get()
+    @_offload_read
+    async def api_stats(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         result = StatsWithPrefix(**db.get_stats(), prefix=db.prefix)
         return JSONResponse(result)
 
     @router.get("/metrics")
+    @_offload_read
     async def api_metrics(days: int = 30, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """Flow metrics: cycle time, lead time, throughput."""
         from filigree.analytics import get_flow_metrics
@@ -517,12 +452,14 @@ def create_classic_router() -> APIRouter:
         return JSONResponse(stats)
 
     @router.get("/critical-path")
+    @_offload_read
     async def api_critical_path(db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """Longest dependency chain among open issues."""
         path = db.get_critical_path()
         return JSONResponse({"path": path, "length": len(path)})
 
     @router.get("/activity")
+    @_offload_read
     async def api_activity(limit: int = 50, since: str = "", db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """Recent events across all issues."""
         limit = min(max(limit, 1), 1000)
@@ -573,9 +510,9 @@ def create_loom_router() -> APIRouter:
 
         Loom-only (no classic dashboard counterpart). Mirrors MCP's
         ``get_changes`` semantics: pass ``?since=<ISO timestamp>`` and
-        optional ``?limit=`` (default 100). Heartbeat events are excluded
-        by default; pass ``?include_heartbeats=true`` or ``?type=heartbeat``
-        to include them. Overfetches by 1 to detect ``has_more``. ``offset``
+        optional ``?limit=`` (default 100). Heartbeat events, which only
+        older versions recorded, are excluded by default; pass
+        ``?include_heartbeats=true`` or ``?type=heartbeat`` to include them. Overfetches by 1 to detect ``has_more``. ``offset``
         is not exposed — the cursor is the ``since`` timestamp.
         """
         params = request.query_params
@@ -0,0 +1,244 @@
+"""Fingerprinted, precompressed dashboard static assets.
+
+The dashboard is a tree of ES modules under ``static/js``. Served as-is,
+every cold load walks the import graph one round trip at a time and every
+warm load revalidates each module. At app creation the tree is instead read
+once (no build step): each script gets a fingerprint covering itself and
+everything it imports, relative imports are rewritten to the fingerprinted
+URLs, and every body is gzip-compressed (and brotli-compressed when the
+optional ``brotli`` module is importable).
+
+Fingerprinted URLs (``/static/js/app.<hash>.js``) are served from memory
+with ``Cache-Control: immutable``, so a warm load fetches only the page.
+The page itself lists every module as ``modulepreload`` so a cold load
+fetches them in parallel, and is served with an ETag and ``no-cache``.
+Unfingerprinted ``/static/…`` paths still come straight from disk.
+"""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from starlette.requests import Request
+from starlette.staticfiles import StaticFiles
+
+from filigree.dashboard_routes.common import _etag_matches
+
+if TYPE_CHECKING:
+    from fastapi import APIRouter
+    from starlette.datastructures import Headers
+    from starlette.responses import Response
+    from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+STATIC_URL_PREFIX = "/static/"
+_INDEX_FILENAME = "dashboard.html"
+_FINGERPRINT_LENGTH = 12
+_IMMUTABLE = "public, max-age=31536000, immutable"
+
+# ``import … from "./x.js"``, ``export … from "../y.js"`` and ``import "./z.js"``.
+_IMPORT_RE = re.compile(r"""(\b(?:from|import)\s*)(["'])(\.{1,2}/[^"'\s]+)\2""")
+_MODULE_SCRIPT_RE = re.compile(r"""<script\s+type="module"\s+src="/static/([^"]+)"\s*>""")
+
+
+@dataclass(frozen=True)
+class _Asset:
+    """One in-memory response body with its precompressed variants."""
+
+    body: bytes
+    media_type: str
+    etag: str
+    encoded: dict[str, bytes]  # content-coding -> body, best first
+
+    def response(self, headers: Headers, cache_control: str) -> Response:
+        from starlette.responses import Response
+
+        out = {"ETag": self.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, self.etag):
+            return Response(status_code=304, headers=out)
+        accepted = _accepted_encodings(headers.get("accept-encoding", ""))
+        for coding, body in self.encoded.items():
+            if coding in accepted:
+                return Response(body, media_type=self.media_type, headers={**out, "Content-Encoding": coding})
+        return Response(self.body, media_type=self.media_type, headers=out)
+
+
+@dataclass(frozen=True)
+class AssetManifest:
+    """The dashboard page plus every fingerprinted script, keyed by static path."""
+
+    index: _Asset
+    assets: dict[str, _Asset]  # "js/app.<hash>.js" -> asset
+    urls: dict[str, str]  # "js/app.js" -> "/static/js/app.<hash>.js"
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Content-codings an ``Accept-Encoding`` header allows (``q=0`` excluded)."""
+    accepted: set[str] = set()
+    for part in header.split(","):
+        coding, *params = part.split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        coding = coding.strip().lower()
+        if coding and q > 0:
+            accepted.add(coding)
+    if "*" in accepted:
+        accepted.update(("br", "gzip"))
+    return accepted
+
+
+def _make_asset(body: bytes, media_type: str) -> _Asset:
+    encoded: dict[str, bytes] = {}
+    try:
+        import brotli
+    except ImportError:
+        pass  # optional: gzip alone covers every browser
+    else:
+        encoded["br"] = brotli.compress(body)
+    encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+    etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    return _Asset(body=body, media_type=media_type, etag=etag, encoded=encoded)
+
+
+def _resolve_import(importer: str, specifier: str) -> str:
+    parts = importer.split("/")[:-1]
+    for segment in specifier.split("/"):
+        if segment == "..":
+            if parts:
+                parts.pop()
+        elif segment != ".":
+            parts.append(segment)
+    return "/".join(parts)
+
+
+def _fingerprinted_path(rel: str, digest: str) -> str:
+    stem, dot, ext = rel.rpartition(".")
+    return f"{stem}.{digest}.{ext}" if dot else f"{rel}.{digest}"
+
+
+def _closure(start: str, imports: dict[str, list[str]]) -> list[str]:
+    """*start* and every script it imports, transitively (cycles allowed), sorted."""
+    seen = {start}
+    stack = [start]
+    while stack:
+        for dep in imports[stack.pop()]:
+            if dep not in seen:
+                seen.add(dep)
+                stack.append(dep)
+    return sorted(seen)
+
+
+def build_manifest(static_dir: Path) -> AssetManifest:
+    """Fingerprint, rewrite and precompress the scripts and page under *static_dir*.
+
+    A script's fingerprint hashes the source of its whole import closure,
+    so changing any module moves the URL of every module that reaches it.
+    """
+    sources = {path.relative_to(static_dir).as_posix(): path.read_text(encoding="utf-8") for path in sorted(static_dir.rglob("*.js"))}
+    imports = {
+        rel: [dep for dep in (_resolve_import(rel, m.group(3)) for m in _IMPORT_RE.finditer(text)) if dep in sources]
+        for rel, text in sources.items()
+    }
+    urls: dict[str, str] = {}
+    for rel in sources:
+        digest = hashlib.blake2b(digest_size=_FINGERPRINT_LENGTH // 2)
+        for member in _closure(rel, imports):
+            digest.update(member.encode())
+            digest.update(b"\0")
+            digest.update(sources[member].encode())
+            digest.update(b"\0")
+        urls[rel] = STATIC_URL_PREFIX + _fingerprinted_path(rel, digest.hexdigest())
+
+    def rewrite(rel: str, text: str) -> str:
+        def repl(m: re.Match[str]) -> str:
+            dep = _resolve_import(rel, m.group(3))
+            return f"{m.group(1)}{m.group(2)}{urls[dep]}{m.group(2)}" if dep in urls else m.group(0)
+
+        return _IMPORT_RE.sub(repl, text)
+
+    assets = {
+        urls[rel].removeprefix(STATIC_URL_PREFIX): _make_asset(rewrite(rel, text).encode("utf-8"), "text/javascript; charset=utf-8")
+        for rel, text in sources.items()
+    }
+
+    html = (static_dir / _INDEX_FILENAME).read_text(encoding="utf-8")
+    preload: set[str] = set()
+    for entry in _MODULE_SCRIPT_RE.findall(html):
+        if entry in sources:
+            preload.update(_closure(entry, imports))
+    for rel, url in urls.items():
+        html = html.replace(f'"{STATIC_URL_PREFIX}{rel}"', f'"{url}"')
+    if preload:
+        links = "".join(f'<link rel="modulepreload" href="{urls[rel]}">\n' for rel in sorted(preload))
+        html = html.replace("</head>", links + "</head>", 1)
+    index = _make_asset(html.encode("utf-8"), "text/html; charset=utf-8")
+    logger.debug("Built dashboard asset manifest: %d script(s), codings=%s", len(assets), list(index.encoded))
+    return AssetManifest(index=index, assets=assets, urls=urls)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_manifest(static_dir: Path, signature: tuple[tuple[str, int, int], ...]) -> AssetManifest:
+    return build_manifest(static_dir)
+
+
+def load_manifest(static_dir: Path) -> AssetManifest:
+    """``build_manifest``, reused while no file under *static_dir* has changed."""
+    signature = tuple(
+        (path.relative_to(static_dir).as_posix(), path.stat().st_mtime_ns, path.stat().st_size)
+        for path in sorted(static_dir.rglob("*"))
+        if path.is_file()
+    )
+    return _cached_manifest(static_dir, signature)
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """``StaticFiles`` that answers fingerprinted paths from an ``AssetManifest``."""
+
+    def __init__(self, *, directory: Path, manifest: AssetManifest) -> None:
+        super().__init__(directory=str(directory))
+        self.manifest = manifest
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        asset = self.manifest.assets.get(Path(path).as_posix())
+        if asset is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+        from starlette.datastructures import Headers
+
+        return asset.response(Headers(scope=scope), _IMMUTABLE)
+
+
+# ---------------------------------------------------------------------------
+# Router factory
+# ---------------------------------------------------------------------------
+
+
+def create_router(manifest: AssetManifest) -> APIRouter:
+    """Build the APIRouter serving the dashboard page from *manifest*.
+
+    The page names fingerprinted script URLs, so it must be revalidated
+    (``no-cache``) while the scripts themselves never are.
+    """
+    from fastapi import APIRouter
+
+    router = APIRouter()
+
+    @router.get("/", response_model=None)
+    async def index(request: Request) -> Response:
+        return manifest.index.response(request.headers, "no-cache")
+
+    return router
@@ -2,23 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
+import hashlib
+import json
 import logging
 import os
 import sys
-from typing import TYPE_CHECKING, Any, Literal
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+# Runtime import: handlers wrapped by ``_conditional_get`` have their
+# string annotations resolved against this module's globals by FastAPI.
+from starlette.requests import Request
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Coroutine, Mapping, Sequence
 
     from fastapi.responses import JSONResponse
-    from starlette.requests import Request
+    from starlette.responses import Response, StreamingResponse
 
-from filigree.core import FILIGREE_DIR_NAME, FiligreeDB, read_config
-from filigree.types.api import ErrorCode, ErrorResponse, parse_response_detail
+from filigree.core import DEFAULT_READ_POOL_SIZE, FILIGREE_DIR_NAME, FiligreeDB, read_config
+from filigree.types.api import ColumnarTable, ErrorCode, ErrorResponse, parse_issue_include, parse_response_detail
 from filigree.validation import sanitize_actor as _sanitize_actor
 
 logger = logging.getLogger(__name__)
 _MISSING = object()
+_T = TypeVar("_T")
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -26,6 +38,7 @@ _MISSING = object()
 
 _GRAPH_MODE_VALUES = frozenset({"legacy", "v2"})
 _GRAPH_STATUS_CATEGORIES = frozenset({"open", "wip", "done"})
+_RESPONSE_FORMAT_VALUES = frozenset({"json", "columnar"})
 _BOOL_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
 _BOOL_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
 
@@ -36,6 +49,10 @@ _BOOL_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
 _MAX_PAGINATION_LIMIT = 10_000
 _MAX_PAGINATION_OFFSET = 9_223_372_036_854_775_806  # 2**63 - 2
 
+# Cap for ``GET /issues?ids=`` — the live-update refetch of changed rows.
+# Change notifications naming more issues than this tell clients to resync.
+_MAX_ISSUE_IDS = 500
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -135,6 +152,54 @@ def _parse_response_detail(
     return parsed
 
 
+def _parse_issue_include(params: Mapping[str, str]) -> frozenset[str] | JSONResponse | None:
+    """Parse the ``include`` query parameter (comma-separated relations).
+
+    Thin HTTP wrapper around ``filigree.types.api.parse_issue_include``;
+    ``None`` (param absent) means full hydration.
+    """
+    parsed = parse_issue_include(params.get("include"))
+    if isinstance(parsed, dict):
+        return _error_response(parsed["error"], ErrorCode.VALIDATION, 400)
+    return parsed
+
+
+def _parse_response_format(params: Mapping[str, str]) -> str | JSONResponse:
+    """Parse the ``format`` query parameter of the large list reads: ``json`` (default) or ``columnar``."""
+    raw = params.get("format")
+    if raw is None:
+        return "json"
+    fmt = raw.strip().lower()
+    if fmt not in _RESPONSE_FORMAT_VALUES:
+        return _error_response(
+            f'Invalid value for format: "{raw}". Must be one of: columnar, json.',
+            ErrorCode.VALIDATION,
+            400,
+            {"param": "format", "value": raw},
+        )
+    return fmt
+
+
+def _columnar_table(rows: Sequence[Mapping[str, Any]], interned: Collection[str] = ()) -> ColumnarTable:
+    """Encode *rows* column-major, interning the low-cardinality *interned* keys.
+
+    Keys come from every row in first-seen order; a row missing a key gets
+    ``None`` in that column. Interned columns must hold hashable values.
+    """
+    keys: dict[str, None] = {}
+    for row in rows:
+        keys.update(dict.fromkeys(row))
+    columns = {key: [row.get(key) for row in rows] for key in keys}
+    dicts: dict[str, list[Any]] = {}
+    for key in interned:
+        if key not in columns:
+            continue
+        index: dict[Any, int] = {}
+        columns[key] = [index.setdefault(value, len(index)) for value in columns[key]]
+        dicts[key] = list(index)
+    return {"count": len(rows), "columns": columns, "dicts": dicts}
+
+
 def _safe_int(
     value: str,
     name: str,
@@ -375,3 +440,230 @@ def _validate_actor(value: Any) -> tuple[str, JSONResponse | None]:
     if err:
         return ("", _error_response(err, ErrorCode.VALIDATION, 400))
     return (cleaned, None)
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+# ---------------------------------------------------------------------------
+
+
+def _db_etag(db: FiligreeDB, request: Request, vary: str = "") -> str:
+    """Strong ETag for a read response: the database's change counters plus the URL.
+
+    The trigger-maintained ``change_counters`` move on every write that can
+    alter a rendered issue, dependency, label or comment — from any process
+    — and survive restarts, so browser caches stay valid across them.
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    for part in (str(db.db_path), request.url.path, request.url.query, vary):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    for name, version in sorted(db.get_change_counters().items()):
+        digest.update(f"{name}={version};".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 9110 §13.1.2).
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _conditional_get(
+    vary: Callable[[FiligreeDB], str] | None = None,
+    skip: Callable[[Request], bool] | None = None,
+) -> Callable[[Callable[..., Awaitable[Response]]], Callable[..., Awaitable[Response]]]:
+    """Decorate a read handler with ETag / ``If-None-Match`` support.
+
+    The handler must take ``request`` and ``db`` parameters and its output
+    must depend only on the database and the URL; *vary* folds in anything
+    else (e.g. config-driven defaults). Requests for which *skip* returns
+    true depend on something no key can capture (e.g. the clock) and are
+    served without an ETag. A matching ``If-None-Match`` gets a 304 before
+    the handler runs; 200 responses carry the ETag with
+    ``Cache-Control: no-cache`` so browsers revalidate on every poll.
+    """
+
+    def decorator(handler: Callable[..., Awaitable[Response]]) -> Callable[..., Awaitable[Response]]:
+        @functools.wraps(handler)
+        async def wrapper(*args: Any, **kwargs: Any) -> Response:
+            from starlette.responses import Response
+
+            request: Request = kwargs["request"]
+            db: FiligreeDB = kwargs["db"]
+            if skip is not None and skip(request):
+                return await handler(*args, **kwargs)
+            etag = _db_etag(db, request, vary(db) if vary is not None else "")
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and _etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers=headers)
+            response = await handler(*args, **kwargs)
+            if response.status_code == 200:
+                response.headers.update(headers)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Read offloading
+# ---------------------------------------------------------------------------
+
+
+class _ReadExecutor:
+    """Bounded worker pool for dashboard reads, kept apart from the loop's default executor.
+
+    Handlers are ``async def`` and run on the event loop thread, which also
+    serves the mounted MCP endpoint; a slow graph or metrics query there
+    stalls every agent's tool call. Reads routed through here run on a
+    pooled read-only connection (``FiligreeDB.read_connection``) in one of
+    ``max_workers`` threads instead. MCP's read-only tools use
+    ``asyncio.to_thread``, so dashboard load never takes their threads.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "filigree-dashboard-read") -> None:
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+
+    def _started(self) -> None:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+
+    def _finished(self, future: Future[Any]) -> None:
+        with self._lock:
+            if future.cancelled():
+                self._queued -= 1  # never started
+            else:
+                self._running -= 1
+
+    async def run(self, db: FiligreeDB, fn: Callable[..., _T], *args: Any) -> _T:
+        """Return ``fn(*args)``, computed on a worker with a read connection bound to *db*.
+
+        Falls back to calling inline when *db* has no read pool (in-memory
+        databases), where a worker would only see the writer connection.
+        """
+        if not db.read_pool_enabled:
+            return fn(*args)
+        # Warm the lazy template registry here so workers never race its load.
+        db.templates  # noqa: B018
+        context = contextvars.copy_context()
+
+        def bound() -> _T:
+            with db.read_connection():
+                return context.run(fn, *args)
+
+        return await self.call(bound)
+
+    async def call(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Return ``fn(*args)`` computed on a worker; *fn* binds its own connections."""
+
+        def started() -> _T:
+            self._started()
+            return fn(*args)
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix)
+            self._queued += 1
+            future = self._pool.submit(started)
+        future.add_done_callback(self._finished)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict[str, int]:
+        """Worker count, busy workers, and reads waiting for a worker."""
+        with self._lock:
+            return {"workers": self.max_workers, "running": self._running, "queued": self._queued}
+
+    def shutdown(self) -> None:
+        """Stop the pool (queued reads are cancelled); the next ``run`` starts a fresh one."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# One worker per pooled read connection, so workers never open spares.
+_read_executor = _ReadExecutor(DEFAULT_READ_POOL_SIZE)
+
+# Server-mode fan-out over projects (``/api/federated/…``). Separate from
+# ``_read_executor`` so a cross-project query never starves one project's
+# dashboard reads; each task reads one project through that project's pool.
+_FEDERATED_WORKERS = 8
+_federated_executor = _ReadExecutor(_FEDERATED_WORKERS, "filigree-federated-read")
+
+
+def _offload_read(handler: Callable[..., Coroutine[Any, Any, Response]]) -> Callable[..., Coroutine[Any, Any, Response]]:
+    """Run a read-only handler on ``_read_executor`` instead of the event loop.
+
+    The handler must take a ``db`` parameter, must not write, and must not
+    await anything tied to the request's loop (reading the body, streaming);
+    its coroutine is driven to completion on the worker thread, the way
+    ``mcp_server`` runs read-only tools. Put it below ``_conditional_get`` so
+    a 304 never occupies a worker.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> Response:
+        db: FiligreeDB = kwargs["db"]
+        if not db.read_pool_enabled:
+            return await handler(*args, **kwargs)
+        return await _read_executor.run(db, lambda: asyncio.run(handler(*args, **kwargs)))
+
+    return wrapper
+
+
+# ---------------------------------------------------------------------------
+# Streaming list responses
+# ---------------------------------------------------------------------------
+
+
+def _encode_page(fetch_page: Callable[[Any], tuple[Sequence[Any], Any]], cursor: Any) -> tuple[bytes, Any]:
+    """Fetch one page and encode its rows as comma-separated JSON (no brackets)."""
+    rows, next_cursor = fetch_page(cursor)
+    if not rows:
+        return b"", next_cursor
+    # Same encoding as JSONResponse; one dumps call per page, brackets dropped.
+    encoded = json.dumps(rows, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+    return encoded[1:-1].encode("utf-8"), next_cursor
+
+
+async def _stream_json_array(db: FiligreeDB, fetch_page: Callable[[Any], tuple[Sequence[Any], Any]]) -> AsyncIterator[bytes]:
+    # The body outlives the request handler; keep the project store from
+    # closing the handle between pages.
+    with db.lease():
+        cursor: Any = None
+        separator = b""
+        yield b"["
+        while True:
+            chunk, cursor = await _read_executor.run(db, _encode_page, fetch_page, cursor)
+            if chunk:
+                yield separator + chunk
+                separator = b","
+            if cursor is None:
+                break
+        yield b"]"
+
+
+def _streaming_json_array(db: FiligreeDB, fetch_page: Callable[[Any], tuple[Sequence[Any], Any]]) -> StreamingResponse:
+    """A JSON array response built one page at a time.
+
+    ``fetch_page(cursor)`` returns ``(rows, next_cursor)``; it is called
+    with ``None`` first and again until it returns a ``None`` cursor. Each
+    page is read and encoded on ``_read_executor`` and sent as one chunk,
+    so memory is bounded by the page size rather than the project size and
+    the first rows leave before the last are read. Pages are separate reads,
+    like any keyset pagination. A database error after the first chunk can
+    only abort the body; validate everything before returning this.
+    """
+    from starlette.responses import StreamingResponse
+
+    return StreamingResponse(_stream_json_array(db, fetch_page), media_type="application/json")
@@ -0,0 +1,357 @@
+"""Federated route handlers — one query across every server-mode project.
+
+In server mode each project lives behind ``/api/p/{key}/…``, so triaging
+across repositories used to cost one round trip per project. ``GET
+/api/federated/search`` and ``GET /api/federated/ready`` fan the query out
+over the ``ProjectStore`` instead: each project is read on
+``_federated_executor`` through ``ProjectStore.borrow_db``, which reuses an
+open handle or reads a cold project through a transient read-only one, and
+the answers are merged into one globally ranked list whose rows carry a
+``project`` key.
+
+A project that errors or overruns ``timeout_ms`` is reported in
+``projects`` and contributes no rows; the rest still answer. The deadline
+counts from the request's arrival, so time queued for a worker and spent
+opening the project is included. It is enforced with an SQLite progress
+handler on the borrowed read connection, so an overrunning query is
+interrupted and frees its worker.
+
+The ``/stream`` variants send the same data as NDJSON: one line per
+project in the order the projects answer, then a ``done`` line with the
+merged order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from starlette.requests import Request
+
+if TYPE_CHECKING:
+    from fastapi import APIRouter
+    from fastapi.responses import JSONResponse, StreamingResponse
+
+    from filigree.dashboard import ProjectStore
+
+from filigree.core import FiligreeDB, ProjectNotInitialisedError
+from filigree.dashboard_routes.common import (
+    _error_response,
+    _federated_executor,
+    _parse_csv_param,
+    _parse_issue_include,
+    _safe_bounded_int,
+)
+from filigree.types.api import (
+    ErrorCode,
+    FederatedIssue,
+    FederatedProjectResult,
+    FederatedProjectStatus,
+    FederatedResponse,
+    FederatedStreamDone,
+    SchemaVersionMismatchError,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TIMEOUT_MS = 5000
+_MAX_TIMEOUT_MS = 60_000
+_MAX_FEDERATED_LIMIT = 1000
+# SQLite VM instructions between deadline checks; cheap enough to be
+# invisible, frequent enough that an interrupt lands within milliseconds.
+_PROGRESS_HANDLER_OPS = 1000
+
+# Builds one project's rows; called on a worker with a read connection bound.
+_ProjectQuery = Callable[[FiligreeDB, str], list[FederatedIssue]]
+
+
+@dataclass(frozen=True)
+class _FederatedRequest:
+    projects: list[dict[str, str]]
+    limit: int
+    timeout: float
+    include: frozenset[str] | None
+    started: float  # time.monotonic() when the request arrived
+
+
+def _search_sort_key(issue: FederatedIssue) -> tuple[Any, ...]:
+    # FTS5 ranks (lower is better) first, LIKE-fallback hits after them.
+    # Ranks from different projects are scored against different corpora,
+    # so this is an approximation — good enough to interleave results.
+    rank = issue.get("rank")
+    return (rank is None, rank or 0.0, issue["priority"], issue["created_at"], issue["project"], issue["id"])
+
+
+def _ready_sort_key(issue: FederatedIssue) -> tuple[Any, ...]:
+    return (issue["priority"], issue["created_at"], issue["project"], issue["id"])
+
+
+def _open_project(store: ProjectStore, key: str, stack: contextlib.ExitStack) -> FiligreeDB | tuple[str, ErrorCode]:
+    """``store.borrow_db(key)`` entered on *stack*, or the error to report for that project."""
+    try:
+        return stack.enter_context(store.borrow_db(key))
+    except KeyError:
+        return f"Unknown project: {key!r}", ErrorCode.NOT_FOUND
+    except SchemaVersionMismatchError as exc:
+        return str(exc), ErrorCode.SCHEMA_MISMATCH
+    except (ProjectNotInitialisedError, ValueError, TypeError) as exc:
+        return f"Invalid project configuration for {key!r}: {exc}", ErrorCode.VALIDATION
+    except Exception as exc:
+        logger.warning("Could not open project %r for a federated query", key, exc_info=True)
+        return str(exc), ErrorCode.INTERNAL
+
+
+def _query_project(
+    store: ProjectStore,
+    project: dict[str, str],
+    query: _ProjectQuery,
+    timeout: float,
+    request_started: float | None = None,
+) -> FederatedProjectResult:
+    """Run *query* against one project on the calling (worker) thread. Never raises.
+
+    *timeout* counts from *request_started* (default: now), so a project
+    whose turn comes after the deadline is reported without being opened.
+    """
+    key = project["key"]
+    started = time.monotonic()
+    deadline = (started if request_started is None else request_started) + timeout
+    results: list[FederatedIssue] = []
+    status: Literal["ok", "timeout", "error"] = "ok"
+    error: tuple[str, ErrorCode] | None = None
+    with contextlib.ExitStack() as stack:
+        db = _open_project(store, key, stack) if started <= deadline else None
+        if db is None:
+            status = "timeout"
+        elif isinstance(db, tuple):
+            status, error = "error", db
+        else:
+            try:
+                with db.read_connection() as conn:
+                    conn.set_progress_handler(lambda: time.monotonic() > deadline, _PROGRESS_HANDLER_OPS)
+                    try:
+                        results = query(db, key)
+                    finally:
+                        conn.set_progress_handler(None, 0)
+            except sqlite3.OperationalError as exc:
+                if time.monotonic() > deadline:
+                    status = "timeout"
+                else:
+                    logger.warning("Federated query failed for project %r", key, exc_info=True)
+                    status, error = "error", (str(exc), ErrorCode.INTERNAL)
+            except Exception as exc:
+                logger.warning("Federated query failed for project %r", key, exc_info=True)
+                status, error = "error", (str(exc), ErrorCode.INTERNAL)
+    if status == "timeout":
+        error = (f"No answer within {timeout * 1000:.0f} ms", ErrorCode.IO)
+    outcome: FederatedProjectResult = {
+        "project": key,
+        "name": project["name"],
+        "status": status,
+        "count": len(results),
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        "results": results,
+    }
+    if error is not None:
+        outcome["error"], outcome["code"] = error
+    return outcome
+
+
+async def _fan_out(store: ProjectStore, req: _FederatedRequest, query: _ProjectQuery) -> AsyncIterator[FederatedProjectResult]:
+    """Yield each project's outcome as soon as it answers."""
+    tasks = [
+        asyncio.ensure_future(_federated_executor.call(_query_project, store, project, query, req.timeout, req.started))
+        for project in req.projects
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Client went away (or we are done): drop projects still queued.
+        for task in tasks:
+            task.cancel()
+
+
+def _status_of(outcome: FederatedProjectResult) -> FederatedProjectStatus:
+    status: FederatedProjectStatus = {
+        "project": outcome["project"],
+        "name": outcome["name"],
+        "status": outcome["status"],
+        "count": outcome["count"],
+        "elapsed_ms": outcome["elapsed_ms"],
+    }
+    if "error" in outcome and "code" in outcome:
+        status["error"], status["code"] = outcome["error"], outcome["code"]
+    return status
+
+
+async def _merged_response(
+    store: ProjectStore, req: _FederatedRequest, query: _ProjectQuery, sort_key: Callable[[FederatedIssue], Any]
+) -> FederatedResponse:
+    outcomes = {outcome["project"]: outcome async for outcome in _fan_out(store, req, query)}
+    merged = sorted((issue for outcome in outcomes.values() for issue in outcome["results"]), key=sort_key)
+    return {
+        "results": merged[: req.limit],
+        "projects": [_status_of(outcomes[project["key"]]) for project in req.projects],
+    }
+
+
+async def _ndjson_stream(
+    store: ProjectStore, req: _FederatedRequest, query: _ProjectQuery, sort_key: Callable[[FederatedIssue], Any]
+) -> AsyncIterator[bytes]:
+    merged: list[FederatedIssue] = []
+    async for outcome in _fan_out(store, req, query):
+        merged.extend(outcome["results"])
+        yield json.dumps(outcome, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+    merged.sort(key=sort_key)
+    done: FederatedStreamDone = {"done": True, "order": [[issue["project"], issue["id"]] for issue in merged[: req.limit]]}
+    yield json.dumps(done, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _parse_federated_request(request: Request, store: ProjectStore, *, default_limit: int) -> _FederatedRequest | JSONResponse:
+    from fastapi.responses import JSONResponse
+
+    started = time.monotonic()
+    params = request.query_params
+    limit = _safe_bounded_int(params.get("limit", str(default_limit)), name="limit", min_value=1, max_value=_MAX_FEDERATED_LIMIT)
+    if isinstance(limit, JSONResponse):
+        return limit
+    timeout_ms = _safe_bounded_int(
+        params.get("timeout_ms", str(_DEFAULT_TIMEOUT_MS)), name="timeout_ms", min_value=1, max_value=_MAX_TIMEOUT_MS
+    )
+    if isinstance(timeout_ms, JSONResponse):
+        return timeout_ms
+    include = _parse_issue_include(params)
+    if isinstance(include, JSONResponse):
+        return include
+    projects = store.list_projects()
+    if "projects" in params:
+        wanted = _parse_csv_param(params["projects"])
+        known = {project["key"] for project in projects}
+        unknown = [key for key in wanted if key not in known]
+        if unknown:
+            return _error_response(
+                f"Unknown project(s): {', '.join(unknown)}",
+                ErrorCode.NOT_FOUND,
+                404,
+                {"param": "projects", "value": params["projects"]},
+            )
+        projects = [project for project in projects if project["key"] in wanted]
+    return _FederatedRequest(projects=projects, limit=limit, timeout=timeout_ms / 1000, include=include, started=started)
+
+
+# ---------------------------------------------------------------------------
+# Router factory
+# ---------------------------------------------------------------------------
+
+
+def create_router() -> APIRouter:
+    """Build the APIRouter for the server-mode ``/api/federated`` endpoints.
+
+    Every endpoint accepts ``?projects=a,b`` (default: every registered
+    project), ``?limit=`` (rows in the merged list, 1-1000),
+    ``?timeout_ms=`` (per-project deadline, default 5000) and
+    ``?include=`` (as on the per-project lists).
+    """
+    from fastapi import APIRouter
+    from fastapi.responses import JSONResponse, StreamingResponse
+
+    router = APIRouter()
+
+    def _store() -> ProjectStore | JSONResponse:
+        from filigree import dashboard
+
+        if dashboard._project_store is None:
+            return _error_response("Federated queries need server mode", ErrorCode.NOT_INITIALIZED, 503)
+        return dashboard._project_store
+
+    def _search_query(request: Request, req: _FederatedRequest) -> _ProjectQuery:
+        q = request.query_params.get("q", "")
+
+        def query(db: FiligreeDB, key: str) -> list[FederatedIssue]:
+            if not q.strip():
+                return []
+            return [
+                {**issue.to_dict(), "project": key, "rank": rank}
+                for issue, rank in db.search_issues_ranked(q, limit=req.limit, include=req.include)
+            ]
+
+        return query
+
+    def _ready_query(req: _FederatedRequest) -> _ProjectQuery:
+        def query(db: FiligreeDB, key: str) -> list[FederatedIssue]:
+            return [
+                {**issue.to_dict(), "project": key}  # type: ignore[typeddict-item]
+                for issue in db.get_ready(include=req.include, limit=req.limit)
+            ]
+
+        return query
+
+    @router.get("/search")
+    async def api_federated_search(request: Request) -> JSONResponse:
+        """Full-text search across projects — ``FederatedResponse``.
+
+        Rows are ranked by FTS rank, then priority, then creation time,
+        and carry ``project`` and ``rank``.
+        """
+        store = _store()
+        if isinstance(store, JSONResponse):
+            return store
+        req = _parse_federated_request(request, store, default_limit=50)
+        if isinstance(req, JSONResponse):
+            return req
+        return JSONResponse(await _merged_response(store, req, _search_query(request, req), _search_sort_key))
+
+    @router.get("/search/stream", response_model=None)
+    async def api_federated_search_stream(request: Request) -> StreamingResponse | JSONResponse:
+        """``/search`` as NDJSON, one line per project as it answers."""
+        store = _store()
+        if isinstance(store, JSONResponse):
+            return store
+        req = _parse_federated_request(request, store, default_limit=50)
+        if isinstance(req, JSONResponse):
+            return req
+        return StreamingResponse(
+            _ndjson_stream(store, req, _search_query(request, req), _search_sort_key),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @router.get("/ready")
+    async def api_federated_ready(request: Request) -> JSONResponse:
+        """Ready issues across projects — ``FederatedResponse``.
+
+        Rows are ranked by priority, then creation time, and carry
+        ``project``.
+        """
+        store = _store()
+        if isinstance(store, JSONResponse):
+            return store
+        req = _parse_federated_request(request, store, default_limit=100)
+        if isinstance(req, JSONResponse):
+            return req
+        return JSONResponse(await _merged_response(store, req, _ready_query(req), _ready_sort_key))
+
+    @router.get("/ready/stream", response_model=None)
+    async def api_federated_ready_stream(request: Request) -> StreamingResponse | JSONResponse:
+        """``/ready`` as NDJSON, one line per project as it answers."""
+        store = _store()
+        if isinstance(store, JSONResponse):
+            return store
+        req = _parse_federated_request(request, store, default_limit=100)
+        if isinstance(req, JSONResponse):
+            return req
+        return StreamingResponse(
+            _ndjson_stream(store, req, _ready_query(req), _ready_sort_key),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return router
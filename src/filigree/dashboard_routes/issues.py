@@ -9,19 +9,29 @@ from starlette.requests import Request
 
 if TYPE_CHECKING:
     from fastapi import APIRouter
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import JSONResponse, StreamingResponse
 
 from filigree.core import FiligreeDB, WrongProjectError
 from filigree.dashboard_routes.common import (
+    _MAX_ISSUE_IDS,
+    _MAX_PAGINATION_LIMIT,
     _MAX_PAGINATION_OFFSET,
+    _columnar_table,
+    _conditional_get,
     _error_response,
+    _offload_read,
+    _parse_csv_param,
+    _parse_issue_include,
     _parse_json_body,
+    _parse_response_format,
     _safe_int,
+    _streaming_json_array,
     _validate_actor,
     _validate_priority_field,
 )
 from filigree.models import Issue
 from filigree.types.api import (
+    ColumnarTable,
     DepDetail,
     EnrichedIssueDetail,
     ErrorCode,
@@ -29,16 +39,21 @@ from filigree.types.api import (
     classify_value_error,
     errorcode_to_http_status,
 )
-from filigree.types.core import ISOTimestamp
-from filigree.types.planning import CommentRecord
+from filigree.types.core import ISOTimestamp, IssueDict
+from filigree.types.planning import CommentRecord, DependencyRecord
 
 logger = logging.getLogger(__name__)
 
-# Page size used when streaming every issue into the dashboard preload.
-# Exposed at module scope so tests can shrink it to exercise pagination.
+# Page sizes used when streaming every issue (or dependency) into the
+# dashboard preload. Exposed at module scope so tests can shrink them to
+# exercise pagination.
 _ISSUES_LIST_PAGE_SIZE = 1000
+_DEPENDENCIES_PAGE_SIZE = 5000
 _MISSING = object()
 
+# Low-cardinality issue columns sent as dictionary indexes in ``?format=columnar``.
+_ISSUE_INTERNED_COLUMNS = ("status", "status_category", "type", "assignee", "parent_id")
+
 
 def _classify_issue_write_error(message: str) -> ErrorCode:
     if "assigned to" in message and "expected" in message:
@@ -46,7 +61,21 @@ def _classify_issue_write_error(message: str) -> ErrorCode:
     return classify_value_error(message)
 
 
-def _fetch_all_issues(db: FiligreeDB) -> list[Issue]:
+def _issue_list_body(issues: list[Issue], fmt: str) -> list[IssueDict] | ColumnarTable:
+    """Serialise an issue list as a flat array, or column-major for ``format=columnar``."""
+    rows = [i.to_dict() for i in issues]
+    if fmt == "columnar":
+        return _columnar_table(rows, _ISSUE_INTERNED_COLUMNS)
+    return rows
+
+
+def _issue_page(db: FiligreeDB, cursor: str | None, include: frozenset[str] | None) -> tuple[list[Issue], str | None]:
+    """One ``_ISSUES_LIST_PAGE_SIZE`` keyset page and the cursor after it (``None`` on the last)."""
+    page = db.list_issues(limit=_ISSUES_LIST_PAGE_SIZE, cursor=cursor, include=include)
+    return page, db.issue_list_cursor(page[-1]) if len(page) == _ISSUES_LIST_PAGE_SIZE else None
+
+
+def _fetch_all_issues(db: FiligreeDB, *, include: frozenset[str] | None = None) -> list[Issue]:
     """Return every issue in the DB by paginating list_issues.
 
     The dashboard preload previously called ``list_issues(limit=10000)``,
@@ -54,14 +83,12 @@ def _fetch_all_issues(db: FiligreeDB) -> list[Issue]:
     ceiling while preserving the response shape.
     """
     all_issues: list[Issue] = []
-    offset = 0
+    cursor: str | None = None
     while True:
-        page = db.list_issues(limit=_ISSUES_LIST_PAGE_SIZE, offset=offset)
+        page, cursor = _issue_page(db, cursor, include)
         all_issues.extend(page)
-        if len(page) < _ISSUES_LIST_PAGE_SIZE:
-            break
-        offset += _ISSUES_LIST_PAGE_SIZE
-    return all_issues
+        if cursor is None:
+            return all_issues
 
 
 @overload
@@ -224,9 +251,15 @@ def create_classic_router() -> APIRouter:
     """Build the classic-generation APIRouter for issue, workflow, and
     dependency endpoints.
 
-    NOTE: All handlers are intentionally async despite doing synchronous
-    SQLite I/O. This serializes DB access on the event loop thread,
-    avoiding concurrent multi-thread access to the shared DB connection.
+    NOTE: Handlers are async and do synchronous SQLite I/O. The read-only
+    ``/issues``, ``/ready``, ``/dependencies``, ``/search`` and
+    ``/plan/{milestone_id}`` handlers are wrapped in ``@_offload_read``:
+    they run on ``_read_executor`` worker threads, where ``db.conn`` is a
+    pooled ``query_only`` connection rather than the shared writer, so they
+    can run alongside each other and alongside a write (WAL). Every handler
+    that writes stays on the event loop thread, which keeps writer access
+    serialized. Without a read pool (in-memory databases) the offloaded
+    handlers fall back to the loop as well.
     """
     from fastapi import APIRouter, Depends
     from fastapi.responses import JSONResponse
@@ -235,15 +268,71 @@ def create_classic_router() -> APIRouter:
 
     router = APIRouter()
 
-    @router.get("/issues")
-    async def api_issues(db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
-        issues = _fetch_all_issues(db)
-        return JSONResponse([i.to_dict() for i in issues])
+    @router.get("/issues", response_model=None)
+    @_conditional_get()
+    @_offload_read
+    async def api_issues(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse | StreamingResponse:
+        """Every issue as a flat array, streamed one keyset page at a time.
+
+        ``?limit=`` (optionally with ``?cursor=``) returns a single keyset
+        page in the same array shape instead; when more rows follow, the
+        cursor for the next page is sent in the ``X-Next-Cursor`` header.
+        ``?include=labels,deps,children,fields`` hydrates only the named
+        relations (the rest come back empty); omit it for everything.
+        ``?ids=a,b,c`` returns just those issues (up to 500); ids that no
+        longer exist are omitted, which is how live-update clients detect
+        deletions. ``?format=columnar`` sends any of these as one
+        ``ColumnarTable`` instead of an array of objects.
+        """
+        params = request.query_params
+        include = _parse_issue_include(params)
+        if isinstance(include, JSONResponse):
+            return include
+        fmt = _parse_response_format(params)
+        if isinstance(fmt, JSONResponse):
+            return fmt
+        if "ids" in params:
+            if "limit" in params or "cursor" in params:
+                return _error_response("ids cannot be combined with limit or cursor", ErrorCode.VALIDATION, 400, {"param": "ids"})
+            ids = _parse_csv_param(params["ids"])
+            if len(ids) > _MAX_ISSUE_IDS:
+                return _error_response(
+                    f"Too many ids: {len(ids)} (max {_MAX_ISSUE_IDS})",
+                    ErrorCode.VALIDATION,
+                    400,
+                    {"param": "ids"},
+                )
+            return JSONResponse(_issue_list_body(db.get_issues(ids, include=include), fmt))
+        if "limit" not in params and "cursor" not in params:
+            if fmt == "columnar":
+                return JSONResponse(_issue_list_body(_fetch_all_issues(db, include=include), fmt))
+
+            def fetch_page(cursor: str | None) -> tuple[list[IssueDict], str | None]:
+                page, next_cursor = _issue_page(db, cursor, include)
+                return [i.to_dict() for i in page], next_cursor
+
+            return _streaming_json_array(db, fetch_page)
+        limit = _safe_int(params.get("limit", "100"), "limit", min_value=1, max_value=_MAX_PAGINATION_LIMIT)
+        if not isinstance(limit, int):
+            return limit
+        try:
+            page = db.list_issues(limit=limit + 1, cursor=params.get("cursor"), include=include)
+        except ValueError as e:
+            return _error_response(str(e), ErrorCode.VALIDATION, 400)
+        headers: dict[str, str] = {}
+        if len(page) > limit:
+            page = page[:limit]
+            headers["X-Next-Cursor"] = db.issue_list_cursor(page[-1])
+        return JSONResponse(_issue_list_body(page, fmt), headers=headers)
 
     @router.get("/ready")
-    async def api_ready(db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
-        """Issues with no open blockers, sorted by priority."""
-        issues = db.get_ready()
+    @_offload_read
+    async def api_ready(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
+        """Issues with no open blockers, sorted by priority. Accepts ``?include=``."""
+        include = _parse_issue_include(request.query_params)
+        if isinstance(include, JSONResponse):
+            return include
+        issues = db.get_ready(include=include)
         return JSONResponse([i.to_dict() for i in issues])
 
     @router.get("/issue/{issue_id}")
@@ -308,9 +397,16 @@ def create_classic_router() -> APIRouter:
         return JSONResponse(result)
 
     @router.get("/dependencies")
-    async def api_dependencies(db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
-        deps = db.get_all_dependencies()
-        return JSONResponse(deps)
+    @_conditional_get()
+    @_offload_read
+    async def api_dependencies(request: Request, db: FiligreeDB = Depends(_get_db)) -> StreamingResponse:
+        """Every dependency edge as a flat array, streamed in ``(from, to)`` order."""
+
+        def fetch_page(after: tuple[str, str] | None) -> tuple[list[DependencyRecord], tuple[str, str] | None]:
+            page = db.get_dependencies_page(after=after, limit=_DEPENDENCIES_PAGE_SIZE)
+            return page, (page[-1]["from"], page[-1]["to"]) if len(page) == _DEPENDENCIES_PAGE_SIZE else None
+
+        return _streaming_json_array(db, fetch_page)
 
     @router.get("/type/{type_name}")
     async def api_type_template(type_name: str, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
@@ -535,8 +631,9 @@ def create_classic_router() -> APIRouter:
         )
 
     @router.get("/search")
+    @_offload_read
     async def api_search(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
-        """Full-text search across issues."""
+        """Full-text search across issues. Accepts ``?include=``."""
         params = request.query_params
         # Parse without min/max so out-of-range values still clamp (pinned by
         # tests/api/test_api.py::TestBoundaryClamping); we only want to reject
@@ -559,14 +656,18 @@ def create_classic_router() -> APIRouter:
                 ErrorCode.VALIDATION,
                 400,
             )
+        include = _parse_issue_include(params)
+        if isinstance(include, JSONResponse):
+            return include
         q = params.get("q", "")
         if not q.strip():
             return JSONResponse({"results": [], "total": 0})
         total = db.count_search_results(q)
-        page = db.search_issues(q, limit=limit, offset=offset)
+        page = db.search_issues(q, limit=limit, offset=offset, include=include)
         return JSONResponse({"results": [i.to_dict() for i in page], "total": total})
 
     @router.get("/plan/{milestone_id}")
+    @_offload_read
     async def api_plan(milestone_id: str, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """Milestone plan tree."""
         try:
@@ -803,6 +904,11 @@ def create_loom_router() -> APIRouter:
     and ``tests/fixtures/contracts/loom/`` for the response-shape
     pins.
 
+    NOTE: ``/issues``, ``/ready``, ``/blocked`` and ``/search`` are
+    read-only and offloaded to ``_read_executor`` like their classic
+    counterparts; the batch and single-issue write endpoints stay on the
+    event loop thread.
+
     Path conventions: loom uses ``/issues/{issue_id}`` (plural,
     symmetric with the ``/issues`` collection); classic uses
     ``/issue/{issue_id}`` (singular). The two never collide so
@@ -832,41 +938,54 @@ def create_loom_router() -> APIRouter:
     router = APIRouter()
 
     @router.get("/issues")
+    @_offload_read
     async def api_loom_list_issues(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """List issues — ``ListResponse[IssueLoom]`` with real pagination.
 
-        Loom adds ``?limit=&offset=`` (default limit=100). Classic
-        ``GET /api/issues`` returns every row in one shot and stays
-        unchanged. The loom variant overfetches by 1 to detect
-        ``has_more`` without a separate COUNT query.
+        Loom adds ``?limit=&offset=`` (default limit=100) and keyset
+        ``?cursor=``; every page with ``has_more`` carries ``next_cursor``,
+        which stays stable under concurrent inserts and costs the same at
+        any depth. ``?include=`` projects hydrated relations as on classic.
+        Classic ``GET /api/issues`` returns every row in one shot
+        unless ``?limit=`` is given. The loom variant overfetches by 1 to
+        detect ``has_more`` without a separate COUNT query.
         """
         params = request.query_params
         pagination = _parse_pagination(params)
         if isinstance(pagination, JSONResponse):
             return pagination
         limit, offset = pagination
+        include = _parse_issue_include(params)
+        if isinstance(include, JSONResponse):
+            return include
         try:
-            page = db.list_issues(limit=limit + 1, offset=offset)
+            page = db.list_issues(limit=limit + 1, offset=offset, cursor=params.get("cursor"), include=include)
         except ValueError as e:
             return _error_response(str(e), ErrorCode.VALIDATION, 400)
         has_more = len(page) > limit
         if has_more:
             page = page[:limit]
         items = [issue_to_loom(i) for i in page]
-        return JSONResponse(list_response(items, limit=limit, offset=offset, has_more=has_more))
+        next_cursor = db.issue_list_cursor(page[-1]) if has_more else None
+        return JSONResponse(list_response(items, limit=limit, offset=offset, has_more=has_more, next_cursor=next_cursor))
 
     @router.get("/ready")
-    async def api_loom_ready(db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
+    @_offload_read
+    async def api_loom_ready(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """Issues ready to work (no open blockers) — ``ListResponse[IssueLoom]``.
 
         Returns the full result set — ``get_ready()`` is unbounded today
-        and ``has_more`` is always ``false``.
+        and ``has_more`` is always ``false``. Accepts ``?include=``.
         """
-        issues = db.get_ready()
+        include = _parse_issue_include(request.query_params)
+        if isinstance(include, JSONResponse):
+            return include
+        issues = db.get_ready(include=include)
         items = [issue_to_loom(i) for i in issues]
         return JSONResponse(list_response(items, limit=len(items), offset=0, has_more=False))
 
     @router.get("/blocked")
+    @_offload_read
     async def api_loom_blocked(db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """Issues with at least one open blocker — ``ListResponse[BlockedIssueLoom]``.
 
@@ -879,6 +998,7 @@ def create_loom_router() -> APIRouter:
         return JSONResponse(list_response(items, limit=len(items), offset=0, has_more=False))
 
     @router.get("/search")
+    @_offload_read
     async def api_loom_search(
         request: Request,
         db: FiligreeDB = Depends(_get_db),
@@ -908,11 +1028,14 @@ def create_loom_router() -> APIRouter:
                 ErrorCode.VALIDATION,
                 400,
             )
+        include = _parse_issue_include(params)
+        if isinstance(include, JSONResponse):
+            return include
         q = params.get("q", "")
         if not q.strip():
             return JSONResponse(list_response([], limit=limit, offset=offset, has_more=False))
         total = db.count_search_results(q)
-        page = db.search_issues(q, limit=limit, offset=offset)
+        page = db.search_issues(q, limit=limit, offset=offset, include=include)
         items = [issue_to_loom(i) for i in page]
         return JSONResponse(list_response(items, limit=limit, offset=offset, total=total))
 
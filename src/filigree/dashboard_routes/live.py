@@ -0,0 +1,337 @@
+"""Live-update route handlers — change notifications and delta sync.
+
+The dashboard used to refetch every issue, every dependency and the stats
+every 15 seconds in every open tab. ``GET /events/stream`` instead pushes a
+small notification naming what changed, and ``GET /sync`` returns just the
+rows that changed since the client's last version token.
+
+Change detection polls the trigger-maintained ``change_counters``, one
+primary-key scan of a seven-row table (``issues``, ``issue_activity``,
+``dependencies``, ``events``, ``labels``, ``comments``, ``claim_leases``),
+so writes from any process — CLI, MCP servers, other dashboards — are seen
+without an in-process bus. The event log supplies *which* issues changed;
+its AUTOINCREMENT id is the stream cursor and the SSE ``id:`` field, so a
+reconnecting ``EventSource`` resumes where it left off via
+``Last-Event-ID``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from starlette.requests import Request
+
+if TYPE_CHECKING:
+    from fastapi import APIRouter
+    from fastapi.responses import JSONResponse
+
+    from filigree.types.events import EventRecord
+
+from filigree.core import FiligreeDB
+from filigree.dashboard_routes.common import (
+    _MAX_ISSUE_IDS,
+    _columnar_table,
+    _error_response,
+    _offload_read,
+    _parse_response_format,
+    _read_executor,
+    _safe_bounded_int,
+)
+from filigree.types.api import ErrorCode, StatsWithPrefix, SyncResponse
+
+logger = logging.getLogger(__name__)
+
+# Stream timing. Module-level so tests can shrink them.
+_STREAM_POLL_SECONDS = 1.0  # how often the change counters are checked
+_STREAM_DEBOUNCE_SECONDS = 0.5  # settle time that coalesces a burst of writes
+_STREAM_KEEPALIVE_SECONDS = 15.0  # comment frame so proxies keep the socket open
+# The server ends each stream after this long and the browser reconnects
+# with Last-Event-ID. Bounds per-connection state, picks up project-store
+# reloads, and keeps the ethereal idle watchdog fed.
+_STREAM_MAX_SECONDS = 300.0
+_STREAM_RETRY_MS = 2000
+
+# More events than this in one batch → tell the client to resync wholesale.
+_STREAM_BATCH_LIMIT = 200
+
+# More events than this since a client's version → send a full snapshot.
+_SYNC_EVENT_LIMIT = 1000
+
+_DEPENDENCY_EVENTS = frozenset({"dependency_added", "dependency_removed"})
+
+
+def _sse_frame(event: str, data: dict[str, Any], event_id: int) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def _affected_issue_ids(db: FiligreeDB, events: list[EventRecord]) -> tuple[set[str], set[str]]:
+    """Return ``(affected, dependency_sources)`` for a run of events.
+
+    ``affected`` is every issue an event names plus the ones whose rendered
+    state it moves: dependency neighbours (``is_ready``, ``blocks``,
+    ``blocked_by`` follow blocker status through the counter triggers) and
+    parents (``children``). ``dependency_sources`` are the issues whose
+    outgoing dependency edges changed.
+    """
+    touched: set[str] = set()
+    dependency_sources: set[str] = set()
+    for event in events:
+        touched.add(event["issue_id"])
+        if event["event_type"] in _DEPENDENCY_EVENTS:
+            dependency_sources.add(event["issue_id"])
+            # Values are "dep_type:depends_on_id" (legacy: bare id).
+            touched.update(v.rsplit(":", 1)[-1] for v in (event["old_value"], event["new_value"]) if v)
+        elif event["event_type"] == "parent_changed":
+            touched.update(v for v in (event["old_value"], event["new_value"]) if v)
+
+    affected = set(touched)
+    if touched:
+        graph = db.dependency_graph()
+        for issue_id in touched:
+            affected.update(graph.blockers(issue_id))
+            affected.update(graph.dependents(issue_id))
+        affected.update(i.parent_id for i in db.get_issues(touched, include=()) if i.parent_id)
+    return affected, dependency_sources
+
+
+def _change_batch(db: FiligreeDB, after_event_id: int, changed: set[str]) -> tuple[dict[str, Any], int]:
+    """Describe everything that changed after *after_event_id*.
+
+    *changed* names the ``change_counters`` domains that moved. Returns the
+    notification payload and the new cursor. ``issue_ids`` comes from
+    ``_affected_issue_ids``; ``resync`` asks for a full refetch when that
+    set is too large, or when issues or labels changed without any event
+    naming them (label writes never record one).
+    """
+    events = db.get_events_after_id(after_event_id, limit=_STREAM_BATCH_LIMIT + 1)
+    if len(events) > _STREAM_BATCH_LIMIT:
+        latest = db.get_latest_event_id()
+        return {"event_id": latest, "issue_ids": [], "dependencies": True, "resync": True}, latest
+    cursor = events[-1]["id"] if events else after_event_id
+    affected, _ = _affected_issue_ids(db, events)
+    resync = len(affected) > _MAX_ISSUE_IDS or "labels" in changed or (not events and "issues" in changed)
+    payload = {
+        "event_id": cursor,
+        "issue_ids": [] if resync else sorted(affected),
+        "dependencies": "dependencies" in changed,
+        "resync": resync,
+    }
+    return payload, cursor
+
+
+async def _change_stream(request: Request, db: FiligreeDB, after_event_id: int | None) -> AsyncIterator[str]:
+    """Yield SSE frames until the client leaves or ``_STREAM_MAX_SECONDS`` pass.
+
+    Each poll is one counter read on the event loop thread; working out
+    what changed runs on ``_read_executor``. The stream holds a lease on
+    *db* so the project store does not close it mid-stream.
+    """
+    with db.lease():
+        try:
+            counters = db.get_change_counters()
+            latest = db.get_latest_event_id()
+        except sqlite3.Error:
+            logger.debug("change stream: database unavailable", exc_info=True)
+            return
+        cursor = latest if after_event_id is None else min(after_event_id, latest)
+        yield f"retry: {_STREAM_RETRY_MS}\n\n"
+        yield _sse_frame("hello", {"event_id": cursor}, cursor)
+        if cursor < latest:
+            # Resuming after a disconnect: deliver what was missed. Which counters
+            # moved meanwhile is unknown, so assume dependencies did.
+            try:
+                payload, cursor = await _read_executor.run(db, _change_batch, db, cursor, {"dependencies"})
+            except sqlite3.Error:
+                logger.debug("change stream: database unavailable", exc_info=True)
+                return
+            yield _sse_frame("changes", payload, cursor)
+
+        started = last_sent = time.monotonic()
+        while time.monotonic() - started < _STREAM_MAX_SECONDS:
+            await asyncio.sleep(_STREAM_POLL_SECONDS)
+            if await request.is_disconnected():
+                return
+            try:
+                current = db.get_change_counters()
+                if current != counters:
+                    # Let a burst (batch update, plan import) finish before reading.
+                    await asyncio.sleep(_STREAM_DEBOUNCE_SECONDS)
+                    current = db.get_change_counters()
+                    changed = {k for k in current.keys() | counters.keys() if current.get(k) != counters.get(k)}
+                    counters = current
+                    payload, cursor = await _read_executor.run(db, _change_batch, db, cursor, changed)
+                    if payload["issue_ids"] or payload["dependencies"] or payload["resync"]:
+                        yield _sse_frame("changes", payload, cursor)
+                        last_sent = time.monotonic()
+                        continue
+            except sqlite3.Error:
+                # Locked or unreadable database. End the stream; the browser
+                # reconnects and resolves a fresh handle.
+                logger.debug("change stream: database unavailable", exc_info=True)
+                return
+            if time.monotonic() - last_sent >= _STREAM_KEEPALIVE_SECONDS:
+                yield ": keepalive\n\n"
+                last_sent = time.monotonic()
+
+
+# change_counters domains a sync version pins, in token order after the event id.
+_SYNC_COUNTERS = ("issues", "dependencies", "labels")
+
+
+def _version_token(event_id: int, counters: dict[str, int]) -> str:
+    """Opaque sync version: event cursor plus the ``_SYNC_COUNTERS`` values."""
+    return ".".join(str(v) for v in (event_id, *(counters.get(name, 0) for name in _SYNC_COUNTERS)))
+
+
+def _parse_version_token(raw: str) -> tuple[int, ...] | None:
+    parts = raw.split(".")
+    if len(parts) != len(_SYNC_COUNTERS) + 1 or not all(p.isdigit() for p in parts):
+        return None
+    return tuple(int(p) for p in parts)
+
+
+def _full_snapshot(db: FiligreeDB, version: str) -> SyncResponse:
+    from filigree.dashboard_routes.issues import _fetch_all_issues
+
+    return {
+        "version": version,
+        "full": True,
+        "issues": [i.to_dict() for i in _fetch_all_issues(db)],
+        "removed": [],
+        "dependencies": db.get_all_dependencies(),
+        "dependency_sources": [],
+        "stats": StatsWithPrefix(**db.get_stats(), prefix=db.prefix),
+    }
+
+
+def _sync_delta(db: FiligreeDB, since: tuple[int, ...] | None) -> SyncResponse:
+    """Everything that changed after version *since* (``None`` → full snapshot).
+
+    A delta carries the affected issues, tombstones for ids that no longer
+    exist, and the current outgoing edges of every issue whose dependencies
+    changed (replace those wholesale). Falls back to a full snapshot when
+    the token is from another database, too many events have landed, a
+    label changed (label writes record no event), or a counter moved
+    without any event explaining it (imports, repairs).
+    """
+    counters = db.get_change_counters()
+    latest = db.get_latest_event_id()
+    snapshot = _version_token(latest, counters)
+    if since is None:
+        return _full_snapshot(db, snapshot)
+    after_event_id, since_issues, since_deps, since_labels = since
+    cur_issues, cur_deps, cur_labels = (counters.get(name, 0) for name in _SYNC_COUNTERS)
+    if after_event_id > latest or since_issues > cur_issues or since_deps > cur_deps or since_labels != cur_labels:
+        return _full_snapshot(db, snapshot)
+
+    events = db.get_events_after_id(after_event_id, limit=_SYNC_EVENT_LIMIT + 1)
+    if len(events) > _SYNC_EVENT_LIMIT or (not events and (since_issues, since_deps) != (cur_issues, cur_deps)):
+        return _full_snapshot(db, snapshot)
+    affected, dependency_sources = _affected_issue_ids(db, events)
+    if cur_deps != since_deps and not dependency_sources:
+        return _full_snapshot(db, snapshot)
+
+    issues = db.get_issues(sorted(affected))
+    present = {i.id for i in issues}
+    cursor = events[-1]["id"] if events else after_event_id
+    return {
+        "version": _version_token(cursor, counters),
+        "full": False,
+        "issues": [i.to_dict() for i in issues],
+        "removed": sorted(affected - present),
+        "dependencies": db.get_all_dependencies(issue_ids=dependency_sources),
+        "dependency_sources": sorted(dependency_sources),
+        "stats": StatsWithPrefix(**db.get_stats(), prefix=db.prefix),
+    }
+
+
+def _columnar_sync(sync: SyncResponse) -> dict[str, Any]:
+    """``/sync`` body for ``format=columnar``: issues and dependencies as ``ColumnarTable``s."""
+    from filigree.dashboard_routes.issues import _ISSUE_INTERNED_COLUMNS
+
+    return {
+        **sync,
+        "format": "columnar",
+        "issues": _columnar_table(sync["issues"], _ISSUE_INTERNED_COLUMNS),
+        "dependencies": _columnar_table(sync["dependencies"], ("from", "to", "type")),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Router factory
+# ---------------------------------------------------------------------------
+
+
+def create_classic_router() -> APIRouter:
+    """Build the classic-generation APIRouter for live-update endpoints.
+
+    NOTE: ``/sync`` is read-only and runs on a ``_read_executor`` worker
+    (``@_offload_read``) with a pooled ``query_only`` connection, so a full
+    snapshot never blocks the loop or touches the writer connection.
+    ``/events/stream`` reads the counters on the loop and hands the event
+    scan for each change to ``_read_executor``.
+    """
+    from fastapi import APIRouter, Depends
+    from fastapi.responses import JSONResponse, StreamingResponse
+
+    from filigree.dashboard import _get_db
+
+    router = APIRouter()
+
+    @router.get("/sync")
+    @_offload_read
+    async def api_sync(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
+        """Delta sync: what changed since ``?since_version=<token>``.
+
+        Without ``since_version`` returns a full snapshot (all issues, all
+        dependencies, stats). Either way the response carries ``version``
+        to send back next time; ``full`` says whether to replace or merge.
+        ``?format=columnar`` sends ``issues`` and ``dependencies`` as
+        ``ColumnarTable``s (``from``/``to`` interned).
+        """
+        fmt = _parse_response_format(request.query_params)
+        if isinstance(fmt, JSONResponse):
+            return fmt
+        raw = request.query_params.get("since_version")
+        since = None
+        if raw:
+            since = _parse_version_token(raw)
+            if since is None:
+                return _error_response(
+                    f'Invalid value for since_version: "{raw}". Pass back the version from a previous /sync response.',
+                    ErrorCode.VALIDATION,
+                    400,
+                    {"param": "since_version", "value": raw},
+                )
+        sync = _sync_delta(db, since)
+        return JSONResponse(_columnar_sync(sync) if fmt == "columnar" else sync)
+
+    @router.get("/events/stream", response_model=None)
+    async def api_event_stream(request: Request, db: FiligreeDB = Depends(_get_db)) -> StreamingResponse | JSONResponse:
+        """Server-sent change notifications (``text/event-stream``).
+
+        Emits ``hello`` with the current cursor, then a ``changes`` event
+        (``{"event_id", "issue_ids", "dependencies", "resync"}``) whenever
+        writes land, coalesced over ``_STREAM_DEBOUNCE_SECONDS``. Resumes
+        after ``Last-Event-ID`` (or ``?after=<event id>``) when given.
+        """
+        raw_after = request.headers.get("last-event-id") or request.query_params.get("after")
+        after_event_id: int | None = None
+        if raw_after:
+            after_or_err = _safe_bounded_int(raw_after, name="after", min_value=0, max_value=9223372036854775807)
+            if not isinstance(after_or_err, int):
+                return after_or_err
+            after_event_id = after_or_err
+        return StreamingResponse(
+            _change_stream(request, db, after_event_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return router
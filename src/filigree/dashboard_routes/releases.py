@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 from starlette.requests import Request
 
 from filigree.core import FiligreeDB
-from filigree.dashboard_routes.common import _error_response, _get_bool_param
+from filigree.dashboard_routes.common import _conditional_get, _error_response, _get_bool_param, _offload_read
 from filigree.db_planning import NotAReleaseError
 from filigree.types.api import ErrorCode
 
@@ -105,9 +105,12 @@ def _semver_sort_key(release: ReleaseSummaryItem) -> _SemverSortKey:
 def create_classic_router() -> APIRouter:
     """Build the classic-generation APIRouter for release endpoints.
 
-    NOTE: All handlers are intentionally async despite doing synchronous
-    SQLite I/O. This serializes DB access on the event loop thread,
-    avoiding concurrent multi-thread access to the shared DB connection.
+    NOTE: Both handlers are read-only and wrapped in ``@_offload_read``, so
+    their synchronous SQLite I/O runs on a ``_read_executor`` worker thread
+    rather than the event loop. The worker binds a pooled ``query_only``
+    connection for the call, so the shared writer connection is never used
+    off the loop. Without a read pool (in-memory databases) they run on the
+    loop.
 
     Classic routes live at their existing unprefixed paths. See ADR-002
     for the generation naming and lifecycle rules.
@@ -120,6 +123,8 @@ def create_classic_router() -> APIRouter:
     router = APIRouter()
 
     @router.get("/releases")
+    @_conditional_get()
+    @_offload_read
     async def api_releases(request: Request, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """List releases with progress rollups."""
         include_released = _get_bool_param(request.query_params, "include_released", False)
@@ -143,6 +148,7 @@ def create_classic_router() -> APIRouter:
         return JSONResponse({"releases": releases})
 
     @router.get("/release/{release_id}/tree")
+    @_offload_read
     async def api_release_tree(release_id: str, db: FiligreeDB = Depends(_get_db)) -> JSONResponse:
         """Release hierarchy tree with progress rollups."""
         try:
@@ -14,6 +14,10 @@ from filigree.types.core import AssocType, ISOTimestamp, ScanRunStatus, StatusCa
 from filigree.types.events import EventType
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from filigree.dep_graph import DependencyGraph
+    from filigree.leases import LeaseBuffer
     from filigree.templates import TemplateRegistry, TransitionOption
     from filigree.types.api import BatchFailure
     from filigree.types.core import ObservationDict, ObservationLinkDict, ScanFindingDict
@@ -156,6 +160,8 @@ class DBMixinProtocol(Protocol):
     _conn: sqlite3.Connection | None
     _template_registry: TemplateRegistry | None
     _enabled_packs_override: list[str] | None
+    _dep_graphs: dict[int, tuple[sqlite3.Connection, int, DependencyGraph]]
+    _lease_buffer: LeaseBuffer | None
 
     @property
     def conn(self) -> sqlite3.Connection: ...
@@ -164,6 +170,7 @@ class DBMixinProtocol(Protocol):
 
     def get_issue(self, issue_id: str) -> Issue: ...
     def _check_id_prefix(self, issue_id: str) -> None: ...
+    def flush_heartbeats(self) -> int: ...
 
     # -- WorkflowMixin -------------------------------------------------------
 
@@ -179,12 +186,12 @@ class DBMixinProtocol(Protocol):
         self,
         category: str,
         *,
-        type_col: str,
-        status_col: str,
+        alias: str = "",
         include_archived: bool = False,
     ) -> tuple[str, list[str]]: ...
     def _blocker_done_states(self) -> list[str]: ...
     def _resolve_status_category(self, issue_type: str, status: str) -> StatusCategory: ...
+    def _sync_status_categories(self) -> bool: ...
     def get_valid_transitions(self, issue_id: str) -> list[TransitionOption]: ...
 
     @staticmethod
@@ -206,7 +213,8 @@ class DBMixinProtocol(Protocol):
     # -- IssuesMixin ---------------------------------------------------------
 
     def _generate_unique_id(self, table: str, infix: str = "") -> str: ...
-    def _build_issues_batch(self, issue_ids: list[str]) -> list[Issue]: ...
+    def _build_issues_batch(self, issue_ids: list[str], *, include: Collection[str] | None = None) -> list[Issue]: ...
+    def _lease_columns(self, row: sqlite3.Row) -> tuple[ISOTimestamp | None, ISOTimestamp | None]: ...
     def _would_create_parent_cycle(self, child_id: str, proposed_parent_id: str) -> bool: ...
 
     def create_issue(
@@ -257,8 +265,12 @@ class DBMixinProtocol(Protocol):
         direction: str = "asc",
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
+        include: Collection[str] | None = None,
     ) -> list[Issue]: ...
 
+    def issue_list_cursor(self, issue: Issue, *, sort_by: str = "priority", direction: str = "asc") -> str: ...
+
     # -- MetaMixin -----------------------------------------------------------
 
     def add_label(
@@ -273,11 +285,14 @@ class DBMixinProtocol(Protocol):
 
     # -- PlanningMixin -------------------------------------------------------
 
-    def get_ready(self) -> list[Issue]: ...
+    def get_ready(self, *, include: Collection[str] | None = None, limit: int | None = None) -> list[Issue]: ...
     def label_subtree(self, parent_id: str, *, label: str) -> tuple[list[dict[str, str]], list[BatchFailure]]: ...
-    def _resolve_open_blocker_predicates(
-        self,
-    ) -> tuple[tuple[str, list[str]], tuple[str, list[str]]] | None: ...
+    def _recount_open_blockers(self) -> int: ...
+    def dependency_graph(self) -> DependencyGraph: ...
+    def _would_create_cycle(self, issue_id: str, depends_on_id: str) -> bool: ...
+    def _dep_graph_add_edge(self, issue_id: str, depends_on_id: str, dep_type: str = "blocks") -> None: ...
+    def _dep_graph_remove_edge(self, issue_id: str, depends_on_id: str) -> None: ...
+    def _invalidate_dep_graph(self) -> None: ...
 
     # -- FilesMixin ----------------------------------------------------------
 
@@ -125,8 +125,9 @@ class EventsMixin(DBMixinProtocol):
         ``exclude_types`` filters out specific event types from the result
         (e.g. ``["heartbeat"]``); takes precedence over an inclusive
         ``event_type`` filter only when no overlap exists. The catch-up MCP
-        path defaults to excluding ``heartbeat`` so liveness pings don't
-        dominate session-resumption feeds (filigree-cb980eee0d, P2.11).
+        path defaults to excluding ``heartbeat`` (filigree-cb980eee0d,
+        P2.11); those events are historical, as ``heartbeat_work`` no
+        longer records them.
         """
         if after_event_id is None:
             clauses = ["e.created_at > ?"]
@@ -162,6 +163,24 @@ class EventsMixin(DBMixinProtocol):
         ).fetchall()
         return [self._build_event_record_with_title(r) for r in rows]
 
+    def get_events_after_id(self, after_event_id: int, *, limit: int = 100) -> list[EventRecord]:
+        """Get events with ``id > after_event_id`` in insertion order.
+
+        Event ids come from AUTOINCREMENT, so unlike ``created_at`` they never
+        go backwards; change-notification consumers use the last id they saw
+        as their cursor. Pair with ``get_latest_event_id()`` to start at "now".
+        """
+        rows = self.conn.execute(
+            "SELECT * FROM events WHERE id > ? ORDER BY id ASC LIMIT ?",
+            (after_event_id, limit),
+        ).fetchall()
+        return [self._build_event_record(r) for r in rows]
+
+    def get_latest_event_id(self) -> int:
+        """Return the highest event id recorded so far (0 for an empty log)."""
+        row = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()
+        return int(row[0])
+
     def get_issue_events(self, issue_id: str, *, limit: int = 50, offset: int = 0) -> list[EventRecord]:
         """Get events for a specific issue, newest first."""
         self.get_issue(issue_id)  # raises KeyError if not found
@@ -314,6 +333,7 @@ class EventsMixin(DBMixinProtocol):
                         "DELETE FROM dependencies WHERE issue_id = ? AND depends_on_id = ?",
                         (issue_id, dep_target),
                     )
+                    self._dep_graph_remove_edge(issue_id, dep_target)
 
                 case "dependency_removed":
                     # Event: issue_id=from_id, old_value="dep_type:depends_on_id" or legacy "depends_on_id"
@@ -325,29 +345,13 @@ class EventsMixin(DBMixinProtocol):
                         dep_type, dep_target = old_val.rsplit(":", 1)
                     else:
                         dep_type, dep_target = "blocks", old_val
-                    # Check for cycles before re-inserting (inline DFS
-                    # to avoid cross-mixin call that mypy can't resolve)
-                    adj: dict[str, list[str]] = {}
-                    for dep_row in self.conn.execute("SELECT issue_id, depends_on_id FROM dependencies").fetchall():
-                        adj.setdefault(dep_row["issue_id"], []).append(dep_row["depends_on_id"])
-                    visited: set[str] = set()
-                    queue = [dep_target]
-                    would_cycle = False
-                    while queue:
-                        cur = queue.pop()
-                        if cur == issue_id:
-                            would_cycle = True
-                            break
-                        if cur in visited:
-                            continue
-                        visited.add(cur)
-                        queue.extend(adj.get(cur, ()))
-                    if would_cycle:
+                    if self._would_create_cycle(issue_id, dep_target):
                         return {"undone": False, "reason": "Cannot undo: restoring dependency would create a cycle"}
                     self.conn.execute(
                         "INSERT OR IGNORE INTO dependencies (issue_id, depends_on_id, type, created_at) VALUES (?, ?, ?, ?)",
                         (issue_id, dep_target, dep_type, now),
                     )
+                    self._dep_graph_add_edge(issue_id, dep_target, dep_type)
 
                 case "description_changed":
                     self.conn.execute(
@@ -422,6 +426,7 @@ class EventsMixin(DBMixinProtocol):
             self.conn.commit()
         except Exception:
             self.conn.rollback()
+            self._invalidate_dep_graph()
             raise
         finally:
             # Release the write lock on any early-return path that left the
@@ -460,14 +465,12 @@ class EventsMixin(DBMixinProtocol):
         cutoff_dt = datetime.now(UTC) - timedelta(days=days_old)
         cutoff = cutoff_dt.isoformat()
 
-        # Match (type, status) pairs so a state name shared across types in
-        # different categories is classified per type (filigree-b55aa3191f).
-        # Archive_closed selects done-category rows only — not the synthetic
-        # 'archived' status, which would re-archive already-archived rows.
-        done_sql, done_params = self._category_predicate_sql("done", type_col="type", status_col="status")
-        if not done_params:
-            # No done-category states registered; nothing to archive.
-            return []
+        # status_category is resolved per (type, status), so a state name
+        # shared across types in different categories is classified per type
+        # (filigree-b55aa3191f). Archive_closed selects done-category rows
+        # only — not the synthetic 'archived' status, which would re-archive
+        # already-archived rows.
+        done_sql, done_params = self._category_predicate_sql("done")
         clauses = [f"({done_sql})", "closed_at < ?", "closed_at IS NOT NULL"]
         params: list[object] = [*done_params, cutoff]
         if normalized_label is not None:
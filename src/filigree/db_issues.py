@@ -7,6 +7,8 @@ Python's MRO when composed into ``FiligreeDB``.
 
 from __future__ import annotations
 
+import base64
+import binascii
 import contextlib
 import json
 import logging
@@ -17,13 +19,14 @@ from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 
 from filigree.db_base import AGE_BUCKETS, DBMixinProtocol, _escape_like, _escape_like_chars, _now_iso, _safe_json_loads
+from filigree.leases import CLAIM_REAPER_ACTOR, DEFAULT_REAP_BATCH_SIZE, DEFAULT_REAP_GRACE_SECONDS, LEASE_UPSERT_SQL, PendingLease
 from filigree.models import Issue
 from filigree.templates import TransitionResult, validate_field_pattern
-from filigree.types.api import BatchFailure, ErrorCode, classify_value_error
-from filigree.types.core import StatusCategory
+from filigree.types.api import ISSUE_INCLUDE_VALUES, BatchFailure, ErrorCode, classify_value_error
+from filigree.types.core import ISOTimestamp, StatusCategory
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Collection
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +82,12 @@ def _claim_expiry(now: str, lease_hours: int = DEFAULT_CLAIM_LEASE_HOURS) -> str
     return (datetime.fromisoformat(str(now)) + timedelta(hours=lease_hours)).isoformat()
 
 
+# Heartbeats live in ``claim_leases`` (see ``leases``); readers of the lease
+# columns join it against ``issues i`` and resolve via ``_lease_columns``.
+_LEASE_JOIN_SQL = "LEFT JOIN claim_leases l ON l.issue_id = i.id"
+_LEASE_COLUMNS_SQL = "l.last_heartbeat_at AS lease_heartbeat_at, l.claim_expires_at AS lease_expires_at"
+
+
 def _parse_issue_timestamp(raw: object) -> datetime | None:
     if not isinstance(raw, str) or not raw.strip():
         return None
@@ -100,21 +109,94 @@ def _validate_lease_hours(value: int, *, name: str = "lease_hours") -> None:
         raise ValueError(msg)
 
 
-def _list_issue_order_by(sort_by: str, direction: str) -> str:
+def _resolve_issue_include(include: Collection[str] | None) -> frozenset[str]:
+    """Validate an ``include`` projection; ``None`` means every relation."""
+    if include is None:
+        return ISSUE_INCLUDE_VALUES
+    if isinstance(include, str):
+        raise ValueError(f"include must be a collection of relation names, got {include!r}")
+    names = frozenset(include)
+    unknown = names - ISSUE_INCLUDE_VALUES
+    if unknown:
+        raise ValueError(f"include must be drawn from: {', '.join(sorted(ISSUE_INCLUDE_VALUES))}; got {', '.join(sorted(unknown))}")
+    return names
+
+
+def _list_issue_sort_keys(sort_by: str, direction: str) -> list[tuple[str, bool]]:
+    """Return the ``list_issues`` sort key as ``[(column, descending), ...]``.
+
+    The requested column comes first, then the fixed tie-breakers
+    (priority, created_at, id — always ascending). The trailing ``id``
+    makes the key unique, which keyset cursors rely on.
+    """
     if not isinstance(sort_by, str) or sort_by not in _LIST_ISSUE_SORT_COLUMNS:
         valid = ", ".join(sorted(_LIST_ISSUE_SORT_COLUMNS))
         raise ValueError(f"sort_by must be one of: {valid}")
     if not isinstance(direction, str) or direction.lower() not in {"asc", "desc"}:
         raise ValueError("direction must be 'asc' or 'desc'")
 
-    order_direction = direction.upper()
-    order_by = [f"{_LIST_ISSUE_SORT_COLUMNS[sort_by]} {order_direction}"]
+    keys = [(_LIST_ISSUE_SORT_COLUMNS[sort_by], direction.lower() == "desc")]
     if sort_by != "priority":
-        order_by.append("i.priority ASC")
+        keys.append(("i.priority", False))
     if sort_by != "created_at":
-        order_by.append("i.created_at ASC")
-    order_by.append("i.id ASC")
-    return ", ".join(order_by)
+        keys.append(("i.created_at", False))
+    keys.append(("i.id", False))
+    return keys
+
+
+def _list_issue_order_by(sort_by: str, direction: str) -> str:
+    return ", ".join(f"{col} {'DESC' if desc else 'ASC'}" for col, desc in _list_issue_sort_keys(sort_by, direction))
+
+
+def _encode_list_cursor(values: list[Any], sort_by: str, direction: str) -> str:
+    payload = json.dumps({"s": sort_by, "d": direction.lower(), "k": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_list_cursor(cursor: str, sort_by: str, direction: str) -> list[Any]:
+    """Decode a ``list_issues`` cursor, checking it matches the requested order.
+
+    Raises ValueError for anything that is not a cursor this module issued
+    for the same ``sort_by`` / ``direction``.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+    if not isinstance(payload, dict) or not isinstance(payload.get("k"), list):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    if payload.get("s") != sort_by or payload.get("d") != direction.lower():
+        msg = f"Cursor was issued for sort_by={payload.get('s')!r} direction={payload.get('d')!r}; pass the same sort order to resume"
+        raise ValueError(msg)
+    values: list[Any] = payload["k"]
+    keys = _list_issue_sort_keys(sort_by, direction)
+    if len(values) != len(keys) or not all(
+        isinstance(v, int) and not isinstance(v, bool) if col == "i.priority" else isinstance(v, str)
+        for (col, _desc), v in zip(keys, values, strict=True)
+    ):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return values
+
+
+def _keyset_predicate(keys: list[tuple[str, bool]], values: list[Any]) -> tuple[str, list[Any]]:
+    """SQL matching rows strictly after *values* in the order given by *keys*.
+
+    Expands the row comparison into ``(a > ?) OR (a = ? AND b > ?) OR ...``
+    so mixed ASC/DESC columns work, and prefixes an inclusive bound on the
+    leading column so SQLite can seek the matching keyset index instead of
+    scanning from the start.
+    """
+    lead_col, lead_desc = keys[0]
+    params: list[Any] = [values[0]]
+    branches: list[str] = []
+    for n, (col, desc) in enumerate(keys):
+        terms = [f"{prev} = ?" for prev, _ in keys[:n]]
+        terms.append(f"{col} {'<' if desc else '>'} ?")
+        branches.append("(" + " AND ".join(terms) + ")")
+        params.extend(values[: n + 1])
+    sql = f"{lead_col} {'<=' if lead_desc else '>='} ? AND (" + " OR ".join(branches) + ")"
+    return sql, params
 
 
 def _resolve_virtual_label(
@@ -130,8 +212,7 @@ def _resolve_virtual_label(
     ``blocker_done_predicate`` is a ``(sql, params)`` fragment that
     matches a "done" blocker row aliased ``blocker`` (for ``has:blockers``).
     Build it at the call site via ``_category_predicate_sql("done",
-    type_col="blocker.type", status_col="blocker.status",
-    include_archived=True)``. When ``None``, falls back to a safe
+    alias="blocker", include_archived=True)``. When ``None``, falls back to a safe
     name-only predicate using ``blocker.status IN ('closed', 'archived')``;
     the typed form is preferred so state-name collisions across types
     (filigree-b55aa3191f) do not erroneously treat a wip blocker as done.
@@ -514,6 +595,8 @@ class IssuesMixin(DBMixinProtocol):
         except Exception:
             self.conn.rollback()
             raise
+        for dep_id in deps or ():
+            self._dep_graph_add_edge(issue_id, dep_id)
 
         return self.get_issue(issue_id)
 
@@ -523,6 +606,15 @@ class IssuesMixin(DBMixinProtocol):
         # close_issue, reopen_issue, claim_issue.
         return self._build_issue(issue_id)
 
+    def get_issues(self, issue_ids: Collection[str], *, include: Collection[str] | None = None) -> list[Issue]:
+        """Batch ``get_issue``: the issues among *issue_ids* that exist, in input order.
+
+        Unknown ids are skipped rather than raising, so callers refreshing a
+        cached set can treat a missing id as deleted. Duplicates collapse.
+        *include* projects relations as in ``list_issues``.
+        """
+        return self._build_issues_batch(list(dict.fromkeys(issue_ids)), include=include)
+
     def _build_issue(self, issue_id: str) -> Issue:
         """Build a single Issue with all computed fields. Internal — caller must validate existence."""
         issues = self._build_issues_batch([issue_id])
@@ -531,30 +623,60 @@ class IssuesMixin(DBMixinProtocol):
             raise KeyError(msg)
         return issues[0]
 
-    def _build_issues_batch(self, issue_ids: list[str]) -> list[Issue]:
-        """Build multiple Issues efficiently with batched queries (eliminates N+1)."""
+    def _lease_columns(self, row: sqlite3.Row) -> tuple[ISOTimestamp | None, ISOTimestamp | None]:
+        """Effective ``(last_heartbeat_at, claim_expires_at)`` of an issue row.
+
+        *row* carries the issue's own columns plus ``_LEASE_COLUMNS_SQL``.
+        A ``claim_leases`` row overrides the issue's columns, and a buffered
+        heartbeat from the current holder overrides both.
+        """
+        heartbeat, expires = row["last_heartbeat_at"], row["claim_expires_at"]
+        if row["lease_heartbeat_at"] is not None:
+            heartbeat, expires = row["lease_heartbeat_at"], row["lease_expires_at"]
+        buffer = self._lease_buffer
+        pending = buffer.get(row["id"]) if buffer is not None else None
+        if pending is not None and pending.assignee == (row["assignee"] or "") and pending.last_heartbeat_at >= (heartbeat or ""):
+            heartbeat, expires = pending.last_heartbeat_at, pending.claim_expires_at
+        return heartbeat, expires
+
+    def _build_issues_batch(self, issue_ids: list[str], *, include: Collection[str] | None = None) -> list[Issue]:
+        """Build multiple Issues efficiently with batched queries (eliminates N+1).
+
+        *include* projects the relations to hydrate — any of ``labels``,
+        ``deps`` (``blocks`` + ``blocked_by``), ``children`` and ``fields``;
+        ``None`` hydrates all of them. Unrequested relations skip their
+        query (or JSON parse) and come back empty.
+        """
         if not issue_ids:
             return []
+        wanted = _resolve_issue_include(include)
 
         placeholders = ",".join("?" * len(issue_ids))
 
-        # 1. Fetch all issue rows
+        # 1. Fetch all issue rows, with any heartbeat lease
         rows_by_id: dict[str, sqlite3.Row] = {}
-        for r in self.conn.execute(f"SELECT * FROM issues WHERE id IN ({placeholders})", issue_ids).fetchall():
+        for r in self.conn.execute(
+            f"SELECT i.*, {_LEASE_COLUMNS_SQL} FROM issues i {_LEASE_JOIN_SQL} WHERE i.id IN ({placeholders})",
+            issue_ids,
+        ).fetchall():
             rows_by_id[r["id"]] = r
 
         # 2. Batch fetch labels
         labels_by_id: dict[str, list[str]] = {iid: [] for iid in issue_ids}
-        for r in self.conn.execute(f"SELECT issue_id, label FROM labels WHERE issue_id IN ({placeholders})", issue_ids).fetchall():
-            labels_by_id[r["issue_id"]].append(r["label"])
+        if "labels" in wanted:
+            for r in self.conn.execute(f"SELECT issue_id, label FROM labels WHERE issue_id IN ({placeholders})", issue_ids).fetchall():
+                labels_by_id[r["issue_id"]].append(r["label"])
 
-        # 3. Batch fetch "blocks" — issues blocked BY these IDs (where depends_on_id = this issue)
+        # 3. Batch fetch "blocks" — issues blocked BY these IDs (where depends_on_id = this issue).
+        # The trigger-maintained blocks_open_count can't prune this one: blocks
+        # lists every dependent, done or not.
         blocks_by_id: dict[str, list[str]] = {iid: [] for iid in issue_ids}
-        for r in self.conn.execute(
-            f"SELECT depends_on_id, issue_id FROM dependencies WHERE depends_on_id IN ({placeholders})",
-            issue_ids,
-        ).fetchall():
-            blocks_by_id[r["depends_on_id"]].append(r["issue_id"])
+        if "deps" in wanted:
+            for r in self.conn.execute(
+                f"SELECT depends_on_id, issue_id FROM dependencies WHERE depends_on_id IN ({placeholders})",
+                issue_ids,
+            ).fetchall():
+                blocks_by_id[r["depends_on_id"]].append(r["issue_id"])
 
         # 4. Batch fetch "blocked_by" — only open (non-done, non-archived) blockers.
         # Archived blockers must not appear here (filigree-42045dd065): archive_closed
@@ -562,36 +684,26 @@ class IssuesMixin(DBMixinProtocol):
         # filigree-b55aa3191f: match by (blocker.type, blocker.status) so a state
         # name shared across types in different categories (e.g.
         # incident.resolved=wip, debt_item.resolved=done) is classified per type.
-        blocker_done_sql, blocker_done_params = self._category_predicate_sql(
-            "done",
-            type_col="blocker.type",
-            status_col="blocker.status",
-            include_archived=True,
-        )
+        # The trigger-maintained open_blocker_count already says which rows have
+        # any open blocker, so only those need the join.
         blocked_by_id: dict[str, list[str]] = {iid: [] for iid in issue_ids}
-        for r in self.conn.execute(
-            f"SELECT d.issue_id, d.depends_on_id FROM dependencies d "
-            f"JOIN issues blocker ON d.depends_on_id = blocker.id "
-            f"WHERE d.issue_id IN ({placeholders}) AND NOT ({blocker_done_sql})",
-            [*issue_ids, *blocker_done_params],
-        ).fetchall():
-            blocked_by_id[r["issue_id"]].append(r["depends_on_id"])
+        blocked_ids = [iid for iid, row in rows_by_id.items() if row["open_blocker_count"] > 0] if "deps" in wanted else []
+        if blocked_ids:
+            blocker_done_sql, blocker_done_params = self._category_predicate_sql("done", alias="blocker", include_archived=True)
+            blocked_placeholders = ",".join("?" * len(blocked_ids))
+            for r in self.conn.execute(
+                f"SELECT d.issue_id, d.depends_on_id FROM dependencies d "
+                f"JOIN issues blocker ON d.depends_on_id = blocker.id "
+                f"WHERE d.issue_id IN ({blocked_placeholders}) AND NOT ({blocker_done_sql})",
+                [*blocked_ids, *blocker_done_params],
+            ).fetchall():
+                blocked_by_id[r["issue_id"]].append(r["depends_on_id"])
 
         # 5. Batch fetch children
         children_by_id: dict[str, list[str]] = {iid: [] for iid in issue_ids}
-        for r in self.conn.execute(f"SELECT id, parent_id FROM issues WHERE parent_id IN ({placeholders})", issue_ids).fetchall():
-            children_by_id[r["parent_id"]].append(r["id"])
-
-        # 6. Batch compute open blocker counts — same blocker semantics as step 4.
-        open_blockers_by_id: dict[str, int] = dict.fromkeys(issue_ids, 0)
-        for r in self.conn.execute(
-            f"SELECT d.issue_id, COUNT(*) as cnt FROM dependencies d "
-            f"JOIN issues blocker ON d.depends_on_id = blocker.id "
-            f"WHERE d.issue_id IN ({placeholders}) AND NOT ({blocker_done_sql}) "
-            f"GROUP BY d.issue_id",
-            [*issue_ids, *blocker_done_params],
-        ).fetchall():
-            open_blockers_by_id[r["issue_id"]] = r["cnt"]
+        if "children" in wanted:
+            for r in self.conn.execute(f"SELECT id, parent_id FROM issues WHERE parent_id IN ({placeholders})", issue_ids).fetchall():
+                children_by_id[r["parent_id"]].append(r["id"])
 
         # Build Issue objects preserving input order
         result: list[Issue] = []
@@ -599,6 +711,11 @@ class IssuesMixin(DBMixinProtocol):
             row = rows_by_id.get(iid)
             if row is None:
                 continue
+            # Resolved against the live registry rather than the stored
+            # status_category column, so types registered in-process without
+            # a status_categories re-sync still hydrate correctly.
+            category = self._resolve_status_category(row["type"], row["status"])
+            last_heartbeat_at, claim_expires_at = self._lease_columns(row)
             result.append(
                 Issue(
                     id=row["id"],
@@ -609,14 +726,14 @@ class IssuesMixin(DBMixinProtocol):
                     parent_id=row["parent_id"],
                     assignee=row["assignee"],
                     claimed_at=row["claimed_at"],
-                    last_heartbeat_at=row["last_heartbeat_at"],
-                    claim_expires_at=row["claim_expires_at"],
+                    last_heartbeat_at=last_heartbeat_at,
+                    claim_expires_at=claim_expires_at,
                     created_at=row["created_at"],
                     updated_at=row["updated_at"],
                     closed_at=row["closed_at"],
                     description=row["description"],
                     notes=row["notes"],
-                    fields=_safe_fields_json(row["fields"], iid),
+                    fields=_safe_fields_json(row["fields"], iid) if "fields" in wanted else {},
                     labels=labels_by_id.get(iid, []),
                     blocks=blocks_by_id.get(iid, []),
                     blocked_by=blocked_by_id.get(iid, []),
@@ -625,12 +742,10 @@ class IssuesMixin(DBMixinProtocol):
                         # rather than via a deduplicated open-state name set, so a
                         # state name shared across types in different categories
                         # is classified correctly.
-                        self._resolve_status_category(row["type"], row["status"]) == "open"
-                        and open_blockers_by_id.get(iid, 0) == 0
-                        and not (row["assignee"] or "")
+                        category == "open" and row["open_blocker_count"] == 0 and not (row["assignee"] or "")
                     ),
                     children=children_by_id.get(iid, []),
-                    status_category=self._resolve_status_category(row["type"], row["status"]),
+                    status_category=category,
                 )
             )
         return result
@@ -1301,7 +1416,13 @@ class IssuesMixin(DBMixinProtocol):
         expected_assignee: str | None = None,
         lease_hours: int = DEFAULT_CLAIM_LEASE_HOURS,
     ) -> Issue:
-        """Refresh liveness metadata for a claimed, non-done issue."""
+        """Refresh liveness metadata for a claimed, non-done issue.
+
+        The heartbeat is written to ``claim_leases``, not the issue row: it
+        records no event and leaves ``updated_at`` alone. With a heartbeat
+        buffer enabled (``enable_heartbeat_buffer``) it is only queued, and
+        the returned issue reflects it immediately.
+        """
         _validate_lease_hours(lease_hours)
         self._check_id_prefix(issue_id)
         row = self.conn.execute("SELECT type, status, assignee FROM issues WHERE id = ?", (issue_id,)).fetchone()
@@ -1326,27 +1447,22 @@ class IssuesMixin(DBMixinProtocol):
             raise ValueError(msg)
 
         now = _now_iso()
-        claim_expires_at = _claim_expiry(now, lease_hours)
+        lease = PendingLease(assignee=observed, last_heartbeat_at=now, claim_expires_at=ISOTimestamp(_claim_expiry(now, lease_hours)))
+        if self._lease_buffer is not None:
+            self._lease_buffer.put(issue_id, lease)
+            return self.get_issue(issue_id)
         try:
-            cursor = self.conn.execute(
-                "UPDATE issues SET last_heartbeat_at = ?, claim_expires_at = ?, updated_at = ? WHERE id = ? AND assignee = ?",
-                (now, claim_expires_at, now, issue_id, observed),
-            )
+            cursor = self.conn.execute(LEASE_UPSERT_SQL, lease.upsert_params(issue_id))
             if cursor.rowcount == 0:
                 current = self.conn.execute("SELECT assignee FROM issues WHERE id = ?", (issue_id,)).fetchone()
                 if current is None:
                     msg = f"Issue not found: {issue_id}"
                     raise KeyError(msg)
                 new_assignee = current["assignee"] or ""
-                msg = f"Cannot heartbeat {issue_id}: reassigned to '{new_assignee}' (expected '{observed}')"
-                raise ValueError(msg)
-            self._record_event(
-                issue_id,
-                "heartbeat",
-                actor=actor,
-                old_value=observed,
-                new_value=claim_expires_at,
-            )
+                if new_assignee != observed:
+                    msg = f"Cannot heartbeat {issue_id}: reassigned to '{new_assignee}' (expected '{observed}')"
+                    raise ValueError(msg)
+                # Otherwise a newer lease already stands; keep it.
             self.conn.commit()
         except Exception:
             self.conn.rollback()
@@ -1367,10 +1483,11 @@ class IssuesMixin(DBMixinProtocol):
         cutoff = now - timedelta(hours=stale_after_hours)
         expiry_cutoff = now + timedelta(hours=expires_within_hours) if expires_within_hours is not None else None
 
-        pred_sql, pred_params = self._category_predicate_sql("done", type_col="i.type", status_col="i.status")
+        pred_sql, pred_params = self._category_predicate_sql("done", alias="i")
         rows = self.conn.execute(
-            "SELECT i.id, i.claim_expires_at, i.last_heartbeat_at, i.claimed_at, i.updated_at "
-            "FROM issues i "
+            "SELECT i.id, i.assignee, i.claim_expires_at, i.last_heartbeat_at, i.claimed_at, i.updated_at, "
+            f"{_LEASE_COLUMNS_SQL} "
+            f"FROM issues i {_LEASE_JOIN_SQL} "
             "WHERE COALESCE(i.assignee, '') != '' "
             f"AND NOT ({pred_sql}) "
             "ORDER BY i.priority ASC, i.created_at ASC, i.id ASC",
@@ -1379,14 +1496,15 @@ class IssuesMixin(DBMixinProtocol):
 
         stale_ids: list[str] = []
         for row in rows:
-            expires_at = _parse_issue_timestamp(row["claim_expires_at"])
+            last_heartbeat_at, claim_expires_at = self._lease_columns(row)
+            expires_at = _parse_issue_timestamp(claim_expires_at)
             if expires_at is not None:
                 if expires_at <= now or (expiry_cutoff is not None and expires_at <= expiry_cutoff):
                     stale_ids.append(row["id"])
                 continue
 
             basis = (
-                _parse_issue_timestamp(row["last_heartbeat_at"])
+                _parse_issue_timestamp(last_heartbeat_at)
                 or _parse_issue_timestamp(row["claimed_at"])
                 or _parse_issue_timestamp(row["updated_at"])
             )
@@ -1395,6 +1513,93 @@ class IssuesMixin(DBMixinProtocol):
 
         return self._build_issues_batch(stale_ids)
 
+    def reap_expired_claims(
+        self,
+        *,
+        actor: str = CLAIM_REAPER_ACTOR,
+        limit: int = DEFAULT_REAP_BATCH_SIZE,
+        revert_status: bool = True,
+        grace_seconds: float = DEFAULT_REAP_GRACE_SECONDS,
+    ) -> list[Issue]:
+        """Release up to *limit* claims whose lease has expired, in one transaction.
+
+        A claim is due when its effective ``claim_expires_at`` (the
+        ``claim_leases`` row when present, else the issue's own column) is
+        more than *grace_seconds* in the past; candidates come from range
+        scans of ``idx_issues_claim_expires_at`` and ``claim_leases``, oldest
+        expiry first. This handle's buffered heartbeats are flushed first and
+        the scan runs under the write lock, so a claim heartbeated in the
+        meantime is never released. The grace covers heartbeats still
+        buffered by other processes, which land up to one flush window
+        late. Each release clears the claim columns and records a
+        ``released`` event by *actor*, which puts the issue back in front
+        of ``get_ready`` and ``claim_next``. As in ``release_claim``,
+        wip-category issues then revert to their open predecessor unless
+        *revert_status* is false.
+
+        Claims without an expiry (rows predating leases) are not touched;
+        ``get_stale_claims`` still reports them.
+        """
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+            msg = f"limit must be a positive integer, got {limit!r}"
+            raise ValueError(msg)
+        if isinstance(grace_seconds, bool) or not isinstance(grace_seconds, (int, float)) or not grace_seconds >= 0:
+            msg = f"grace_seconds must be a non-negative number, got {grace_seconds!r}"
+            raise ValueError(msg)
+        self.flush_heartbeats()
+        done_sql, done_params = self._category_predicate_sql("done", alias="i")
+        opened = not self.conn.in_transaction
+        if opened:
+            self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = _now_iso()
+            cutoff = (datetime.now(UTC) - timedelta(seconds=grace_seconds)).isoformat()
+            rows = self.conn.execute(
+                "WITH due(id) AS ("
+                "SELECT id FROM issues WHERE claim_expires_at <= ? "
+                "UNION SELECT issue_id FROM claim_leases WHERE claim_expires_at <= ?) "
+                "SELECT i.id, i.assignee, COALESCE(l.claim_expires_at, i.claim_expires_at) AS expires_at "
+                f"FROM due JOIN issues i ON i.id = due.id {_LEASE_JOIN_SQL} "
+                "WHERE COALESCE(i.assignee, '') != '' "
+                "AND COALESCE(l.claim_expires_at, i.claim_expires_at) <= ? "
+                f"AND NOT ({done_sql}) "
+                "ORDER BY expires_at, i.id LIMIT ?",
+                [cutoff, cutoff, cutoff, *done_params, limit],
+            ).fetchall()
+            released: list[str] = []
+            for row in rows:
+                self.conn.execute(
+                    "UPDATE issues SET assignee = '', claimed_at = NULL, last_heartbeat_at = NULL, "
+                    "claim_expires_at = NULL, updated_at = ? WHERE id = ? AND assignee = ?",
+                    (now, row["id"], row["assignee"]),
+                )
+                self._record_event(
+                    row["id"],
+                    "released",
+                    actor=actor,
+                    old_value=row["assignee"],
+                    comment=f"Claim lease expired at {row['expires_at']}",
+                )
+                released.append(row["id"])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        # Same post-commit wip->open revert as release_claim; a type with no
+        # reverse target keeps its status, and one failure must not strand
+        # the rest of the batch.
+        if revert_status:
+            for issue in self._build_issues_batch(released):
+                target = self.templates.get_release_target(issue.type, issue.status)
+                if target is None or target == issue.status:
+                    continue
+                try:
+                    self.update_issue(issue.id, status=target, actor=actor, _skip_transition_check=True)
+                except (KeyError, ValueError):
+                    logger.warning("Released expired claim on %s but could not revert its status", issue.id, exc_info=True)
+        return self._build_issues_batch(released)
+
     def reclaim_issue(
         self,
         issue_id: str,
@@ -1473,9 +1678,9 @@ class IssuesMixin(DBMixinProtocol):
     ) -> Issue | None:
         """Claim the highest-priority ready issue matching filters.
 
-        Iterates ready issues sorted by priority and attempts claim_issue()
-        on each until one succeeds (handles race conditions with retry).
-        Returns None if no matching ready issues exist.
+        Selects and reserves the candidate in one statement (see
+        ``_claim_next_with_prior``). Returns None if no matching ready
+        issues exist.
         """
         result = self._claim_next_with_prior(
             assignee,
@@ -1501,36 +1706,64 @@ class IssuesMixin(DBMixinProtocol):
         Returns ``(claimed_issue, prior_assignee)`` so composed callers
         (start_next_work) can distinguish a freshly-acquired claim from a
         same-assignee re-claim and decide whether a compensating release is
-        appropriate. ``prior_assignee`` is read transactionally just before
-        ``claim_issue`` so a concurrent reassignment landing between the read
-        and the UPDATE will surface as the same race ``claim_issue`` already
-        handles (skip and continue).
+        appropriate.
+
+        The ready predicate and the filters run in SQL: a single
+        ``UPDATE … WHERE id = (SELECT … LIMIT 1) RETURNING`` inside
+        ``BEGIN IMMEDIATE`` picks the top candidate (priority asc,
+        created_at asc, id asc) and reserves it, so concurrent claimers
+        serialize on the write lock instead of racing over a materialised
+        ready queue, and only the claimed issue is hydrated. Ready issues
+        are unassigned, so ``prior_assignee`` is always ``""`` here.
         """
-        if not assignee or not assignee.strip():
+        assignee = _normalize_assignee(assignee)
+        if not assignee:
             msg = "Assignee cannot be empty"
             raise ValueError(msg)
-        ready = self.get_ready()
+        open_sql, open_params = self._category_predicate_sql("open", alias="i")
+        params: list[Any] = list(open_params)
+        filters = [
+            open_sql,
+            "(i.assignee = '' OR i.assignee IS NULL)",
+            "i.open_blocker_count = 0",
+        ]
+        if type_filter is not None:
+            filters.append("i.type = ?")
+            params.append(type_filter)
+        if priority_min is not None:
+            filters.append("i.priority >= ?")
+            params.append(priority_min)
+        if priority_max is not None:
+            filters.append("i.priority <= ?")
+            params.append(priority_max)
+        now = _now_iso()
 
-        skipped = 0
-        for issue in ready:
-            if type_filter is not None and issue.type != type_filter:
-                continue
-            if priority_min is not None and issue.priority < priority_min:
-                continue
-            if priority_max is not None and issue.priority > priority_max:
-                continue
-            try:
-                row = self.conn.execute("SELECT assignee FROM issues WHERE id = ?", (issue.id,)).fetchone()
-                prior_assignee = (row["assignee"] if row is not None else "") or ""
-                claimed = self.claim_issue(issue.id, assignee=assignee, actor=actor or assignee, _commit=_commit)
-            except (ValueError, KeyError) as exc:
-                skipped += 1
-                logger.debug("claim_next: skipping %s: %s", issue.id, exc)
-                continue  # Race condition, status mismatch, or deleted issue
-            return claimed, prior_assignee
-        if skipped:
-            logger.warning("claim_next: all %d candidate(s) failed to claim for '%s'", skipped, assignee)
-        return None
+        opened_txn = False
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
+            opened_txn = True
+        try:
+            row = self.conn.execute(
+                f"UPDATE issues SET assignee = ?, claimed_at = COALESCE(claimed_at, ?), "
+                f"last_heartbeat_at = ?, claim_expires_at = ?, updated_at = ? "
+                f"WHERE id = ("
+                f"  SELECT i.id FROM issues i WHERE {' AND '.join(filters)} "
+                f"  ORDER BY i.priority, i.created_at, i.id LIMIT 1"
+                f") RETURNING id",
+                [assignee, now, now, _claim_expiry(now), now, *params],
+            ).fetchone()
+            if row is None:
+                if opened_txn:
+                    self.conn.rollback()
+                return None
+            issue_id = row["id"]
+            self._record_event(issue_id, "claimed", actor=actor or assignee, old_value="", new_value=assignee)
+            if _commit:
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return self.get_issue(issue_id), ""
 
     def start_work(
         self,
@@ -1881,11 +2114,26 @@ class IssuesMixin(DBMixinProtocol):
         direction: str = "asc",
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
+        include: Collection[str] | None = None,
     ) -> list[Issue]:
+        """List issues matching the filters, in ``sort_by`` order.
+
+        Page with either ``offset`` or ``cursor``. A cursor comes from
+        :meth:`issue_list_cursor` on the last issue of the previous page and
+        resumes strictly after it, so each page costs ``O(limit)`` regardless
+        of depth and concurrent inserts never shift rows between pages. Pass
+        the same filters and sort order with every cursor.
+
+        *include* limits which relations are hydrated; see
+        ``_build_issues_batch``.
+        """
         if limit < 0:
             raise ValueError(f"limit must be non-negative, got {limit}")
         if offset < 0:
             raise ValueError(f"offset must be non-negative, got {offset}")
+        if cursor is not None and offset:
+            raise ValueError("cursor and offset are mutually exclusive")
         if label_prefix is not None and not label_prefix.endswith(":"):
             msg = f"label_prefix must include a trailing colon (got {label_prefix!r})"
             raise ValueError(msg)
@@ -1903,32 +2151,22 @@ class IssuesMixin(DBMixinProtocol):
         # blockers do not block dependents. (filigree-b55aa3191f): match by
         # ``(blocker.type, blocker.status)`` rather than status name alone, so
         # an ``incident.resolved`` (wip) is correctly seen as still-blocking.
-        blocker_done_predicate = self._category_predicate_sql(
-            "done",
-            type_col="blocker.type",
-            status_col="blocker.status",
-            include_archived=True,
-        )
+        blocker_done_predicate = self._category_predicate_sql("done", alias="blocker", include_archived=True)
 
         if status is not None:
             # Check if status is a category name (with aliases)
             category_aliases = {"in_progress": "wip", "closed": "done"}
             category_key = category_aliases.get(status, status)
-            cat_pred: tuple[str, list[str]] | None = None
             if category_key in ("open", "wip", "done"):
-                # filigree-b55aa3191f: compare (type, status) pairs so a state
-                # name shared across types in different categories (e.g.
-                # incident.resolved=wip vs debt_item.resolved=done) routes only
-                # to the right type.
-                pred_sql, pred_params = self._category_predicate_sql(category_key, type_col="i.type", status_col="i.status")
-                if pred_params:
-                    cat_pred = (pred_sql, pred_params)
-
-            if cat_pred is not None:
-                conditions.append(cat_pred[0])
-                params.extend(cat_pred[1])
+                # filigree-b55aa3191f: status_category is resolved per
+                # (type, status), so a state name shared across types in
+                # different categories (e.g. incident.resolved=wip vs
+                # debt_item.resolved=done) routes only to the right type.
+                pred_sql, pred_params = self._category_predicate_sql(category_key, alias="i")
+                conditions.append(pred_sql)
+                params.extend(pred_params)
             else:
-                # Literal state match (either not a category, or W7 empty guard)
+                # Literal state match
                 conditions.append("i.status = ?")
                 params.append(status)
         if type is not None:
@@ -1983,6 +2221,12 @@ class IssuesMixin(DBMixinProtocol):
                     conditions.append("i.id NOT IN (SELECT issue_id FROM labels WHERE label = ?)")
                     params.append(not_label)
 
+        if cursor is not None:
+            keys = _list_issue_sort_keys(sort_by, direction)
+            keyset_sql, keyset_params = _keyset_predicate(keys, _decode_list_cursor(cursor, sort_by, direction))
+            conditions.append(keyset_sql)
+            params.extend(keyset_params)
+
         where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
         params.extend([limit, offset])
         rows = self.conn.execute(
@@ -1990,7 +2234,16 @@ class IssuesMixin(DBMixinProtocol):
             params,
         ).fetchall()
 
-        return self._build_issues_batch([r["id"] for r in rows])
+        return self._build_issues_batch([r["id"] for r in rows], include=include)
+
+    def issue_list_cursor(self, issue: Issue, *, sort_by: str = "priority", direction: str = "asc") -> str:
+        """Return the opaque ``list_issues`` cursor that resumes after *issue*.
+
+        *sort_by* and *direction* must match the ``list_issues`` call that
+        produced *issue*; the cursor records them and is rejected otherwise.
+        """
+        values = [getattr(issue, col.removeprefix("i.")) for col, _desc in _list_issue_sort_keys(sort_by, direction)]
+        return _encode_list_cursor(values, sort_by, direction)
 
     def count_search_results(self, query: str) -> int:
         """Return the total number of issues matching a search query."""
@@ -2028,6 +2281,7 @@ class IssuesMixin(DBMixinProtocol):
         limit: int = 100,
         offset: int = 0,
         status_category: StatusCategory | None = None,
+        include: Collection[str] | None = None,
     ) -> list[Issue]:
         """Search issues by title/description using FTS5, falling back to LIKE.
 
@@ -2041,7 +2295,38 @@ class IssuesMixin(DBMixinProtocol):
         ``status_category`` (``"open"`` / ``"wip"`` / ``"done"``) optionally
         restricts the result set so agents searching for live work don't
         get archived results back. Senior-user MCP review run e P2.7.
+
+        *include* limits which relations are hydrated; see
+        ``_build_issues_batch``.
         """
+        rows = self._search_issue_rows(query, limit=limit, offset=offset, status_category=status_category)
+        return self._build_issues_batch([r["id"] for r in rows], include=include)
+
+    def search_issues_ranked(
+        self,
+        query: str,
+        *,
+        limit: int = 100,
+        status_category: StatusCategory | None = None,
+        include: Collection[str] | None = None,
+    ) -> list[tuple[Issue, float | None]]:
+        """``search_issues`` with each hit's FTS5 rank (lower is better).
+
+        The rank is ``None`` for LIKE-fallback hits, which are ordered by
+        priority instead. Used to merge results from several projects.
+        """
+        rows = self._search_issue_rows(query, limit=limit, offset=0, status_category=status_category)
+        ranks = {r["id"]: r["rank"] for r in rows}
+        return [(issue, ranks[issue.id]) for issue in self._build_issues_batch(list(ranks), include=include)]
+
+    def _search_issue_rows(
+        self,
+        query: str,
+        *,
+        limit: int,
+        offset: int,
+        status_category: StatusCategory | None,
+    ) -> list[Any]:
         category_sql = ""
         category_params: list[str] = []
         if status_category is not None:
@@ -2050,8 +2335,7 @@ class IssuesMixin(DBMixinProtocol):
                 raise ValueError(msg)
             category_sql, category_params = self._category_predicate_sql(
                 status_category,
-                type_col="i.type",
-                status_col="i.status",
+                alias="i",
                 include_archived=status_category == "done",
             )
 
@@ -2068,7 +2352,7 @@ class IssuesMixin(DBMixinProtocol):
                 params.extend(category_params)
             params.extend([limit, offset])
             rows = self.conn.execute(
-                f"SELECT i.id, i.type, i.status FROM issues i WHERE {where} ORDER BY priority, created_at LIMIT ? OFFSET ?",
+                f"SELECT i.id, NULL AS rank FROM issues i WHERE {where} ORDER BY priority, created_at LIMIT ? OFFSET ?",
                 params,
             ).fetchall()
         else:
@@ -2080,7 +2364,7 @@ class IssuesMixin(DBMixinProtocol):
                     params.extend(category_params)
                 params.extend([limit, offset])
                 rows = self.conn.execute(
-                    "SELECT i.id, i.type, i.status FROM issues i "
+                    "SELECT i.id, issues_fts.rank AS rank FROM issues i "
                     "JOIN issues_fts ON issues_fts.rowid = i.rowid "
                     f"WHERE {where} "
                     "ORDER BY issues_fts.rank LIMIT ? OFFSET ?",
@@ -2101,8 +2385,8 @@ class IssuesMixin(DBMixinProtocol):
                     params.extend(category_params)
                 params.extend([limit, offset])
                 rows = self.conn.execute(
-                    f"SELECT i.id, i.type, i.status FROM issues i WHERE {where} ORDER BY priority, created_at LIMIT ? OFFSET ?",
+                    f"SELECT i.id, NULL AS rank FROM issues i WHERE {where} ORDER BY priority, created_at LIMIT ? OFFSET ?",
                     params,
                 ).fetchall()
 
-        return self._build_issues_batch([r["id"] for r in rows])
+        return rows
@@ -259,12 +259,8 @@ class MetaMixin(DBMixinProtocol):
     def _compute_virtual_has_counts(self) -> list[dict[str, Any]]:
         # filigree-b55aa3191f: type-aware blocker-done predicate so a blocker
         # whose state name collides across categories (e.g. incident.resolved
-        # vs debt_item.resolved) is classified per type. With
-        # include_archived=True the predicate is always SQL-valid even when no
-        # done-category states are registered (matches archived-only).
-        blocker_done_sql, blocker_done_params = self._category_predicate_sql(
-            "done", type_col="b.type", status_col="b.status", include_archived=True
-        )
+        # vs debt_item.resolved) is classified per type.
+        blocker_done_sql, blocker_done_params = self._category_predicate_sql("done", alias="b", include_archived=True)
         counts = []
         cnt = self.conn.execute(
             f"SELECT COUNT(DISTINCT i.id) as cnt FROM issues i "
@@ -379,38 +375,26 @@ class MetaMixin(DBMixinProtocol):
         for row in self.conn.execute("SELECT type, COUNT(*) as cnt FROM issues GROUP BY type").fetchall():
             by_type[row["type"]] = row["cnt"]
 
-        preds = self._resolve_open_blocker_predicates()
-        if preds is None:
-            ready_count = 0
-            blocked_count = 0
-        else:
-            (open_sql, open_params), (blocker_done_sql, blocker_done_params) = preds
-            ready_count = self.conn.execute(
-                f"SELECT COUNT(*) as cnt FROM issues i "
-                f"WHERE {open_sql} "
-                f"AND (i.assignee = '' OR i.assignee IS NULL) "
-                f"AND NOT EXISTS ("
-                f"  SELECT 1 FROM dependencies d "
-                f"  JOIN issues blocker ON d.depends_on_id = blocker.id "
-                f"  WHERE d.issue_id = i.id AND NOT ({blocker_done_sql})"
-                f")",
-                [*open_params, *blocker_done_params],
-            ).fetchone()["cnt"]
-            blocked_count = self.conn.execute(
-                f"SELECT COUNT(DISTINCT i.id) as cnt FROM issues i "
-                f"JOIN dependencies d ON d.issue_id = i.id "
-                f"JOIN issues blocker ON d.depends_on_id = blocker.id "
-                f"WHERE {open_sql} AND NOT ({blocker_done_sql})",
-                [*open_params, *blocker_done_params],
-            ).fetchone()["cnt"]
+        # Category and blocker state come from the trigger-maintained
+        # status_category / open_blocker_count columns, so both counts are a
+        # single indexed scan over open-category issues.
+        open_sql, open_params = self._category_predicate_sql("open", alias="i")
+        counts = self.conn.execute(
+            f"SELECT "
+            f"COALESCE(SUM(i.open_blocker_count = 0 AND (i.assignee = '' OR i.assignee IS NULL)), 0) AS ready, "
+            f"COALESCE(SUM(i.open_blocker_count > 0), 0) AS blocked "
+            f"FROM issues i WHERE {open_sql}",
+            open_params,
+        ).fetchone()
+        ready_count = counts["ready"]
+        blocked_count = counts["blocked"]
 
         dep_count = self.conn.execute("SELECT COUNT(*) as cnt FROM dependencies").fetchone()["cnt"]
 
-        # Category-level counts (open/wip/done) via template-aware resolution
+        # Category-level counts (open/wip/done) from the materialised column
         by_category: dict[str, int] = {"open": 0, "wip": 0, "done": 0}
-        for row in self.conn.execute("SELECT type, status, COUNT(*) as cnt FROM issues GROUP BY type, status").fetchall():
-            cat = self._resolve_status_category(row["type"], row["status"])
-            by_category[cat] = by_category.get(cat, 0) + row["cnt"]
+        for row in self.conn.execute("SELECT status_category, COUNT(*) as cnt FROM issues GROUP BY status_category").fetchall():
+            by_category[row["status_category"]] = by_category.get(row["status_category"], 0) + row["cnt"]
 
         return {
             "by_status": by_status,
@@ -423,6 +407,16 @@ class MetaMixin(DBMixinProtocol):
             "total_dependencies": dep_count,
         }
 
+    def get_change_counters(self) -> dict[str, int]:
+        """Return the trigger-maintained change counters (see ``change_counters``).
+
+        Keys are ``issues``, ``issue_activity``, ``dependencies``,
+        ``events``, ``labels``, ``comments`` and ``claim_leases``; a domain
+        that has never been written is absent. Values only ever grow, so
+        equal counters mean nothing in that domain changed.
+        """
+        return {row["name"]: row["version"] for row in self.conn.execute("SELECT name, version FROM change_counters").fetchall()}
+
     # -- Bulk import (for migration) -----------------------------------------
 
     def bulk_insert_issue(self, issue_data: dict[str, Any], *, validate: bool = True) -> bool:
@@ -465,7 +459,11 @@ class MetaMixin(DBMixinProtocol):
             (issue_id, depends_on_id, dep_type, _now_iso()),
         )
         inserted = cursor.rowcount > 0
-        if not inserted:
+        if inserted:
+            # Bulk loads commit (or roll back) later via bulk_commit; rebuild
+            # the graph on next use rather than patching ahead of the commit.
+            self._invalidate_dep_graph()
+        else:
             logger.debug("bulk_insert_dependency: skipped duplicate %s -> %s", issue_id, depends_on_id)
         return inserted
 
@@ -655,7 +653,11 @@ class MetaMixin(DBMixinProtocol):
 
     # Table export definitions: (record_type_tag, SQL query)
     _EXPORT_TABLES: ClassVar[list[tuple[str, str]]] = [
-        ("issue", "SELECT * FROM issues ORDER BY created_at"),
+        (
+            "issue",
+            "SELECT i.*, l.last_heartbeat_at AS lease_heartbeat_at, l.claim_expires_at AS lease_expires_at "
+            "FROM issues i LEFT JOIN claim_leases l ON l.issue_id = i.id ORDER BY i.created_at",
+        ),
         ("file_record", "SELECT * FROM file_records ORDER BY path"),
         ("scan_run", "SELECT * FROM scan_runs ORDER BY started_at, id"),
         ("scan_finding", "SELECT * FROM scan_findings ORDER BY first_seen, file_id, scan_source, rule_id"),
@@ -678,6 +680,11 @@ class MetaMixin(DBMixinProtocol):
         ),
     ]
 
+    # Trigger-maintained columns: recomputed on import, so never exported.
+    _EXPORT_DERIVED_COLUMNS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "issue": ("open_blocker_count", "blocks_open_count", "status_category"),
+    }
+
     def export_jsonl(self, output_path: str | Path) -> int:
         """Export full project data to JSONL.
 
@@ -687,8 +694,16 @@ class MetaMixin(DBMixinProtocol):
         count = 0
         with Path(output_path).open("w") as f:
             for type_tag, query in self._EXPORT_TABLES:
+                derived = self._EXPORT_DERIVED_COLUMNS.get(type_tag, ())
                 for row in self.conn.execute(query).fetchall():
                     record = dict(row)
+                    if type_tag == "issue":
+                        # Heartbeats live in claim_leases; export the effective lease.
+                        record["last_heartbeat_at"], record["claim_expires_at"] = self._lease_columns(row)
+                        record.pop("lease_heartbeat_at")
+                        record.pop("lease_expires_at")
+                    for column in derived:
+                        record.pop(column, None)
                     record["_type"] = type_tag
                     f.write(json.dumps(record, default=str) + "\n")
                     count += 1
@@ -1025,6 +1040,8 @@ class MetaMixin(DBMixinProtocol):
                     ),
                 )
                 count += cursor.rowcount
+            if dependencies:
+                self._invalidate_dep_graph()
 
             _import_stage = "label"
             for _import_index, record in enumerate(labels):
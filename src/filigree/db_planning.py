@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import json
 import logging
+import sqlite3
 from collections import deque
 from typing import TYPE_CHECKING, Any
 
 from filigree.db_base import DBMixinProtocol, _now_iso
+from filigree.dep_graph import DependencyGraph
 from filigree.models import _EMPTY_TS, Issue
 from filigree.types.api import BatchFailure
 from filigree.types.core import IssueDict
@@ -20,6 +22,7 @@ from filigree.types.planning import (
     ChildSummary,
     CriticalPathNode,
     DependencyRecord,
+    GraphNodeRecord,
     IssueRef,
     PlanPhase,
     PlanTree,
@@ -30,6 +33,8 @@ from filigree.types.planning import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from filigree.types.inputs import MilestoneInput, PhaseInput
 
 logger = logging.getLogger(__name__)
@@ -135,6 +140,34 @@ def _truncated_issue_sentinel(issue_id: str) -> IssueDict:
     )
 
 
+class _Rollup:
+    """Leaf counts accumulated while assembling a tree (see ``_progress_from_subtree``)."""
+
+    __slots__ = ("completed", "in_progress", "open", "total")
+
+    def __init__(self) -> None:
+        self.total = self.completed = self.in_progress = self.open = 0
+
+    def count(self, category: str) -> None:
+        self.total += 1
+        if category == "done":
+            self.completed += 1
+        elif category == "wip":
+            self.in_progress += 1
+        else:
+            self.open += 1
+
+    def merge(self, other: _Rollup) -> None:
+        self.total += other.total
+        self.completed += other.completed
+        self.in_progress += other.in_progress
+        self.open += other.open
+
+    def as_dict(self) -> ProgressDict:
+        pct = round(self.completed / self.total * 100) if self.total > 0 else 0
+        return {"total": self.total, "completed": self.completed, "in_progress": self.in_progress, "open": self.open, "pct": pct}
+
+
 class PlanningMixin(DBMixinProtocol):
     """Dependencies, plans, and DAG queries (ready/blocked/critical path).
 
@@ -179,33 +212,16 @@ class PlanningMixin(DBMixinProtocol):
         except Exception:
             self.conn.rollback()
             raise
+        self._dep_graph_add_edge(issue_id, depends_on_id, dep_type)
         return True
 
     def _would_create_cycle(self, issue_id: str, depends_on_id: str) -> bool:
         """Check if adding issue_id -> depends_on_id would create a cycle.
 
-        Uses BFS from depends_on_id following existing dependency edges.
-        If issue_id is reachable, adding the new edge would close a cycle.
-
-        Loads all edges in a single query to avoid N+1 per-node queries.
+        Uses BFS from depends_on_id over the cached dependency graph. If
+        issue_id is reachable, adding the new edge would close a cycle.
         """
-        # Build adjacency list from all edges in one query
-        adj: dict[str, list[str]] = {}
-        for r in self.conn.execute("SELECT issue_id, depends_on_id FROM dependencies").fetchall():
-            adj.setdefault(r["issue_id"], []).append(r["depends_on_id"])
-
-        visited: set[str] = set()
-        queue = deque([depends_on_id])
-        while queue:
-            current = queue.popleft()
-            if current == issue_id:
-                return True
-            if current in visited:
-                continue
-            visited.add(current)
-            for neighbor in adj.get(current, ()):
-                queue.append(neighbor)
-        return False
+        return self.dependency_graph().would_create_cycle(issue_id, depends_on_id)
 
     def remove_dependency(self, issue_id: str, depends_on_id: str, *, actor: str = "") -> bool:
         self._check_id_prefix(issue_id)
@@ -228,60 +244,140 @@ class PlanningMixin(DBMixinProtocol):
         except Exception:
             self.conn.rollback()
             raise
+        self._dep_graph_remove_edge(issue_id, depends_on_id)
         return True
 
-    def get_all_dependencies(self) -> list[DependencyRecord]:
-        rows = self.conn.execute("SELECT issue_id, depends_on_id, type FROM dependencies").fetchall()
-        return [{"from": r["issue_id"], "to": r["depends_on_id"], "type": r["type"]} for r in rows]
+    def get_all_dependencies(self, *, issue_ids: Collection[str] | None = None) -> list[DependencyRecord]:
+        """Every dependency edge, or only those whose dependent (``from``) is in *issue_ids*."""
+        edges = self.dependency_graph().edges(None if issue_ids is None else sorted(set(issue_ids)))
+        return [{"from": src, "to": dst, "type": dep_type} for src, dst, dep_type in edges]
 
-    # -- Ready / Blocked -----------------------------------------------------
+    def get_dependencies_page(self, *, after: tuple[str, str] | None = None, limit: int = 1000) -> list[DependencyRecord]:
+        """One keyset page of every dependency edge, ordered by ``(from, to)``.
 
-    def _resolve_open_blocker_predicates(self) -> tuple[tuple[str, list[str]], tuple[str, list[str]]] | None:
-        """Return ``(open_predicate, blocker_done_predicate)`` SQL fragments.
+        Pass the last edge's ``(from, to)`` as *after* for the next page; a
+        page shorter than *limit* is the last. Reads the primary key index,
+        so each page costs the same however deep it is.
+        """
+        if limit < 1:
+            msg = f"limit must be >= 1, got {limit}"
+            raise ValueError(msg)
+        where, params = ("WHERE (issue_id, depends_on_id) > (?, ?)", [*after]) if after is not None else ("", [])
+        rows = self.conn.execute(
+            f"SELECT issue_id, depends_on_id, type FROM dependencies {where} ORDER BY issue_id, depends_on_id LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+        return [{"from": r["issue_id"], "to": r["depends_on_id"], "type": r["type"]} for r in rows]
 
-        Returns ``None`` when no open-category states are registered — callers
-        treat that as "nothing can be ready".
+    # -- Dependency graph index ----------------------------------------------
 
-        - ``open_predicate`` matches an issue row aliased ``i`` whose
-          ``(type, status)`` is open-category.
-        - ``blocker_done_predicate`` matches a blocker row aliased ``blocker``
-          whose ``(type, status)`` is done-category, plus the synthetic
-          ``'archived'`` terminal state (filigree-42045dd065).
+    def dependency_graph(self) -> DependencyGraph:
+        """Return the in-memory dependency graph for the current connection.
 
-        Type-aware (filigree-b55aa3191f): replaces the prior status-name list
-        approach so colliding state names across types are classified per type.
+        Built on first use and reused until ``PRAGMA data_version`` shows a
+        commit from another connection (another process, or the writer when
+        this is a pooled reader). This connection's own writes do not bump
+        ``data_version``; the write paths patch the cached graph instead.
+        Treat the result as read-only.
         """
-        open_pred = self._category_predicate_sql("open", type_col="i.type", status_col="i.status")
-        if not open_pred[1]:
+        conn = self.conn
+        version: int = conn.execute("PRAGMA data_version").fetchone()[0]
+        cached = self._dep_graphs.get(id(conn))
+        if cached is not None and cached[0] is conn and cached[1] == version:
+            return cached[2]
+        graph = DependencyGraph.load(conn)
+        self._dep_graphs[id(conn)] = (conn, version, graph)
+        return graph
+
+    def _cached_dep_graph(self) -> DependencyGraph | None:
+        cached = self._dep_graphs.get(id(self.conn))
+        if cached is None or cached[0] is not self.conn:
             return None
-        blocker_done_pred = self._category_predicate_sql(
-            "done",
-            type_col="blocker.type",
-            status_col="blocker.status",
-            include_archived=True,
-        )
-        return open_pred, blocker_done_pred
+        return cached[2]
 
-    def get_ready(self) -> list[Issue]:
-        """Unassigned issues in open-category states with no open blockers."""
-        preds = self._resolve_open_blocker_predicates()
-        if preds is None:
-            return []
-        (open_sql, open_params), (blocker_done_sql, blocker_done_params) = preds
+    def _dep_graph_add_edge(self, issue_id: str, depends_on_id: str, dep_type: str = "blocks") -> None:
+        """Patch an edge this connection just wrote into its cached graph, if any."""
+        graph = self._cached_dep_graph()
+        if graph is not None:
+            graph.add_edge(issue_id, depends_on_id, dep_type)
+
+    def _dep_graph_remove_edge(self, issue_id: str, depends_on_id: str) -> None:
+        graph = self._cached_dep_graph()
+        if graph is not None:
+            graph.remove_edge(issue_id, depends_on_id)
+
+    def _invalidate_dep_graph(self) -> None:
+        """Drop this connection's cached graph after a write that was not patched in.
+
+        Needed after bulk dependency writes and after rolling back edges that
+        were patched in ahead of the commit.
+        """
+        self._dep_graphs.pop(id(self.conn), None)
+
+    # -- Ready / Blocked -----------------------------------------------------
+
+    def _recount_open_blockers(self) -> int:
+        """Recompute ``open_blocker_count`` / ``blocks_open_count`` from scratch.
+
+        The counters are normally maintained incrementally by triggers; this
+        is the repair path, also used when ``status_categories`` changes.
+        Returns the number of issues whose counters were wrong. Does not commit.
+        """
+        rows = self.conn.execute(
+            "SELECT id, open_blocker_count AS cur_open, blocks_open_count AS cur_blocks, "
+            "(SELECT COUNT(*) FROM dependencies d JOIN issues b ON b.id = d.depends_on_id "
+            " WHERE d.issue_id = i.id AND b.status_category != 'done') AS open_cnt, "
+            "CASE WHEN i.status_category = 'done' THEN 0 ELSE "
+            "(SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id "
+            " WHERE d.depends_on_id = i.id) END AS blocks_cnt "
+            "FROM issues i"
+        ).fetchall()
+        stale = [
+            (r["open_cnt"], r["blocks_cnt"], r["id"]) for r in rows if (r["cur_open"], r["cur_blocks"]) != (r["open_cnt"], r["blocks_cnt"])
+        ]
+        if stale:
+            self.conn.executemany("UPDATE issues SET open_blocker_count = ?, blocks_open_count = ? WHERE id = ?", stale)
+        return len(stale)
+
+    def rebuild_blocker_counts(self) -> int:
+        """Repair the trigger-maintained open-blocker counters.
+
+        Returns the number of issues whose counters were corrected — 0 on a
+        healthy database.
+        """
+        try:
+            repaired = self._recount_open_blockers()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        if repaired:
+            logger.warning("rebuild_blocker_counts: corrected counters on %d issue(s)", repaired)
+        return repaired
 
+    def get_ready(self, *, include: Collection[str] | None = None, limit: int | None = None) -> list[Issue]:
+        """Unassigned issues in open-category states with no open blockers.
+
+        *include* limits which relations are hydrated; see
+        ``_build_issues_batch``. *limit* keeps only the first issues in
+        priority order.
+        """
+        open_sql, open_params = self._category_predicate_sql("open", alias="i")
+        limit_sql = ""
+        params: list[Any] = list(open_params)
+        if limit is not None:
+            limit_sql = " LIMIT ?"
+            params.append(limit)
         rows = self.conn.execute(
             f"SELECT i.id FROM issues i "
             f"WHERE {open_sql} "
             f"AND (i.assignee = '' OR i.assignee IS NULL) "
-            f"AND NOT EXISTS ("
-            f"  SELECT 1 FROM dependencies d "
-            f"  JOIN issues blocker ON d.depends_on_id = blocker.id "
-            f"  WHERE d.issue_id = i.id AND NOT ({blocker_done_sql})"
-            f") ORDER BY i.priority, i.created_at",
-            [*open_params, *blocker_done_params],
+            f"AND i.open_blocker_count = 0 "
+            f"ORDER BY i.priority, i.created_at{limit_sql}",
+            params,
         ).fetchall()
 
-        return self._build_issues_batch([r["id"] for r in rows])
+        return self._build_issues_batch([r["id"] for r in rows], include=include)
 
     def get_blocked(self) -> list[Issue]:
         """Issues in open- or wip-category states that have at least one non-done blocker.
@@ -291,37 +387,104 @@ class PlanningMixin(DBMixinProtocol):
         Done-category issues are excluded — once an issue is closed, its
         dependencies are no longer interesting. (filigree-cb980eee0d, P2.8.)
         """
-        # not-done predicate covers both open and wip; the blocker side stays
-        # done-only so we surface anything that isn't yet finished but is
-        # waiting on something also unfinished.
-        not_done_pred = self._category_predicate_sql(
-            "done",
-            type_col="i.type",
-            status_col="i.status",
-            include_archived=True,
-        )
-        not_done_sql, not_done_params = not_done_pred
-        blocker_done_pred = self._category_predicate_sql(
-            "done",
-            type_col="blocker.type",
-            status_col="blocker.status",
-            include_archived=True,
-        )
-        blocker_done_sql, blocker_done_params = blocker_done_pred
-        if not not_done_params and not blocker_done_params:
-            return []
+        # not-done predicate covers both open and wip; the blocker side is
+        # the trigger-maintained count of not-yet-done blockers, so we surface
+        # anything that isn't yet finished but is waiting on something also
+        # unfinished.
+        not_done_sql, not_done_params = self._category_predicate_sql("done", alias="i", include_archived=True)
 
         rows = self.conn.execute(
-            f"SELECT DISTINCT i.id FROM issues i "
-            f"JOIN dependencies d ON d.issue_id = i.id "
-            f"JOIN issues blocker ON d.depends_on_id = blocker.id "
-            f"WHERE NOT ({not_done_sql}) AND NOT ({blocker_done_sql}) "
-            f"ORDER BY i.priority, i.created_at",
-            [*not_done_params, *blocker_done_params],
+            f"SELECT i.id FROM issues i WHERE i.open_blocker_count > 0 AND NOT ({not_done_sql}) ORDER BY i.priority, i.created_at",
+            not_done_params,
         ).fetchall()
 
         return self._build_issues_batch([r["id"] for r in rows])
 
+    def get_graph_nodes(
+        self,
+        *,
+        issue_ids: Collection[str] | None = None,
+        include_done: bool = True,
+        types: Collection[str] = (),
+        status_categories: Collection[str] = (),
+        assignee: str | None = None,
+        updated_since: str | None = None,
+        blocked_only: bool = False,
+        ready_only: bool = False,
+        limit: int | None = None,
+    ) -> tuple[list[GraphNodeRecord], int]:
+        """Filtered graph nodes in ``list_issues`` priority order, plus the pre-limit match count.
+
+        Every filter and the limit run in SQL against the materialised
+        ``status_category`` and blocker counters, and rows are a flat column
+        projection, so a scoped or filtered graph costs what it returns
+        rather than what the project holds. *issue_ids* restricts to a set
+        (a scope neighbourhood, the critical path); *updated_since* is an
+        ISO timestamp compared against ``updated_at`` (``created_at`` when
+        empty). Archived issues read as done, as in blocker semantics.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be positive, got {limit}")
+        conditions: list[str] = []
+        params: list[Any] = []
+        if issue_ids is not None:
+            conditions.append("i.id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(sorted(issue_ids)))
+        if not include_done:
+            done_sql, done_params = self._category_predicate_sql("done", alias="i", include_archived=True)
+            conditions.append(f"NOT ({done_sql})")
+            params.extend(done_params)
+        if types:
+            conditions.append(f"i.type IN ({','.join('?' * len(types))})")
+            params.extend(sorted(types))
+        if status_categories:
+            conditions.append(f"i.status_category IN ({','.join('?' * len(status_categories))})")
+            params.extend(sorted(status_categories))
+        if assignee is not None:
+            conditions.append("i.assignee = ?")
+            params.append(assignee)
+        if updated_since is not None:
+            conditions.append("julianday(COALESCE(NULLIF(i.updated_at, ''), i.created_at)) >= julianday(?)")
+            params.append(updated_since)
+        if blocked_only:
+            conditions.append("i.open_blocker_count > 0")
+        if ready_only:
+            open_sql, open_params = self._category_predicate_sql("open", alias="i")
+            conditions.append(f"{open_sql} AND COALESCE(i.assignee, '') = '' AND i.open_blocker_count = 0")
+            params.extend(open_params)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        params.append(-1 if limit is None else limit)
+        # The page is cut first; only its rows pay for the dependents count.
+        rows = self.conn.execute(
+            "SELECT page.*, ("
+            "  SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id"
+            "  WHERE d.depends_on_id = page.id AND x.status_category != 'done'"
+            ") AS blocks_open "
+            "FROM ("
+            "  SELECT i.id, i.title, i.status, i.status_category, i.priority, i.type, i.assignee,"
+            "         i.open_blocker_count, COUNT(*) OVER () AS total"
+            f"  FROM issues i {where}"
+            "  ORDER BY i.priority ASC, i.created_at ASC, i.id ASC LIMIT ?"
+            ") page",
+            params,
+        ).fetchall()
+        nodes: list[GraphNodeRecord] = [
+            {
+                "id": r["id"],
+                "title": r["title"],
+                "status": r["status"],
+                "status_category": r["status_category"],
+                "priority": r["priority"],
+                "type": r["type"],
+                "assignee": r["assignee"] or "",
+                "is_ready": r["status_category"] == "open" and r["open_blocker_count"] == 0 and not r["assignee"],
+                "blocked_by_open_count": r["open_blocker_count"],
+                "blocks_open_count": r["blocks_open"],
+            }
+            for r in rows
+        ]
+        return nodes, rows[0]["total"] if rows else 0
+
     # -- Critical path -------------------------------------------------------
 
     def get_critical_path(self) -> list[CriticalPathNode]:
@@ -333,81 +496,40 @@ class PlanningMixin(DBMixinProtocol):
         """
         # Treat archived as done here: an archived issue has reached terminal
         # state and must not appear as an open node on the critical path.
-        # (filigree-42045dd065). Match by (type, status) so colliding state
-        # names across types are classified per type (filigree-b55aa3191f).
-        not_done_sql, not_done_params = self._category_predicate_sql(
-            "done",
-            type_col="type",
-            status_col="status",
-            include_archived=True,
-        )
+        # (filigree-42045dd065). status_category is resolved per (type, status)
+        # so colliding state names across types are classified per type
+        # (filigree-b55aa3191f).
+        not_done_sql, not_done_params = self._category_predicate_sql("done", include_archived=True)
         open_rows = self.conn.execute(
             f"SELECT id, title, priority, type FROM issues WHERE NOT ({not_done_sql})",
             not_done_params,
         ).fetchall()
-        open_ids = {r["id"] for r in open_rows}
         info = {r["id"]: CriticalPathNode(id=r["id"], title=r["title"], priority=r["priority"], type=r["type"]) for r in open_rows}
 
-        # edges: blocker -> list of issues it blocks (forward edges)
-        forward: dict[str, list[str]] = {nid: [] for nid in open_ids}
-        in_degree: dict[str, int] = dict.fromkeys(open_ids, 0)
-        dep_rows = self.conn.execute("SELECT issue_id, depends_on_id FROM dependencies").fetchall()
-        for dep in dep_rows:
-            from_id, to_id = dep["issue_id"], dep["depends_on_id"]
-            if from_id in open_ids and to_id in open_ids:
-                forward[to_id].append(from_id)  # to_id blocks from_id
-                in_degree[from_id] = in_degree.get(from_id, 0) + 1
-
-        if not open_ids:
-            return []
-
-        # Topological sort (Kahn's algorithm) + longest path DP
-        queue = deque(nid for nid in open_ids if in_degree[nid] == 0)
-        dist: dict[str, int] = dict.fromkeys(open_ids, 0)
-        pred: dict[str, str | None] = dict.fromkeys(open_ids, None)
-
-        while queue:
-            node = queue.popleft()
-            for neighbor in forward[node]:
-                if dist[node] + 1 > dist[neighbor]:
-                    dist[neighbor] = dist[node] + 1
-                    pred[neighbor] = node
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        if not dist:
-            return []
-
-        # Find the node with the longest path
-        end_node = max(dist, key=lambda n: dist[n])
-        if dist[end_node] == 0:
-            return []  # No chains at all
-
-        # Reconstruct path
-        path: list[str] = []
-        current: str | None = end_node
-        while current is not None:
-            path.append(current)
-            current = pred[current]
-        path.reverse()
-
+        path = self.dependency_graph().longest_chain(r["id"] for r in open_rows)
         return [info[nid] for nid in path]
 
     # -- Plan tree -----------------------------------------------------------
 
-    def _list_all_children(self, parent_id: str) -> list[Issue]:
-        """Return every direct child of ``parent_id`` — no pagination.
+    def _subtree_rows(self, root_id: str, max_depth: int) -> list[sqlite3.Row]:
+        """Every descendant of ``root_id`` down to ``max_depth`` in one recursive query.
 
-        Tree construction (``get_plan``, ``_build_tree``) needs the complete
-        child set; using the paginated ``list_issues`` (default ``limit=100``)
-        silently truncates large plans/releases.
+        Direct children are depth 0. Rows carry ``id``, ``parent_id`` and
+        ``depth`` and come back ordered by depth, then priority and creation
+        time, so appending each row to its parent's list yields siblings in
+        display order. No pagination: tree construction needs the complete
+        child set, and the paginated ``list_issues`` (default ``limit=100``)
+        silently truncated large plans/releases.
         """
-        rows = self.conn.execute(
-            "SELECT id FROM issues WHERE parent_id = ? ORDER BY priority, created_at",
-            (parent_id,),
+        return self.conn.execute(
+            "WITH RECURSIVE subtree(id, parent_id, depth, priority, created_at) AS ("
+            " SELECT id, parent_id, 0, priority, created_at FROM issues WHERE parent_id = ?"
+            " UNION ALL"
+            " SELECT i.id, i.parent_id, s.depth + 1, i.priority, i.created_at"
+            " FROM issues i JOIN subtree s ON i.parent_id = s.id WHERE s.depth < ?"
+            ") SELECT id, parent_id, depth FROM subtree ORDER BY depth, priority, created_at, id",
+            (root_id, max_depth),
         ).fetchall()
-        return self._build_issues_batch([r["id"] for r in rows])
 
     def _normalize_label_inputs(self, labels: Any, source: str) -> list[str]:
         if labels is None:
@@ -500,9 +622,18 @@ class PlanningMixin(DBMixinProtocol):
 
     def get_plan(self, milestone_id: str) -> PlanTree:
         """Get milestone->phase->step tree with progress stats."""
-        milestone = self.get_issue(milestone_id)
-
-        phases = self._list_all_children(milestone_id)
+        # Milestone, phases and steps: one recursive fetch, one batch build.
+        rows = self._subtree_rows(milestone_id, 1)
+        issues = {i.id: i for i in self._build_issues_batch([milestone_id, *(r["id"] for r in rows)])}
+        if milestone_id not in issues:
+            msg = f"Issue not found: {milestone_id}"
+            raise KeyError(msg)
+        milestone = issues[milestone_id]
+        children_of: dict[str, list[Issue]] = {}
+        for r in rows:
+            children_of.setdefault(r["parent_id"], []).append(issues[r["id"]])
+
+        phases = children_of.get(milestone_id, [])
         phases.sort(key=lambda p: p.fields.get("sequence", 999))
 
         phase_list: list[PlanPhase] = []
@@ -510,7 +641,7 @@ class PlanningMixin(DBMixinProtocol):
         completed_steps = 0
 
         for phase in phases:
-            steps = self._list_all_children(phase.id)
+            steps = children_of.get(phase.id, [])
             steps.sort(key=lambda s: s.fields.get("sequence", 999))
 
             completed = sum(1 for s in steps if s.status_category == "done")
@@ -617,10 +748,12 @@ class PlanningMixin(DBMixinProtocol):
                 )
                 if cursor.rowcount > 0:
                     self._record_event(step_id, "dependency_added", actor=actor, new_value=f"blocks:{dep_id}")
+                    self._dep_graph_add_edge(step_id, dep_id)
 
             self.conn.commit()
         except Exception:
             self.conn.rollback()
+            self._invalidate_dep_graph()
             raise
 
         return self.get_issue(step_id)
@@ -683,6 +816,8 @@ class PlanningMixin(DBMixinProtocol):
         except Exception:
             self.conn.rollback()
             raise
+        self._dep_graph_remove_edge(step_id, old_depends_on_id)
+        self._dep_graph_add_edge(step_id, new_depends_on_id, dep_type)
 
         return self.get_issue(step_id)
 
@@ -891,10 +1026,14 @@ class PlanningMixin(DBMixinProtocol):
                                 actor=actor,
                                 new_value=f"blocks:{dep_issue_id}",
                             )
+                            # Patched in ahead of the commit so the next
+                            # edge's cycle check sees it; dropped on rollback.
+                            self._dep_graph_add_edge(issue_id, dep_issue_id)
 
             self.conn.commit()
         except Exception:
             self.conn.rollback()
+            self._invalidate_dep_graph()
             raise
 
         return self.get_plan(ms_id)
@@ -911,9 +1050,8 @@ class PlanningMixin(DBMixinProtocol):
 
         result: list[ReleaseSummaryItem] = []
         for release in releases:
-            # Build the full tree once; extract progress from it
-            subtree = self._build_tree(release.id)
-            progress = self._progress_from_subtree(subtree)
+            # Build the full tree once; progress is rolled up in the same pass
+            subtree, progress = self._build_tree_with_progress(release.id)
 
             child_summary = self._summarize_children_by_type(subtree)
 
@@ -951,26 +1089,47 @@ class PlanningMixin(DBMixinProtocol):
             "data_warnings": tree_warnings,
         }
 
-    def _build_tree(self, parent_id: str, *, _depth: int = 0) -> list[TreeNode]:
-        if _depth > _MAX_TREE_DEPTH:
-            logger.warning("_build_tree: depth limit reached at parent_id=%s", parent_id)
-            return [TreeNode(issue=_truncated_issue_sentinel(parent_id), progress=None, children=[], truncated=True)]
-
-        children = self._list_all_children(parent_id)
-        nodes: list[TreeNode] = []
-        for child in children:
-            subtree = self._build_tree(child.id, _depth=_depth + 1)
-            progress = self._progress_from_subtree(subtree) if subtree else None
-            nodes.append(
-                {
-                    "issue": child.to_dict(),
-                    "progress": progress,
-                    "children": subtree,
-                }
-            )
-        # Group nodes: epics/milestones first, then loose items (tasks, bugs, etc.)
-        nodes.sort(key=lambda n: 0 if n["issue"].get("type") in ("epic", "milestone") else 1)
-        return nodes
+    def _build_tree(self, parent_id: str) -> list[TreeNode]:
+        return self._build_tree_with_progress(parent_id)[0]
+
+    def _build_tree_with_progress(self, parent_id: str) -> tuple[list[TreeNode], ProgressDict]:
+        """Nested ``TreeNode`` list under ``parent_id`` plus its progress rollup.
+
+        The whole subtree is fetched with one recursive CTE and hydrated with
+        one batch build, then assembled in memory; each node's ``progress``
+        and the returned rollup match ``_progress_from_subtree`` but are
+        accumulated bottom-up during assembly. Children of nodes at depth
+        ``_MAX_TREE_DEPTH`` are replaced by a truncation sentinel.
+        """
+        rows = self._subtree_rows(parent_id, _MAX_TREE_DEPTH)
+        issues = {i.id: i for i in self._build_issues_batch([r["id"] for r in rows])}
+        children_of: dict[str, list[str]] = {}
+        for r in rows:
+            children_of.setdefault(r["parent_id"], []).append(r["id"])
+
+        def assemble(node_id: str, depth: int) -> tuple[list[TreeNode], _Rollup]:
+            if depth > _MAX_TREE_DEPTH:
+                logger.warning("_build_tree: depth limit reached at parent_id=%s", node_id)
+                sentinel = TreeNode(issue=_truncated_issue_sentinel(node_id), progress=None, children=[], truncated=True)
+                return [sentinel], _Rollup()
+            nodes: list[TreeNode] = []
+            rollup = _Rollup()
+            for child_id in children_of.get(node_id, ()):
+                child = issues.get(child_id)
+                if child is None:  # deleted between the CTE and the batch build
+                    continue
+                subtree, sub = assemble(child_id, depth + 1)
+                nodes.append({"issue": child.to_dict(), "progress": sub.as_dict() if subtree else None, "children": subtree})
+                if subtree:
+                    rollup.merge(sub)
+                else:
+                    rollup.count(child.status_category)
+            # Group nodes: epics/milestones first, then loose items (tasks, bugs, etc.)
+            nodes.sort(key=lambda n: 0 if n["issue"].get("type") in ("epic", "milestone") else 1)
+            return nodes, rollup
+
+        tree, rollup = assemble(parent_id, 0)
+        return tree, rollup.as_dict()
 
     def _progress_from_subtree(self, nodes: list[TreeNode]) -> ProgressDict:
         total = completed = in_progress = open_count = 0
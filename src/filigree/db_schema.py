@@ -24,6 +24,9 @@ CREATE TABLE IF NOT EXISTS issues (
     description TEXT DEFAULT '',
     notes       TEXT DEFAULT '',
     fields      TEXT DEFAULT '{}',
+    open_blocker_count INTEGER NOT NULL DEFAULT 0,
+    blocks_open_count  INTEGER NOT NULL DEFAULT 0,
+    status_category    TEXT NOT NULL DEFAULT 'open',
 
     CHECK (priority BETWEEN 0 AND 4)
 );
@@ -35,6 +38,11 @@ CREATE INDEX IF NOT EXISTS idx_issues_priority ON issues(priority);
 CREATE INDEX IF NOT EXISTS idx_issues_status_priority ON issues(status, priority, created_at);
 CREATE INDEX IF NOT EXISTS idx_issues_assignee_priority ON issues(assignee, priority, created_at);
 CREATE INDEX IF NOT EXISTS idx_issues_claim_expires_at ON issues(claim_expires_at);
+CREATE INDEX IF NOT EXISTS idx_issues_open_blockers ON issues(open_blocker_count, priority, created_at);
+CREATE INDEX IF NOT EXISTS idx_issues_status_category ON issues(status_category, priority, created_at);
+CREATE INDEX IF NOT EXISTS idx_issues_keyset_priority ON issues(priority, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_issues_keyset_created ON issues(created_at, priority, id);
+CREATE INDEX IF NOT EXISTS idx_issues_keyset_updated ON issues(updated_at, priority, created_at, id);
 
 CREATE TABLE IF NOT EXISTS dependencies (
     issue_id       TEXT NOT NULL REFERENCES issues(id),
@@ -47,6 +55,95 @@ CREATE TABLE IF NOT EXISTS dependencies (
 CREATE INDEX IF NOT EXISTS idx_deps_depends_on ON dependencies(depends_on_id);
 CREATE INDEX IF NOT EXISTS idx_deps_issue_depends ON dependencies(issue_id, depends_on_id);
 
+-- ---- Status categories & open-blocker counters ---------------------------
+-- status_categories mirrors WorkflowMixin._resolve_status_category so
+-- triggers can classify a row without Python (see
+-- WorkflowMixin._sync_status_categories). Lookup order for (type, status):
+--   1. exact (type, status) row — active templates, bundled floor otherwise
+--   2. status 'archived' -> done (synthetic archive_closed terminal state)
+--   3. (type, '') row marks an active type: undeclared states are open
+--   4. ('', status) row — unambiguous bundled state name (done / wip)
+--   5. open
+-- issues.status_category caches that answer and is refreshed on every
+-- status/type write. A dependency edge is "open" while its blocker exists
+-- and is not done; issues.open_blocker_count counts open edges out of a row
+-- (what it waits on), issues.blocks_open_count counts open edges into it
+-- (what it holds up). PlanningMixin.rebuild_blocker_counts() recomputes both.
+
+CREATE TABLE IF NOT EXISTS status_categories (
+    type      TEXT NOT NULL,
+    status    TEXT NOT NULL,
+    category  TEXT NOT NULL,
+    PRIMARY KEY (type, status)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS deps_open_count_insert AFTER INSERT ON dependencies
+WHEN EXISTS (SELECT 1 FROM issues WHERE id = new.issue_id)
+ AND EXISTS (SELECT 1 FROM issues b WHERE b.id = new.depends_on_id AND b.status_category != 'done')
+BEGIN
+    UPDATE issues SET open_blocker_count = open_blocker_count + 1 WHERE id = new.issue_id;
+    UPDATE issues SET blocks_open_count = blocks_open_count + 1 WHERE id = new.depends_on_id;
+END;
+CREATE TRIGGER IF NOT EXISTS deps_open_count_delete AFTER DELETE ON dependencies
+WHEN EXISTS (SELECT 1 FROM issues WHERE id = old.issue_id)
+ AND EXISTS (SELECT 1 FROM issues b WHERE b.id = old.depends_on_id AND b.status_category != 'done')
+BEGIN
+    UPDATE issues SET open_blocker_count = open_blocker_count - 1 WHERE id = old.issue_id;
+    UPDATE issues SET blocks_open_count = blocks_open_count - 1 WHERE id = old.depends_on_id;
+END;
+CREATE TRIGGER IF NOT EXISTS issues_status_category_update AFTER UPDATE OF status, type ON issues
+BEGIN
+    UPDATE issues SET status_category = COALESCE(
+        (SELECT c.category FROM status_categories c WHERE c.type = new.type AND c.status = new.status),
+        CASE WHEN new.status = 'archived' THEN 'done' END,
+        (SELECT 'open' FROM status_categories c WHERE c.type = new.type AND c.status = ''),
+        (SELECT c.category FROM status_categories c WHERE c.type = '' AND c.status = new.status),
+        'open')
+     WHERE id = new.id;
+    UPDATE issues SET open_blocker_count = open_blocker_count
+        + CASE WHEN (SELECT status_category FROM issues WHERE id = new.id) = 'done' THEN -1 ELSE 1 END
+     WHERE (old.status_category = 'done') IS NOT ((SELECT status_category FROM issues WHERE id = new.id) = 'done')
+       AND id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = new.id);
+    UPDATE issues SET blocks_open_count = CASE WHEN status_category = 'done' THEN 0
+        ELSE (SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id
+              WHERE d.depends_on_id = new.id) END
+     WHERE id = new.id AND (old.status_category = 'done') IS NOT (status_category = 'done');
+END;
+CREATE TRIGGER IF NOT EXISTS issues_status_category_insert AFTER INSERT ON issues
+BEGIN
+    UPDATE issues SET status_category = COALESCE(
+        (SELECT c.category FROM status_categories c WHERE c.type = new.type AND c.status = new.status),
+        CASE WHEN new.status = 'archived' THEN 'done' END,
+        (SELECT 'open' FROM status_categories c WHERE c.type = new.type AND c.status = ''),
+        (SELECT c.category FROM status_categories c WHERE c.type = '' AND c.status = new.status),
+        'open')
+     WHERE id = new.id;
+    UPDATE issues SET
+        open_blocker_count = (
+            SELECT COUNT(*) FROM dependencies d JOIN issues b ON b.id = d.depends_on_id
+            WHERE d.issue_id = issues.id AND b.status_category != 'done'),
+        blocks_open_count = CASE WHEN status_category = 'done' THEN 0
+            ELSE (SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id
+                  WHERE d.depends_on_id = issues.id) END
+     WHERE EXISTS (SELECT 1 FROM dependencies WHERE issue_id = new.id OR depends_on_id = new.id)
+       AND (id = new.id
+            OR id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = new.id)
+            OR id IN (SELECT depends_on_id FROM dependencies WHERE issue_id = new.id));
+END;
+CREATE TRIGGER IF NOT EXISTS issues_open_count_delete AFTER DELETE ON issues
+WHEN EXISTS (SELECT 1 FROM dependencies WHERE issue_id = old.id OR depends_on_id = old.id)
+BEGIN
+    UPDATE issues SET
+        open_blocker_count = (
+            SELECT COUNT(*) FROM dependencies d JOIN issues b ON b.id = d.depends_on_id
+            WHERE d.issue_id = issues.id AND b.status_category != 'done'),
+        blocks_open_count = CASE WHEN status_category = 'done' THEN 0
+            ELSE (SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id
+                  WHERE d.depends_on_id = issues.id) END
+     WHERE id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = old.id)
+        OR id IN (SELECT depends_on_id FROM dependencies WHERE issue_id = old.id);
+END;
+
 CREATE TABLE IF NOT EXISTS events (
     id         INTEGER PRIMARY KEY AUTOINCREMENT,
     issue_id   TEXT NOT NULL REFERENCES issues(id),
@@ -397,6 +494,131 @@ CREATE TABLE IF NOT EXISTS entity_associations (
 
 CREATE INDEX IF NOT EXISTS ix_entity_assoc_entity
   ON entity_associations(clarion_entity_id);
+
+-- ---- Change counters -------------------------------------------------------
+-- Monotonic per-domain write counters bumped by triggers, so readers can ask
+-- "did anything I depend on change?" with one primary-key lookup instead of
+-- re-querying. Domains:
+--   issues         rows added/removed, or a column the views render changed
+--   issue_activity updated_at touched (heartbeats, description/notes edits)
+--   dependencies   edges added/removed/retyped
+--   events         audit events appended or pruned
+--   labels         labels attached or removed (these write no event)
+--   comments       comments added, edited or removed
+--   claim_leases   heartbeats written to (or cleared from) claim_leases
+-- Comments, labels and heartbeats deliberately leave 'issues' alone. Values
+-- are only comparable within one database; rows appear on first bump.
+
+CREATE TABLE IF NOT EXISTS change_counters (
+    name     TEXT PRIMARY KEY,
+    version  INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS issues_change_insert AFTER INSERT ON issues
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('issues', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS issues_change_delete AFTER DELETE ON issues
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('issues', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS issues_change_update AFTER UPDATE OF title, status, priority, type, parent_id, assignee, fields,
+    status_category, open_blocker_count, blocks_open_count ON issues
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('issues', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS issues_activity_update AFTER UPDATE OF updated_at ON issues
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('issue_activity', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS deps_change_insert AFTER INSERT ON dependencies
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('dependencies', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS deps_change_delete AFTER DELETE ON dependencies
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('dependencies', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS deps_change_update AFTER UPDATE ON dependencies
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('dependencies', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS events_change_insert AFTER INSERT ON events
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('events', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS events_change_delete AFTER DELETE ON events
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('events', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS labels_change_insert AFTER INSERT ON labels
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('labels', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS labels_change_delete AFTER DELETE ON labels
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('labels', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS comments_change_insert AFTER INSERT ON comments
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('comments', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS comments_change_delete AFTER DELETE ON comments
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('comments', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS comments_change_update AFTER UPDATE ON comments
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('comments', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+
+-- ---- Claim leases ----------------------------------------------------------
+-- Heartbeats land here instead of on the issues row: one small upsert, no
+-- event, no updated_at churn. A row overrides the issue's own
+-- last_heartbeat_at / claim_expires_at while it exists; any write to the
+-- issue's claim columns (claim, release, reclaim, reassign, undo) supersedes
+-- it, so the reset trigger drops it.
+
+CREATE TABLE IF NOT EXISTS claim_leases (
+    issue_id          TEXT PRIMARY KEY REFERENCES issues(id) ON DELETE CASCADE,
+    assignee          TEXT NOT NULL,
+    last_heartbeat_at TEXT NOT NULL,
+    claim_expires_at  TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS claim_leases_reset AFTER UPDATE OF assignee, claimed_at, last_heartbeat_at, claim_expires_at ON issues
+BEGIN
+    DELETE FROM claim_leases WHERE issue_id = new.id;
+END;
+CREATE TRIGGER IF NOT EXISTS claim_leases_change_insert AFTER INSERT ON claim_leases
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('claim_leases', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS claim_leases_change_update AFTER UPDATE ON claim_leases
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('claim_leases', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS claim_leases_change_delete AFTER DELETE ON claim_leases
+BEGIN
+    INSERT INTO change_counters (name, version) VALUES ('claim_leases', 1)
+        ON CONFLICT(name) DO UPDATE SET version = version + 1;
+END;
 """
 
 # V1 schema (without file tables) — kept for migration tests.
@@ -505,4 +727,4 @@ CREATE TRIGGER IF NOT EXISTS issues_fts_delete AFTER DELETE ON issues BEGIN
 END;
 """
 
-CURRENT_SCHEMA_VERSION = 15
+CURRENT_SCHEMA_VERSION = 21
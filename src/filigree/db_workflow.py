@@ -66,6 +66,17 @@ def _build_builtin_category_maps() -> tuple[
 
 _BUILTIN_CATEGORY_BY_TYPE_STATE, _BUILTIN_UNAMBIGUOUS_DONE_NAMES, _BUILTIN_UNAMBIGUOUS_WIP_NAMES = _build_builtin_category_maps()
 
+# Resolves an ``issues`` row's category through ``status_categories`` —
+# the same lookup the schema triggers use (see SCHEMA_SQL).
+_STATUS_CATEGORY_LOOKUP_SQL = (
+    "COALESCE("
+    "(SELECT c.category FROM status_categories c WHERE c.type = issues.type AND c.status = issues.status), "
+    "CASE WHEN issues.status = 'archived' THEN 'done' END, "
+    "(SELECT 'open' FROM status_categories c WHERE c.type = issues.type AND c.status = ''), "
+    "(SELECT c.category FROM status_categories c WHERE c.type = '' AND c.status = issues.status), "
+    "'open')"
+)
+
 
 class WorkflowMixin(DBMixinProtocol):
     """Template and workflow operations for FiligreeDB.
@@ -121,11 +132,15 @@ class WorkflowMixin(DBMixinProtocol):
         """Clear the cached template registry so it reloads on next access.
 
         Also refreshes ``self.enabled_packs`` from config.json when no
-        explicit override was provided at construction time.
+        explicit override was provided at construction time, and re-syncs
+        the ``status_categories`` mirror (which reloads the registry) so the
+        trigger-maintained blocker counters follow the new workflow.
         """
         self._template_registry = None
         if self._enabled_packs_override is None:
             self._refresh_enabled_packs()
+        if self._sync_status_categories():
+            self.conn.commit()
 
     def _refresh_enabled_packs(self) -> None:
         """Re-read enabled_packs from config.json and update self.enabled_packs."""
@@ -264,37 +279,73 @@ class WorkflowMixin(DBMixinProtocol):
         self,
         category: str,
         *,
-        type_col: str,
-        status_col: str,
+        alias: str = "",
         include_archived: bool = False,
     ) -> tuple[str, list[str]]:
-        """Build a SQL fragment matching rows whose ``(type, status)`` maps to *category*.
-
-        Returns ``(sql, params)``. ``include_archived`` ORs in the synthetic
-        ``status='archived'`` terminal status — used only by blocker
-        semantics, where ``archive_closed()`` rows must count as no-longer-
-        blocking even though ``'archived'`` is not a workflow state.
-
-        When no ``(type, state)`` pair matches the requested category (and
-        ``include_archived`` is false), returns ``("0", [])`` — a SQL-valid
-        always-false predicate — so callers do not need to special-case
-        empty registries.
+        """Build a SQL fragment matching rows whose status category is *category*.
+
+        Returns ``(sql, params)`` against the trigger-maintained
+        ``status_category`` column of the row aliased *alias* (bare column
+        names when empty), so the filter is one indexed comparison rather
+        than an OR over every registered ``(type, state)`` pair.
+
+        The column classifies the synthetic ``status='archived'`` written by
+        ``archive_closed()`` as done, matching ``_resolve_status_category``.
+        ``include_archived`` keeps those rows in a ``"done"`` match — blocker
+        semantics, where archived rows must count as no-longer-blocking.
+        Without it, ``"done"`` excludes them so archival selection and
+        ``status="done"`` listings do not pick up already-archived rows.
+        """
+        col = f"{alias}." if alias else ""
+        sql = f"{col}status_category = ?"
+        if category == "done" and not include_archived:
+            sql = f"({sql} AND {col}status != 'archived')"
+        return (sql, [category])
+
+    def _status_category_rows(self) -> dict[tuple[str, str], str]:
+        """Rows for the ``status_categories`` mirror of ``_resolve_status_category``.
+
+        Besides the exact ``(type, state)`` pairs (active templates plus the
+        bundled floor for inactive types), two sentinel kinds carry the
+        fallback rules: ``(type, "")`` marks an active type, whose undeclared
+        states resolve to open, and ``("", state)`` records a state name that
+        is unambiguously done or wip across the bundled packs.
         """
-        pairs = self._get_type_states_for_category(category)
-        parts: list[str] = []
-        params: list[str] = []
-        if include_archived:
-            parts.append(f"{status_col} = 'archived'")
-        if pairs:
-            ors = " OR ".join(f"({type_col} = ? AND {status_col} = ?)" for _ in pairs)
-            parts.append(f"({ors})")
-            for t, s in pairs:
-                params.extend([t, s])
-        if not parts:
-            return ("0", [])
-        if len(parts) == 1:
-            return (parts[0], params)
-        return ("(" + " OR ".join(parts) + ")", params)
+        rows = {(t, s): cat for cat in ("open", "wip", "done") for t, s in self._get_type_states_for_category(cat)}
+        for tpl in self.templates.list_types():
+            rows[(tpl.type, "")] = "open"
+        for name in _BUILTIN_UNAMBIGUOUS_DONE_NAMES:
+            rows[("", name)] = "done"
+        for name in _BUILTIN_UNAMBIGUOUS_WIP_NAMES:
+            rows[("", name)] = "wip"
+        return rows
+
+    def _sync_status_categories(self) -> bool:
+        """Mirror the registry's category resolution into ``status_categories``.
+
+        The triggers that maintain ``issues.status_category`` and the
+        open-blocker counters consult this table. When the mirror changes,
+        every row's category is re-resolved and the counters recomputed,
+        because both may have flipped for existing issues. Does not commit.
+
+        Returns True when the table was rewritten.
+        """
+        desired = self._status_category_rows()
+        current = {
+            (r["type"], r["status"]): r["category"] for r in self.conn.execute("SELECT type, status, category FROM status_categories")
+        }
+        if current == desired:
+            return False
+        self.conn.execute("DELETE FROM status_categories")
+        self.conn.executemany(
+            "INSERT INTO status_categories (type, status, category) VALUES (?, ?, ?)",
+            [(t, s, cat) for (t, s), cat in desired.items()],
+        )
+        self.conn.execute(
+            f"UPDATE issues SET status_category = {_STATUS_CATEGORY_LOOKUP_SQL} WHERE status_category IS NOT {_STATUS_CATEGORY_LOOKUP_SQL}"
+        )
+        self._recount_open_blockers()
+        return True
 
     def _blocker_done_states(self) -> list[str]:
         """States that count as 'no longer blocking dependents'.
@@ -0,0 +1,75 @@
+"""Timer-based debouncing for write-behind work in long-running processes.
+
+``LeaseBuffer`` (batched heartbeat writes) and ``SummaryScheduler``
+(``context.md`` regeneration) both defer work by a short window so a burst
+of triggers costs one write, run it on a background thread, and must be
+flushable on demand and on shutdown. ``Debouncer`` is that machinery; the
+owners keep their own state (what is pending) and decide in their callback
+whether there is anything to do.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class Debouncer(Generic[_T]):
+    """Run *run* once per quiet period of ``window`` seconds, on a timer thread.
+
+    The first ``trigger()`` in a quiet period arms a daemon timer; further
+    triggers before it fires are absorbed. ``flush()`` cancels the timer and
+    runs on the calling thread, returning *run*'s result. ``close()``
+    flushes and makes later triggers run synchronously, as does a
+    ``window`` of 0. Runs are serialised, so a flush never races the timer
+    thread, and the timer is disarmed before each run starts, so a trigger
+    that arrives mid-run arms a fresh one.
+    """
+
+    def __init__(self, run: Callable[[], _T], *, window: float, name: str = "filigree-debounce") -> None:
+        self.window = window
+        self.name = name
+        self._run = run
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._closed = False
+        self._timer: threading.Timer | None = None
+
+    def trigger(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                return
+            if self._closed or self.window <= 0:
+                timer = None
+            else:
+                timer = self._timer = threading.Timer(self.window, self._run_now)
+                timer.name = self.name
+                timer.daemon = True
+        if timer is None:
+            self._run_now()
+        else:
+            timer.start()
+
+    def flush(self) -> _T:
+        """Run now, cancelling the timer."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        return self._run_now()
+
+    def close(self) -> _T:
+        """Flush, then run every later trigger synchronously. Owners must call it on shutdown."""
+        with self._lock:
+            self._closed = True
+        return self.flush()
+
+    def _run_now(self) -> _T:
+        with self._run_lock:
+            with self._lock:
+                if self._timer is threading.current_thread():
+                    self._timer = None
+            return self._run()
@@ -0,0 +1,277 @@
+"""In-memory index over the ``dependencies`` table.
+
+``FiligreeDB.dependency_graph()`` builds one ``DependencyGraph`` per SQLite
+connection and reuses it until ``PRAGMA data_version`` reports a commit from
+another connection. Writes made through ``FiligreeDB`` patch the cached graph
+in place, so cycle checks, critical-path DP and scope BFS stop re-reading the
+full edge list on every call.
+
+The graph also maintains a topological order online (Pearce & Kelly, "A
+Dynamic Topological Sort Algorithm for Directed Acyclic Graphs", 2006). An
+edge whose blocker already sorts before the blocked issue — the common case
+when agents add edges in roadmap order — is accepted in O(1) with no
+reachability search; otherwise only the slice of the order between the two
+endpoints is searched and re-ranked.
+
+The graph holds topology only (edges and their ``type``). Status-derived
+facts — open-blocker counts, readiness — already live in trigger-maintained
+SQL columns, so a status change never touches the graph.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class DependencyGraph:
+    """Adjacency sets for ``issue_id -> depends_on_id`` edges plus a topological rank.
+
+    ``blockers(x)`` are the issues *x* waits on; ``dependents(x)`` are the
+    issues waiting on *x*. ``_rank`` orders every node with edges so each
+    blocker ranks below the issues it blocks. If the loaded data already
+    holds a cycle (only possible via raw SQL or a foreign import) the rank is
+    marked unusable and the graph falls back to plain BFS/Kahn.
+    """
+
+    __slots__ = ("_blocked_by", "_blocks", "_high_rank", "_low_rank", "_rank", "_ranked")
+
+    def __init__(self, edges: Iterable[tuple[str, str, str]] = ()) -> None:
+        # issue_id -> {depends_on_id: dep_type}; insertion order is kept so
+        # ``edges()`` is stable between calls.
+        self._blocked_by: dict[str, dict[str, str]] = {}
+        self._blocks: dict[str, set[str]] = {}
+        for issue_id, depends_on_id, dep_type in edges:
+            self._link(issue_id, depends_on_id, dep_type)
+        self._rank: dict[str, int] = {}
+        # Unused ranks at either end, for nodes seen for the first time.
+        self._low_rank = -1
+        self._high_rank = 0
+        self._ranked = self._rank_from_scratch()
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection) -> DependencyGraph:
+        """Build a graph from every row of ``dependencies`` visible on *conn*."""
+        rows = conn.execute("SELECT issue_id, depends_on_id, type FROM dependencies").fetchall()
+        return cls((r[0], r[1], r[2] or "blocks") for r in rows)
+
+    # -- Mutation -------------------------------------------------------------
+
+    def add_edge(self, issue_id: str, depends_on_id: str, dep_type: str = "blocks") -> None:
+        """Record ``issue_id -> depends_on_id`` and keep the rank topological.
+
+        Callers are expected to have rejected cycles via
+        ``would_create_cycle``; an edge that closes one anyway is stored and
+        the rank is abandoned for the rest of this graph's life.
+        """
+        existed = self.has_edge(issue_id, depends_on_id)
+        self._link(issue_id, depends_on_id, dep_type)
+        if existed or not self._ranked:
+            return
+        # A first-time blocker ranks below everything and a first-time
+        # blocked issue above everything, so edges touching a new node never
+        # need re-ranking.
+        lower = self._rank_of(depends_on_id, first_seen_low=True)
+        upper = self._rank_of(issue_id)
+        if lower < upper:
+            return
+        # Pearce-Kelly: the blocker ranks at or above the blocked issue.
+        # Collect what must move — everything downstream of issue_id and
+        # upstream of depends_on_id inside the [upper, lower] window — and
+        # re-deal that window's ranks, upstream set first.
+        forward, closed = self._downstream_within(issue_id, lower, stop_at=depends_on_id)
+        if closed:
+            self._ranked = False
+            return
+        backward = self._upstream_within(depends_on_id, upper)
+        moved = sorted(backward, key=self._rank.__getitem__) + sorted(forward, key=self._rank.__getitem__)
+        for node, rank in zip(moved, sorted(self._rank[n] for n in moved), strict=True):
+            self._rank[node] = rank
+
+    def remove_edge(self, issue_id: str, depends_on_id: str) -> None:
+        # Deleting an edge never invalidates a topological order.
+        targets = self._blocked_by.get(issue_id)
+        if targets is not None:
+            targets.pop(depends_on_id, None)
+            if not targets:
+                del self._blocked_by[issue_id]
+        sources = self._blocks.get(depends_on_id)
+        if sources is not None:
+            sources.discard(issue_id)
+            if not sources:
+                del self._blocks[depends_on_id]
+
+    def _link(self, issue_id: str, depends_on_id: str, dep_type: str) -> None:
+        self._blocked_by.setdefault(issue_id, {})[depends_on_id] = dep_type
+        self._blocks.setdefault(depends_on_id, set()).add(issue_id)
+
+    def _rank_of(self, node: str, *, first_seen_low: bool = False) -> int:
+        rank = self._rank.get(node)
+        if rank is None:
+            if first_seen_low:
+                rank = self._low_rank
+                self._low_rank -= 1
+            else:
+                rank = self._high_rank
+                self._high_rank += 1
+            self._rank[node] = rank
+        return rank
+
+    def _rank_from_scratch(self) -> bool:
+        """Rank every node in Kahn order; False if a cycle prevents it."""
+        nodes = list(dict.fromkeys([*self._blocked_by, *self._blocks]))
+        order = self._kahn(nodes)
+        for node in order:
+            self._rank_of(node)
+        return len(order) == len(nodes)
+
+    # -- Lookup ---------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return sum(len(targets) for targets in self._blocked_by.values())
+
+    def has_edge(self, issue_id: str, depends_on_id: str) -> bool:
+        return depends_on_id in self._blocked_by.get(issue_id, {})
+
+    def blockers(self, issue_id: str) -> Iterator[str]:
+        """Issues *issue_id* depends on."""
+        return iter(self._blocked_by.get(issue_id, {}))
+
+    def dependents(self, issue_id: str) -> Iterator[str]:
+        """Issues that depend on *issue_id*."""
+        return iter(self._blocks.get(issue_id, ()))
+
+    def edges(self, sources: Iterable[str] | None = None) -> Iterator[tuple[str, str, str]]:
+        """Yield ``(issue_id, depends_on_id, dep_type)`` for every edge, or only those leaving *sources*."""
+        if sources is None:
+            items: Iterable[tuple[str, dict[str, str]]] = self._blocked_by.items()
+        else:
+            items = ((issue_id, self._blocked_by.get(issue_id, {})) for issue_id in sources)
+        for issue_id, targets in items:
+            for depends_on_id, dep_type in targets.items():
+                yield issue_id, depends_on_id, dep_type
+
+    # -- Traversal ------------------------------------------------------------
+
+    def reaches(self, start: str, target: str) -> bool:
+        """Whether *target* is reachable from *start* along dependency edges."""
+        if start == target:
+            return True
+        visited = {start}
+        queue = deque([start])
+        while queue:
+            for nxt in self._blocked_by.get(queue.popleft(), ()):
+                if nxt == target:
+                    return True
+                if nxt not in visited:
+                    visited.add(nxt)
+                    queue.append(nxt)
+        return False
+
+    def would_create_cycle(self, issue_id: str, depends_on_id: str) -> bool:
+        """Whether adding ``issue_id -> depends_on_id`` would close a cycle.
+
+        With a valid rank this is O(1) whenever the blocker already ranks
+        below *issue_id*; otherwise only nodes ranked between the two are
+        visited.
+        """
+        if issue_id == depends_on_id:
+            return True
+        if not self._ranked:
+            return self.reaches(depends_on_id, issue_id)
+        lower = self._rank.get(depends_on_id)
+        upper = self._rank.get(issue_id)
+        # A node with no rank has no edges, so it cannot be on a cycle.
+        if lower is None or upper is None or lower < upper:
+            return False
+        return self._downstream_within(issue_id, lower, stop_at=depends_on_id)[1]
+
+    def _downstream_within(self, start: str, max_rank: int, *, stop_at: str) -> tuple[set[str], bool]:
+        """Dependents reachable from *start* ranked <= *max_rank*; flag if *stop_at* is one."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            for nxt in self._blocks.get(stack.pop(), ()):
+                if nxt == stop_at:
+                    return seen, True
+                if nxt not in seen and self._rank[nxt] <= max_rank:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return seen, False
+
+    def _upstream_within(self, start: str, min_rank: int) -> set[str]:
+        """Blockers reachable from *start* ranked >= *min_rank*."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            for nxt in self._blocked_by.get(stack.pop(), ()):
+                if nxt not in seen and self._rank[nxt] >= min_rank:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return seen
+
+    def neighbourhood(self, root: str, radius: int) -> set[str]:
+        """Issues within *radius* undirected hops of *root* (including *root*)."""
+        seen = {root}
+        frontier = [root]
+        for _ in range(radius):
+            nxt_frontier: list[str] = []
+            for node in frontier:
+                for nxt in (*self._blocked_by.get(node, ()), *self._blocks.get(node, ())):
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        nxt_frontier.append(nxt)
+            if not nxt_frontier:
+                break
+            frontier = nxt_frontier
+        return seen
+
+    def _kahn(self, nodes: list[str]) -> list[str]:
+        """Topological order of the subgraph induced by *nodes*; cycle members are dropped."""
+        members = set(nodes)
+        in_degree = {n: sum(1 for b in self._blocked_by.get(n, ()) if b in members) for n in nodes}
+        queue = deque(n for n in nodes if in_degree[n] == 0)
+        order: list[str] = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for nxt in self._blocks.get(node, ()):
+                if nxt in members:
+                    in_degree[nxt] -= 1
+                    if in_degree[nxt] == 0:
+                        queue.append(nxt)
+        return order
+
+    def longest_chain(self, nodes: Iterable[str]) -> list[str]:
+        """Longest blocker-to-blocked chain within the subgraph induced by *nodes*.
+
+        Longest-path DP over the maintained rank (or a fresh Kahn order if
+        the rank is unusable). Returns the chain ordered from root blocker
+        to final blocked issue, or ``[]`` when no edge joins two of *nodes*.
+        Ties resolve to the earliest end node in *nodes* order.
+        """
+        order = list(dict.fromkeys(nodes))
+        if not order:
+            return []
+        members = set(order)
+        # Unranked nodes have no edges; their position is irrelevant.
+        topo = sorted(order, key=lambda n: self._rank.get(n, 0)) if self._ranked else self._kahn(order)
+        dist = dict.fromkeys(order, 0)
+        pred: dict[str, str | None] = dict.fromkeys(order, None)
+        for node in topo:
+            for nxt in self._blocks.get(node, ()):
+                if nxt in members and dist[node] + 1 > dist[nxt]:
+                    dist[nxt] = dist[node] + 1
+                    pred[nxt] = node
+
+        end = max(order, key=dist.__getitem__)
+        if dist[end] == 0:
+            return []
+        path = [end]
+        prev = pred[end]
+        while prev is not None:
+            path.append(prev)
+            prev = pred[prev]
+        path.reverse()
+        return path
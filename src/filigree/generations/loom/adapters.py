@@ -303,7 +303,15 @@ def change_record_to_loom(record: EventRecordWithTitle) -> ChangeRecordLoom:
     )
 
 
-def list_response(items: list[Any], *, limit: int, offset: int, total: int | None = None, has_more: bool | None = None) -> dict[str, Any]:
+def list_response(
+    items: list[Any],
+    *,
+    limit: int,
+    offset: int,
+    total: int | None = None,
+    has_more: bool | None = None,
+    next_cursor: str | None = None,
+) -> dict[str, Any]:
     """Build a unified ``ListResponse[T]`` envelope.
 
     Two paging modes:
@@ -318,6 +326,11 @@ def list_response(items: list[Any], *, limit: int, offset: int, total: int | Non
     ``next_offset`` is omitted entirely (NotRequired) when
     ``has_more`` is False, matching the documented ``ListResponse``
     contract: present only when there is more to fetch.
+
+    Keyset-capable endpoints also pass ``next_cursor``, emitted under the
+    same rule. ``next_offset`` is still emitted alongside it so the
+    envelope invariant holds; on a cursor-fetched page it counts from the
+    cursor, so clients walking by cursor should ignore it.
     """
     if has_more is None:
         if total is None:
@@ -327,6 +340,8 @@ def list_response(items: list[Any], *, limit: int, offset: int, total: int | Non
     body: dict[str, Any] = {"items": items, "has_more": has_more}
     if has_more:
         body["next_offset"] = offset + len(items)
+        if next_cursor is not None:
+            body["next_cursor"] = next_cursor
     return body
 
 
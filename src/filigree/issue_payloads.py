@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, cast
 
 from filigree.models import Issue
 from filigree.types.api import PublicIssue, ReadyIssue, SlimIssue
 
+SLIM_ISSUE_KEYS: tuple[str, ...] = tuple(SlimIssue.__annotations__)
+PUBLIC_ISSUE_KEYS: tuple[str, ...] = tuple(PublicIssue.__annotations__)
+
+# Public keys that stay empty unless their relation is hydrated (``include=``).
+_KEY_RELATIONS = {
+    "labels": "labels",
+    "blocks": "deps",
+    "blocked_by": "deps",
+    "children": "children",
+    "fields": "fields",
+    "data_warnings": "fields",
+}
+
 
 def issue_to_slim(issue: Issue) -> SlimIssue:
     """Return the lightweight issue projection used by list-style surfaces."""
@@ -19,9 +33,18 @@ def issue_to_slim(issue: Issue) -> SlimIssue:
     )
 
 
-def issue_to_ready(issue: Issue, *, include_context: bool = False, parent_title: str | None = None) -> ReadyIssue:
-    """Return a ready-queue projection, optionally enriched with parent context."""
-    payload = cast(ReadyIssue, dict(issue_to_slim(issue)))
+def issue_to_ready(
+    issue: Issue,
+    *,
+    include_context: bool = False,
+    parent_title: str | None = None,
+    keys: Sequence[str] | None = SLIM_ISSUE_KEYS,
+) -> ReadyIssue:
+    """Return a ready-queue projection, optionally enriched with parent context.
+
+    *keys* selects issue keys as in ``issue_to_fields``; the default is the slim shape.
+    """
+    payload = cast(ReadyIssue, issue_to_fields(issue, keys))
     if include_context:
         payload["parent_issue_id"] = issue.parent_id
         payload["parent_title"] = parent_title if issue.parent_id else None
@@ -73,3 +96,18 @@ def public_issue_with(issue: Issue, **extra: Any) -> dict[str, Any]:
     payload: dict[str, Any] = dict(issue_to_public(issue))
     payload.update(extra)
     return payload
+
+
+def issue_include_for(keys: Sequence[str] | None) -> frozenset[str] | None:
+    """Return the ``include`` relations needed to fill *keys* (``None`` means every key)."""
+    if keys is None:
+        return None
+    return frozenset(_KEY_RELATIONS[key] for key in keys if key in _KEY_RELATIONS)
+
+
+def issue_to_fields(issue: Issue, keys: Sequence[str] | None) -> dict[str, Any]:
+    """Return the public issue shape cut down to *keys*, in that order (``None`` keeps all)."""
+    payload: dict[str, Any] = dict(issue_to_public(issue))
+    if keys is None:
+        return payload
+    return {key: payload[key] for key in keys}
@@ -0,0 +1,249 @@
+"""Write-behind buffer for claim heartbeats.
+
+``heartbeat_work`` records liveness as one guarded upsert into the
+``claim_leases`` table (schema v21) — no event, no touch of the issue row.
+In a long-running server fronting many agents even that is a commit, and an
+fsync, per ping. ``LeaseBuffer`` absorbs heartbeats in memory instead and
+writes everything pending in one transaction per ``window`` on a background
+thread, through its own short-lived connection, so the heartbeating request
+never waits on the write lock.
+
+The owning ``FiligreeDB`` overlays pending heartbeats on its reads, so the
+process that accepted them sees them immediately; other processes see them
+after the next flush. A crash loses at most one window of heartbeats, which
+only makes those leases look ``window`` seconds older than they are.
+
+``ClaimReaper`` is the other half of the lease lifecycle: in the same
+long-running servers it periodically releases claims whose lease has
+expired (``reap_expired_claims``), so work held by a dead agent returns to
+the ready queue without anyone having to notice it first.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from filigree.debounce import Debouncer
+from filigree.types.core import ISOTimestamp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEARTBEAT_FLUSH_SECONDS = 5.0
+
+# How often long-running servers release expired claims. Override with
+# ``claim_reap_seconds`` in config.json or the env var below; 0 disables.
+DEFAULT_CLAIM_REAP_SECONDS = 60.0
+CLAIM_REAP_ENV = "FILIGREE_CLAIM_REAP_SECONDS"
+# Claims released per transaction, so a backlog never holds the write lock long.
+DEFAULT_REAP_BATCH_SIZE = 100
+# How long past its expiry a claim must be before the reaper releases it. A
+# reaper only flushes its own process's LeaseBuffer; a heartbeat buffered by
+# another process reaches claim_leases up to one flush window late, so the
+# grace covers that window twice over (a slow or retried flush).
+DEFAULT_REAP_GRACE_SECONDS = 2 * DEFAULT_HEARTBEAT_FLUSH_SECONDS
+# Actor recorded on the ``released`` events the reaper writes.
+CLAIM_REAPER_ACTOR = "claim-reaper"
+
+# Parameters: (last_heartbeat_at, claim_expires_at, issue_id, assignee,
+# last_heartbeat_at). Writes nothing when the issue has been reassigned, or
+# re-claimed after this heartbeat, since it was accepted; never moves an
+# existing lease backwards.
+LEASE_UPSERT_SQL = (
+    "INSERT INTO claim_leases (issue_id, assignee, last_heartbeat_at, claim_expires_at) "
+    "SELECT id, assignee, ?, ? FROM issues "
+    "WHERE id = ? AND assignee = ? AND COALESCE(last_heartbeat_at, '') <= ? "
+    "ON CONFLICT(issue_id) DO UPDATE SET assignee = excluded.assignee, "
+    "last_heartbeat_at = excluded.last_heartbeat_at, claim_expires_at = excluded.claim_expires_at "
+    "WHERE excluded.last_heartbeat_at >= claim_leases.last_heartbeat_at"
+)
+
+
+@dataclass(frozen=True)
+class PendingLease:
+    """A heartbeat accepted but not yet written."""
+
+    assignee: str
+    last_heartbeat_at: ISOTimestamp
+    claim_expires_at: ISOTimestamp
+
+    def upsert_params(self, issue_id: str) -> tuple[str, str, str, str, str]:
+        return (self.last_heartbeat_at, self.claim_expires_at, issue_id, self.assignee, self.last_heartbeat_at)
+
+
+class LeaseBuffer:
+    """Coalesced, batched ``claim_leases`` writes for long-running processes.
+
+    ``put()`` keeps only the latest heartbeat per issue. The first one in a
+    quiet period arms a timer, and ``window`` seconds later every pending
+    heartbeat is written in one transaction. Entries stay visible through
+    ``get()`` until their write commits, so there is no gap in which a
+    reader sees neither. A failed flush keeps them for the next attempt.
+
+    ``flush()`` writes immediately on the calling thread; ``close()``
+    flushes and makes later ``put()`` calls write through. Owners must call
+    ``close()`` on shutdown.
+    """
+
+    def __init__(self, db_path: str | Path, *, window: float = DEFAULT_HEARTBEAT_FLUSH_SECONDS) -> None:
+        self.db_path = Path(db_path)
+        self.flushes = 0
+        self._lock = threading.Lock()
+        self._pending: dict[str, PendingLease] = {}
+        self._debouncer = Debouncer(self._write_pending, window=window, name="filigree-heartbeat-flush")
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def window(self) -> float:
+        return self._debouncer.window
+
+    def get(self, issue_id: str) -> PendingLease | None:
+        with self._lock:
+            return self._pending.get(issue_id)
+
+    def put(self, issue_id: str, lease: PendingLease) -> None:
+        with self._lock:
+            self._pending[issue_id] = lease
+        self._debouncer.trigger()
+
+    def flush(self) -> int:
+        """Write every pending heartbeat now, cancelling the timer. Returns how many were written."""
+        return self._debouncer.flush()
+
+    def close(self) -> None:
+        self._debouncer.close()
+
+    def _write_pending(self) -> int:
+        with self._lock:
+            batch = dict(self._pending)
+        if not batch:
+            return 0
+        try:
+            conn = sqlite3.connect(str(self.db_path))
+            try:
+                conn.execute("PRAGMA busy_timeout=5000")
+                with conn:
+                    conn.executemany(LEASE_UPSERT_SQL, [lease.upsert_params(iid) for iid, lease in batch.items()])
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            logger.warning("Failed to flush %d buffered heartbeat(s) to %s", len(batch), self.db_path, exc_info=True)
+            return 0
+        with self._lock:
+            for issue_id, lease in batch.items():
+                # A newer heartbeat for the same issue may have arrived mid-write.
+                if self._pending.get(issue_id) is lease:
+                    del self._pending[issue_id]
+        self.flushes += 1
+        return len(batch)
+
+
+def claim_reap_seconds(filigree_dir: Path) -> float:
+    """Resolve the expired-claim reap interval for a project.
+
+    Precedence: ``FILIGREE_CLAIM_REAP_SECONDS`` env var, then
+    ``claim_reap_seconds`` in config.json, then
+    ``DEFAULT_CLAIM_REAP_SECONDS``. Unparseable or negative values are
+    ignored with a warning. ``0`` disables the reaper.
+    """
+    from filigree.core import _resolve_seconds
+
+    return _resolve_seconds(filigree_dir, CLAIM_REAP_ENV, "claim_reap_seconds", DEFAULT_CLAIM_REAP_SECONDS)
+
+
+class ClaimReaper:
+    """Periodic release of expired claims for long-running processes.
+
+    Every ``interval`` seconds a daemon thread calls ``reap(batch_size)``,
+    which releases up to ``batch_size`` expired claims in one transaction
+    and returns how many it released. A full batch is followed straight
+    away by another, so a backlog drains within one scan without holding
+    the write lock across all of it.
+
+    ``run_once()`` scans on the calling thread. ``stats()`` reports scans,
+    claims reaped, failures and scan latency. ``close()`` stops the thread;
+    owners must call it on shutdown.
+    """
+
+    def __init__(
+        self,
+        reap: Callable[[int], int],
+        *,
+        interval: float = DEFAULT_CLAIM_REAP_SECONDS,
+        batch_size: int = DEFAULT_REAP_BATCH_SIZE,
+    ) -> None:
+        self.interval = interval
+        self.batch_size = batch_size
+        self.scans = 0
+        self.reaped = 0
+        self.failures = 0
+        self.last_scan_seconds: float | None = None
+        self._reap = reap
+        self._scan_seconds_max = 0.0
+        # Serialises scans so run_once() never races the thread.
+        self._scan_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the scan thread. No-op when already running or ``interval`` is 0."""
+        if self._thread is not None or self.interval <= 0:
+            return
+        self._stop.clear()
+
+        def run() -> None:
+            while not self._stop.wait(self.interval):
+                self.run_once()
+
+        self._thread = threading.Thread(target=run, name="filigree-claim-reaper", daemon=True)
+        self._thread.start()
+
+    def run_once(self) -> int:
+        """Reap every currently expired claim. Returns how many were released."""
+        with self._scan_lock:
+            started = time.monotonic()
+            total = 0
+            try:
+                while True:
+                    released = self._reap(self.batch_size)
+                    total += released
+                    if released < self.batch_size or self._stop.is_set():
+                        break
+            except Exception:
+                self.failures += 1
+                logger.warning("Expired-claim scan failed after releasing %d claim(s)", total, exc_info=True)
+            elapsed = time.monotonic() - started
+            self.scans += 1
+            self.reaped += total
+            self.last_scan_seconds = elapsed
+            self._scan_seconds_max = max(self._scan_seconds_max, elapsed)
+        if total:
+            logger.info("Released %d expired claim(s) in %.1f ms", total, elapsed * 1000)
+        else:
+            logger.debug("Expired-claim scan found nothing in %.1f ms", elapsed * 1000)
+        return total
+
+    def stats(self) -> dict[str, Any]:
+        """Running totals and scan latency, for health endpoints and logs."""
+        return {
+            "interval_seconds": self.interval,
+            "scans": self.scans,
+            "reaped": self.reaped,
+            "failures": self.failures,
+            "last_scan_ms": round(self.last_scan_seconds * 1000, 1) if self.last_scan_seconds is not None else None,
+            "scan_ms_max": round(self._scan_seconds_max * 1000, 1),
+        }
+
+    def close(self) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
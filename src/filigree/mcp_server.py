@@ -13,12 +13,15 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import atexit
+import contextlib
 import logging
 import sqlite3
 import sys
+import threading
 import time
 import weakref
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from contextvars import ContextVar, Token
 from pathlib import Path
 from typing import Any
@@ -45,11 +48,12 @@ from filigree.core import (
 )
 from filigree.db_schema import CURRENT_SCHEMA_VERSION
 from filigree.install_support.version_marker import format_schema_mismatch_guidance
+from filigree.leases import claim_reap_seconds
 from filigree.mcp_tools.common import (  # noqa: F401  — re-exported for backward compat
     _MAX_LIST_RESULTS,
     _text,
 )
-from filigree.summary import generate_summary, write_summary
+from filigree.summary import SummaryScheduler, generate_summary, summary_debounce_seconds, write_summary
 from filigree.types.api import ErrorCode, ErrorResponse, SchemaVersionMismatchError
 
 # ---------------------------------------------------------------------------
@@ -83,6 +87,19 @@ _db_open_error: Exception | None = None
 _tool_locks: weakref.WeakKeyDictionary[FiligreeDB, asyncio.Lock] = weakref.WeakKeyDictionary()
 
 
+# Debounced context.md regeneration (see ``summary.SummaryScheduler``). Off
+# by default so in-process callers keep the synchronous write; the long-running
+# entry points (stdio ``_run`` and the dashboard's MCP lifespan) switch it on
+# and flush every scheduler on the way out.
+_summary_debounce = False
+_summary_schedulers: dict[Path, SummaryScheduler] = {}
+_summary_schedulers_lock = threading.Lock()
+
+# Set while ``execute_batch`` runs its operations: the tool handlers it calls
+# skip their own ``_refresh_summary`` and the batch refreshes once at the end.
+_summary_deferred: ContextVar[bool] = ContextVar("filigree_summary_deferred", default=False)
+
+
 def _lock_for(db_obj: FiligreeDB) -> asyncio.Lock:
     lock = _tool_locks.get(db_obj)
     if lock is None:
@@ -125,19 +142,83 @@ def _resolve_request_filigree_dir(active_db: FiligreeDB) -> Path:
     return active_db.db_path.parent
 
 
-def _refresh_summary() -> None:
-    """Regenerate context.md after mutations (best-effort, never fatal)."""
+def _log_summary_failure(exc: Exception) -> None:
+    log = _logger or logging.getLogger(__name__)
+    if isinstance(exc, OSError):
+        log.warning("Failed to write context.md", exc_info=exc)
+    else:
+        log.error(
+            "BUG in summary generation — context.md not updated. This is likely a code defect, not a database problem.",
+            exc_info=exc,
+        )
+
+
+def _refresh_summary(*, force: bool = False) -> None:
+    """Regenerate context.md after mutations (best-effort, never fatal).
+
+    When debouncing is enabled this only marks the project's summary dirty;
+    a ``SummaryScheduler`` regenerates it once per window off the request
+    path. ``force=True`` writes before returning either way, folding in any
+    pending debounced regeneration.
+    Inside ``execute_batch`` it does nothing until the batch is done.
+    """
+    if _summary_deferred.get():
+        return
     filigree_dir = _get_filigree_dir()
-    if filigree_dir is not None:
-        try:
-            write_summary(_get_db(), filigree_dir / SUMMARY_FILENAME)
-        except OSError:
-            (_logger or logging.getLogger(__name__)).warning("Failed to write context.md", exc_info=True)
-        except Exception:
-            (_logger or logging.getLogger(__name__)).error(
-                "BUG in summary generation — context.md not updated. This is likely a code defect, not a database problem.",
-                exc_info=True,
+    if filigree_dir is None:
+        return
+    try:
+        active_db = _get_db()
+        if _summary_debounce:
+            scheduler = _summary_scheduler(active_db, filigree_dir)
+            scheduler.mark_dirty()
+            if force:
+                scheduler.flush()
+            return
+        write_summary(active_db, filigree_dir / SUMMARY_FILENAME)
+    except Exception as exc:
+        _log_summary_failure(exc)
+
+
+def _summary_scheduler(active_db: FiligreeDB, filigree_dir: Path) -> SummaryScheduler:
+    with _summary_schedulers_lock:
+        scheduler = _summary_schedulers.get(filigree_dir)
+        if scheduler is None:
+            scheduler = SummaryScheduler(
+                active_db,
+                filigree_dir / SUMMARY_FILENAME,
+                window=summary_debounce_seconds(filigree_dir),
+                on_error=_log_summary_failure,
             )
+            _summary_schedulers[filigree_dir] = scheduler
+        else:
+            # The dashboard may reopen a project's DB; regenerate from the
+            # handle the latest mutation went through.
+            scheduler.db = active_db
+        return scheduler
+
+
+def _enable_summary_debounce() -> None:
+    global _summary_debounce
+    _summary_debounce = True
+
+
+def _flush_summaries() -> None:
+    """Write every pending debounced summary and drop the schedulers.
+
+    Called on server shutdown (and as an ``atexit`` safety net) so a
+    mutation made inside the last debounce window still reaches context.md.
+    """
+    global _summary_debounce
+    with _summary_schedulers_lock:
+        schedulers = list(_summary_schedulers.values())
+        _summary_schedulers.clear()
+        _summary_debounce = False
+    for scheduler in schedulers:
+        scheduler.close()
+
+
+atexit.register(_flush_summaries)
 
 
 def _find_venv_root(executable: Path) -> Path | None:
@@ -329,6 +410,13 @@ def _allowed_tool_arguments(tool: Tool) -> set[str]:
 
 _tool_argument_names: dict[str, set[str]] = {tool.name: _allowed_tool_arguments(tool) for tool in _all_tools}
 
+# Tools declared ``readOnlyHint`` by their domain module. ``call_tool`` runs
+# these on a pooled read-only connection in a worker thread instead of
+# queueing them behind the per-DB writer lock.
+_read_only_tools: frozenset[str] = frozenset(
+    tool.name for tool in _all_tools if tool.annotations is not None and tool.annotations.readOnlyHint
+)
+
 
 def _unknown_argument_error(tool_name: str, arguments: object) -> ErrorResponse | None:
     if not isinstance(arguments, dict):
@@ -522,6 +610,20 @@ async def list_tools() -> list[Tool]:
     return _all_tools
 
 
+def _run_read_only(active_db: FiligreeDB, handler: Callable[..., Any], arguments: dict[str, Any]) -> list[TextContent]:
+    """Worker-thread body for read-only tools.
+
+    Binds a pooled read-only connection to this thread for the duration of
+    the handler, so every ``self.conn`` access inside ``FiligreeDB`` resolves
+    to it. ``asyncio.to_thread`` copies the caller's context, so the
+    request-scoped ``_request_db`` / ``_request_filigree_dir`` ContextVars
+    stay visible to the handler.
+    """
+    with active_db.read_connection():
+        out: list[TextContent] = asyncio.run(handler(arguments))
+        return out
+
+
 @server.call_tool()  # type: ignore[untyped-decorator]
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     t0 = time.monotonic()
@@ -581,12 +683,31 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return _common_text(unknown_argument_error)
 
-    # Serialise tool execution per-DB. The MCP SDK dispatches tool calls
-    # concurrently; the shared ``sqlite3.Connection`` on ``FiligreeDB`` has
-    # no transaction isolation between coroutines, and the finally-rollback
-    # below would otherwise erase a sibling coroutine's uncommitted writes.
-    # See filigree-33a938b515.
     active_db = _request_db.get() or db
+    if name in _read_only_tools and active_db is not None and active_db.read_pool_enabled:
+        # Read-only tools never touch the shared writer connection: each runs
+        # in a worker thread on a pooled read-only connection (WAL readers do
+        # not block the writer or each other), so a slow list/plan call no
+        # longer queues every other agent's reads behind the writer lock.
+        # Warm the template registry on the loop thread first so worker
+        # threads never race its lazy load.
+        active_db.templates  # noqa: B018
+        try:
+            result = await asyncio.to_thread(_run_read_only, active_db, handler, arguments)
+        except Exception:
+            if _logger:
+                _logger.error("tool_error", extra={"tool": name, "args_data": arguments}, exc_info=True)
+            raise
+        duration_ms = round((time.monotonic() - t0) * 1000, 1)
+        if _logger:
+            _logger.info("tool_call", extra={"tool": name, "args_data": arguments, "duration_ms": duration_ms})
+        return result
+
+    # Serialise mutating tool execution per-DB. The MCP SDK dispatches tool
+    # calls concurrently; the shared ``sqlite3.Connection`` on ``FiligreeDB``
+    # has no transaction isolation between coroutines, and the
+    # finally-rollback below would otherwise erase a sibling coroutine's
+    # uncommitted writes. See filigree-33a938b515.
     lock = _lock_for(active_db) if active_db is not None else None
 
     async def _run() -> list[TextContent]:
@@ -747,7 +868,16 @@ def create_mcp_app(
                 if db_token is not None:
                     _request_db.reset(db_token)
 
-    return _handle_mcp, session_manager.run
+    @contextlib.asynccontextmanager
+    async def _lifespan() -> AsyncIterator[None]:
+        _enable_summary_debounce()
+        try:
+            async with session_manager.run():
+                yield
+        finally:
+            await asyncio.to_thread(_flush_summaries)
+
+    return _handle_mcp, _lifespan
 
 
 # ---------------------------------------------------------------------------
@@ -834,10 +964,17 @@ async def _run(project_path: Path | None) -> None:
         print("Run `filigree doctor` for diagnosis.", file=sys.stderr)
         sys.exit(1)
 
+    _enable_summary_debounce()
+    if db is not None:
+        # Long-running: batch heartbeat writes and release expired claims;
+        # db.close() flushes the former and stops the latter.
+        db.enable_heartbeat_buffer()
+        db.enable_claim_reaper(claim_reap_seconds(filigree_dir))
     try:
         async with stdio_server() as (read_stream, write_stream):
             await server.run(read_stream, write_stream, server.create_initialization_options())
     finally:
+        _flush_summaries()
         if db is not None:
             db.close()
 
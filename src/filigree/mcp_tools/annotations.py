@@ -13,7 +13,7 @@ from filigree.core import (
     VALID_ANNOTATION_STATUSES,
     VALID_ANNOTATION_TARGET_TYPES,
 )
-from filigree.mcp_tools.common import _list_response, _parse_args, _text, _validate_actor, _validate_int_range, _validate_str
+from filigree.mcp_tools.common import _READ_ONLY, _list_response, _parse_args, _text, _validate_actor, _validate_int_range, _validate_str
 from filigree.types.api import ErrorCode, ErrorResponse
 from filigree.types.inputs import (
     AnnotateFileArgs,
@@ -103,11 +103,13 @@ def _common_annotation_tools() -> list[Tool]:
         ),
         Tool(
             name="list_annotations",
+            annotations=_READ_ONLY,
             description="List shared file annotations with optional filters. Summary detail is the default.",
             inputSchema={"type": "object", "properties": list_filters},
         ),
         Tool(
             name="get_annotation",
+            annotations=_READ_ONLY,
             description="Get a single annotation by annotation_id, including provenance, links, and audit events.",
             inputSchema={
                 "type": "object",
@@ -218,6 +220,7 @@ def _common_annotation_tools() -> list[Tool]:
         ),
         Tool(
             name="get_file_annotations",
+            annotations=_READ_ONLY,
             description="List annotations for a file path. Active critical annotations sort first.",
             inputSchema={
                 "type": "object",
@@ -232,6 +235,7 @@ def _common_annotation_tools() -> list[Tool]:
         ),
         Tool(
             name="get_issue_annotations",
+            annotations=_READ_ONLY,
             description="List annotations linked to an issue or epic. Summary detail is the default.",
             inputSchema={
                 "type": "object",
@@ -246,6 +250,7 @@ def _common_annotation_tools() -> list[Tool]:
         ),
         Tool(
             name="list_attention_annotations",
+            annotations=_READ_ONLY,
             description="List active critical must-consider annotations for a target or file.",
             inputSchema={
                 "type": "object",
@@ -8,16 +8,17 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, TypeVar, cast, get_args
 
-from mcp.types import TextContent
+from mcp.types import TextContent, ToolAnnotations
 
-from filigree.issue_payloads import issue_to_ready, issue_to_slim
+from filigree.issue_payloads import SLIM_ISSUE_KEYS, issue_to_ready, issue_to_slim
 from filigree.models import Issue
 
 if TYPE_CHECKING:
     from filigree.core import FiligreeDB
-from filigree.types.api import ErrorCode, ErrorResponse, ListResponse, ReadyIssue, SlimIssue, TransitionError
+from filigree.types.api import ErrorCode, ErrorResponse, ListDetail, ListResponse, ReadyIssue, SlimIssue, TransitionError
 from filigree.validation import sanitize_actor
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,13 @@ _MAX_SQLITE_OFFSET = 9_223_372_036_854_775_807
 _MAX_SQLITE_OVERFETCH_LIMIT = _MAX_SQLITE_OFFSET - 1
 
 
+# Annotation for tools that never write to the database. ``call_tool`` runs
+# these on a pooled read-only connection outside the per-DB writer lock, so
+# only tag handlers whose whole call graph is SELECT-only (no sweeps, no
+# status reconciliation, no filesystem side effects).
+_READ_ONLY = ToolAnnotations(readOnlyHint=True)
+
+
 def _text(content: object) -> list[TextContent]:
     if isinstance(content, str):
         return [TextContent(type="text", text=content)]
@@ -53,9 +61,15 @@ def _slim_issue(issue: Issue) -> SlimIssue:
     return issue_to_slim(issue)
 
 
-def _ready_issue(issue: Issue, *, include_context: bool = False, parent_title: str | None = None) -> ReadyIssue:
+def _ready_issue(
+    issue: Issue,
+    *,
+    include_context: bool = False,
+    parent_title: str | None = None,
+    keys: Sequence[str] | None = SLIM_ISSUE_KEYS,
+) -> ReadyIssue:
     """Return a ready-queue item, keeping the default shape slim."""
-    return issue_to_ready(issue, include_context=include_context, parent_title=parent_title)
+    return issue_to_ready(issue, include_context=include_context, parent_title=parent_title, keys=keys)
 
 
 def _resolve_pagination(arguments: dict[str, Any]) -> tuple[int, int, list[TextContent] | None]:
@@ -100,11 +114,17 @@ def _apply_has_more(items: list[Any], effective_limit: int) -> tuple[list[Any],
     return items, has_more
 
 
-def _list_response(items: list[Any], *, has_more: bool, next_offset: int | None = None) -> ListResponse[Any]:
+def _list_response(
+    items: list[Any],
+    *,
+    has_more: bool,
+    next_offset: int | None = None,
+    next_cursor: str | None = None,
+) -> ListResponse[Any]:
     """Build a unified ``ListResponse[T]`` envelope for MCP list tools.
 
     Mirrors the loom HTTP ``list_response`` adapter:
-    ``next_offset`` is present only when ``has_more`` is True. Defined here
+    ``next_offset`` / ``next_cursor`` are present only when ``has_more`` is True. Defined here
     rather than reusing the loom adapter to keep the MCP surface free of
     generation-layer dependencies (per the operating principle "MCP reflects
     the living surface only", not "MCP imports loom").
@@ -112,9 +132,31 @@ def _list_response(items: list[Any], *, has_more: bool, next_offset: int | None
     body: ListResponse[Any] = {"items": items, "has_more": has_more}
     if has_more and next_offset is not None:
         body["next_offset"] = next_offset
+    if has_more and next_cursor is not None:
+        body["next_cursor"] = next_cursor
     return body
 
 
+def _list_projection_schema(*, default: ListDetail, fields: Sequence[str], summary: Sequence[str]) -> dict[str, Any]:
+    """``response_detail`` and ``fields`` inputSchema properties for a high-volume list tool."""
+    return {
+        "response_detail": {
+            "type": "string",
+            "enum": list(get_args(ListDetail)),
+            "default": default,
+            "description": (
+                f"Item shape: 'ids' (id only), 'summary' ({', '.join(summary)}) or 'full' (every field). "
+                "Compact shapes also skip the relation queries they don't need."
+            ),
+        },
+        "fields": {
+            "type": "array",
+            "items": {"type": "string", "enum": list(fields)},
+            "description": "Exactly these keys per item (the id is always included). Overrides response_detail.",
+        },
+    }
+
+
 def _validate_str(value: Any, name: str) -> list[TextContent] | None:
     """Return a validation error if *value* is not ``None`` and not a ``str``."""
     if value is not None and not isinstance(value, str):
@@ -22,6 +22,7 @@ from typing import Any
 from mcp.types import TextContent, Tool
 
 from filigree.mcp_tools.common import (
+    _READ_ONLY,
     _parse_args,
     _text,
     _validate_actor,
@@ -97,6 +98,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="list_entity_associations",
+            annotations=_READ_ONLY,
             description=(
                 "Return all Clarion entity bindings attached to an issue. "
                 "Returns raw rows — drift detection is the caller's job per "
@@ -113,6 +115,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="list_associations_by_entity",
+            annotations=_READ_ONLY,
             description=(
                 "Reverse lookup: return every Filigree issue currently bound "
                 "to a given Clarion entity_id. This is the surface Clarion's "
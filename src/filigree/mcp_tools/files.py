@@ -12,6 +12,7 @@ from mcp.types import TextContent, Tool
 from filigree.core import VALID_ASSOC_TYPES, VALID_FINDING_STATUSES, VALID_SEVERITIES
 from filigree.issue_payloads import issue_to_public
 from filigree.mcp_tools.common import (
+    _READ_ONLY,
     _list_response,
     _parse_args,
     _text,
@@ -52,6 +53,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
     tools = [
         Tool(
             name="list_files",
+            annotations=_READ_ONLY,
             description="List tracked files with filtering, sorting, and pagination.",
             inputSchema={
                 "type": "object",
@@ -78,6 +80,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_file",
+            annotations=_READ_ONLY,
             description="Get file details, linked issues, recent findings, and summary by file ID.",
             inputSchema={
                 "type": "object",
@@ -89,6 +92,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_file_timeline",
+            annotations=_READ_ONLY,
             description="Get merged timeline events for a file (finding, association, metadata updates).",
             inputSchema={
                 "type": "object",
@@ -132,6 +136,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_issue_files",
+            annotations=_READ_ONLY,
             description="List files associated with an issue.",
             inputSchema={
                 "type": "object",
@@ -176,6 +181,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_finding",
+            annotations=_READ_ONLY,
             description="Get a single scan finding by ID.",
             inputSchema={
                 "type": "object",
@@ -187,6 +193,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="list_findings",
+            annotations=_READ_ONLY,
             description="List scan findings across all files with optional filters.",
             inputSchema={
                 "type": "object",
@@ -12,11 +12,13 @@ if TYPE_CHECKING:
 from mcp.types import TextContent, Tool
 
 from filigree.core import WrongProjectError
-from filigree.issue_payloads import issue_to_public
+from filigree.issue_payloads import PUBLIC_ISSUE_KEYS, SLIM_ISSUE_KEYS, issue_include_for, issue_to_fields, issue_to_public
 from filigree.mcp_tools.common import (
     _MAX_LIST_RESULTS,
+    _READ_ONLY,
     _apply_has_more,
     _build_transition_error,
+    _list_projection_schema,
     _list_response,
     _parse_args,
     _resolve_pagination,
@@ -24,6 +26,7 @@ from filigree.mcp_tools.common import (
     _text,
     _validate_actor,
     _validate_int_range,
+    _validate_str,
 )
 from filigree.mcp_tools.payloads import file_assoc_to_mcp
 from filigree.types.api import (
@@ -40,6 +43,8 @@ from filigree.types.api import (
     SlimIssue,
     TransitionDetail,
     classify_value_error,
+    parse_issue_include,
+    parse_list_projection,
     parse_response_detail,
 )
 from filigree.types.inputs import (
@@ -78,6 +83,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
     tools = [
         Tool(
             name="get_issue",
+            annotations=_READ_ONLY,
             description="Get full details of an issue including deps, labels, children, ready status. Set include_transitions=true for valid next states.",
             inputSchema={
                 "type": "object",
@@ -104,6 +110,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="list_issues",
+            annotations=_READ_ONLY,
             description="List issues with optional filters. Use status_category for template-aware filtering.",
             inputSchema={
                 "type": "object",
@@ -158,11 +165,27 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
                         "description": f"Max results (default {_MAX_LIST_RESULTS}, capped at {_MAX_LIST_RESULTS} unless no_limit=true)",
                     },
                     "offset": {"type": "integer", "default": 0, "minimum": 0, "description": "Skip first N results"},
+                    "include": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["labels", "deps", "children", "fields"]},
+                        "description": (
+                            "Relations to hydrate (default: all). deps covers blocks and blocked_by. "
+                            "Omitted relations come back empty; pass [] for bare issue rows."
+                        ),
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": (
+                            "Resume after the previous page: pass its next_cursor with the same filters and sort. "
+                            "Cheaper than offset for deep pages and stable under concurrent inserts. Exclusive with offset."
+                        ),
+                    },
                     "no_limit": {
                         "type": "boolean",
                         "default": False,
                         "description": f"Bypass the default result cap of {_MAX_LIST_RESULTS}. Use with caution on large projects.",
                     },
+                    **_list_projection_schema(default="full", fields=PUBLIC_ISSUE_KEYS, summary=SLIM_ISSUE_KEYS),
                 },
             },
         ),
@@ -309,6 +332,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="search_issues",
+            annotations=_READ_ONLY,
             description=(
                 "Search issues by title and description. Pure word-token queries use FTS5 "
                 "with prefix matching for ranked relevance. Queries containing punctuation "
@@ -348,6 +372,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
                         "default": False,
                         "description": f"Bypass the default result cap of {_MAX_LIST_RESULTS}. Use with caution on large projects.",
                     },
+                    **_list_projection_schema(default="summary", fields=PUBLIC_ISSUE_KEYS, summary=SLIM_ISSUE_KEYS),
                 },
                 "required": ["query"],
             },
@@ -493,6 +518,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_stale_claims",
+            annotations=_READ_ONLY,
             description="List assigned, non-done issues whose claim lease has expired or whose legacy assignment is older than the stale threshold.",
             inputSchema={
                 "type": "object",
@@ -814,6 +840,22 @@ async def _handle_list_issues(arguments: dict[str, Any]) -> list[TextContent]:
         return _text(ErrorResponse(error=f"sort_by must be one of {sorted(_LIST_ISSUES_SORT_FIELDS)}", code=ErrorCode.VALIDATION))
     if not isinstance(direction, str) or direction.lower() not in {"asc", "desc"}:
         return _text(ErrorResponse(error="direction must be 'asc' or 'desc'", code=ErrorCode.VALIDATION))
+    cursor = args.get("cursor")
+    cursor_err = _validate_str(cursor, "cursor")
+    if cursor_err:
+        return cursor_err
+    include = parse_issue_include(args.get("include"))
+    if isinstance(include, dict):
+        return _text(include)
+    keys = parse_list_projection(
+        args.get("response_detail"), args.get("fields"), id_key="issue_id", summary=SLIM_ISSUE_KEYS, full=PUBLIC_ISSUE_KEYS, default="full"
+    )
+    if isinstance(keys, dict):
+        return _text(keys)
+    # Relations the projection drops are never queried.
+    needed = issue_include_for(keys)
+    if needed is not None:
+        include = needed if include is None else include & needed
 
     try:
         issues = tracker.list_issues(
@@ -829,13 +871,16 @@ async def _handle_list_issues(arguments: dict[str, Any]) -> list[TextContent]:
             direction=direction,
             limit=effective_limit + 1,
             offset=offset,
+            cursor=cursor,
+            include=include,
         )
     except ValueError as e:
         return _text(ErrorResponse(error=str(e), code=ErrorCode.VALIDATION))
     issues, has_more = _apply_has_more(issues, effective_limit)
-    items = [issue_to_public(i) for i in issues]
+    items = [issue_to_fields(i, keys) for i in issues]
     next_offset = offset + len(items) if has_more else None
-    return _text(_list_response(items, has_more=has_more, next_offset=next_offset))
+    next_cursor = tracker.issue_list_cursor(issues[-1], sort_by=sort_by, direction=direction) if has_more else None
+    return _text(_list_response(items, has_more=has_more, next_offset=next_offset, next_cursor=next_cursor))
 
 
 async def _handle_create_issue(arguments: dict[str, Any]) -> list[TextContent]:
@@ -1006,17 +1051,28 @@ async def _handle_search_issues(arguments: dict[str, Any]) -> list[TextContent]:
             )
         )
     status_category = cast("StatusCategory | None", status_category_raw)
+    keys = parse_list_projection(
+        args.get("response_detail"),
+        args.get("fields"),
+        id_key="issue_id",
+        summary=SLIM_ISSUE_KEYS,
+        full=PUBLIC_ISSUE_KEYS,
+        default="summary",
+    )
+    if isinstance(keys, dict):
+        return _text(keys)
     try:
         issues = tracker.search_issues(
             args["query"],
             limit=effective_limit + 1,
             offset=offset,
             status_category=status_category,
+            include=issue_include_for(keys),
         )
     except ValueError as e:
         return _text(ErrorResponse(error=str(e), code=ErrorCode.VALIDATION))
     issues, has_more = _apply_has_more(issues, effective_limit)
-    items = [_slim_issue(i) for i in issues]
+    items = [issue_to_fields(i, keys) for i in issues]
     next_offset = offset + len(items) if has_more else None
     return _text(_list_response(items, has_more=has_more, next_offset=next_offset))
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import re
 import sqlite3
 from collections.abc import Callable
 from typing import Any, cast, get_args
@@ -11,18 +13,30 @@ from mcp.types import TextContent, Tool
 
 from filigree.issue_payloads import issue_to_public
 from filigree.label_payloads import label_namespace_from_public, label_namespace_item_to_public
-from filigree.mcp_tools.common import _list_response, _parse_args, _text, _validate_actor, _validate_int_range, _validate_str
-from filigree.mcp_tools.payloads import comment_to_mcp, event_to_mcp, undo_result_to_mcp
+from filigree.mcp_tools.common import (
+    _READ_ONLY,
+    _list_projection_schema,
+    _list_response,
+    _parse_args,
+    _text,
+    _validate_actor,
+    _validate_int_range,
+    _validate_str,
+)
+from filigree.mcp_tools.payloads import EVENT_KEYS, EVENT_SUMMARY_KEYS, comment_to_mcp, event_to_mcp, project_keys, undo_result_to_mcp
 from filigree.types.api import (
     AddCommentResult,
     ArchiveClosedResponse,
+    BatchOperationResult,
     BatchResponse,
     CompactEventsResponse,
     ErrorCode,
     ErrorResponse,
+    ExecuteBatchResponse,
     JsonlTransferResponse,
     LabelActionResponse,
     PublicIssue,
+    parse_list_projection,
     parse_response_detail,
 )
 from filigree.types.events import EventType
@@ -32,8 +46,10 @@ from filigree.types.inputs import (
     ArchiveClosedArgs,
     BatchAddCommentArgs,
     BatchAddLabelArgs,
+    BatchOperation,
     BatchRemoveLabelArgs,
     CompactEventsArgs,
+    ExecuteBatchArgs,
     ExportJsonlArgs,
     GetChangesArgs,
     GetCommentsArgs,
@@ -47,6 +63,41 @@ from filigree.types.inputs import (
 
 logger = logging.getLogger(__name__)
 
+# Tools ``execute_batch`` may run. Each commits through ``FiligreeDB`` and
+# nothing else, so ``FiligreeDB.atomic()`` can fold it into one transaction.
+# Excluded: reads, tools with side effects outside the database (files,
+# scanners, processes), heartbeats (buffered, not transactional), and tools
+# that open a transaction of their own (observation triage, undo, import).
+_BATCHABLE_TOOLS = frozenset(
+    {
+        "add_comment",
+        "add_dependency",
+        "add_label",
+        "add_plan_step",
+        "batch_add_comment",
+        "batch_add_label",
+        "batch_close",
+        "batch_remove_label",
+        "batch_update",
+        "claim_issue",
+        "close_issue",
+        "create_issue",
+        "create_plan",
+        "label_subtree",
+        "reclaim_issue",
+        "release_claim",
+        "remove_dependency",
+        "remove_label",
+        "reopen_issue",
+        "start_work",
+        "update_issue",
+    }
+)
+_MAX_BATCH_OPERATIONS = 100
+_BATCH_REF_NAME_RE = re.compile(r"[A-Za-z_][\w-]*")
+# "$name", "$3", "$name.path.0.id"
+_BATCH_REF_RE = re.compile(r"\$([A-Za-z_][\w-]*|\d+)((?:\.[\w-]+)*)")
+
 
 def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
     """Return (tool_definitions, handler_map) for meta-domain tools."""
@@ -78,6 +129,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_comments",
+            annotations=_READ_ONLY,
             description="Get all comments on an issue (for agent-to-agent context handoff)",
             inputSchema={
                 "type": "object",
@@ -246,13 +298,52 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
                 "required": ["issue_ids", "text"],
             },
         ),
+        Tool(
+            name="execute_batch",
+            description=(
+                "Run an ordered list of mutations atomically: one transaction, one commit, one "
+                "context.md refresh. Each operation names a tool and its arguments. A string "
+                "argument '$<ref>' (or '$<index>') is replaced by the issue_id (else id) an earlier "
+                "operation returned, and '$<ref>.<path>' by any field of its result; write '$$' for "
+                "a literal leading '$'. Returns {results: [{tool, ref?, result}]}, one per operation, "
+                "each result exactly as the tool returns it. If any operation fails, nothing is "
+                "committed and the error names the failing operation in details.index. "
+                f"Batchable tools: {', '.join(sorted(_BATCHABLE_TOOLS))}."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "operations": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": _MAX_BATCH_OPERATIONS,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "tool": {"type": "string", "enum": sorted(_BATCHABLE_TOOLS)},
+                                "arguments": {"type": "object", "description": "The tool's arguments"},
+                                "ref": {"type": "string", "description": "Name later operations use to refer to this result"},
+                            },
+                            "required": ["tool"],
+                        },
+                        "description": f"Operations to run in order (at most {_MAX_BATCH_OPERATIONS})",
+                    },
+                    "actor": {
+                        "type": "string",
+                        "description": "Default actor for operations that take one and do not set it",
+                    },
+                },
+                "required": ["operations"],
+            },
+        ),
         Tool(
             name="get_changes",
+            annotations=_READ_ONLY,
             description=(
                 "Get events since a timestamp (for session resumption). Returns chronological event list "
-                "with optional catch-up filters. Heartbeat events are excluded by default so the catch-up "
-                "feed isn't dominated by liveness pings; pass include_heartbeats=true (or type='heartbeat' "
-                "explicitly) to see them."
+                "with optional catch-up filters. heartbeat_work no longer records events; heartbeat events "
+                "written by older versions are excluded by default, pass include_heartbeats=true (or "
+                "type='heartbeat' explicitly) to see them."
             ),
             inputSchema={
                 "type": "object",
@@ -281,16 +372,18 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
                         "type": "boolean",
                         "default": False,
                         "description": (
-                            "Default false — heartbeat events are excluded so the catch-up feed isn't "
-                            "dominated by liveness pings. Set true (or pass type='heartbeat') to include them."
+                            "Default false. Heartbeat events are historical only (heartbeat_work stopped "
+                            "recording them) and are excluded. Set true (or pass type='heartbeat') to include them."
                         ),
                     },
+                    **_list_projection_schema(default="full", fields=EVENT_KEYS, summary=EVENT_SUMMARY_KEYS),
                 },
                 "required": ["since"],
             },
         ),
         Tool(
             name="get_summary",
+            annotations=_READ_ONLY,
             description=(
                 "Get the pre-computed project summary (same as context.md). Default returns markdown "
                 "for human display; pass format='json' to receive a structured envelope "
@@ -316,6 +409,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_stats",
+            annotations=_READ_ONLY,
             description=(
                 "Get project statistics: status_name_counts are literal workflow statuses, "
                 "status_category_counts are template categories (open/wip/done), plus type and ready/blocked counts."
@@ -324,6 +418,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_metrics",
+            annotations=_READ_ONLY,
             description="Flow metrics: cycle time, lead time, throughput. Useful for retrospectives and velocity tracking.",
             inputSchema={
                 "type": "object",
@@ -415,6 +510,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_issue_events",
+            annotations=_READ_ONLY,
             description="Get events for a specific issue, newest first. Useful for reviewing history before undo.",
             inputSchema={
                 "type": "object",
@@ -427,6 +523,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="list_labels",
+            annotations=_READ_ONLY,
             description=(
                 "List all distinct labels grouped by namespace with counts. "
                 "Use get_label_taxonomy to see reserved namespaces and suggested vocabulary."
@@ -446,6 +543,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_label_taxonomy",
+            annotations=_READ_ONLY,
             description=(
                 "Get the full label vocabulary: reserved namespaces, auto-tags, virtual labels, "
                 "and suggested manual labels. Use before adding labels to see what's available."
@@ -467,6 +565,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         "batch_add_label": _handle_batch_add_label,
         "batch_remove_label": _handle_batch_remove_label,
         "batch_add_comment": _handle_batch_add_comment,
+        "execute_batch": _handle_execute_batch,
         "get_changes": _handle_get_changes,
         "get_summary": _handle_get_summary,
         "session_context": _handle_session_context,
@@ -737,6 +836,153 @@ async def _handle_batch_add_comment(arguments: dict[str, Any]) -> list[TextConte
     return _text(result)
 
 
+class _BatchAbortedError(Exception):
+    """Raised inside ``execute_batch``'s transaction to roll it back."""
+
+    def __init__(self, index: int, tool: str, error: ErrorResponse) -> None:
+        super().__init__(error["error"])
+        self.index = index
+        self.tool = tool
+        self.error = error
+
+
+def _resolve_batch_refs(value: Any, results: list[BatchOperationResult], refs: dict[str, int]) -> Any:
+    """Substitute ``$ref`` / ``$ref.path`` strings in *value* with earlier results."""
+    if isinstance(value, dict):
+        return {key: _resolve_batch_refs(item, results, refs) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_batch_refs(item, results, refs) for item in value]
+    if not isinstance(value, str) or not value.startswith("$"):
+        return value
+    if value.startswith("$$"):
+        return value[1:]
+    match = _BATCH_REF_RE.fullmatch(value)
+    if match is None:
+        msg = f"Malformed reference {value!r} (write '$$' for a literal '$')"
+        raise ValueError(msg)
+    name, path = match.group(1), match.group(2)
+    index = int(name) if name.isdigit() else refs.get(name)
+    if index is None or index >= len(results):
+        msg = f"Reference {value!r} does not name an earlier operation"
+        raise ValueError(msg)
+    resolved: Any = results[index]["result"]
+    if not path:
+        # Bare "$ref" is the id: issue_id for issue payloads, else id.
+        path = ".issue_id" if isinstance(resolved, dict) and "issue_id" in resolved else ".id"
+    for segment in path.split(".")[1:]:
+        if isinstance(resolved, dict) and segment in resolved:
+            resolved = resolved[segment]
+        elif isinstance(resolved, list) and segment.isdigit() and int(segment) < len(resolved):
+            resolved = resolved[int(segment)]
+        else:
+            msg = f"Reference {value!r}: the result of operation {index} has no {segment!r}"
+            raise ValueError(msg)
+    return resolved
+
+
+def _batch_operation_error(result: Any) -> ErrorResponse | None:
+    """The error a tool result reports, if any: an error envelope or a non-empty ``failed`` list."""
+    if not isinstance(result, dict):
+        return None
+    if "error" in result and "code" in result:
+        return ErrorResponse(error=str(result["error"]), code=result["code"])
+    failed = result.get("failed")
+    if isinstance(failed, list) and failed:
+        first = failed[0]
+        return ErrorResponse(
+            error=f"{len(failed)} item(s) failed, first {first.get('id')}: {first.get('error')}",
+            code=first.get("code", ErrorCode.VALIDATION),
+        )
+    return None
+
+
+def _validate_batch_operations(operations: object) -> tuple[list[BatchOperation], dict[str, int]] | ErrorResponse:
+    if not isinstance(operations, list) or not operations:
+        return ErrorResponse(error="operations must be a non-empty list", code=ErrorCode.VALIDATION)
+    if len(operations) > _MAX_BATCH_OPERATIONS:
+        return ErrorResponse(
+            error=f"At most {_MAX_BATCH_OPERATIONS} operations per batch, got {len(operations)}", code=ErrorCode.VALIDATION
+        )
+    refs: dict[str, int] = {}
+    for index, op in enumerate(operations):
+        if not isinstance(op, dict):
+            return ErrorResponse(error=f"Operation {index} must be an object", code=ErrorCode.VALIDATION)
+        tool = op.get("tool")
+        if tool not in _BATCHABLE_TOOLS:
+            return ErrorResponse(error=f"Operation {index}: {tool!r} cannot run in a batch", code=ErrorCode.VALIDATION)
+        if not isinstance(op.get("arguments", {}), dict):
+            return ErrorResponse(error=f"Operation {index}: arguments must be an object", code=ErrorCode.VALIDATION)
+        ref = op.get("ref")
+        if ref is not None:
+            if not isinstance(ref, str) or _BATCH_REF_NAME_RE.fullmatch(ref) is None:
+                return ErrorResponse(error=f"Operation {index}: invalid ref {ref!r}", code=ErrorCode.VALIDATION)
+            if ref in refs:
+                return ErrorResponse(
+                    error=f"Operation {index}: ref {ref!r} is already used by operation {refs[ref]}", code=ErrorCode.VALIDATION
+                )
+            refs[ref] = index
+    return cast(list[BatchOperation], operations), refs
+
+
+async def _handle_execute_batch(arguments: dict[str, Any]) -> list[TextContent]:
+    from filigree.mcp_server import _all_handlers, _all_tools, _get_db, _refresh_summary, _summary_deferred, _unknown_argument_error
+
+    args = _parse_args(arguments, ExecuteBatchArgs)
+    default_actor: str | None = None
+    if "actor" in args:
+        default_actor, actor_err = _validate_actor(args["actor"])
+        if actor_err:
+            return actor_err
+    validated = _validate_batch_operations(args.get("operations"))
+    if isinstance(validated, dict):
+        return _text(validated)
+    operations, refs = validated
+    schemas = {tool.name: tool.inputSchema for tool in _all_tools if tool.name in _BATCHABLE_TOOLS}
+    tracker = _get_db()
+    results: list[BatchOperationResult] = []
+    token = _summary_deferred.set(True)
+    try:
+        with tracker.atomic():
+            for index, op in enumerate(operations):
+                tool = op["tool"]
+                try:
+                    op_args = _resolve_batch_refs(op.get("arguments", {}), results, refs)
+                except ValueError as e:
+                    raise _BatchAbortedError(index, tool, ErrorResponse(error=str(e), code=ErrorCode.VALIDATION)) from None
+                if default_actor is not None and "actor" in schemas[tool].get("properties", {}):
+                    op_args.setdefault("actor", default_actor)
+                arg_error = _unknown_argument_error(tool, op_args)
+                missing = [key for key in schemas[tool].get("required", []) if key not in op_args]
+                if arg_error is None and missing:
+                    arg_error = ErrorResponse(error=f"Missing required argument(s): {', '.join(missing)}", code=ErrorCode.VALIDATION)
+                if arg_error is not None:
+                    raise _BatchAbortedError(index, tool, arg_error)
+                content = await _all_handlers[tool](op_args)
+                try:
+                    result = json.loads(content[0].text)
+                except (IndexError, json.JSONDecodeError):
+                    result = content[0].text if content else None
+                error = _batch_operation_error(result)
+                if error is not None:
+                    raise _BatchAbortedError(index, tool, error)
+                entry = BatchOperationResult(tool=tool, result=result)
+                if "ref" in op:
+                    entry["ref"] = op["ref"]
+                results.append(entry)
+    except _BatchAbortedError as aborted:
+        return _text(
+            ErrorResponse(
+                error=f"Operation {aborted.index} ({aborted.tool}) failed, nothing was committed: {aborted.error['error']}",
+                code=aborted.error["code"],
+                details={"index": aborted.index, "tool": aborted.tool},
+            )
+        )
+    finally:
+        _summary_deferred.reset(token)
+    _refresh_summary()
+    return _text(ExecuteBatchResponse(results=results))
+
+
 async def _handle_get_changes(arguments: dict[str, Any]) -> list[TextContent]:
     from datetime import datetime
 
@@ -774,10 +1020,15 @@ async def _handle_get_changes(arguments: dict[str, Any]) -> list[TextContent]:
     event_type = args.get("type")
     if event_type is not None and event_type not in get_args(EventType):
         return _text(ErrorResponse(error=f"Invalid event type: {event_type}", code=ErrorCode.VALIDATION))
-    # Default-exclude heartbeat events so the catch-up firehose isn't
-    # dominated by liveness pings. Callers can opt back in by passing
-    # type='heartbeat' explicitly or include_heartbeats=true to see all
-    # events. (filigree-cb980eee0d, P2.11.)
+    keys = parse_list_projection(
+        args.get("response_detail"), args.get("fields"), id_key="event_id", summary=EVENT_SUMMARY_KEYS, full=EVENT_KEYS, default="full"
+    )
+    if isinstance(keys, dict):
+        return _text(keys)
+    # Default-exclude heartbeat events (filigree-cb980eee0d, P2.11). They
+    # are historical only: heartbeat_work now writes claim_leases and
+    # records no event, so only databases from older versions carry them.
+    # Callers can opt back in with type='heartbeat' or include_heartbeats=true.
     include_heartbeats = args.get("include_heartbeats", False)
     if not isinstance(include_heartbeats, bool):
         return _text(ErrorResponse(error="include_heartbeats must be a boolean", code=ErrorCode.VALIDATION))
@@ -798,10 +1049,11 @@ async def _handle_get_changes(arguments: dict[str, Any]) -> list[TextContent]:
     has_more = len(events) > limit
     if has_more:
         events = events[:limit]
-    items = [event_to_mcp(event) for event in events]
+    items = [project_keys(event_to_mcp(event), keys) for event in events]
     response: dict[str, Any] = dict(_list_response(items, has_more=has_more))
-    response["next_since"] = items[-1]["created_at"] if items else since_normalized
-    response["next_event_id"] = items[-1]["event_id"] if items else after_event_id
+    # Cursors come from the raw events: a projection may have dropped created_at.
+    response["next_since"] = events[-1]["created_at"] if events else since_normalized
+    response["next_event_id"] = events[-1]["id"] if events else after_event_id
     return _text(response)
 
 
@@ -13,6 +13,7 @@ from filigree.issue_payloads import issue_to_public
 from filigree.mcp_tools.common import (
     _MAX_LIST_RESULTS,
     _apply_has_more,
+    _list_projection_schema,
     _list_response,
     _parse_args,
     _resolve_pagination,
@@ -22,8 +23,14 @@ from filigree.mcp_tools.common import (
     _validate_int_range,
     _validate_str,
 )
-from filigree.mcp_tools.payloads import observation_link_to_mcp, observation_to_mcp
-from filigree.types.api import BatchFailure, BatchResponse, ErrorCode, ErrorResponse, parse_response_detail
+from filigree.mcp_tools.payloads import (
+    OBSERVATION_KEYS,
+    OBSERVATION_SUMMARY_KEYS,
+    observation_link_to_mcp,
+    observation_to_mcp,
+    project_keys,
+)
+from filigree.types.api import BatchFailure, BatchResponse, ErrorCode, ErrorResponse, parse_list_projection, parse_response_detail
 from filigree.types.inputs import (
     BatchDismissObservationsArgs,
     BatchLinkObservationsArgs,
@@ -124,6 +131,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
                         "default": "asc",
                         "description": "Sort direction. Default 'asc' (lowest priority number first, oldest first).",
                     },
+                    **_list_projection_schema(default="full", fields=OBSERVATION_KEYS, summary=OBSERVATION_SUMMARY_KEYS),
                 },
             },
         ),
@@ -402,6 +410,16 @@ async def _handle_list_observations(arguments: dict[str, Any]) -> list[TextConte
     effective_limit, offset, pag_err = _resolve_pagination(arguments)
     if pag_err is not None:
         return pag_err
+    keys = parse_list_projection(
+        args.get("response_detail"),
+        args.get("fields"),
+        id_key="observation_id",
+        summary=OBSERVATION_SUMMARY_KEYS,
+        full=OBSERVATION_KEYS,
+        default="full",
+    )
+    if isinstance(keys, dict):
+        return _text(keys)
     tracker = _get_db()
     try:
         observations = tracker.list_observations(
@@ -426,7 +444,8 @@ async def _handle_list_observations(arguments: dict[str, Any]) -> list[TextConte
     # Drops the legacy ``stats`` sibling per the loom precedent (Phase C4 dropped
     # it on the HTTP side); consumers needing observation stats use
     # ``tracker.observation_stats()`` via a dedicated tool.
-    return _text(_list_response([observation_to_mcp(obs) for obs in observations], has_more=has_more, next_offset=next_offset))
+    items = [project_keys(observation_to_mcp(obs), keys) for obs in observations]
+    return _text(_list_response(items, has_more=has_more, next_offset=next_offset))
 
 
 async def _handle_dismiss_observation(arguments: dict[str, Any]) -> list[TextContent]:
@@ -8,9 +8,12 @@ their existing names.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
+from filigree.types.core import ObservationDict
+from filigree.types.events import EventRecordWithTitle
+
 
 def _rename_primary_id(record: Mapping[str, Any], new_key: str) -> dict[str, Any]:
     payload = dict(record)
@@ -49,6 +52,24 @@ def finding_to_mcp(record: Mapping[str, Any]) -> dict[str, Any]:
     return _rename_primary_id(record, "finding_id")
 
 
+def _renamed_keys(cls: type, new_key: str) -> tuple[str, ...]:
+    return tuple(new_key if key == "id" else key for key in cls.__annotations__)
+
+
+# Item keys for ``response_detail`` / ``fields`` on the list tools.
+OBSERVATION_KEYS = _renamed_keys(ObservationDict, "observation_id")
+OBSERVATION_SUMMARY_KEYS = ("observation_id", "summary", "file_path", "line", "priority")
+EVENT_KEYS = _renamed_keys(EventRecordWithTitle, "event_id")
+EVENT_SUMMARY_KEYS = ("event_id", "issue_id", "event_type", "actor", "created_at")
+
+
+def project_keys(payload: dict[str, Any], keys: Sequence[str] | None) -> dict[str, Any]:
+    """Cut *payload* down to *keys*, in that order (``None`` keeps it whole)."""
+    if keys is None:
+        return payload
+    return {key: payload[key] for key in keys if key in payload}
+
+
 def observation_to_mcp(record: Mapping[str, Any]) -> dict[str, Any]:
     return _rename_primary_id(record, "observation_id")
 
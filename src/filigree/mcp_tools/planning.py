@@ -9,8 +9,10 @@ from typing import Any, cast
 
 from mcp.types import TextContent, Tool
 
-from filigree.issue_payloads import issue_to_public
+from filigree.issue_payloads import PUBLIC_ISSUE_KEYS, SLIM_ISSUE_KEYS, issue_include_for, issue_to_public
 from filigree.mcp_tools.common import (
+    _READ_ONLY,
+    _list_projection_schema,
     _list_response,
     _parse_args,
     _ready_issue,
@@ -29,6 +31,7 @@ from filigree.types.api import (
     ErrorResponse,
     PlanResponse,
     PublicIssue,
+    parse_list_projection,
     parse_response_detail,
 )
 from filigree.types.inputs import (
@@ -79,9 +82,11 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_ready",
+            annotations=_READ_ONLY,
             description=(
                 "Get all unassigned issues in the open category with no open blockers, sorted by priority. "
-                "Pass include_context=true to add parent_issue_id and parent_title while preserving the slim default."
+                "Pass include_context=true to add parent_issue_id and parent_title while preserving the slim default. "
+                "response_detail='ids' or fields=[...] trims items further; 'full' returns PublicIssue items."
             ),
             inputSchema={
                 "type": "object",
@@ -91,11 +96,13 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
                         "default": False,
                         "description": "Include parent_issue_id and parent_title on each ready item.",
                     },
+                    **_list_projection_schema(default="summary", fields=PUBLIC_ISSUE_KEYS, summary=SLIM_ISSUE_KEYS),
                 },
             },
         ),
         Tool(
             name="get_blocked",
+            annotations=_READ_ONLY,
             description=(
                 "Get all blocked issues with their blocker ID lists. "
                 "Pass include_blockers=true to hydrate blocker title/status/priority/type context."
@@ -113,6 +120,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_plan",
+            annotations=_READ_ONLY,
             description="Get milestone plan tree showing phases, steps, and progress. Defaults to slim issue records; pass response_detail='full' for full issue payloads.",
             inputSchema={
                 "type": "object",
@@ -305,6 +313,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_critical_path",
+            annotations=_READ_ONLY,
             description="Longest dependency chain among open issues. Helps prioritize work that unblocks the most downstream items.",
             inputSchema={"type": "object", "properties": {}},
         ),
@@ -401,10 +410,22 @@ async def _handle_get_ready(arguments: dict[str, Any]) -> list[TextContent]:
     if not isinstance(include_context, bool):
         return _text(ErrorResponse(error="include_context must be a boolean", code=ErrorCode.VALIDATION))
 
+    keys = parse_list_projection(
+        args.get("response_detail"),
+        args.get("fields"),
+        id_key="issue_id",
+        summary=SLIM_ISSUE_KEYS,
+        full=PUBLIC_ISSUE_KEYS,
+        default="summary",
+    )
+    if isinstance(keys, dict):
+        return _text(keys)
+
     tracker = _get_db()
-    issues = tracker.get_ready()
+    # Hydrate only the relations the requested item shape carries.
+    issues = tracker.get_ready(include=issue_include_for(keys))
     parent_titles = _parent_titles_by_id(tracker, issues) if include_context else {}
-    items = [_ready_issue(i, include_context=include_context, parent_title=parent_titles.get(i.parent_id or "")) for i in issues]
+    items = [_ready_issue(i, include_context=include_context, parent_title=parent_titles.get(i.parent_id or ""), keys=keys) for i in issues]
     return _text(_list_response(items, has_more=False))
 
 
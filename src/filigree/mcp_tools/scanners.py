@@ -17,7 +17,7 @@ from mcp.types import TextContent, Tool
 
 from filigree.bundled_scanners import BUNDLED_SCANNERS, bundled_scanner_matches, get_bundled_scanner, looks_like_stale_bundled_scanner
 from filigree.core import VALID_SEVERITIES
-from filigree.mcp_tools.common import _list_response, _parse_args, _text, _validate_int_range
+from filigree.mcp_tools.common import _READ_ONLY, _list_response, _parse_args, _text, _validate_int_range
 from filigree.mcp_tools.payloads import finding_to_mcp
 from filigree.scanner_callback import resolve_scanner_api_url_with_source
 from filigree.scanner_prompts import PROMPT_PACKS, applicable_prompt_pack_names, expand_prompt_pack_names, list_prompt_packs
@@ -200,6 +200,7 @@ def register(
         ),
         Tool(
             name="list_prompt_packs",
+            annotations=_READ_ONLY,
             description=(
                 "List bundled scanner prompt packs. Prompt packs are advisory review-focus hints; "
                 "they do not restrict what the scanner process can read or report. "
@@ -220,6 +221,7 @@ def register(
         ),
         Tool(
             name="list_available_scanners",
+            annotations=_READ_ONLY,
             description=(
                 "List bundled scanner registrations that can be enabled in this project. "
                 "Returns command availability, command path, enabled state, and target TOML path."
@@ -304,6 +306,7 @@ def register(
         ),
         Tool(
             name="preview_scan",
+            annotations=_READ_ONLY,
             description="Preview the command that would be executed for a scan, without spawning a process.",
             inputSchema={
                 "type": "object",
@@ -320,6 +323,7 @@ def register(
     legacy_tools = [
         Tool(
             name="list_scanners",
+            annotations=_READ_ONLY,
             description=(
                 "List registered scanners from .filigree/scanners/*.toml. Returns available scanner names, "
                 "descriptions, supported file types, prompt support, and risk metadata. If this returns an empty "
@@ -7,7 +7,7 @@ from typing import Any
 
 from mcp.types import TextContent, Tool
 
-from filigree.mcp_tools.common import _list_response, _parse_args, _text
+from filigree.mcp_tools.common import _READ_ONLY, _list_response, _parse_args, _text
 from filigree.types.api import (
     ErrorCode,
     ErrorResponse,
@@ -81,6 +81,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
     tools = [
         Tool(
             name="get_template",
+            annotations=_READ_ONLY,
             description=(
                 "canonical full workflow definition for an issue type: pack, states, transitions, "
                 "initial state, and fields schema. Prefer this for workflow discovery."
@@ -101,26 +102,31 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_workflow_statuses",
+            annotations=_READ_ONLY,
             description="Return workflow statuses by category (open/wip/done) from enabled templates.",
             inputSchema={"type": "object", "properties": {}},
         ),
         Tool(
             name="get_schema",
+            annotations=_READ_ONLY,
             description="Return MCP schema/discovery metadata including entity ID prefixes and the tools that accept each ID family.",
             inputSchema={"type": "object", "properties": {}},
         ),
         Tool(
             name="get_mcp_status",
+            annotations=_READ_ONLY,
             description="Read-only MCP server health and schema-compatibility diagnostic. Safe in schema-mismatch mode.",
             inputSchema={"type": "object", "properties": {}},
         ),
         Tool(
             name="list_types",
+            annotations=_READ_ONLY,
             description="List all registered issue types with their workflow info (states, pack, description).",
             inputSchema={"type": "object", "properties": {}},
         ),
         Tool(
             name="get_type_info",
+            annotations=_READ_ONLY,
             description=("compatibility alias for get_template; returns the same canonical full workflow definition."),
             inputSchema={
                 "type": "object",
@@ -132,11 +138,13 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="list_packs",
+            annotations=_READ_ONLY,
             description="List all enabled workflow packs with their types and metadata.",
             inputSchema={"type": "object", "properties": {}},
         ),
         Tool(
             name="get_valid_transitions",
+            annotations=_READ_ONLY,
             description="Get valid next states for an issue with readiness indicators. Shows which fields are needed before each transition.",
             inputSchema={
                 "type": "object",
@@ -148,6 +156,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="validate_issue",
+            annotations=_READ_ONLY,
             description="Validate an issue against its type template. Returns warnings for missing recommended fields. Call get_valid_transitions first to see allowed state changes.",
             inputSchema={
                 "type": "object",
@@ -159,6 +168,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="get_workflow_guide",
+            annotations=_READ_ONLY,
             description="Get the workflow guide for a pack: state diagram, overview, tips, common mistakes.",
             inputSchema={
                 "type": "object",
@@ -170,6 +180,7 @@ def register() -> tuple[list[Tool], dict[str, Callable[..., Any]]]:
         ),
         Tool(
             name="explain_status",
+            annotations=_READ_ONLY,
             description="Explain a status within a type's workflow: its category, inbound/outbound transitions, and fields required at this status.",
             inputSchema={
                 "type": "object",
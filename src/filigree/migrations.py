@@ -619,6 +619,321 @@ def migrate_v14_to_v15(conn: sqlite3.Connection) -> None:
     add_index(conn, "ix_entity_assoc_entity", "entity_associations", ["clarion_entity_id"])
 
 
+def _blocker_done_sql(alias: str) -> str:
+    """SQL truth value for "row *alias* no longer blocks its dependents"."""
+    return (
+        f"({alias}.status = 'archived' OR EXISTS (SELECT 1 FROM status_categories c "  # noqa: S608
+        f"WHERE c.type = {alias}.type AND c.status = {alias}.status AND c.category = 'done'))"
+    )
+
+
+def _create_open_blocker_count_triggers(conn: sqlite3.Connection) -> None:
+    """Create the triggers that keep issues.open_blocker_count / blocks_open_count current.
+
+    Mirrors the trigger block in SCHEMA_SQL; see the comment there for the
+    counter semantics.
+    """
+    recount = (
+        "open_blocker_count = (SELECT COUNT(*) FROM dependencies d JOIN issues b ON b.id = d.depends_on_id "  # noqa: S608
+        f"WHERE d.issue_id = issues.id AND NOT {_blocker_done_sql('b')}), "
+        f"blocks_open_count = CASE WHEN {_blocker_done_sql('issues')} THEN 0 "
+        "ELSE (SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id "
+        "WHERE d.depends_on_id = issues.id) END"
+    )
+    for event, row, sign in (("INSERT", "new", "+"), ("DELETE", "old", "-")):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS deps_open_count_{event.lower()} AFTER {event} ON dependencies
+            WHEN EXISTS (SELECT 1 FROM issues WHERE id = {row}.issue_id)
+             AND EXISTS (SELECT 1 FROM issues b WHERE b.id = {row}.depends_on_id AND NOT {_blocker_done_sql("b")})
+            BEGIN
+                UPDATE issues SET open_blocker_count = open_blocker_count {sign} 1 WHERE id = {row}.issue_id;
+                UPDATE issues SET blocks_open_count = blocks_open_count {sign} 1 WHERE id = {row}.depends_on_id;
+            END""")  # noqa: S608
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS issues_open_count_status AFTER UPDATE OF status, type ON issues
+        WHEN {_blocker_done_sql("old")} IS NOT {_blocker_done_sql("new")}
+        BEGIN
+            UPDATE issues SET open_blocker_count = open_blocker_count
+                + CASE WHEN {_blocker_done_sql("new")} THEN -1 ELSE 1 END
+             WHERE id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = new.id);
+            UPDATE issues SET blocks_open_count = CASE WHEN {_blocker_done_sql("new")} THEN 0
+                ELSE (SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id
+                      WHERE d.depends_on_id = new.id) END
+             WHERE id = new.id;
+        END""")  # noqa: S608
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS issues_open_count_insert AFTER INSERT ON issues
+        WHEN EXISTS (SELECT 1 FROM dependencies WHERE issue_id = new.id OR depends_on_id = new.id)
+        BEGIN
+            UPDATE issues SET {recount}
+             WHERE id = new.id
+                OR id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = new.id)
+                OR id IN (SELECT depends_on_id FROM dependencies WHERE issue_id = new.id);
+        END""")  # noqa: S608
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS issues_open_count_delete AFTER DELETE ON issues
+        WHEN EXISTS (SELECT 1 FROM dependencies WHERE issue_id = old.id OR depends_on_id = old.id)
+        BEGIN
+            UPDATE issues SET {recount}
+             WHERE id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = old.id)
+                OR id IN (SELECT depends_on_id FROM dependencies WHERE issue_id = old.id);
+        END""")  # noqa: S608
+
+
+def migrate_v15_to_v16(conn: sqlite3.Connection) -> None:
+    """v15 -> v16: Persist open-blocker counters maintained by triggers.
+
+    ``get_ready``, ``get_blocked`` and ``get_stats`` used to recompute "open
+    blockers" with a correlated ``NOT EXISTS (... JOIN issues blocker ...)``
+    subquery per candidate row. The counters turn those into index scans.
+
+    Changes:
+      - issues: add open_blocker_count and blocks_open_count (INTEGER, default 0)
+      - new index idx_issues_open_blockers on issues(open_blocker_count, priority, created_at)
+      - new table status_categories — the registry's (type, state) -> category map
+      - triggers on dependencies/issues that keep both counters current
+
+    The counters are left at 0 here: ``status_categories`` is populated from
+    the template registry by ``FiligreeDB.initialize()``, which rebuilds the
+    counters whenever the mirrored map changes (always, on first open).
+    """
+    add_column(conn, "issues", "open_blocker_count", "INTEGER NOT NULL", "0")
+    add_column(conn, "issues", "blocks_open_count", "INTEGER NOT NULL", "0")
+    add_index(conn, "idx_issues_open_blockers", "issues", ["open_blocker_count", "priority", "created_at"])
+    conn.execute("""        CREATE TABLE IF NOT EXISTS status_categories (
+            type      TEXT NOT NULL,
+            status    TEXT NOT NULL,
+            category  TEXT NOT NULL,
+            PRIMARY KEY (type, status)
+        ) WITHOUT ROWID""")
+    _create_open_blocker_count_triggers(conn)
+
+
+def _status_category_lookup_sql(alias: str) -> str:
+    """SQL expression resolving row *alias*'s category through ``status_categories``."""
+    return (
+        "COALESCE("  # noqa: S608
+        f"(SELECT c.category FROM status_categories c WHERE c.type = {alias}.type AND c.status = {alias}.status), "
+        f"CASE WHEN {alias}.status = 'archived' THEN 'done' END, "
+        f"(SELECT 'open' FROM status_categories c WHERE c.type = {alias}.type AND c.status = ''), "
+        f"(SELECT c.category FROM status_categories c WHERE c.type = '' AND c.status = {alias}.status), "
+        "'open')"
+    )
+
+
+def migrate_v16_to_v17(conn: sqlite3.Connection) -> None:
+    """v16 -> v17: Materialise issues.status_category.
+
+    Category filters used to expand into a ``(type = ? AND status = ?) OR ...``
+    disjunction over every registered pair — over 100 bound parameters with
+    every pack enabled, and unindexable. The column turns them into
+    ``status_category = ?`` against a composite index. ``status_categories``
+    grows sentinel rows so the triggers can reproduce
+    ``_resolve_status_category`` exactly (see the comment in SCHEMA_SQL), and
+    the v16 counter triggers are replaced by ones that classify blockers via
+    the new column.
+
+    Changes:
+      - issues: add status_category (TEXT NOT NULL, default 'open')
+      - new index idx_issues_status_category on issues(status_category, priority, created_at)
+      - triggers: replace issues_open_count_status / issues_open_count_insert
+        with issues_status_category_update / issues_status_category_insert;
+        recreate the remaining counter triggers against status_category
+
+    Values are filled in by ``FiligreeDB.initialize()``: the re-synced
+    ``status_categories`` mirror always differs after this migration, which
+    recomputes every row's category and counters.
+    """
+    add_column(conn, "issues", "status_category", "TEXT NOT NULL", "'open'")
+    add_index(conn, "idx_issues_status_category", "issues", ["status_category", "priority", "created_at"])
+    for trigger in (
+        "deps_open_count_insert",
+        "deps_open_count_delete",
+        "issues_open_count_status",
+        "issues_open_count_insert",
+        "issues_open_count_delete",
+    ):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    recount = (
+        "open_blocker_count = (SELECT COUNT(*) FROM dependencies d JOIN issues b ON b.id = d.depends_on_id "
+        "WHERE d.issue_id = issues.id AND b.status_category != 'done'), "
+        "blocks_open_count = CASE WHEN status_category = 'done' THEN 0 "
+        "ELSE (SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id "
+        "WHERE d.depends_on_id = issues.id) END"
+    )
+    for event, row, sign in (("INSERT", "new", "+"), ("DELETE", "old", "-")):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS deps_open_count_{event.lower()} AFTER {event} ON dependencies
+            WHEN EXISTS (SELECT 1 FROM issues WHERE id = {row}.issue_id)
+             AND EXISTS (SELECT 1 FROM issues b WHERE b.id = {row}.depends_on_id AND b.status_category != 'done')
+            BEGIN
+                UPDATE issues SET open_blocker_count = open_blocker_count {sign} 1 WHERE id = {row}.issue_id;
+                UPDATE issues SET blocks_open_count = blocks_open_count {sign} 1 WHERE id = {row}.depends_on_id;
+            END""")  # noqa: S608
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS issues_status_category_update AFTER UPDATE OF status, type ON issues
+        BEGIN
+            UPDATE issues SET status_category = {_status_category_lookup_sql("new")} WHERE id = new.id;
+            UPDATE issues SET open_blocker_count = open_blocker_count
+                + CASE WHEN (SELECT status_category FROM issues WHERE id = new.id) = 'done' THEN -1 ELSE 1 END
+             WHERE (old.status_category = 'done') IS NOT ((SELECT status_category FROM issues WHERE id = new.id) = 'done')
+               AND id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = new.id);
+            UPDATE issues SET blocks_open_count = CASE WHEN status_category = 'done' THEN 0
+                ELSE (SELECT COUNT(*) FROM dependencies d JOIN issues x ON x.id = d.issue_id
+                      WHERE d.depends_on_id = new.id) END
+             WHERE id = new.id AND (old.status_category = 'done') IS NOT (status_category = 'done');
+        END""")  # noqa: S608
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS issues_status_category_insert AFTER INSERT ON issues
+        BEGIN
+            UPDATE issues SET status_category = {_status_category_lookup_sql("new")} WHERE id = new.id;
+            UPDATE issues SET {recount}
+             WHERE EXISTS (SELECT 1 FROM dependencies WHERE issue_id = new.id OR depends_on_id = new.id)
+               AND (id = new.id
+                    OR id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = new.id)
+                    OR id IN (SELECT depends_on_id FROM dependencies WHERE issue_id = new.id));
+        END""")  # noqa: S608
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS issues_open_count_delete AFTER DELETE ON issues
+        WHEN EXISTS (SELECT 1 FROM dependencies WHERE issue_id = old.id OR depends_on_id = old.id)
+        BEGIN
+            UPDATE issues SET {recount}
+             WHERE id IN (SELECT issue_id FROM dependencies WHERE depends_on_id = old.id)
+                OR id IN (SELECT depends_on_id FROM dependencies WHERE issue_id = old.id);
+        END""")  # noqa: S608
+
+
+def migrate_v17_to_v18(conn: sqlite3.Connection) -> None:
+    """v17 -> v18: Covering indexes for keyset pagination of list_issues.
+
+    ``list_issues(cursor=...)`` resumes from the last row's full sort key
+    (sort column, tie-breakers, id). These indexes match each supported
+    ``ORDER BY`` exactly, so a page is an index seek plus ``LIMIT`` rows
+    instead of a sort over everything after the cursor.
+
+    Changes:
+      - new index idx_issues_keyset_priority on issues(priority, created_at, id)
+      - new index idx_issues_keyset_created on issues(created_at, priority, id)
+      - new index idx_issues_keyset_updated on issues(updated_at, priority, created_at, id)
+    """
+    add_index(conn, "idx_issues_keyset_priority", "issues", ["priority", "created_at", "id"])
+    add_index(conn, "idx_issues_keyset_created", "issues", ["created_at", "priority", "id"])
+    add_index(conn, "idx_issues_keyset_updated", "issues", ["updated_at", "priority", "created_at", "id"])
+
+
+def migrate_v18_to_v19(conn: sqlite3.Connection) -> None:
+    """v18 -> v19: Trigger-maintained change counters.
+
+    ``generate_summary`` rebuilt every context.md section after every write.
+    The counters let it (and any other cache) tell which inputs actually
+    changed since the last render with one primary-key lookup, so a heartbeat
+    or comment no longer recomputes plan progress, the critical path, etc.
+
+    Changes:
+      - new table change_counters (name TEXT PRIMARY KEY, version INTEGER)
+      - triggers on issues, dependencies and events that bump the
+        ``issues``, ``issue_activity``, ``dependencies`` and ``events`` rows
+
+    Counters start empty and appear on first bump; readers treat a missing
+    row as 0.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS change_counters (
+            name     TEXT PRIMARY KEY,
+            version  INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID""")
+    for trigger, event, counter in (
+        ("issues_change_insert", "AFTER INSERT ON issues", "issues"),
+        ("issues_change_delete", "AFTER DELETE ON issues", "issues"),
+        (
+            "issues_change_update",
+            "AFTER UPDATE OF title, status, priority, type, parent_id, assignee, fields, "
+            "status_category, open_blocker_count, blocks_open_count ON issues",
+            "issues",
+        ),
+        ("issues_activity_update", "AFTER UPDATE OF updated_at ON issues", "issue_activity"),
+        ("deps_change_insert", "AFTER INSERT ON dependencies", "dependencies"),
+        ("deps_change_delete", "AFTER DELETE ON dependencies", "dependencies"),
+        ("deps_change_update", "AFTER UPDATE ON dependencies", "dependencies"),
+        ("events_change_insert", "AFTER INSERT ON events", "events"),
+        ("events_change_delete", "AFTER DELETE ON events", "events"),
+    ):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {trigger} {event}
+            BEGIN
+                INSERT INTO change_counters (name, version) VALUES ('{counter}', 1)
+                    ON CONFLICT(name) DO UPDATE SET version = version + 1;
+            END""")  # noqa: S608
+
+
+def migrate_v19_to_v20(conn: sqlite3.Connection) -> None:
+    """v19 -> v20: Change counters for labels and comments.
+
+    Label and comment writes record no event and leave ``issues`` alone, so
+    caches keyed on the v19 counters (dashboard ETags, delta sync) could not
+    see them.
+
+    Changes:
+      - triggers on labels and comments that bump the ``labels`` and
+        ``comments`` rows of change_counters
+    """
+    for trigger, event, counter in (
+        ("labels_change_insert", "AFTER INSERT ON labels", "labels"),
+        ("labels_change_delete", "AFTER DELETE ON labels", "labels"),
+        ("comments_change_insert", "AFTER INSERT ON comments", "comments"),
+        ("comments_change_delete", "AFTER DELETE ON comments", "comments"),
+        ("comments_change_update", "AFTER UPDATE ON comments", "comments"),
+    ):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {trigger} {event}
+            BEGIN
+                INSERT INTO change_counters (name, version) VALUES ('{counter}', 1)
+                    ON CONFLICT(name) DO UPDATE SET version = version + 1;
+            END""")  # noqa: S608
+
+
+def migrate_v20_to_v21(conn: sqlite3.Connection) -> None:
+    """v20 -> v21: Heartbeats move to a claim_leases side table.
+
+    ``heartbeat_work`` used to rewrite the issue row (bumping ``updated_at``)
+    and append a ``heartbeat`` event on every ping, so long-running agents
+    inflated the events log and churned the row every few minutes.
+
+    Changes:
+      - new table claim_leases (issue_id PK, assignee, last_heartbeat_at,
+        claim_expires_at), overriding the issue's lease columns while present
+      - trigger claim_leases_reset dropping the lease whenever the issue's
+        own claim columns are written
+      - triggers bumping the ``claim_leases`` row of change_counters
+
+    Existing heartbeat events stay in the log; no lease rows are created.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS claim_leases (
+            issue_id          TEXT PRIMARY KEY REFERENCES issues(id) ON DELETE CASCADE,
+            assignee          TEXT NOT NULL,
+            last_heartbeat_at TEXT NOT NULL,
+            claim_expires_at  TEXT NOT NULL
+        ) WITHOUT ROWID""")
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS claim_leases_reset
+        AFTER UPDATE OF assignee, claimed_at, last_heartbeat_at, claim_expires_at ON issues
+        BEGIN
+            DELETE FROM claim_leases WHERE issue_id = new.id;
+        END""")
+    for trigger, event in (
+        ("claim_leases_change_insert", "AFTER INSERT ON claim_leases"),
+        ("claim_leases_change_update", "AFTER UPDATE ON claim_leases"),
+        ("claim_leases_change_delete", "AFTER DELETE ON claim_leases"),
+    ):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {trigger} {event}
+            BEGIN
+                INSERT INTO change_counters (name, version) VALUES ('claim_leases', 1)
+                    ON CONFLICT(name) DO UPDATE SET version = version + 1;
+            END""")  # noqa: S608
+
+
 MIGRATIONS: dict[int, MigrationFn] = {
     1: migrate_v1_to_v2,
     2: migrate_v2_to_v3,
@@ -634,6 +949,12 @@ MIGRATIONS: dict[int, MigrationFn] = {
     12: migrate_v12_to_v13,
     13: migrate_v13_to_v14,
     14: migrate_v14_to_v15,
+    15: migrate_v15_to_v16,
+    16: migrate_v16_to_v17,
+    17: migrate_v17_to_v18,
+    18: migrate_v18_to_v19,
+    19: migrate_v19_to_v20,
+    20: migrate_v20_to_v21,
 }
 
 
@@ -828,7 +1149,8 @@ def rebuild_table(
                         Use SQL expressions as values for transformations, e.g.:
                         {"priority": "CASE WHEN priority > 4 THEN 4 ELSE priority END"}
 
-    Warning: This drops all indexes, triggers, and views that reference the table.
+    Warning: This drops all indexes, triggers, and views that reference the table,
+             including triggers on other tables whose bodies mention it.
              Recreate them after calling this function.
     """
     temp_table = f"_filigree_migrate_{table}"
@@ -862,6 +1184,15 @@ def rebuild_table(
     insert_sql = f"INSERT INTO {temp_table} ({insert_cols}) SELECT {select_cols} FROM {table}"  # noqa: S608
     conn.execute(insert_sql)
 
+    # Triggers attached to *other* tables whose bodies mention this one
+    # (e.g. the dependencies -> issues counter triggers) survive DROP TABLE
+    # but make the RENAME below fail schema validation. Drop them too, per
+    # the warning above; the caller recreates them.
+    word = re.compile(rf"\b{re.escape(table)}\b", re.IGNORECASE)
+    for name, sql in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name != ?", (table,)).fetchall():
+        if sql and word.search(sql):
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
     # The caller (migration runner) is responsible for disabling FK
     # enforcement before starting the transaction, so DROP TABLE works
     # even for FK-referenced tables without breaking atomicity.
@@ -16,7 +16,7 @@ import subprocess
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TypedDict
 
 import portalocker
 
@@ -31,6 +31,8 @@ SERVER_CONFIG_FILE = SERVER_CONFIG_DIR / "server.json"
 SERVER_PID_FILE = SERVER_CONFIG_DIR / "server.pid"
 
 DEFAULT_PORT = 8377
+DEFAULT_MAX_OPEN_PROJECTS = 32
+DEFAULT_PROJECT_IDLE_SECONDS = 900.0
 SUPPORTED_SCHEMA_VERSION = CURRENT_SCHEMA_VERSION
 
 # Expected process identity for verify_pid_ownership calls.
@@ -48,10 +50,21 @@ class ProjectEntry(TypedDict):
 class ServerConfig:
     port: int = DEFAULT_PORT
     projects: dict[str, ProjectEntry] = field(default_factory=dict)
+    # Dashboard ProjectStore bounds. At most ``max_open_projects`` project
+    # DBs stay open (least recently used evicted first; 0 = unbounded),
+    # handles unused for ``project_idle_seconds`` are closed (0 = never),
+    # and the ``warm_projects`` most recently written projects are opened
+    # in the background at startup.
+    max_open_projects: int = DEFAULT_MAX_OPEN_PROJECTS
+    project_idle_seconds: float = DEFAULT_PROJECT_IDLE_SECONDS
+    warm_projects: int = 0
 
     def __post_init__(self) -> None:
         if not (1 <= self.port <= 65535):
             raise ValueError(f"port must be between 1 and 65535, got {self.port}")
+        for name in ("max_open_projects", "project_idle_seconds", "warm_projects"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be >= 0, got {getattr(self, name)}")
 
 
 def _read_project_schema_version(filigree_dir: Path) -> int:
@@ -89,6 +102,18 @@ def _backup_corrupt_config() -> None:
         logger.debug("Could not back up corrupt config to %s", backup_path, exc_info=True)
 
 
+def _coerce_non_negative(data: dict[str, Any], key: str, default: float, cast: type[int] | type[float]) -> Any:
+    raw = data.get(key, default)
+    try:
+        value = cast(raw)
+    except (TypeError, ValueError):
+        value = -1
+    if isinstance(raw, bool) or not value >= 0:
+        logger.warning("Invalid %s value %r in server config; using default %s", key, raw, default)
+        return cast(default)
+    return value
+
+
 def read_server_config() -> ServerConfig:
     """Read server.json. Returns defaults if missing or invalid."""
     if not SERVER_CONFIG_FILE.exists():
@@ -126,14 +151,26 @@ def read_server_config() -> ServerConfig:
         if isinstance(v, dict)
     }
 
-    return ServerConfig(port=port, projects=projects)
+    return ServerConfig(
+        port=port,
+        projects=projects,
+        max_open_projects=_coerce_non_negative(data, "max_open_projects", DEFAULT_MAX_OPEN_PROJECTS, int),
+        project_idle_seconds=_coerce_non_negative(data, "project_idle_seconds", DEFAULT_PROJECT_IDLE_SECONDS, float),
+        warm_projects=_coerce_non_negative(data, "warm_projects", 0, int),
+    )
 
 
 def write_server_config(config: ServerConfig) -> None:
     """Write server.json atomically."""
     SERVER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     content = json.dumps(
-        {"port": config.port, "projects": config.projects},
+        {
+            "port": config.port,
+            "projects": config.projects,
+            "max_open_projects": config.max_open_projects,
+            "project_idle_seconds": config.project_idle_seconds,
+            "warm_projects": config.warm_projects,
+        },
         indent=2,
     )
     write_atomic(SERVER_CONFIG_FILE, content + "\n")
@@ -38,13 +38,33 @@ async function writeRequest(path, { method = "POST", body, errorLabel } = {}) {
   }
 }
 
+/**
+ * Expand a `?format=columnar` table back into an array of objects.
+ * Interned columns (listed in `dicts`) hold indexes into their dictionary.
+ */
+export function decodeColumnar(table) {
+  const keys = Object.keys(table.columns);
+  const columns = keys.map((key) => {
+    const values = table.columns[key];
+    const dict = table.dicts[key];
+    return dict ? values.map((i) => dict[i]) : values;
+  });
+  const rows = new Array(table.count);
+  for (let r = 0; r < table.count; r++) {
+    const row = {};
+    for (let k = 0; k < keys.length; k++) row[keys[k]] = columns[k][r];
+    rows[r] = row;
+  }
+  return rows;
+}
+
 // --- Read operations (return data or null) ---
 
 export async function fetchIssues() {
   try {
-    const resp = await fetch(apiUrl("/issues"));
+    const resp = await fetch(apiUrl("/issues?format=columnar"));
     if (!resp.ok) return null;
-    return await resp.json();
+    return decodeColumnar(await resp.json());
   } catch (err) {
     console.warn("[fetchIssues] Network error:", err);
     return null;
@@ -84,33 +104,25 @@ export async function fetchDashboardConfig() {
   }
 }
 
-export async function fetchAllData() {
+/**
+ * Delta sync: a full snapshot when version is null, otherwise only what changed.
+ * Requested columnar (a fraction of the bytes and parse time on big
+ * projects) and decoded here, so callers see plain issue/dependency arrays.
+ */
+export async function fetchSync(version) {
   try {
-    const results = await Promise.allSettled([
-      fetch(apiUrl("/issues")),
-      fetch(apiUrl("/dependencies")),
-      fetch(apiUrl("/stats")),
-    ]);
-    const [issuesRes, depsRes, statsRes] = results;
-    const labels = ["issues", "dependencies", "stats"];
-    for (let i = 0; i < results.length; i++) {
-      const r = results[i];
-      if (r.status !== "fulfilled") {
-        console.error(`[fetchAllData] ${labels[i]} request failed:`, r.reason);
-        return null;
-      }
-      if (!r.value.ok) {
-        console.error(`[fetchAllData] ${labels[i]} returned HTTP ${r.value.status}`);
-        return null;
-      }
+    const query = version ? `&since_version=${encodeURIComponent(version)}` : "";
+    const resp = await fetch(apiUrl(`/sync?format=columnar${query}`));
+    if (!resp.ok) {
+      console.error(`[fetchSync] HTTP ${resp.status}`);
+      return null;
     }
-    return {
-      issues: await issuesRes.value.json(),
-      deps: await depsRes.value.json(),
-      stats: await statsRes.value.json(),
-    };
+    const body = await resp.json();
+    body.issues = decodeColumnar(body.issues);
+    body.dependencies = decodeColumnar(body.dependencies);
+    return body;
   } catch (err) {
-    console.error("[fetchAllData] Unexpected error:", err);
+    console.error("[fetchSync] Network error:", err);
     return null;
   }
 }
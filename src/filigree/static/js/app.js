@@ -11,7 +11,7 @@
 
 // --- Module imports ---
 
-import { fetchAllData, fetchDashboardConfig, fetchProjects } from "./api.js";
+import { fetchDashboardConfig, fetchProjects, fetchSync } from "./api.js";
 import {
   applyFilters,
   applyTypeFilter,
@@ -42,7 +42,14 @@ import {
   switchView,
   updateHash,
 } from "./router.js";
-import { CATEGORY_COLORS, REFRESH_INTERVAL, state, THEME_COLORS } from "./state.js";
+import {
+  applySync,
+  CATEGORY_COLORS,
+  CHANGE_APPLY_DELAY,
+  REFRESH_INTERVAL,
+  state,
+  THEME_COLORS,
+} from "./state.js";
 import {
   batchCloseSelected,
   batchSetPriority,
@@ -149,41 +156,106 @@ import { loadReady } from "./views/ready.js";
 // Core data fetching (lives here because it touches every module)
 // ---------------------------------------------------------------------------
 
+// The first call (and the first after a project switch) loads a full
+// snapshot; later calls send the last sync version and merge only what
+// changed. Calls are serialised so deltas apply in order; a call made
+// while one is in flight schedules exactly one follow-up.
 async function fetchData() {
+  if (state._syncInFlight) {
+    state._syncQueued = true;
+    return state._syncInFlight;
+  }
+  state._syncInFlight = syncData();
+  try {
+    await state._syncInFlight;
+  } finally {
+    state._syncInFlight = null;
+  }
+  if (state._syncQueued) {
+    state._syncQueued = false;
+    await fetchData();
+  }
+}
+
+async function syncData() {
   document.getElementById("refreshIndicator").style.opacity = "1";
   try {
     if (!state.graphConfigLoaded) {
       await loadDashboardConfig();
     }
-    const data = await fetchAllData();
-    if (!data) {
+    const base = state.API_BASE;
+    const delta = await fetchSync(state.syncVersion);
+    if (!delta) {
       console.warn("fetchData: non-OK response");
       return;
     }
-    state.allIssues = data.issues;
-    state.allDeps = data.deps;
-    state.stats = data.stats;
-    state.issueMap = {};
-    state.allIssues.forEach((i) => {
-      state.issueMap[i.id] = i;
-    });
-    rebuildTreeIndex();
-    trackChanges(state.allIssues);
-    computeImpactScores();
-    computeHealthScore();
-    updateStaleBadge();
-    renderSparkline();
-    updateStats();
-    render();
+    if (base !== state.API_BASE) return; // project switched mid-flight
+    applySync(delta);
+    refreshDerivedViews();
   } finally {
-    setTimeout(() => {
-      document.getElementById("refreshIndicator").textContent =
-        `Updated ${new Date().toLocaleTimeString()}`;
-      document.getElementById("refreshIndicator").style.opacity = "0.5";
-    }, 300);
+    markRefreshed();
   }
 }
 
+function refreshDerivedViews() {
+  rebuildTreeIndex();
+  trackChanges(state.allIssues);
+  computeImpactScores();
+  computeHealthScore();
+  updateStaleBadge();
+  renderSparkline();
+  updateStats();
+  render();
+}
+
+function markRefreshed() {
+  setTimeout(() => {
+    document.getElementById("refreshIndicator").textContent =
+      `Updated ${new Date().toLocaleTimeString()}`;
+    document.getElementById("refreshIndicator").style.opacity = "0.5";
+  }, 300);
+}
+
+// ---------------------------------------------------------------------------
+// Live updates — server-sent change notifications
+//
+// The server announces writes; each announcement (coalesced over
+// CHANGE_APPLY_DELAY) triggers one delta sync. The REFRESH_INTERVAL poll
+// only runs while the stream is down.
+// ---------------------------------------------------------------------------
+
+function openChangeStream() {
+  closeChangeStream();
+  if (typeof EventSource === "undefined" || document.hidden) return;
+  const stream = new EventSource(`${state.API_BASE}/events/stream`);
+  state.changeStream = stream;
+  stream.addEventListener("hello", () => {
+    state.changeStreamConnected = true;
+  });
+  stream.addEventListener("changes", queueSync);
+  // EventSource reconnects on its own (resuming via Last-Event-ID); until it
+  // does, the interval poll covers for it.
+  stream.onerror = () => {
+    state.changeStreamConnected = false;
+  };
+}
+
+function closeChangeStream() {
+  if (state.changeStream) state.changeStream.close();
+  state.changeStream = null;
+  state.changeStreamConnected = false;
+  clearTimeout(state._changeApplyTimer);
+  state._changeApplyTimer = null;
+}
+
+function queueSync() {
+  if (state._changeApplyTimer) return;
+  state._changeApplyTimer = setTimeout(() => {
+    state._changeApplyTimer = null;
+    fetchData();
+  }, CHANGE_APPLY_DELAY);
+}
+
 async function loadDashboardConfig() {
   try {
     const config = await fetchDashboardConfig();
@@ -225,6 +297,7 @@ function setProject(key, opts) {
   state.currentProjectKey = key;
   state.API_BASE = key ? `/api/p/${encodeURIComponent(key)}` : "/api";
   state.graphConfigLoaded = false;
+  state.syncVersion = null;
   state.graphData = null;
   state.graphQuery = {};
   state.graphQueryKey = "";
@@ -238,6 +311,7 @@ function setProject(key, opts) {
   if (!opts?.keepDetail) closeDetail();
   updateHash();
   loadDashboardConfig().finally(fetchData);
+  openChangeStream();
 }
 
 async function loadProjects() {
@@ -490,8 +564,15 @@ document.addEventListener("keydown", (e) => {
 // Visibility-change refresh
 // ---------------------------------------------------------------------------
 
+// Hidden tabs drop the change stream so an idle ethereal dashboard can still
+// shut itself down; becoming visible catches up and reconnects.
 document.addEventListener("visibilitychange", () => {
-  if (!document.hidden) fetchData();
+  if (document.hidden) {
+    closeChangeStream();
+  } else {
+    fetchData();
+    openChangeStream();
+  }
 });
 
 // ---------------------------------------------------------------------------
@@ -548,6 +629,7 @@ loadProjectFilterSettings();
   if (!localStorage.getItem("filigree_tour_done")) setTimeout(startTour, 1500);
   initDragAndDrop();
   attachSidebarListeners();
+  if (!state.changeStream) openChangeStream();
   fetch("/api/health")
     .then((r) => r.json())
     .then((d) => {
@@ -560,7 +642,7 @@ loadProjectFilterSettings();
 });
 
 setInterval(() => {
-  if (!document.hidden) fetchData();
+  if (!document.hidden && !state.changeStreamConnected) fetchData();
 }, REFRESH_INTERVAL);
 
 setInterval(loadProjects, 60000);
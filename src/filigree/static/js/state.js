@@ -83,7 +83,10 @@ export const TOUR_STEPS = [
   },
 ];
 
+// Fallback sync poll; only runs while the change stream is disconnected.
 export const REFRESH_INTERVAL = 15000;
+// Settle time before syncing pushed changes, so bursts share one request.
+export const CHANGE_APPLY_DELAY = 250;
 
 // --- Mutable application state ---
 
@@ -158,6 +161,14 @@ export const state = {
   previousIssueState: {},
   changedIds: new Set(),
 
+  // Delta sync and live updates (server-sent change stream)
+  syncVersion: null,
+  _syncInFlight: null,
+  _syncQueued: false,
+  changeStream: null,
+  changeStreamConnected: false,
+  _changeApplyTimer: null,
+
   // List mode sort
   _listSortCol: "priority",
   _listSortDir: "asc",
@@ -179,3 +190,40 @@ export const state = {
   timelineFilter: null,
   hotspots: null,
 };
+
+// --- Delta sync merge ---
+
+/**
+ * Apply a /sync response. Full snapshots replace issues and dependencies;
+ * deltas upsert the returned issues, drop tombstoned ids (and their edges),
+ * and replace the outgoing edges of each id in dependency_sources.
+ */
+export function applySync(delta) {
+  if (delta.full) {
+    state.allIssues = delta.issues;
+    state.allDeps = delta.dependencies;
+  } else {
+    const removed = new Set(delta.removed);
+    const updated = new Map(delta.issues.map((i) => [i.id, i]));
+    const merged = [];
+    state.allIssues.forEach((i) => {
+      if (removed.has(i.id)) return;
+      merged.push(updated.get(i.id) || i);
+      updated.delete(i.id);
+    });
+    updated.forEach((i) => merged.push(i));
+    state.allIssues = merged;
+    const sources = new Set(delta.dependency_sources);
+    if (sources.size || removed.size) {
+      state.allDeps = state.allDeps
+        .filter((d) => !sources.has(d.from) && !removed.has(d.from) && !removed.has(d.to))
+        .concat(delta.dependencies);
+    }
+  }
+  state.stats = delta.stats;
+  state.syncVersion = delta.version;
+  state.issueMap = {};
+  state.allIssues.forEach((i) => {
+    state.issueMap[i.id] = i;
+  });
+}
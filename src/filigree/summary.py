@@ -12,16 +12,27 @@ import os
 import re
 import sqlite3
 import tempfile
+import threading
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import TypeVar
 
-from filigree.core import FiligreeDB
+from filigree.core import FiligreeDB, _resolve_seconds
+from filigree.debounce import Debouncer
 from filigree.models import Issue
 
 logger = logging.getLogger(__name__)
 
 STALE_THRESHOLD_DAYS = 3
 
+_T = TypeVar("_T")
+
+# Debounce window for ``SummaryScheduler``; overridable per project via
+# ``summary_debounce_seconds`` in config.json or the env var below.
+DEFAULT_SUMMARY_DEBOUNCE_SECONDS = 2.0
+SUMMARY_DEBOUNCE_ENV = "FILIGREE_SUMMARY_DEBOUNCE_SECONDS"
+
 
 class _MalformedTimestamp:
     """Sentinel for unparseable timestamps (typed alternative to bare object())."""
@@ -67,44 +78,64 @@ def _parse_iso(ts: str) -> datetime | _MalformedTimestamp:
         return _MALFORMED_TIMESTAMP
 
 
-def generate_summary(db: FiligreeDB) -> str:
-    """Generate the context.md summary from current DB state."""
-    now = datetime.now(UTC)
-    now_iso = now.isoformat(timespec="seconds")
-    stats = db.get_stats()
-    ready = db.get_ready()
-    blocked = db.get_blocked()
-    # Use wip category to capture all work-in-progress states (fixing, verifying, etc.)
-    in_progress = db.list_issues(status="wip", limit=10000)
-    recent = db.get_recent_events(limit=10)
+class SummaryCache:
+    """Per-section memo for ``generate_summary``.
 
-    lines: list[str] = []
-    lines.append(f"# Project Pulse (auto-generated {now_iso})")
-    lines.append("")
+    Each section is stored with the change counters (see ``change_counters``
+    in the schema) it was built from and reused while they are unchanged, so
+    a heartbeat only re-renders the Stale section and a comment re-renders
+    nothing. Sections that depend on the clock cache their
+    rows rather than their lines and are formatted on every render.
 
-    # Batch-fetch parent titles to avoid N+1 queries in render loops
-    parent_ids: set[str] = set()
-    for issue in ready:
-        if issue.parent_id:
-            parent_ids.add(issue.parent_id)
-    for issue in in_progress:
-        if issue.parent_id:
-            parent_ids.add(issue.parent_id)
-    parent_titles: dict[str, str] = {}
-    if parent_ids:
-        # Chunk to stay within SQLite's SQLITE_MAX_VARIABLE_NUMBER limit
-        ids_list = list(parent_ids)
-        chunk_size = 500
-        for i in range(0, len(ids_list), chunk_size):
-            chunk = ids_list[i : i + chunk_size]
-            placeholders = ",".join("?" * len(chunk))
-            rows = db.conn.execute(
-                f"SELECT id, title FROM issues WHERE id IN ({placeholders})",  # noqa: S608
-                chunk,
-            ).fetchall()
-            for r in rows:
-                parent_titles[r["id"]] = _sanitize_title(r["title"])
+    Not thread-safe: the owner (``SummaryScheduler``) serialises renders.
+    The cache is bound to one ``FiligreeDB`` object and clears itself when
+    handed another, since counter values only compare within one database.
+    """
 
+    def __init__(self) -> None:
+        self._db: FiligreeDB | None = None
+        self._entries: dict[str, tuple[tuple[object, ...], object]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def bind(self, db: FiligreeDB) -> None:
+        if db is not self._db:
+            self._db = db
+            self._entries.clear()
+
+    def get(self, section: str, signature: tuple[object, ...], build: Callable[[], _T]) -> _T:
+        """Return *section*'s cached value, rebuilding it if *signature* changed."""
+        entry = self._entries.get(section)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]  # type: ignore[return-value]
+        self.misses += 1
+        value = build()
+        self._entries[section] = (signature, value)
+        return value
+
+
+def _parent_titles(db: FiligreeDB, issues: list[Issue]) -> dict[str, str]:
+    """Batch-fetch parent titles to avoid N+1 queries in render loops."""
+    parent_ids = {issue.parent_id for issue in issues if issue.parent_id}
+    parent_titles: dict[str, str] = {}
+    # Chunk to stay within SQLite's SQLITE_MAX_VARIABLE_NUMBER limit
+    ids_list = list(parent_ids)
+    chunk_size = 500
+    for i in range(0, len(ids_list), chunk_size):
+        chunk = ids_list[i : i + chunk_size]
+        placeholders = ",".join("?" * len(chunk))
+        rows = db.conn.execute(
+            f"SELECT id, title FROM issues WHERE id IN ({placeholders})",  # noqa: S608
+            chunk,
+        ).fetchall()
+        for r in rows:
+            parent_titles[r["id"]] = _sanitize_title(r["title"])
+    return parent_titles
+
+
+def _vitals_lines(db: FiligreeDB) -> list[str]:
+    stats = db.get_stats()
     # Vitals use category counts (open/wip/done) instead of literal status names
     by_cat = stats.get("by_category", {})
     open_count = by_cat.get("open", 0)
@@ -112,14 +143,17 @@ def generate_summary(db: FiligreeDB) -> str:
     done_count = by_cat.get("done", 0)
     ready_count = stats["ready_count"]
     blocked_count = stats["blocked_count"]
+    return [
+        "## Vitals",
+        f"Open: {open_count} | In Progress: {wip_count} | Done: {done_count} | Ready: {ready_count} | Blocked: {blocked_count}",
+        "",
+    ]
 
-    lines.append("## Vitals")
-    lines.append(f"Open: {open_count} | In Progress: {wip_count} | Done: {done_count} | Ready: {ready_count} | Blocked: {blocked_count}")
-    lines.append("")
 
-    # -- Active Plans (milestones)
-    milestones = db.list_issues(type="milestone", status="open", limit=10000)
-    milestones += db.list_issues(type="milestone", status="wip", limit=10000)
+def _plans_lines(db: FiligreeDB) -> list[str]:
+    lines: list[str] = []
+    milestones = db.list_issues(type="milestone", status="open", limit=10000, include=())
+    milestones += db.list_issues(type="milestone", status="wip", limit=10000, include=())
     if milestones:
         lines.append("## Active Plans")
         for ms in milestones:
@@ -150,9 +184,14 @@ def generate_summary(db: FiligreeDB) -> str:
                 lines.append(f"  {marker} {_sanitize_title(phase['title'])} ({p_done}/{p_total} complete{ready_note})")
 
             lines.append("")
+    return lines
+
 
-    # -- Ready to Work (limit 12)
-    lines.append("## Ready to Work (no blockers, by priority)")
+def _ready_lines(db: FiligreeDB) -> list[str]:
+    # Ready rows render no relations, so skip hydrating them.
+    ready = db.get_ready(include=())
+    parent_titles = _parent_titles(db, ready[:12])
+    lines = ["## Ready to Work (no blockers, by priority)"]
     if ready:
         for issue in ready[:12]:
             parent_ctx = ""
@@ -167,9 +206,12 @@ def generate_summary(db: FiligreeDB) -> str:
     else:
         lines.append("- (none)")
     lines.append("")
+    return lines
 
-    # -- In Progress (all wip-category states)
-    lines.append("## In Progress")
+
+def _in_progress_lines(db: FiligreeDB, in_progress: list[Issue]) -> list[str]:
+    parent_titles = _parent_titles(db, in_progress)
+    lines = ["## In Progress"]
     if in_progress:
         for issue in in_progress:
             parent_ctx = ""
@@ -198,12 +240,20 @@ def generate_summary(db: FiligreeDB) -> str:
         if len(needs_attention) > 8:
             lines.append(f"  ...and {len(needs_attention) - 8} more")
         lines.append("")
+    return lines
+
 
+def _stale_lines(in_progress: list[Issue], now: datetime) -> list[str]:
     # -- Stale (wip-category >3 days with no activity)
+    lines: list[str] = []
     stale_cutoff = now - timedelta(days=STALE_THRESHOLD_DAYS)
     stale: list[tuple[Issue, datetime | _MalformedTimestamp]] = []
     for issue in in_progress:
         parsed_updated = _parse_iso(issue.updated_at)
+        # Heartbeats no longer touch updated_at but still count as activity.
+        heartbeat = _parse_iso(issue.last_heartbeat_at) if issue.last_heartbeat_at else None
+        if isinstance(heartbeat, datetime) and isinstance(parsed_updated, datetime):
+            parsed_updated = max(parsed_updated, heartbeat)
         if isinstance(parsed_updated, _MalformedTimestamp) or parsed_updated < stale_cutoff:
             stale.append((issue, parsed_updated))
     if stale:
@@ -217,9 +267,12 @@ def generate_summary(db: FiligreeDB) -> str:
                 line = f'- P{issue.priority} {issue.id} [{issue.type}] "{_sanitize_title(issue.title)}" ({days_ago}d stale)'
             lines.append(line)
         lines.append("")
+    return lines
 
-    # -- Blocked (top 10)
-    lines.append("## Blocked (top 10 by priority)")
+
+def _blocked_lines(db: FiligreeDB) -> list[str]:
+    blocked = db.get_blocked()
+    lines = ["## Blocked (top 10 by priority)"]
     if blocked:
         for issue in blocked[:10]:
             blockers_str = ", ".join(issue.blocked_by) if issue.blocked_by else "?"
@@ -231,14 +284,18 @@ def generate_summary(db: FiligreeDB) -> str:
     else:
         lines.append("- (none)")
     lines.append("")
+    return lines
+
 
+def _epic_lines(db: FiligreeDB) -> list[str]:
     # -- Epic Progress (limit 10; use status_category for done/open checks)
-    epics = db.list_issues(type="epic", limit=10000)
+    lines: list[str] = []
+    epics = db.list_issues(type="epic", limit=10000, include=())
     open_epics = [e for e in epics if e.status_category != "done"]
     if open_epics:
         lines.append("## Epic Progress")
         for epic in open_epics[:10]:
-            children = db.list_issues(parent_id=epic.id, limit=10000)
+            children = db.list_issues(parent_id=epic.id, limit=10000, include=())
             total = len(children)
             done = sum(1 for c in children if c.status_category == "done")
             ready_c = sum(1 for c in children if c.is_ready)
@@ -259,8 +316,11 @@ def generate_summary(db: FiligreeDB) -> str:
 
             lines.append(f"- {_sanitize_title(epic.title):<40} [{bar}] {done}/{total}{extra_str}")
         lines.append("")
+    return lines
+
 
-    # -- Critical Path
+def _critical_path_lines(db: FiligreeDB) -> list[str]:
+    lines: list[str] = []
     crit_path = db.get_critical_path()
     if crit_path:
         lines.append(f"## Critical Path ({len(crit_path)} issues)")
@@ -269,9 +329,12 @@ def generate_summary(db: FiligreeDB) -> str:
             title = _sanitize_title(item["title"])
             lines.append(f'  {arrow}P{item["priority"]} {item["id"]} [{item["type"]}] "{title}"')
         lines.append("")
+    return lines
 
-    # -- Recent Activity
-    lines.append("## Recent Activity (last 10 events)")
+
+def _recent_lines(db: FiligreeDB) -> list[str]:
+    recent = db.get_recent_events(limit=10)
+    lines = ["## Recent Activity (last 10 events)"]
     if recent:
         for evt in recent:
             evt_type = evt["event_type"].upper().replace("_", " ")
@@ -294,8 +357,12 @@ def generate_summary(db: FiligreeDB) -> str:
     else:
         lines.append("- (no recent activity)")
     lines.append("")
+    return lines
 
+
+def _observation_lines(db: FiligreeDB) -> list[str]:
     # Observations (read-only — sweep=False to avoid write side effects on a read path)
+    lines: list[str] = []
     try:
         obs_stats = db.observation_stats(sweep=False)
         if obs_stats["count"] > 0:
@@ -316,13 +383,65 @@ def generate_summary(db: FiligreeDB) -> str:
             lines.append("")
     except sqlite3.OperationalError:
         logger.debug("observation stats unavailable in summary", exc_info=True)
+    return lines
+
+
+def generate_summary(db: FiligreeDB, *, cache: SummaryCache | None = None) -> str:
+    """Generate the context.md summary from current DB state.
+
+    With a ``SummaryCache``, sections whose change counters are unchanged
+    since the previous render are reused instead of re-queried.
+    """
+    now = datetime.now(UTC)
+    now_iso = now.isoformat(timespec="seconds")
+    if cache is None:
+        cache = SummaryCache()
+    cache.bind(db)
+    # Read the counters before any section data: a write landing in between
+    # leaves a section tagged with an older signature, so it is rebuilt next
+    # time rather than served stale.
+    counters = db.get_change_counters()
+    issues_v = counters.get("issues", 0)
+    graph_sig: tuple[object, ...] = (issues_v, counters.get("dependencies", 0))
+
+    lines: list[str] = []
+    lines.append(f"# Project Pulse (auto-generated {now_iso})")
+    lines.append("")
+    lines += cache.get("vitals", graph_sig, lambda: _vitals_lines(db))
+    lines += cache.get("plans", graph_sig, lambda: _plans_lines(db))
+    lines += cache.get("ready", graph_sig, lambda: _ready_lines(db))
+
+    # Use wip category to capture all work-in-progress states (fixing,
+    # verifying, etc.). In Progress needs fields for the Needs Attention
+    # check; Stale also needs fresh updated_at and heartbeats, so it keys on
+    # issue_activity and claim_leases and keeps the rows to re-measure against
+    # the clock on every render.
+    in_progress_rows: list[Issue] | None = None
+
+    def _wip() -> list[Issue]:
+        nonlocal in_progress_rows
+        if in_progress_rows is None:
+            in_progress_rows = db.list_issues(status="wip", limit=10000, include=("fields",))
+        return in_progress_rows
+
+    lines += cache.get("in_progress", (issues_v, db.templates), lambda: _in_progress_lines(db, _wip()))
+    stale_sig = (issues_v, counters.get("issue_activity", 0), counters.get("claim_leases", 0))
+    lines += _stale_lines(cache.get("stale", stale_sig, _wip), now)
+
+    lines += cache.get("blocked", graph_sig, lambda: _blocked_lines(db))
+    lines += cache.get("epics", graph_sig, lambda: _epic_lines(db))
+    lines += cache.get("critical_path", graph_sig, lambda: _critical_path_lines(db))
+    # Event rows carry their issue's current title.
+    lines += cache.get("recent", (counters.get("events", 0), issues_v), lambda: _recent_lines(db))
+    # Observation ages move with the clock; one aggregate query, never cached.
+    lines += _observation_lines(db)
 
     return "\n".join(lines)
 
 
-def write_summary(db: FiligreeDB, output_path: str | Path) -> None:
+def write_summary(db: FiligreeDB, output_path: str | Path, *, cache: SummaryCache | None = None) -> None:
     """Generate and write the summary atomically (write-temp then rename)."""
-    summary = generate_summary(db)
+    summary = generate_summary(db, cache=cache)
     output = Path(output_path)
     fd, tmp_name = tempfile.mkstemp(dir=output.parent, suffix=".tmp", prefix=".context_")
     try:
@@ -339,3 +458,99 @@ def write_summary(db: FiligreeDB, output_path: str | Path) -> None:
         with contextlib.suppress(OSError):
             os.unlink(tmp_name)
         raise
+
+
+def summary_debounce_seconds(filigree_dir: Path) -> float:
+    """Resolve the context.md debounce window for a project.
+
+    Precedence: ``FILIGREE_SUMMARY_DEBOUNCE_SECONDS`` env var, then
+    ``summary_debounce_seconds`` in config.json, then
+    ``DEFAULT_SUMMARY_DEBOUNCE_SECONDS``. Unparseable or negative values are
+    ignored with a warning. ``0`` disables debouncing.
+    """
+    return _resolve_seconds(filigree_dir, SUMMARY_DEBOUNCE_ENV, "summary_debounce_seconds", DEFAULT_SUMMARY_DEBOUNCE_SECONDS)
+
+
+class SummaryScheduler:
+    """Debounced, coalesced ``context.md`` regeneration for long-running processes.
+
+    ``mark_dirty()`` only flags the summary stale. The first flag in a quiet
+    period arms a timer, and ``window`` seconds later one regeneration runs
+    on a background thread, so a burst of mutations (a 50-item batch, an
+    agent's rapid-fire updates) costs a single rebuild and writers never
+    wait on it. The rebuild reads through ``FiligreeDB.read_connection()``,
+    so it does not touch the caller's connection, and reuses unchanged
+    sections through a ``SummaryCache``.
+
+    ``flush()`` runs any pending regeneration immediately on the calling
+    thread; ``close()`` flushes and makes later ``mark_dirty()`` calls
+    synchronous. Owners must call ``close()`` on shutdown so the last
+    mutations always reach disk.
+
+    While a regeneration is pending the scheduler holds a lease on the
+    handle it will read from (``FiligreeDB.lease``), so a shared handle
+    cannot be closed under the timer.
+    """
+
+    def __init__(
+        self,
+        db: FiligreeDB,
+        output_path: str | Path,
+        *,
+        window: float = DEFAULT_SUMMARY_DEBOUNCE_SECONDS,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        self.db = db
+        self.output_path = Path(output_path)
+        self.regenerations = 0
+        self.cache = SummaryCache()
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._leased_db: FiligreeDB | None = None
+        self._debouncer = Debouncer(self._run_pending, window=window, name="filigree-summary")
+
+    @property
+    def window(self) -> float:
+        return self._debouncer.window
+
+    @property
+    def pending(self) -> bool:
+        """Whether a regeneration is owed."""
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        with self._lock:
+            if self._leased_db is None:
+                self._leased_db = self.db
+                self._leased_db.acquire_lease()
+            self._dirty = True
+        self._debouncer.trigger()
+
+    def flush(self) -> None:
+        """Regenerate now if a regeneration is pending, cancelling the timer."""
+        self._debouncer.flush()
+
+    def close(self) -> None:
+        self._debouncer.close()
+
+    def _run_pending(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            leased, self._leased_db = self._leased_db, None
+        db = leased or self.db
+        try:
+            with db.read_connection():
+                write_summary(db, self.output_path, cache=self.cache)
+        except Exception as exc:
+            if self._on_error is None:
+                logger.warning("Failed to regenerate %s", self.output_path, exc_info=True)
+            else:
+                self._on_error(exc)
+            return
+        finally:
+            if leased is not None:
+                leased.release_lease()
+        self.regenerations += 1
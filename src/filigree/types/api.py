@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from enum import StrEnum
-from typing import Any, Generic, Literal, NotRequired, TypedDict, TypeVar, assert_never
+from typing import Any, Generic, Literal, NotRequired, TypedDict, TypeVar, assert_never, get_args
 
 from filigree.types.core import ISOTimestamp, IssueDict, StatusCategory
 from filigree.types.events import EventType
-from filigree.types.planning import CommentRecord, PlanTree, StatsResult
+from filigree.types.planning import CommentRecord, DependencyRecord, PlanTree, StatsResult
 
 # ---------------------------------------------------------------------------
 # Shared types
@@ -242,6 +243,82 @@ class EnrichedIssueDetail(IssueDict):
     comments: list[CommentRecord]
 
 
+class SyncResponse(TypedDict):
+    """Dashboard delta sync (``GET /api/sync``).
+
+    ``full`` snapshots replace client state; deltas merge ``issues``, drop
+    ``removed`` ids, and replace the outgoing edges of ``dependency_sources``
+    with ``dependencies``.
+    """
+
+    version: str
+    full: bool
+    issues: list[IssueDict]
+    removed: list[str]
+    dependencies: list[DependencyRecord]
+    dependency_sources: list[str]
+    stats: StatsWithPrefix
+
+
+class ColumnarTable(TypedDict):
+    """Column-major encoding of a list of records (dashboard ``?format=columnar``).
+
+    ``columns[key][i]`` is record *i*'s value for *key*. Columns listed in
+    ``dicts`` are interned: they hold indexes into ``dicts[key]``, the
+    column's distinct values in first-seen order.
+    """
+
+    count: int
+    columns: dict[str, list[Any]]
+    dicts: dict[str, list[Any]]
+
+
+class FederatedIssue(IssueDict):
+    """An issue in a server-mode cross-project result (``/api/federated/…``).
+
+    ``rank`` is the project-local FTS5 rank (search only; ``None`` for
+    LIKE-fallback hits).
+    """
+
+    project: str
+    rank: NotRequired[float | None]
+
+
+class FederatedProjectStatus(TypedDict):
+    """How one project answered a federated query.
+
+    ``error`` / ``code`` are present unless ``status`` is ``"ok"``.
+    """
+
+    project: str
+    name: str
+    status: Literal["ok", "timeout", "error"]
+    count: int
+    elapsed_ms: float
+    error: NotRequired[str]
+    code: NotRequired[ErrorCode]
+
+
+class FederatedProjectResult(FederatedProjectStatus):
+    """One project's line in a federated NDJSON stream."""
+
+    results: list[FederatedIssue]
+
+
+class FederatedResponse(TypedDict):
+    """Merged federated result: globally ranked rows plus per-project status."""
+
+    results: list[FederatedIssue]
+    projects: list[FederatedProjectStatus]
+
+
+class FederatedStreamDone(TypedDict):
+    """Last line of a federated NDJSON stream: the merged ``[project, id]`` order."""
+
+    done: bool
+    order: list[list[str]]
+
+
 # ---------------------------------------------------------------------------
 # True envelopes — list / search / batch wrappers
 # ---------------------------------------------------------------------------
@@ -493,6 +570,23 @@ class BatchResponse(TypedDict, Generic[_T]):
     newly_unblocked: NotRequired[list[SlimIssue]]
 
 
+class BatchOperationResult(TypedDict):
+    """One operation's outcome inside an ExecuteBatchResponse.
+
+    ``result`` is exactly what the named tool would have returned on its own.
+    """
+
+    tool: str
+    ref: NotRequired[str]
+    result: Any
+
+
+class ExecuteBatchResponse(TypedDict):
+    """Response for the execute_batch MCP tool: every operation committed, in order."""
+
+    results: list[BatchOperationResult]
+
+
 class ListResponse(TypedDict, Generic[_T]):
     """Unified response for list/query operations.
 
@@ -500,11 +594,14 @@ class ListResponse(TypedDict, Generic[_T]):
     - ``has_more`` is always present (never omitted); callers can
       reliably distinguish "no more" from "field absent."
     - ``next_offset`` is present only when ``has_more=True``.
+    - ``next_cursor`` is present only when ``has_more=True`` and the
+      endpoint supports keyset paging (``list_issues``).
     """
 
     items: list[_T]
     has_more: bool
     next_offset: NotRequired[int]
+    next_cursor: NotRequired[str]
 
 
 # ---------------------------------------------------------------------------
@@ -533,6 +630,86 @@ def parse_response_detail(raw: str | None) -> ResponseDetail | ErrorResponse:
     )
 
 
+# ---------------------------------------------------------------------------
+# Issue relation projection (include=...) for list surfaces
+# ---------------------------------------------------------------------------
+
+IssueInclude = Literal["labels", "deps", "children", "fields"]
+ISSUE_INCLUDE_VALUES: frozenset[str] = frozenset(get_args(IssueInclude))
+
+
+def parse_issue_include(raw: str | Sequence[str] | None) -> frozenset[str] | ErrorResponse | None:
+    """Parse an ``include`` projection to the set of relations to hydrate.
+
+    Accepts a comma-separated string (HTTP query param) or a list (MCP).
+    ``None`` means "everything" and is passed through so the DB layer keeps
+    its full-hydration default; an empty string or list hydrates only the
+    issue row. ``deps`` covers both ``blocks`` and ``blocked_by``. Returns
+    an ``ErrorResponse`` with ``code=VALIDATION`` for unknown names.
+    """
+    if raw is None:
+        return None
+    parts = raw.split(",") if isinstance(raw, str) else raw
+    if not all(isinstance(p, str) for p in parts):
+        return ErrorResponse(error="include must be a list of strings", code=ErrorCode.VALIDATION)
+    names = frozenset(p.strip() for p in parts if p.strip())
+    unknown = names - ISSUE_INCLUDE_VALUES
+    if unknown:
+        return ErrorResponse(
+            error=f"Invalid value for include: {', '.join(sorted(unknown))}. Must be drawn from {', '.join(sorted(ISSUE_INCLUDE_VALUES))}.",
+            code=ErrorCode.VALIDATION,
+        )
+    return names
+
+
+# ---------------------------------------------------------------------------
+# List detail (ids/summary/full) and field selection for read-heavy tools
+# ---------------------------------------------------------------------------
+
+ListDetail = Literal["ids", "summary", "full"]
+
+
+def parse_list_projection(
+    detail: object,
+    fields: object,
+    *,
+    id_key: str,
+    summary: Sequence[str],
+    full: Sequence[str],
+    default: ListDetail,
+) -> tuple[str, ...] | ErrorResponse | None:
+    """Resolve ``response_detail`` and ``fields`` to the keys each list item keeps.
+
+    ``ids`` keeps only *id_key*, ``summary`` keeps *summary* and ``full``
+    returns ``None``, meaning the record is passed through untouched. An
+    explicit ``fields`` list overrides ``response_detail``. It must be drawn
+    from *full*, and *id_key* is always kept first so items stay
+    addressable. Returns an ``ErrorResponse`` with ``code=VALIDATION`` for
+    an unknown detail level or field name.
+    """
+    if fields is not None:
+        if not isinstance(fields, list) or not all(isinstance(f, str) for f in fields):
+            return ErrorResponse(error="fields must be a list of strings", code=ErrorCode.VALIDATION)
+        unknown = sorted(set(fields) - set(full))
+        if unknown:
+            return ErrorResponse(
+                error=f"Invalid value for fields: {', '.join(unknown)}. Must be drawn from {', '.join(full)}.",
+                code=ErrorCode.VALIDATION,
+            )
+        return tuple(dict.fromkeys([id_key, *fields]))
+    level = default if detail is None else detail
+    if level == "ids":
+        return (id_key,)
+    if level == "summary":
+        return tuple(summary)
+    if level == "full":
+        return None
+    return ErrorResponse(
+        error=f"Invalid value for response_detail: {detail!r}. Must be one of {', '.join(get_args(ListDetail))}.",
+        code=ErrorCode.VALIDATION,
+    )
+
+
 # ---------------------------------------------------------------------------
 # 2.0 typed exceptions
 # ---------------------------------------------------------------------------
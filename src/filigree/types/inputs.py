@@ -21,6 +21,7 @@ Safety note on cast():
 
 from typing import Any, Literal, NotRequired, TypedDict
 
+from filigree.types.api import IssueInclude, ListDetail
 from filigree.types.core import AssocType, FindingStatus, ISOTimestamp, Severity, StatusCategory
 
 # ---------------------------------------------------------------------------
@@ -50,7 +51,11 @@ class ListIssuesArgs(TypedDict):
     direction: NotRequired[Literal["asc", "desc"]]
     limit: NotRequired[int]
     offset: NotRequired[int]
+    cursor: NotRequired[str]
+    include: NotRequired[list[IssueInclude]]
     no_limit: NotRequired[bool]
+    response_detail: NotRequired[ListDetail]
+    fields: NotRequired[list[str]]
 
 
 class CreateIssueArgs(TypedDict):
@@ -101,6 +106,8 @@ class SearchIssuesArgs(TypedDict):
     limit: NotRequired[int]
     offset: NotRequired[int]
     no_limit: NotRequired[bool]
+    response_detail: NotRequired[ListDetail]
+    fields: NotRequired[list[str]]
 
 
 class ClaimIssueArgs(TypedDict):
@@ -377,6 +384,17 @@ class BatchAddCommentArgs(TypedDict):
     expected_assignee: NotRequired[str]
 
 
+class BatchOperation(TypedDict):
+    tool: str
+    arguments: NotRequired[dict[str, Any]]
+    ref: NotRequired[str]
+
+
+class ExecuteBatchArgs(TypedDict):
+    operations: list[BatchOperation]
+    actor: NotRequired[str]
+
+
 class GetChangesArgs(TypedDict):
     since: ISOTimestamp
     limit: NotRequired[int]
@@ -386,6 +404,8 @@ class GetChangesArgs(TypedDict):
     label: NotRequired[str]
     type: NotRequired[str]
     include_heartbeats: NotRequired[bool]
+    response_detail: NotRequired[ListDetail]
+    fields: NotRequired[list[str]]
 
 
 class GetSummaryArgs(TypedDict):
@@ -444,6 +464,8 @@ class RemoveDependencyArgs(TypedDict):
 
 class GetReadyArgs(TypedDict):
     include_context: NotRequired[bool]
+    response_detail: NotRequired[ListDetail]
+    fields: NotRequired[list[str]]
 
 
 class GetBlockedArgs(TypedDict):
@@ -762,6 +784,8 @@ class ListObservationsArgs(TypedDict):
     older_than_hours: NotRequired[int]
     sort_by: NotRequired[str]
     direction: NotRequired[str]
+    response_detail: NotRequired[ListDetail]
+    fields: NotRequired[list[str]]
 
 
 class DismissObservationArgs(TypedDict):
@@ -867,6 +891,7 @@ TOOL_ARGS_MAP: dict[str, type] = {
     "batch_add_label": BatchAddLabelArgs,
     "batch_remove_label": BatchRemoveLabelArgs,
     "batch_add_comment": BatchAddCommentArgs,
+    "execute_batch": ExecuteBatchArgs,
     "get_changes": GetChangesArgs,
     "get_summary": GetSummaryArgs,
     "get_metrics": GetMetricsArgs,
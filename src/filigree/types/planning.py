@@ -20,6 +20,25 @@ class CriticalPathNode(TypedDict):
     type: str
 
 
+class GraphNodeRecord(TypedDict):
+    """Lightweight issue projection from ``get_graph_nodes()``.
+
+    ``blocked_by_open_count`` counts not-done blockers the issue waits on;
+    ``blocks_open_count`` counts not-done issues waiting on it.
+    """
+
+    id: str
+    title: str
+    status: str
+    status_category: str
+    priority: int
+    type: str
+    assignee: str
+    is_ready: bool
+    blocked_by_open_count: int
+    blocks_open_count: int
+
+
 # DependencyRecord uses "from" as a key at runtime (a Python keyword).
 # TypedDict cannot express this with class syntax; we use functional form.
 DependencyRecord = TypedDict("DependencyRecord", {"from": str, "to": str, "type": str})
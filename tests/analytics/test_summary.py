@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from filigree.core import FiligreeDB
+from filigree.core import FiligreeDB, write_config
+from filigree.summary import (
+    DEFAULT_SUMMARY_DEBOUNCE_SECONDS,
+    SUMMARY_DEBOUNCE_ENV,
+    SummaryCache,
+    SummaryScheduler,
+    _sanitize_title,
+    generate_summary,
+    summary_debounce_seconds,
+    write_summary,
+)
 from filigree.summary import _parse_iso as summary_parse_iso
-from filigree.summary import _sanitize_title, generate_summary, write_summary
 from tests.conftest import PopulatedDB
 
 
@@ -393,12 +403,174 @@ class TestWriteSummary:
         assert leftovers == []
 
 
+def _body(summary: str) -> str:
+    """Drop the timestamped header line so renders can be compared."""
+    return summary.split("\n", 1)[1]
+
+
+class TestSummaryCache:
+    def test_cached_render_matches_uncached(self, populated_db: PopulatedDB) -> None:
+        db = populated_db.db
+        cache = SummaryCache()
+        assert _body(generate_summary(db, cache=cache)) == _body(generate_summary(db))
+        db.close_issue(populated_db.ids["b"])
+        assert _body(generate_summary(db, cache=cache)) == _body(generate_summary(db))
+
+    def test_unchanged_db_reuses_every_section(self, db: FiligreeDB) -> None:
+        db.create_issue("Steady")
+        cache = SummaryCache()
+        generate_summary(db, cache=cache)
+        misses = cache.misses
+        with patch.object(db, "get_plan", side_effect=AssertionError("plans should be cached")):
+            summary = generate_summary(db, cache=cache)
+        assert cache.misses == misses
+        assert "Steady" in summary
+
+    def test_heartbeat_and_comment_skip_plan_sections(self, db: FiligreeDB) -> None:
+        db.create_plan({"title": "M"}, [{"title": "P1", "steps": [{"title": "S1"}]}])
+        issue = db.create_issue("Claimed")
+        db.claim_issue(issue.id, assignee="agent")
+        cache = SummaryCache()
+        generate_summary(db, cache=cache)
+        db.heartbeat_work(issue.id, actor="agent")
+        db.add_comment(issue.id, "still going")
+        misses = cache.misses
+        with patch.object(db, "get_plan", side_effect=AssertionError("plans should be cached")):
+            summary = generate_summary(db, cache=cache)
+        # Only the Stale rows are rebuilt: neither write records an event.
+        assert cache.misses == misses + 1
+        assert "HEARTBEAT" not in summary
+
+    def test_status_change_rebuilds_sections(self, db: FiligreeDB) -> None:
+        issue = db.create_issue("Moving")
+        cache = SummaryCache()
+        generate_summary(db, cache=cache)
+        db.update_issue(issue.id, status="in_progress")
+        summary = generate_summary(db, cache=cache)
+        in_progress = summary.split("## In Progress", 1)[1].split("## ", 1)[0]
+        assert "Moving" in in_progress
+
+    def test_rebinding_to_another_db_clears(self, db: FiligreeDB, tmp_path: Path) -> None:
+        cache = SummaryCache()
+        db.create_issue("First project")
+        generate_summary(db, cache=cache)
+        other = FiligreeDB(tmp_path / "other.db", prefix="other")
+        other.initialize()
+        try:
+            other.create_issue("Second project")
+            summary = generate_summary(other, cache=cache)
+        finally:
+            other.close()
+        assert "Second project" in summary
+        assert "First project" not in summary
+
+
 # ---------------------------------------------------------------------------
 # Bug fixes: summary timezone handling, WIP limit
 # (consolidated from test_analytics_templates_fixes.py)
 # ---------------------------------------------------------------------------
 
 
+class TestSummaryScheduler:
+    def test_burst_coalesces_into_one_regeneration(self, db: FiligreeDB, tmp_path: Path) -> None:
+        output = tmp_path / "context.md"
+        scheduler = SummaryScheduler(db, output, window=60)
+        try:
+            for i in range(20):
+                db.create_issue(f"Burst {i}")
+                scheduler.mark_dirty()
+            assert not output.exists(), "marking dirty must not regenerate inline"
+            assert scheduler.pending
+            scheduler.flush()
+            assert scheduler.regenerations == 1
+            assert "Burst 19" in output.read_text()
+            scheduler.flush()
+            assert scheduler.regenerations == 1, "flush with nothing pending is a no-op"
+        finally:
+            scheduler.close()
+
+    def test_timer_regenerates_in_background(self, db: FiligreeDB, tmp_path: Path) -> None:
+        output = tmp_path / "context.md"
+        done = threading.Event()
+        scheduler = SummaryScheduler(db, output, window=0.05)
+        original = scheduler._debouncer._run
+
+        def _run_and_signal() -> None:
+            original()
+            done.set()
+
+        scheduler._debouncer._run = _run_and_signal
+        try:
+            db.create_issue("Background")
+            scheduler.mark_dirty()
+            scheduler.mark_dirty()
+            assert done.wait(5)
+            assert scheduler.regenerations == 1
+            assert "Background" in output.read_text()
+        finally:
+            scheduler.close()
+
+    def test_close_flushes_pending_regeneration(self, db: FiligreeDB, tmp_path: Path) -> None:
+        output = tmp_path / "context.md"
+        scheduler = SummaryScheduler(db, output, window=60)
+        db.create_issue("Last write before exit")
+        scheduler.mark_dirty()
+        scheduler.close()
+        assert "Last write before exit" in output.read_text()
+        # After close, marks regenerate synchronously instead of arming a timer.
+        db.create_issue("After close")
+        scheduler.mark_dirty()
+        assert "After close" in output.read_text()
+
+    def test_pending_regeneration_holds_a_lease(self, db: FiligreeDB, tmp_path: Path) -> None:
+        scheduler = SummaryScheduler(db, tmp_path / "context.md", window=60)
+        try:
+            scheduler.mark_dirty()
+            scheduler.mark_dirty()
+            assert db.leased
+            scheduler.flush()
+            assert not db.leased
+        finally:
+            scheduler.close()
+
+    def test_zero_window_is_synchronous(self, db: FiligreeDB, tmp_path: Path) -> None:
+        output = tmp_path / "context.md"
+        scheduler = SummaryScheduler(db, output, window=0)
+        scheduler.mark_dirty()
+        assert output.exists()
+        assert scheduler.regenerations == 1
+
+    def test_failure_reported_and_not_retried(self, db: FiligreeDB, tmp_path: Path) -> None:
+        errors: list[Exception] = []
+        scheduler = SummaryScheduler(db, tmp_path / "context.md", window=60, on_error=errors.append)
+        with patch("filigree.summary.write_summary", side_effect=OSError("disk full")):
+            scheduler.mark_dirty()
+            scheduler.flush()
+        assert len(errors) == 1
+        assert isinstance(errors[0], OSError)
+        assert not scheduler.pending
+        assert scheduler.regenerations == 0
+
+
+class TestSummaryDebounceSeconds:
+    def test_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(SUMMARY_DEBOUNCE_ENV, raising=False)
+        write_config(tmp_path, {"prefix": "t", "version": 1})
+        assert summary_debounce_seconds(tmp_path) == DEFAULT_SUMMARY_DEBOUNCE_SECONDS
+
+    def test_config_then_env_precedence(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(SUMMARY_DEBOUNCE_ENV, raising=False)
+        write_config(tmp_path, {"prefix": "t", "version": 1, "summary_debounce_seconds": 5})
+        assert summary_debounce_seconds(tmp_path) == 5.0
+        monkeypatch.setenv(SUMMARY_DEBOUNCE_ENV, "0")
+        assert summary_debounce_seconds(tmp_path) == 0.0
+
+    def test_invalid_values_fall_through(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(SUMMARY_DEBOUNCE_ENV, "soon")
+        write_config(tmp_path, {"prefix": "t", "version": 1, "summary_debounce_seconds": -1})
+        assert summary_debounce_seconds(tmp_path) == DEFAULT_SUMMARY_DEBOUNCE_SECONDS
+
+
 class TestSummaryTimezoneHandling:
     def test_naive_datetime_gets_utc(self) -> None:
         """Naive datetime should get UTC attached via replace."""
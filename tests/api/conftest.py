@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from collections.abc import AsyncIterator, Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -67,6 +68,14 @@ def make_release_hierarchy(db: FiligreeDB, *, include_done: bool = False) -> tup
     return release, epic, task
 
 
+def _decode_columnar(table: dict[str, Any]) -> list[dict[str, Any]]:
+    """Expand a ``?format=columnar`` table into row dicts (mirrors ``decodeColumnar`` in api.js)."""
+    columns = {
+        key: [table["dicts"][key][i] for i in values] if key in table["dicts"] else values for key, values in table["columns"].items()
+    }
+    return [{key: values[r] for key, values in columns.items()} for r in range(table["count"])]
+
+
 def _create_project(base: Path, name: str, prefix: str, issue_count: int) -> Path:
     """Helper: create a .filigree/ project dir with *issue_count* issues."""
     filigree_dir = base / name / ".filigree"
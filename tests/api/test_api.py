@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import threading
+import time
 from typing import Any
 
 import pytest
@@ -11,6 +13,7 @@ from httpx import ASGITransport, AsyncClient
 
 import filigree.dashboard as dash_module
 from filigree.dashboard import STATIC_DIR, create_app
+from tests.api.conftest import _decode_columnar
 from tests.conftest import PopulatedDB
 
 
@@ -24,6 +27,33 @@ class TestDashboardIndex:
     def test_html_file_exists(self) -> None:
         assert (STATIC_DIR / "dashboard.html").exists()
 
+    async def test_page_revalidates_and_answers_304(self, client: AsyncClient) -> None:
+        resp = await client.get("/")
+        assert resp.headers["cache-control"] == "no-cache"
+        assert resp.headers["content-encoding"] == "gzip"
+        again = await client.get("/", headers={"If-None-Match": resp.headers["etag"]})
+        assert again.status_code == 304
+
+    async def test_scripts_served_fingerprinted_and_immutable(self, client: AsyncClient) -> None:
+        import re
+
+        html = (await client.get("/")).text
+        app_url = re.search(r'<script type="module" src="(/static/js/app\.[0-9a-f]+\.js)"', html)
+        assert app_url is not None
+        assert f'<link rel="modulepreload" href="{app_url.group(1)}">' in html
+        resp = await client.get(app_url.group(1))
+        assert resp.status_code == 200
+        assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["content-type"].startswith("text/javascript")
+        assert 'from "./api.js"' not in resp.text
+        assert re.search(r'from "/static/js/api\.[0-9a-f]+\.js"', resp.text)
+
+    async def test_unfingerprinted_static_path_still_served(self, client: AsyncClient) -> None:
+        resp = await client.get("/static/js/app.js")
+        assert resp.status_code == 200
+        assert 'from "./api.js"' in resp.text
+
     async def test_graph_sidebar_and_toolbar_present(self, client: AsyncClient) -> None:
         resp = await client.get("/")
         assert resp.status_code == 200
@@ -122,6 +152,87 @@ class TestIssuesAPI:
         for issue_id in created_ids:
             assert issue_id in issue_ids, f"Issue {issue_id} missing — /api/issues pagination failed"
 
+    async def test_list_issues_cursor_pages(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/issues", params={"limit": 3})
+        assert resp.status_code == 200
+        first = resp.json()
+        assert len(first) == 3
+        cursor = resp.headers["X-Next-Cursor"]
+        resp = await client.get("/api/issues", params={"limit": 3, "cursor": cursor})
+        rest = resp.json()
+        assert "X-Next-Cursor" not in resp.headers
+        everything = (await client.get("/api/issues")).json()
+        assert [i["id"] for i in first + rest] == [i["id"] for i in everything]
+
+    async def test_list_issues_columnar(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        plain = (await client.get("/api/issues")).json()
+        resp = await client.get("/api/issues", params={"format": "columnar"})
+        assert resp.status_code == 200
+        table = resp.json()
+        assert table["count"] == len(plain)
+        assert _decode_columnar(table) == plain
+        assert "open" in table["dicts"]["status"]
+        ids = dashboard_db.ids
+        by_ids = (await client.get("/api/issues", params={"ids": f"{ids['a']},{ids['b']}", "format": "columnar"})).json()
+        assert [i["id"] for i in _decode_columnar(by_ids)] == [ids["a"], ids["b"]]
+
+    async def test_list_issues_columnar_page_keeps_cursor(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/issues", params={"limit": 2, "format": "columnar"})
+        assert resp.json()["count"] == 2
+        assert "X-Next-Cursor" in resp.headers
+
+    async def test_list_issues_bad_cursor(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/issues", params={"cursor": "bogus"})
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "VALIDATION"
+
+    async def test_list_issues_include_projection(self, client: AsyncClient) -> None:
+        full = {i["id"]: i for i in (await client.get("/api/issues")).json()}
+        assert any(i["blocks"] for i in full.values())
+        resp = await client.get("/api/issues", params={"include": "labels"})
+        assert resp.status_code == 200
+        projected = resp.json()
+        assert {i["id"] for i in projected} == set(full)
+        assert all(i["blocks"] == [] and i["blocked_by"] == [] and i["children"] == [] for i in projected)
+
+    async def test_list_issues_bad_include(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/loom/issues", params={"include": "labels,comments"})
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "VALIDATION"
+
+    async def test_loom_list_issues_next_cursor(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/loom/issues", params={"limit": 2})
+        body = resp.json()
+        assert body["has_more"] is True
+        resp = await client.get("/api/loom/issues", params={"limit": 100, "cursor": body["next_cursor"]})
+        rest = resp.json()
+        assert rest["has_more"] is False
+        assert "next_cursor" not in rest
+        ids = [i["issue_id"] for i in body["items"] + rest["items"]]
+        assert len(ids) == len(set(ids)) == 5
+
+    async def test_list_issues_by_ids(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        ids = dashboard_db.ids
+        resp = await client.get("/api/issues", params={"ids": f"{ids['b']},{ids['a']},{ids['b']},nope-123"})
+        assert resp.status_code == 200
+        data = resp.json()
+        # Input order, duplicates collapsed, unknown ids skipped.
+        assert [i["id"] for i in data] == [ids["b"], ids["a"]]
+        assert data[1]["blocked_by"] == [ids["b"]]
+
+    async def test_list_issues_by_ids_rejects_pagination(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        resp = await client.get("/api/issues", params={"ids": dashboard_db.ids["a"], "limit": 2})
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "VALIDATION"
+
+    async def test_list_issues_by_ids_caps_count(self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        from filigree.dashboard_routes import issues as issue_routes
+
+        monkeypatch.setattr(issue_routes, "_MAX_ISSUE_IDS", 2)
+        resp = await client.get("/api/issues", params={"ids": "x-1,x-2,x-3"})
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "VALIDATION"
+
     async def test_issue_structure(self, client: AsyncClient) -> None:
         resp = await client.get("/api/issues")
         data = resp.json()
@@ -1309,6 +1420,59 @@ class TestDashboardConcurrency:
         assert all(r == 200 for r in results), f"Got status codes: {results}"
 
 
+class TestReadOffload:
+    """Heavy reads run on the bounded read executor, not the event loop."""
+
+    async def test_read_runs_on_worker_read_connection(
+        self, client: AsyncClient, dashboard_db: PopulatedDB, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db = dashboard_db.db
+        seen: dict[str, Any] = {}
+        original = db.get_stats
+
+        def spy() -> Any:
+            seen["thread"] = threading.current_thread().name
+            seen["query_only"] = db.conn.execute("PRAGMA query_only").fetchone()[0]
+            return original()
+
+        monkeypatch.setattr(db, "get_stats", spy)
+        resp = await client.get("/api/stats")
+        assert resp.status_code == 200
+        assert seen["thread"].startswith("filigree-dashboard-read")
+        assert seen["query_only"] == 1
+
+    async def test_slow_read_does_not_block_loop(
+        self, client: AsyncClient, dashboard_db: PopulatedDB, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db = dashboard_db.db
+        original = db.get_critical_path
+        finished: list[str] = []
+
+        def slow() -> Any:
+            time.sleep(0.5)
+            return original()
+
+        monkeypatch.setattr(db, "get_critical_path", slow)
+
+        async def get(path: str) -> None:
+            resp = await client.get(path)
+            assert resp.status_code == 200
+            finished.append(path)
+
+        async def health_later() -> None:
+            await asyncio.sleep(0.1)
+            await get("/api/health")
+
+        await asyncio.gather(get("/api/critical-path"), health_later())
+        assert finished == ["/api/health", "/api/critical-path"]
+
+    async def test_health_reports_executor_depth(self, client: AsyncClient) -> None:
+        stats = (await client.get("/api/health")).json()["read_executor"]
+        assert stats["workers"] >= 1
+        assert stats["running"] == 0
+        assert stats["queued"] == 0
+
+
 class TestEtherealDashboard:
     async def test_no_register_endpoint(self, client: AsyncClient) -> None:
         """Ethereal mode should not have /api/register."""
@@ -1490,6 +1654,130 @@ class TestCORSMiddleware:
         assert "access-control-allow-origin" not in resp.headers
 
 
+class TestConditionalGet:
+    @pytest.mark.parametrize("path", ["/api/issues", "/api/dependencies", "/api/stats", "/api/graph", "/api/releases"])
+    async def test_etag_round_trip(self, client: AsyncClient, path: str) -> None:
+        first = await client.get(path)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert etag.startswith('"')
+        assert etag.endswith('"')
+        assert first.headers["cache-control"] == "no-cache"
+        again = await client.get(path, headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == etag
+
+    async def test_write_changes_etag(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        etag = (await client.get("/api/issues")).headers["etag"]
+        dashboard_db.db.update_issue(dashboard_db.ids["b"], priority=0)
+        resp = await client.get("/api/issues", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+    async def test_label_changes_etag(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        etag = (await client.get("/api/issues")).headers["etag"]
+        dashboard_db.db.add_label(dashboard_db.ids["b"], "needs-review")
+        resp = await client.get("/api/issues", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+
+    async def test_query_string_changes_etag(self, client: AsyncClient) -> None:
+        full = (await client.get("/api/issues")).headers["etag"]
+        paged = (await client.get("/api/issues", params={"limit": 2})).headers["etag"]
+        assert full != paged
+
+    async def test_weak_and_listed_tags_match(self, client: AsyncClient) -> None:
+        etag = (await client.get("/api/stats")).headers["etag"]
+        resp = await client.get("/api/stats", headers={"If-None-Match": f'"stale", W/{etag}'})
+        assert resp.status_code == 304
+
+    async def test_errors_carry_no_etag(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/issues", params={"cursor": "bogus"})
+        assert resp.status_code == 400
+        assert "etag" not in resp.headers
+
+    async def test_graph_etag_follows_config_default(self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        etag = (await client.get("/api/graph")).headers["etag"]
+        monkeypatch.setenv("FILIGREE_GRAPH_API_MODE", "v2")
+        monkeypatch.setenv("FILIGREE_GRAPH_V2_ENABLED", "1")
+        resp = await client.get("/api/graph", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+
+    async def test_graph_window_days_carries_no_etag(self, client: AsyncClient) -> None:
+        # The window is measured from now(), so the result can change without a write.
+        resp = await client.get("/api/graph", params={"mode": "v2", "window_days": 7})
+        assert resp.status_code == 200
+        assert "etag" not in resp.headers
+        again = await client.get("/api/graph", params={"mode": "v2", "window_days": 7}, headers={"If-None-Match": '"anything"'})
+        assert again.status_code == 200
+
+
+class TestStreamedLists:
+    async def test_issues_stream_across_pages(
+        self, client: AsyncClient, dashboard_db: PopulatedDB, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from filigree.dashboard_routes import issues as issue_routes
+
+        expected = [i.to_dict() for i in dashboard_db.db.list_issues(limit=100)]
+        monkeypatch.setattr(issue_routes, "_ISSUES_LIST_PAGE_SIZE", 2)
+        resp = await client.get("/api/issues")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert "content-length" not in resp.headers
+        assert resp.json() == expected
+
+    async def test_dependencies_stream_across_pages(
+        self, client: AsyncClient, dashboard_db: PopulatedDB, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from filigree.dashboard_routes import issues as issue_routes
+
+        db, ids = dashboard_db.db, dashboard_db.ids
+        db.add_dependency(ids["c"], ids["b"])
+        db.add_dependency(ids["epic"], ids["c"])
+        monkeypatch.setattr(issue_routes, "_DEPENDENCIES_PAGE_SIZE", 1)
+        data = (await client.get("/api/dependencies")).json()
+        assert data == sorted(db.get_all_dependencies(), key=lambda d: (d["from"], d["to"]))
+        assert len(data) == 3
+
+    async def test_empty_stream_is_empty_array(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        dashboard_db.db.remove_dependency(dashboard_db.ids["a"], dashboard_db.ids["b"])
+        resp = await client.get("/api/dependencies")
+        assert resp.content == b"[]"
+
+    async def test_pages_read_on_worker_connections(
+        self, client: AsyncClient, dashboard_db: PopulatedDB, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from filigree.dashboard_routes import issues as issue_routes
+
+        db = dashboard_db.db
+        monkeypatch.setattr(issue_routes, "_ISSUES_LIST_PAGE_SIZE", 2)
+        seen: list[tuple[str, int]] = []
+        original = db.list_issues
+
+        def spy(*args: Any, **kwargs: Any) -> Any:
+            seen.append((threading.current_thread().name, db.conn.execute("PRAGMA query_only").fetchone()[0]))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(db, "list_issues", spy)
+        await client.get("/api/issues")
+        assert len(seen) == 3
+        assert all(name.startswith("filigree-dashboard-read") and query_only == 1 for name, query_only in seen)
+
+
+class TestCompression:
+    async def test_large_responses_gzipped(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        for i in range(20):
+            dashboard_db.db.create_issue(f"Padding issue {i}")
+        resp = await client.get("/api/issues", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert len(resp.json()) == 25
+
+    async def test_identity_when_not_accepted(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/issues", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+
+
 class TestBoundaryClamping:
     """Input clamping tests for activity and search endpoints."""
 
@@ -6,6 +6,7 @@ import pytest
 from httpx import AsyncClient
 
 from filigree.dashboard import STATIC_DIR
+from tests.api.conftest import _decode_columnar
 from tests.conftest import PopulatedDB
 
 
@@ -372,22 +373,17 @@ class TestGraphAdvancedAPI:
         assert len(data["edges"]) == 50
         assert data["telemetry"]["total_edges_before_limit"] > 50
 
-    async def test_graph_v2_paginates_beyond_single_list_page(
+    async def test_graph_v2_returns_every_issue_under_node_limit(
         self,
         client: AsyncClient,
         dashboard_db: PopulatedDB,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Regression: /api/graph must paginate through all issues, not cap silently.
+        """Regression: /api/graph must not cap the node set below node_limit.
 
         Previously the handler called list_issues(limit=10000); projects with
         more issues silently lost graph nodes and could false-404 on a valid
         scope_root past the cap.
         """
-        from filigree.dashboard_routes import analytics as analytics_routes
-
-        monkeypatch.setattr(analytics_routes, "_GRAPH_LIST_PAGE_SIZE", 3)
-
         created_ids: list[str] = []
         for i in range(7):
             new_issue = dashboard_db.db.create_issue(f"Beyond cap {i}", type="task", priority=2)
@@ -398,29 +394,22 @@ class TestGraphAdvancedAPI:
         data = resp.json()
         node_ids = {n["id"] for n in data["nodes"]}
         for issue_id in created_ids:
-            assert issue_id in node_ids, f"Issue {issue_id} missing — pagination failed"
+            assert issue_id in node_ids, f"Issue {issue_id} missing from graph"
 
     async def test_graph_v2_scope_root_accepted_when_beyond_preload_page(
         self,
         client: AsyncClient,
         dashboard_db: PopulatedDB,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """scope_root must validate against the full DB, not a preload-truncated subset."""
-        from filigree.dashboard_routes import analytics as analytics_routes
-
-        monkeypatch.setattr(analytics_routes, "_GRAPH_LIST_PAGE_SIZE", 3)
-
         far_ids: list[str] = []
         for i in range(6):
             far_issue = dashboard_db.db.create_issue(f"Far issue {i}", type="task", priority=2)
             far_ids.append(far_issue.id)
 
-        # scope_root is the last-created issue, which under the old non-paginated
-        # 10000-limit code was inside the preload, but the bug class the test
-        # guards against is: any issue not in the preload must still validate.
-        # The pagination fix ensures issue_map is complete even when the underlying
-        # list_issues default page size is tiny.
+        # The bug class this guards against: scope_root validated against a
+        # preloaded issue list rather than the database. It is now checked
+        # with a direct lookup, so any existing issue validates.
         resp = await client.get(f"/api/graph?mode=v2&scope_root={far_ids[-1]}&scope_radius=0")
         assert resp.status_code == 200, resp.text
         data = resp.json()
@@ -753,3 +742,57 @@ class TestGraphAPI:
         data = resp.json()
         # No issue currently has this type, so the node list is empty.
         assert data["nodes"] == []
+
+
+class TestGraphColumnar:
+    async def test_v2_columnar_matches_json(self, client: AsyncClient) -> None:
+        plain = (await client.get("/api/graph?mode=v2")).json()
+        resp = await client.get("/api/graph?mode=v2&format=columnar")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["format"] == "columnar"
+        assert body["telemetry"]["total_nodes_before_limit"] == plain["telemetry"]["total_nodes_before_limit"]
+        nodes = _decode_columnar(body["nodes"])
+        assert nodes == plain["nodes"]
+        assert set(body["nodes"]["dicts"]) == {"status", "status_category", "type", "assignee"}
+        # Edges reference nodes by row index; the derivable id is dropped.
+        edges = [
+            {
+                **e,
+                "id": f"{nodes[e['source']]['id']}->{nodes[e['target']]['id']}",
+                "source": nodes[e["source"]]["id"],
+                "target": nodes[e["target"]]["id"],
+            }
+            for e in _decode_columnar(body["edges"])
+        ]
+        assert sorted(edges, key=lambda e: e["id"]) == sorted(plain["edges"], key=lambda e: e["id"])
+        assert all(isinstance(i, int) for i in body["edges"]["columns"]["source"])
+
+    async def test_legacy_columnar_matches_json(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        plain = (await client.get("/api/graph?mode=legacy")).json()
+        body = (await client.get("/api/graph?mode=legacy&format=columnar")).json()
+        nodes = _decode_columnar(body["nodes"])
+        assert nodes == plain["nodes"]
+        edges = [{"source": nodes[e["source"]]["id"], "target": nodes[e["target"]]["id"]} for e in _decode_columnar(body["edges"])]
+        assert edges == plain["edges"]
+
+    async def test_interned_columns_are_indexes(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        for i in range(5):
+            dashboard_db.db.create_issue(f"Same type {i}", type="task")
+        body = (await client.get("/api/graph?mode=v2&format=columnar")).json()
+        table = body["nodes"]
+        assert len(table["dicts"]["type"]) < table["count"]
+        assert all(isinstance(i, int) for i in table["columns"]["type"])
+
+    async def test_invalid_format(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/graph?format=xml")
+        assert resp.status_code == 400
+        body = resp.json()
+        assert body["code"] == "VALIDATION"
+        assert body["details"] == {"param": "format", "value": "xml"}
+
+    def test_dashboard_loader_requests_columnar(self) -> None:
+        api_js = (STATIC_DIR / "js" / "api.js").read_text()
+        assert "export function decodeColumnar(table)" in api_js
+        assert "/sync?format=columnar" in api_js
+        assert "body.issues = decodeColumnar(body.issues);" in api_js
@@ -0,0 +1,261 @@
+"""Tests for live dashboard updates: the change stream and delta sync."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+from filigree.core import FiligreeDB
+from filigree.dashboard_routes import live
+from tests.api.conftest import _decode_columnar
+from tests.conftest import PopulatedDB
+
+
+@pytest.fixture
+def fast_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Shrink stream timings so one request finishes in well under a second."""
+    monkeypatch.setattr(live, "_STREAM_POLL_SECONDS", 0.02)
+    monkeypatch.setattr(live, "_STREAM_DEBOUNCE_SECONDS", 0.01)
+    monkeypatch.setattr(live, "_STREAM_MAX_SECONDS", 0.4)
+
+
+def _write_once_streaming(db: FiligreeDB, monkeypatch: pytest.MonkeyPatch, write: Callable[[], object]) -> asyncio.Task[None]:
+    """Run *write* shortly after the stream takes its first counter snapshot.
+
+    A fixed delay races the request start-up on a loaded machine; waiting for
+    the handler's first ``get_change_counters`` call does not.
+    """
+    started = asyncio.Event()
+    original = db.get_change_counters
+
+    def spy() -> dict[str, int]:
+        started.set()
+        return original()
+
+    monkeypatch.setattr(db, "get_change_counters", spy)
+
+    async def run() -> None:
+        await started.wait()
+        await asyncio.sleep(0.05)
+        write()
+
+    return asyncio.create_task(run())
+
+
+def _frames(text: str) -> list[dict[str, Any]]:
+    """Parse an SSE body into ``{"id", "event", "data"}`` dicts (comments/retry skipped)."""
+    frames = []
+    for block in text.split("\n\n"):
+        fields: dict[str, Any] = {}
+        for line in block.splitlines():
+            key, _, value = line.partition(": ")
+            if key in {"id", "event"}:
+                fields[key] = value
+            elif key == "data":
+                fields["data"] = json.loads(value)
+        if "event" in fields:
+            frames.append(fields)
+    return frames
+
+
+class TestEventStream:
+    async def test_headers_and_hello(self, client: AsyncClient, dashboard_db: PopulatedDB, fast_stream: None) -> None:
+        resp = await client.get("/api/events/stream")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        assert resp.headers["cache-control"] == "no-cache"
+        assert resp.text.startswith("retry: ")
+        hello = _frames(resp.text)[0]
+        latest = dashboard_db.db.get_latest_event_id()
+        assert hello == {"id": str(latest), "event": "hello", "data": {"event_id": latest}}
+
+    async def test_quiet_stream_sends_no_changes(self, client: AsyncClient, fast_stream: None) -> None:
+        resp = await client.get("/api/events/stream")
+        assert [f["event"] for f in _frames(resp.text)] == ["hello"]
+
+    async def test_write_pushes_changes_with_neighbours(
+        self, client: AsyncClient, dashboard_db: PopulatedDB, fast_stream: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        writer = _write_once_streaming(db, monkeypatch, lambda: db.close_issue(ids["b"], reason="done"))
+        resp = await client.get("/api/events/stream")
+        await writer
+        changes = [f for f in _frames(resp.text) if f["event"] == "changes"]
+        assert len(changes) == 1
+        payload = changes[0]["data"]
+        # B closed; A (blocked by B) became ready, so it is refetched too.
+        assert set(payload["issue_ids"]) == {ids["a"], ids["b"]}
+        assert payload["resync"] is False
+        assert payload["event_id"] == db.get_latest_event_id()
+        assert changes[0]["id"] == str(payload["event_id"])
+
+    async def test_dependency_flag(
+        self, client: AsyncClient, dashboard_db: PopulatedDB, fast_stream: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        writer = _write_once_streaming(db, monkeypatch, lambda: db.add_dependency(ids["c"], ids["b"]))
+        resp = await client.get("/api/events/stream")
+        await writer
+        payload = next(f["data"] for f in _frames(resp.text) if f["event"] == "changes")
+        assert payload["dependencies"] is True
+        assert {ids["b"], ids["c"]} <= set(payload["issue_ids"])
+
+    async def test_resume_after_event_id(self, client: AsyncClient, dashboard_db: PopulatedDB, fast_stream: None) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        cursor = db.get_latest_event_id()
+        db.update_issue(ids["epic"], title="Renamed epic")
+        resp = await client.get("/api/events/stream", headers={"Last-Event-ID": str(cursor)})
+        frames = _frames(resp.text)
+        assert frames[0]["event"] == "hello"
+        assert frames[0]["data"]["event_id"] == cursor
+        assert frames[1]["event"] == "changes"
+        assert ids["epic"] in frames[1]["data"]["issue_ids"]
+        assert frames[1]["data"]["event_id"] == db.get_latest_event_id()
+
+    async def test_bad_after_rejected(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/events/stream", params={"after": "-1"})
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "VALIDATION"
+
+
+class TestChangeBatch:
+    def test_expands_to_parent_and_dependency_neighbours(self, dashboard_db: PopulatedDB) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        cursor = db.get_latest_event_id()
+        db.update_issue(ids["a"], priority=0)
+        payload, new_cursor = live._change_batch(db, cursor, {"issues"})
+        assert new_cursor == db.get_latest_event_id()
+        assert set(payload["issue_ids"]) == {ids["a"], ids["b"], ids["epic"]}
+        assert payload["dependencies"] is False
+        assert payload["resync"] is False
+
+    def test_overflow_requests_resync(self, dashboard_db: PopulatedDB, monkeypatch: pytest.MonkeyPatch) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        monkeypatch.setattr(live, "_STREAM_BATCH_LIMIT", 2)
+        cursor = db.get_latest_event_id()
+        for p in (0, 1, 2):
+            db.update_issue(ids["c"], priority=p)
+        payload, new_cursor = live._change_batch(db, cursor, {"issues"})
+        assert payload["resync"] is True
+        assert payload["issue_ids"] == []
+        assert new_cursor == db.get_latest_event_id()
+
+    def test_issue_change_without_events_requests_resync(self, dashboard_db: PopulatedDB) -> None:
+        db = dashboard_db.db
+        payload, cursor = live._change_batch(db, db.get_latest_event_id(), {"issues"})
+        assert payload["resync"] is True
+        assert cursor == db.get_latest_event_id()
+
+
+class TestSync:
+    async def test_full_snapshot_without_version(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        resp = await client.get("/api/sync")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["full"] is True
+        assert len(body["issues"]) == 5
+        assert body["dependencies"] == [{"from": dashboard_db.ids["a"], "to": dashboard_db.ids["b"], "type": "blocks"}]
+        assert body["stats"]["prefix"] == dashboard_db.db.prefix
+        assert body["removed"] == []
+
+    async def test_unchanged_delta_is_empty(self, client: AsyncClient) -> None:
+        version = (await client.get("/api/sync")).json()["version"]
+        body = (await client.get("/api/sync", params={"since_version": version})).json()
+        assert body["full"] is False
+        assert body["issues"] == []
+        assert body["dependencies"] == []
+        assert body["dependency_sources"] == []
+        assert body["version"] == version
+
+    async def test_delta_carries_changed_issues_and_neighbours(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        version = (await client.get("/api/sync")).json()["version"]
+        db.close_issue(ids["b"], reason="done")
+        new = db.create_issue("Fresh")
+        body = (await client.get("/api/sync", params={"since_version": version})).json()
+        assert body["full"] is False
+        by_id = {i["id"]: i for i in body["issues"]}
+        assert set(by_id) == {ids["a"], ids["b"], new.id}
+        assert by_id[ids["a"]]["is_ready"] is True
+        assert body["stats"]["by_category"]["done"] >= 2
+        assert body["version"] != version
+
+    async def test_delta_replaces_dependency_sources(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        version = (await client.get("/api/sync")).json()["version"]
+        db.remove_dependency(ids["a"], ids["b"])
+        db.add_dependency(ids["c"], ids["b"])
+        body = (await client.get("/api/sync", params={"since_version": version})).json()
+        assert body["dependency_sources"] == sorted([ids["a"], ids["c"]])
+        assert body["dependencies"] == [{"from": ids["c"], "to": ids["b"], "type": "blocks"}]
+
+    async def test_deleted_issue_becomes_tombstone(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        version = (await client.get("/api/sync")).json()["version"]
+        db.add_dependency(ids["a"], ids["c"])
+        # Hard-delete C (no public API does this); A's dependency event still names it.
+        db.conn.execute("DELETE FROM dependencies WHERE depends_on_id = ?", (ids["c"],))
+        for table in ("events", "labels", "comments", "issues"):
+            column = "id" if table == "issues" else "issue_id"
+            db.conn.execute(f"DELETE FROM {table} WHERE {column} = ?", (ids["c"],))  # noqa: S608
+        db.conn.commit()
+        body = (await client.get("/api/sync", params={"since_version": version})).json()
+        assert body["full"] is False
+        assert body["removed"] == [ids["c"]]
+        assert ids["a"] in {i["id"] for i in body["issues"]}
+
+    async def test_unexplained_change_falls_back_to_snapshot(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        db = dashboard_db.db
+        version = (await client.get("/api/sync")).json()["version"]
+        db.conn.execute("UPDATE issues SET title = 'Edited behind our back' WHERE id = ?", (dashboard_db.ids["a"],))
+        db.conn.commit()
+        body = (await client.get("/api/sync", params={"since_version": version})).json()
+        assert body["full"] is True
+
+    async def test_label_change_falls_back_to_snapshot(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        version = (await client.get("/api/sync")).json()["version"]
+        dashboard_db.db.add_label(dashboard_db.ids["b"], "needs-review")
+        body = (await client.get("/api/sync", params={"since_version": version})).json()
+        assert body["full"] is True
+        labels = {i["id"]: i["labels"] for i in body["issues"]}
+        assert "needs-review" in labels[dashboard_db.ids["b"]]
+
+    async def test_too_many_events_falls_back_to_snapshot(
+        self, client: AsyncClient, dashboard_db: PopulatedDB, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(live, "_SYNC_EVENT_LIMIT", 2)
+        version = (await client.get("/api/sync")).json()["version"]
+        for p in (0, 1, 2):
+            dashboard_db.db.update_issue(dashboard_db.ids["c"], priority=p)
+        body = (await client.get("/api/sync", params={"since_version": version})).json()
+        assert body["full"] is True
+
+    async def test_columnar_snapshot_and_delta(self, client: AsyncClient, dashboard_db: PopulatedDB) -> None:
+        db, ids = dashboard_db.db, dashboard_db.ids
+        plain = (await client.get("/api/sync")).json()
+        body = (await client.get("/api/sync", params={"format": "columnar"})).json()
+        assert body["format"] == "columnar"
+        assert body["version"] == plain["version"]
+        assert _decode_columnar(body["issues"]) == plain["issues"]
+        assert _decode_columnar(body["dependencies"]) == plain["dependencies"]
+        db.remove_dependency(ids["a"], ids["b"])
+        delta = (await client.get("/api/sync", params={"since_version": body["version"], "format": "columnar"})).json()
+        assert delta["full"] is False
+        assert delta["dependency_sources"] == [ids["a"]]
+        assert delta["dependencies"]["count"] == 0
+        assert {i["id"] for i in _decode_columnar(delta["issues"])} >= {ids["a"], ids["b"]}
+
+    @pytest.mark.parametrize("token", ["bogus", "1.2.3", "1.-2.3.4", "9.9.9.9.9"])
+    async def test_bad_version_rejected(self, client: AsyncClient, token: str) -> None:
+        resp = await client.get("/api/sync", params={"since_version": token})
+        assert resp.status_code == 400
+        assert resp.json()["code"] == "VALIDATION"
+
+    async def test_version_from_other_database_gets_snapshot(self, client: AsyncClient) -> None:
+        body = (await client.get("/api/sync", params={"since_version": "999999.0.0.0"})).json()
+        assert body["full"] is True
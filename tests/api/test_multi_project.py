@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -449,6 +451,127 @@ class TestProjectStore:
             store.load()
 
 
+class TestProjectStoreBounds:
+    """LRU cap, idle sweep, warm-up and stats for server-mode handles."""
+
+    def test_lru_evicts_least_recently_used(self, project_store: ProjectStore) -> None:
+        project_store.max_open = 1
+        alpha = project_store.get_db("alpha")
+        project_store.get_db("bravo")
+        assert list(project_store._dbs) == ["bravo"]
+        # Evicted handle stays usable through the grace period.
+        assert alpha in project_store._evicted_dbs
+        assert alpha._conn is not None
+        assert project_store.stats()["lru_evictions"] == 1
+
+    def test_hit_refreshes_recency(self, project_store: ProjectStore) -> None:
+        project_store.max_open = 2
+        project_store.get_db("alpha")
+        project_store.get_db("bravo")
+        project_store.get_db("alpha")
+        assert list(project_store._dbs) == ["bravo", "alpha"]
+
+    def test_limits_read_from_server_json(self, project_store: ProjectStore, tmp_path: Path) -> None:
+        import json
+
+        project_store.get_db("alpha")
+        project_store.get_db("bravo")
+        config_file = tmp_path / ".config" / "filigree" / "server.json"
+        config = json.loads(config_file.read_text())
+        config.update(max_open_projects=1, project_idle_seconds=5, warm_projects=1)
+        config_file.write_text(json.dumps(config))
+
+        project_store.reload()
+        assert (project_store.max_open, project_store.idle_seconds, project_store.warm_count) == (1, 5.0, 1)
+        assert list(project_store._dbs) == ["bravo"]
+
+    def test_sweep_closes_idle_handles(self, project_store: ProjectStore) -> None:
+        project_store._evicted_close_grace_seconds = 0
+        alpha = project_store.get_db("alpha")
+        project_store.get_db("bravo")
+        project_store.idle_seconds = 60
+        project_store._last_used["alpha"] -= 120
+
+        project_store.sweep()
+        assert list(project_store._dbs) == ["bravo"]
+        assert alpha._conn is None
+        assert project_store.stats()["idle_evictions"] == 1
+
+    def test_leased_handle_survives_idle_sweep_and_eviction(self, project_store: ProjectStore) -> None:
+        project_store._evicted_close_grace_seconds = 0
+        project_store.idle_seconds = 60
+        alpha = project_store.get_db("alpha")
+        with alpha.lease():
+            project_store._last_used["alpha"] -= 120
+            project_store.sweep()
+            assert "alpha" in project_store._dbs
+
+            project_store.max_open = 1
+            project_store.get_db("bravo")
+            project_store.sweep()
+            assert alpha in project_store._evicted_dbs
+            assert alpha._conn is not None
+            assert project_store.stats()["leased"] == 1
+
+        project_store.sweep()
+        assert alpha not in project_store._evicted_dbs
+        assert alpha._conn is None
+
+    def test_sweep_disabled_with_zero_idle_seconds(self, project_store: ProjectStore) -> None:
+        project_store.get_db("alpha")
+        project_store.idle_seconds = 0
+        project_store._last_used["alpha"] -= 10_000
+        project_store.sweep()
+        assert "alpha" in project_store._dbs
+
+    def test_sweeper_thread_stops_on_close_all(self, project_store: ProjectStore) -> None:
+        project_store.start_sweeper(interval=0.01)
+        sweeper = project_store._sweeper
+        assert sweeper is not None
+        assert sweeper.is_alive()
+        project_store.close_all()
+        assert not sweeper.is_alive()
+
+    def test_warm_opens_most_recently_written_first(self, project_store: ProjectStore) -> None:
+        import os
+
+        bravo_db = Path(project_store._projects["bravo"]["path"]) / "filigree.db"
+        for name in ("filigree.db", "filigree.db-wal", "context.md"):
+            for key, mtime in (("alpha", 1_000_000), ("bravo", 2_000_000)):
+                target = Path(project_store._projects[key]["path"]) / name
+                if target.exists():
+                    os.utime(target, (mtime, mtime))
+        assert bravo_db.exists()
+
+        assert project_store.warm(1) == ["bravo"]
+        assert list(project_store._dbs) == ["bravo"]
+        stats = project_store.stats()
+        assert stats["warmed"] == 1
+        assert (stats["hits"], stats["misses"]) == (0, 0)
+
+        project_store.get_db("bravo")
+        assert project_store.stats()["hits"] == 1
+
+    def test_warm_capped_at_max_open(self, project_store: ProjectStore) -> None:
+        project_store.max_open = 1
+        assert len(project_store.warm(5)) == 1
+        assert len(project_store._dbs) == 1
+
+    def test_stats_hit_rate_and_open_latency(self, project_store: ProjectStore) -> None:
+        assert project_store.stats()["hit_rate"] is None
+        project_store.get_db("alpha")
+        project_store.get_db("alpha")
+        project_store.get_db("alpha")
+        project_store.get_db("bravo")
+        stats = project_store.stats()
+        assert stats["open"] == 2
+        assert (stats["hits"], stats["misses"], stats["opens"]) == (2, 2, 2)
+        assert stats["hit_rate"] == 0.5
+        assert stats["open_ms_avg"] is not None
+        assert stats["open_ms_max"] >= stats["open_ms_avg"]
+        assert stats["claims_reaped"] == 0
+
+
 class TestMultiProjectRouting:
     """Integration tests for multi-project URL routing."""
 
@@ -538,6 +661,111 @@ class TestMultiProjectRouting:
         assert body["code"] != ErrorCode.INTERNAL
 
 
+class TestFederated:
+    """Cross-project /api/federated/search and /api/federated/ready."""
+
+    async def test_search_merges_projects_with_attribution(self, multi_client: AsyncClient) -> None:
+        resp = await multi_client.get("/api/federated/search", params={"q": "issue"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert sorted((r["project"], r["title"]) for r in data["results"]) == [
+            ("alpha", "alpha issue 1"),
+            ("bravo", "bravo issue 1"),
+            ("bravo", "bravo issue 2"),
+        ]
+        assert all(isinstance(r["rank"], float) for r in data["results"])
+        ranks = [r["rank"] for r in data["results"]]
+        assert ranks == sorted(ranks)
+        assert [(p["project"], p["status"], p["count"]) for p in data["projects"]] == [("alpha", "ok", 1), ("bravo", "ok", 2)]
+
+    async def test_search_blank_query_returns_nothing(self, multi_client: AsyncClient) -> None:
+        data = (await multi_client.get("/api/federated/search", params={"q": " "})).json()
+        assert data["results"] == []
+
+    async def test_ready_ranked_by_priority_then_age(self, multi_client: AsyncClient, project_store: ProjectStore) -> None:
+        urgent = project_store.get_db("bravo").create_issue("bravo urgent", priority=0)
+        data = (await multi_client.get("/api/federated/ready", params={"limit": "3"})).json()
+        assert len(data["results"]) == 3
+        assert (data["results"][0]["project"], data["results"][0]["id"]) == ("bravo", urgent.id)
+        keys = [(r["priority"], r["created_at"]) for r in data["results"]]
+        assert keys == sorted(keys)
+
+    async def test_projects_param_restricts_fan_out(self, multi_client: AsyncClient) -> None:
+        data = (await multi_client.get("/api/federated/ready", params={"projects": "bravo"})).json()
+        assert {r["project"] for r in data["results"]} == {"bravo"}
+        assert [p["project"] for p in data["projects"]] == ["bravo"]
+
+    async def test_unknown_project_param_404(self, multi_client: AsyncClient) -> None:
+        resp = await multi_client.get("/api/federated/ready", params={"projects": "alpha,nope"})
+        assert resp.status_code == 404
+        assert resp.json()["code"] == ErrorCode.NOT_FOUND
+
+    @pytest.mark.parametrize("param", ["limit", "timeout_ms"])
+    async def test_rejects_out_of_range_params(self, multi_client: AsyncClient, param: str) -> None:
+        resp = await multi_client.get("/api/federated/ready", params={param: "0"})
+        assert resp.status_code == 400
+
+    async def test_stream_sends_a_line_per_project_then_order(self, multi_client: AsyncClient) -> None:
+        import json
+
+        resp = await multi_client.get("/api/federated/search/stream", params={"q": "issue"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        assert "content-encoding" not in resp.headers
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        *project_lines, done = lines
+        assert sorted(line["project"] for line in project_lines) == ["alpha", "bravo"]
+        assert all(r["project"] == line["project"] for line in project_lines for r in line["results"])
+        assert done["done"] is True
+        merged = (await multi_client.get("/api/federated/search", params={"q": "issue"})).json()["results"]
+        assert done["order"] == [[r["project"], r["id"]] for r in merged]
+
+    def test_slow_project_times_out(self, project_store: ProjectStore) -> None:
+        from filigree.dashboard_routes.federated import _query_project
+
+        def slow(db: FiligreeDB, key: str) -> list[Any]:
+            db.conn.execute("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT count(*) FROM n").fetchone()
+            return []
+
+        outcome = _query_project(project_store, {"key": "alpha", "name": "alpha"}, slow, timeout=0.05)
+        assert outcome["status"] == "timeout"
+        assert outcome["results"] == []
+        # The interrupted read connection is usable again.
+        with project_store.get_db("alpha").read_connection() as conn:
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_unopenable_project_reported_not_raised(self, project_store: ProjectStore) -> None:
+        from filigree.dashboard_routes.federated import _query_project
+
+        outcome = _query_project(project_store, {"key": "gone", "name": "gone"}, lambda db, key: [], timeout=1.0)
+        assert (outcome["status"], outcome["code"]) == ("error", ErrorCode.NOT_FOUND)
+
+    async def test_fan_out_leaves_the_handle_cache_alone(self, multi_client: AsyncClient, project_store: ProjectStore) -> None:
+        alpha = project_store.get_db("alpha")
+        before = project_store.stats()
+        data = (await multi_client.get("/api/federated/ready")).json()
+        assert [p["status"] for p in data["projects"]] == ["ok", "ok"]
+        stats = project_store.stats()
+        # alpha was read through its open handle; bravo through a transient one.
+        assert list(project_store._dbs) == ["alpha"]
+        assert project_store._dbs["alpha"] is alpha
+        assert (stats["hits"], stats["misses"], stats["opens"]) == (before["hits"], before["misses"], before["opens"])
+        assert stats["transient_opens"] == before["transient_opens"] + 1
+        assert not alpha.leased
+
+    def test_deadline_counts_from_request_start(self, project_store: ProjectStore) -> None:
+        from filigree.dashboard_routes.federated import _query_project
+
+        queued_since = time.monotonic() - 1.0
+        outcome = _query_project(project_store, {"key": "bravo", "name": "bravo"}, lambda db, key: [], 0.5, queued_since)
+        assert (outcome["status"], outcome["code"]) == ("timeout", ErrorCode.IO)
+        assert project_store.stats()["transient_opens"] == 0
+
+    async def test_not_mounted_in_ethereal_mode(self, client: AsyncClient) -> None:
+        resp = await client.get("/api/federated/ready")
+        assert resp.status_code == 404
+
+
 class TestMultiProjectManagement:
     """Tests for server-mode management endpoints."""
 
@@ -578,6 +806,9 @@ class TestMultiProjectManagement:
         assert data["status"] == "ok"
         assert data["mode"] == "server"
         assert data["projects"] == 2
+        assert data["project_store"]["max_open"] == 32
+        assert "hit_rate" in data["project_store"]
+        assert data["federated_executor"]["workers"] == 8
 
 
 class TestEtherealProjectsEndpoint:
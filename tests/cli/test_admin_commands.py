@@ -217,6 +217,12 @@ class TestJsonRetrofit:
         data = json.loads(result.output)
         assert "deleted_events" in data
 
+    def test_rebuild_blocker_counts_json(self, cli_in_project: tuple[CliRunner, Path]) -> None:
+        runner, _ = cli_in_project
+        result = runner.invoke(cli, ["rebuild-blocker-counts", "--json"])
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {"repaired": 0}
+
     def test_compact_rejects_negative_keep(self, cli_in_project: tuple[CliRunner, Path]) -> None:
         runner, _ = cli_in_project
         result = runner.invoke(cli, ["compact", "--keep", "-1"])
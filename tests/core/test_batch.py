@@ -248,3 +248,105 @@ class TestBatchTransitionEnrichmentRace:
         assert len(errors) == 1
         assert errors[0]["code"] == "INVALID_TRANSITION"
         assert "valid_transitions" in errors[0]
+
+
+class TestAtomic:
+    """FiligreeDB.atomic() folds many mutations into one transaction."""
+
+    def test_writes_are_invisible_until_the_block_exits(self, db: FiligreeDB) -> None:
+        import sqlite3
+
+        peer = sqlite3.connect(str(db.db_path))
+        try:
+            with db.atomic():
+                a = db.create_issue("A")
+                b = db.create_issue("B", deps=[a.id])
+                db.add_label(a.id, "backend")
+                assert peer.execute("SELECT COUNT(*) FROM issues WHERE id IN (?, ?)", (a.id, b.id)).fetchone()[0] == 0
+            assert peer.execute("SELECT COUNT(*) FROM issues WHERE id IN (?, ?)", (a.id, b.id)).fetchone()[0] == 2
+        finally:
+            peer.close()
+        assert not db.conn.in_transaction
+        assert db.get_issue(b.id).blocked_by == [a.id]
+
+    def test_exception_rolls_back_everything(self, db: FiligreeDB) -> None:
+        keep = db.create_issue("Keep")
+
+        def mutate_then_fail() -> None:
+            with db.atomic():
+                db.create_issue("Dropped")
+                db.update_issue(keep.id, title="Renamed")
+                raise RuntimeError("abort")
+
+        with pytest.raises(RuntimeError):
+            mutate_then_fail()
+
+        assert [i.title for i in db.list_issues(type="task")] == ["Keep"]
+        assert db.get_issue(keep.id).title == "Keep"
+        assert not db.conn.in_transaction
+
+    def test_inner_rollback_only_undoes_that_method(self, db: FiligreeDB) -> None:
+        with db.atomic():
+            a = db.create_issue("A")
+            closed, failed = db.batch_close([a.id, "test-missing0000"])
+            b = db.create_issue("B")
+
+        assert [r.id for r in closed] == [a.id]
+        assert len(failed) == 1
+        assert db.get_issue(a.id).status == "closed"
+        assert db.get_issue(b.id).title == "B"
+
+    def test_dependency_graph_matches_rolled_back_state(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        db.dependency_graph()
+
+        def mutate_then_fail() -> None:
+            with db.atomic():
+                db.add_dependency(b.id, a.id)
+                raise RuntimeError("abort")
+
+        with pytest.raises(RuntimeError):
+            mutate_then_fail()
+
+        assert [i.id for i in db.get_blocked()] == []
+        assert {i.id for i in db.get_ready()} >= {a.id, b.id}
+
+    def test_inside_a_caller_transaction_leaves_the_commit_to_the_caller(self, db: FiligreeDB) -> None:
+        import sqlite3
+
+        existing = db.create_issue("Existing")
+        db.conn.execute("BEGIN IMMEDIATE")
+        db.conn.execute("UPDATE issues SET title = 'Caller' WHERE id = ?", (existing.id,))
+        with db.atomic():
+            kept = db.create_issue("Kept")
+
+        def mutate_then_fail() -> None:
+            with db.atomic():
+                db.create_issue("Dropped")
+                raise RuntimeError("abort")
+
+        with pytest.raises(RuntimeError):
+            mutate_then_fail()
+
+        assert db.conn.in_transaction
+        peer = sqlite3.connect(str(db.db_path))
+        try:
+            assert peer.execute("SELECT COUNT(*) FROM issues WHERE id = ?", (kept.id,)).fetchone()[0] == 0
+            db.conn.commit()
+            assert peer.execute("SELECT COUNT(*) FROM issues WHERE id = ?", (kept.id,)).fetchone()[0] == 1
+        finally:
+            peer.close()
+        assert sorted(i.title for i in db.list_issues(type="task")) == ["Caller", "Kept"]
+
+    def test_block_is_local_to_its_thread(self, db: FiligreeDB) -> None:
+        import threading
+
+        seen: list[object] = []
+        with db.atomic():
+            worker = threading.Thread(target=lambda: seen.append(db._atomic_conn))
+            worker.start()
+            worker.join()
+            assert db._atomic_conn is not None
+        assert seen == [None]
+        assert db._atomic_conn is None
@@ -149,3 +149,51 @@ class TestBlockerSemanticsRespectType:
 
         with_blockers = {i.id for i in collision_db.list_issues(label="has:blockers")}
         assert task.id in with_blockers
+
+
+class TestMaterialisedStatusCategory:
+    """``issues.status_category`` is kept in step with ``_resolve_status_category``."""
+
+    @staticmethod
+    def _column(db: FiligreeDB, issue_id: str) -> str:
+        return str(db.conn.execute("SELECT status_category FROM issues WHERE id = ?", (issue_id,)).fetchone()[0])
+
+    def test_column_follows_transitions(self, collision_db: FiligreeDB) -> None:
+        task = collision_db.create_issue("task")
+        assert self._column(collision_db, task.id) == "open"
+        collision_db.update_issue(task.id, status="in_progress")
+        assert self._column(collision_db, task.id) == "wip"
+        collision_db.close_issue(task.id)
+        assert self._column(collision_db, task.id) == "done"
+        reopened = collision_db.reopen_issue(task.id)
+        assert self._column(collision_db, task.id) == collision_db._resolve_status_category("task", reopened.status) != "done"
+
+    def test_colliding_state_names_resolve_per_type(self, collision_db: FiligreeDB) -> None:
+        inc = collision_db.create_issue("incident", type="incident")
+        collision_db.update_issue(inc.id, status="triaging", fields={"severity": "sev3"})
+        for nxt in ("investigating", "mitigating", "resolved"):
+            collision_db.update_issue(inc.id, status=nxt)
+        assert self._column(collision_db, inc.id) == "wip"
+        assert collision_db.get_issue(inc.id).status_category == "wip"
+
+    def test_archived_is_done(self, collision_db: FiligreeDB) -> None:
+        task = collision_db.create_issue("task")
+        collision_db.close_issue(task.id)
+        collision_db.conn.execute("UPDATE issues SET status = 'archived' WHERE id = ?", (task.id,))
+        assert self._column(collision_db, task.id) == "done"
+
+    def test_inactive_type_matches_python_resolution(self, collision_db: FiligreeDB) -> None:
+        now = "2026-01-01T00:00:00+00:00"
+        for issue_id, status in (("test-ghost1", "closed"), ("test-ghost2", "whatever")):
+            collision_db.conn.execute(
+                "INSERT INTO issues (id, title, type, status, created_at, updated_at) VALUES (?, ?, 'ghost', ?, ?, ?)",
+                (issue_id, issue_id, status, now, now),
+            )
+        for issue_id, status in (("test-ghost1", "closed"), ("test-ghost2", "whatever")):
+            assert self._column(collision_db, issue_id) == collision_db._resolve_status_category("ghost", status)
+
+    def test_sync_is_noop_when_unchanged(self, collision_db: FiligreeDB) -> None:
+        assert collision_db._sync_status_categories() is False
+        collision_db.conn.execute("DELETE FROM status_categories WHERE type = 'task'")
+        assert collision_db._sync_status_categories() is True
+        assert collision_db._sync_status_categories() is False
@@ -266,6 +266,12 @@ class TestCreateAndGet:
         with pytest.raises(KeyError):
             db.get_issue("nonexistent-abc123")
 
+    def test_get_issues_batch(self, db: FiligreeDB) -> None:
+        first = db.create_issue("First")
+        second = db.create_issue("Second")
+        fetched = db.get_issues([second.id, "nonexistent-abc123", first.id, second.id])
+        assert [i.id for i in fetched] == [second.id, first.id]
+
 
 class TestUpdateAndClose:
     def test_update_status(self, db: FiligreeDB) -> None:
@@ -811,7 +817,7 @@ class TestClaimNextFilters:
 
 
 class TestClaimNextExhaustion:
-    """Bug fix: filigree-2e5383 — claim_next logs when all candidates fail."""
+    """claim_next selects and reserves its candidate in SQL."""
 
     def test_claim_next_no_warning_when_no_candidates(self, db: FiligreeDB) -> None:
         """When no ready issues exist, claim_next returns None without warning."""
@@ -824,35 +830,87 @@ class TestClaimNextExhaustion:
         result = db.claim_next("agent2")
         assert result is None
 
-    def test_claim_next_logs_on_race_exhaustion(self, db: FiligreeDB) -> None:
-        """When claim_issue raises ValueError for all candidates, warn about exhaustion."""
-        db.create_issue("Target")
+    def test_claim_next_skips_blocked_issue(self, db: FiligreeDB) -> None:
+        blocker = db.create_issue("Blocker", priority=1)
+        blocked = db.create_issue("Blocked", priority=0)
+        db.add_dependency(blocked.id, blocker.id)
 
-        # Simulate claim_issue always raising ValueError (race condition)
-        with (
-            patch.object(db, "claim_issue", side_effect=ValueError("race")),
-            patch("filigree.db_issues.logger") as mock_logger,
-        ):
-            result = db.claim_next("agent2")
+        result = db.claim_next("agent2")
 
-        assert result is None
-        mock_logger.warning.assert_called_once()
-        assert "failed to claim" in str(mock_logger.warning.call_args)
+        assert result is not None
+        assert result.id != blocked.id
 
-    def test_claim_next_skips_deleted_issue(self, db: FiligreeDB) -> None:
-        """Bug filigree-e55da01144: KeyError from deleted issue must be caught, not propagated."""
-        db.create_issue("Target")
+    def test_claim_next_tie_breaks_on_created_at_then_id(self, db: FiligreeDB) -> None:
+        first = db.create_issue("First", priority=0)
+        db.create_issue("Second", priority=0)
+
+        result = db.claim_next("agent2")
+
+        assert result is not None
+        assert result.id == first.id
+
+    def test_claim_next_hydrates_only_the_claimed_issue(self, db: FiligreeDB) -> None:
+        """The candidate is chosen in SQL, not by materialising the ready queue."""
+        for i in range(5):
+            db.create_issue(f"Ready {i}", priority=0)
 
-        # Simulate claim_issue raising KeyError (issue deleted between get_ready and claim)
         with (
-            patch.object(db, "claim_issue", side_effect=KeyError("Issue not found: test-abc")),
-            patch("filigree.db_issues.logger") as mock_logger,
+            patch.object(db, "get_ready", side_effect=AssertionError("ready queue built")),
+            patch.object(db, "_build_issues_batch", wraps=db._build_issues_batch) as build,
         ):
             result = db.claim_next("agent2")
 
-        assert result is None
-        mock_logger.warning.assert_called_once()
-        assert "failed to claim" in str(mock_logger.warning.call_args)
+        assert result is not None
+        assert [call.args[0] for call in build.call_args_list] == [[result.id]]
+
+    def test_claim_next_records_claim_event(self, db: FiligreeDB) -> None:
+        db.create_issue("Target", priority=0)
+
+        result = db.claim_next("  agent2  ")
+
+        assert result is not None
+        assert result.assignee == "agent2"
+        assert result.claim_expires_at is not None
+        event = db.get_issue_events(result.id)[0]
+        assert (event["event_type"], event["old_value"], event["new_value"], event["actor"]) == ("claimed", "", "agent2", "agent2")
+
+    def test_concurrent_claim_next_claims_distinct_issues(self, db: FiligreeDB) -> None:
+        """Peers racing claim_next serialize on BEGIN IMMEDIATE and never share an issue."""
+        import threading
+
+        for existing in db.get_ready():
+            db.claim_issue(existing.id, assignee="setup")
+        for i in range(6):
+            db.create_issue(f"Ready {i}")
+        db_path = db.db_path
+        db.close()
+
+        peers = [FiligreeDB(db_path, prefix="test", check_same_thread=False) for _ in range(4)]
+        try:
+            barrier = threading.Barrier(len(peers))
+            claimed: list[str] = []
+            errors: list[BaseException] = []
+
+            def run(peer: FiligreeDB, name: str) -> None:
+                try:
+                    barrier.wait()
+                    while (issue := peer.claim_next(name)) is not None:
+                        claimed.append(issue.id)
+                except BaseException as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=run, args=(peer, f"agent-{i}")) for i, peer in enumerate(peers)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert errors == []
+            assert len(claimed) == 6
+            assert len(set(claimed)) == 6
+        finally:
+            for peer in peers:
+                peer.close()
 
 
 class TestClaimRaceCondition:
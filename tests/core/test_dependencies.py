@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import random
 import sqlite3
+from typing import Any
 
 import pytest
 
 from filigree.core import FiligreeDB
+from filigree.dep_graph import DependencyGraph
 
 
 class TestDependencies:
@@ -101,6 +104,15 @@ class TestDependencyOperations:
         assert all_deps[0]["from"] == a.id
         assert all_deps[0]["to"] == b.id
 
+    def test_get_all_dependencies_for_sources(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        c = db.create_issue("C")
+        db.add_dependency(a.id, b.id)
+        db.add_dependency(c.id, b.id)
+        assert db.get_all_dependencies(issue_ids=[c.id, "nonexistent-abc123"]) == [{"from": c.id, "to": b.id, "type": "blocks"}]
+        assert db.get_all_dependencies(issue_ids=[]) == []
+
 
 class TestCriticalPath:
     def test_linear_chain(self, db: FiligreeDB) -> None:
@@ -155,6 +167,90 @@ class TestCriticalPath:
         assert len(path) == 3
 
 
+class TestGraphNodes:
+    """``get_graph_nodes`` — the SQL-filtered projection behind /api/graph."""
+
+    def test_counts_and_readiness(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        c = db.create_issue("C")
+        db.add_dependency(a.id, b.id)
+        db.add_dependency(b.id, c.id)
+        db.close_issue(c.id)
+        nodes, total = db.get_graph_nodes(issue_ids={a.id, b.id, c.id})
+        by_id = {n["id"]: n for n in nodes}
+        assert total == 3
+        assert (by_id[a.id]["blocked_by_open_count"], by_id[a.id]["is_ready"]) == (1, False)
+        assert (by_id[b.id]["blocked_by_open_count"], by_id[b.id]["blocks_open_count"]) == (0, 1)
+        assert by_id[b.id]["is_ready"] is True
+        assert by_id[c.id]["status_category"] == "done"
+        # C holds up B, but B is open and C itself is done: only not-done dependents count.
+        assert by_id[c.id]["blocks_open_count"] == 1
+
+    def test_filters(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A", type="bug", assignee="alice")
+        b = db.create_issue("B")
+        c = db.create_issue("C")
+        db.add_dependency(a.id, b.id)
+        db.close_issue(c.id)
+
+        def ids(**kwargs: Any) -> set[str]:
+            return {n["id"] for n in db.get_graph_nodes(**kwargs)[0]}
+
+        assert c.id not in ids(include_done=False)
+        assert ids(types={"bug"}) == {a.id}
+        assert ids(status_categories={"done"}) >= {c.id}
+        assert ids(assignee="alice") == {a.id}
+        assert ids(blocked_only=True) == {a.id}
+        assert b.id in ids(ready_only=True)
+        assert a.id not in ids(ready_only=True)
+        assert ids(issue_ids={a.id, c.id}) == {a.id, c.id}
+        assert ids(issue_ids=set()) == set()
+
+    def test_updated_since(self, db: FiligreeDB) -> None:
+        old = db.create_issue("Old")
+        new = db.create_issue("New")
+        db.conn.execute("UPDATE issues SET updated_at = '2020-01-01T00:00:00+00:00' WHERE id = ?", (old.id,))
+        db.conn.commit()
+        nodes, _ = db.get_graph_nodes(updated_since="2024-01-01T00:00:00+00:00")
+        assert [n["id"] for n in nodes if n["id"] in {old.id, new.id}] == [new.id]
+
+    def test_limit_keeps_priority_order_and_total(self, db: FiligreeDB) -> None:
+        low = db.create_issue("Low", priority=3)
+        high = db.create_issue("High", priority=0)
+        db.create_issue("Mid", priority=2)
+        nodes, total = db.get_graph_nodes(issue_ids={low.id, high.id}, limit=1)
+        assert [n["id"] for n in nodes] == [high.id]
+        assert total == 2
+        with pytest.raises(ValueError, match="limit"):
+            db.get_graph_nodes(limit=0)
+
+
+class TestDependencyPages:
+    """``get_dependencies_page`` — keyset pages behind the streamed /api/dependencies."""
+
+    def test_pages_cover_every_edge_in_key_order(self, db: FiligreeDB) -> None:
+        issues = [db.create_issue(f"I{i}") for i in range(5)]
+        for blocked in issues[:4]:
+            for blocker in issues[issues.index(blocked) + 1 :]:
+                db.add_dependency(blocked.id, blocker.id)
+        expected = sorted((d["from"], d["to"]) for d in db.get_all_dependencies())
+        seen: list[tuple[str, str]] = []
+        after: tuple[str, str] | None = None
+        while True:
+            page = db.get_dependencies_page(after=after, limit=3)
+            seen.extend((d["from"], d["to"]) for d in page)
+            if len(page) < 3:
+                break
+            after = seen[-1]
+        assert seen == expected
+        assert len(seen) == 10
+
+    def test_rejects_non_positive_limit(self, db: FiligreeDB) -> None:
+        with pytest.raises(ValueError, match="limit"):
+            db.get_dependencies_page(limit=0)
+
+
 class TestInvalidDepValidation:
     """Bug fix: filigree-1acc4b — create_issue dep FK crash."""
 
@@ -355,3 +451,209 @@ class TestDependencyEdgeCases:
             second.commit()
         finally:
             second.close()
+
+
+class TestOpenBlockerCounters:
+    """Trigger-maintained ``open_blocker_count`` / ``blocks_open_count``."""
+
+    @staticmethod
+    def _counts(db: FiligreeDB, issue_id: str) -> tuple[int, int]:
+        row = db.conn.execute("SELECT open_blocker_count, blocks_open_count FROM issues WHERE id = ?", (issue_id,)).fetchone()
+        return row["open_blocker_count"], row["blocks_open_count"]
+
+    def test_add_and_remove_dependency(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        db.add_dependency(a.id, b.id)
+        assert self._counts(db, a.id) == (1, 0)
+        assert self._counts(db, b.id) == (0, 1)
+        db.remove_dependency(a.id, b.id)
+        assert self._counts(db, a.id) == (0, 0)
+        assert self._counts(db, b.id) == (0, 0)
+
+    def test_blocker_close_and_reopen(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        db.add_dependency(a.id, b.id)
+        db.close_issue(b.id)
+        assert self._counts(db, a.id) == (0, 0)
+        assert self._counts(db, b.id) == (0, 0)
+        db.reopen_issue(b.id)
+        assert self._counts(db, a.id) == (1, 0)
+        assert self._counts(db, b.id) == (0, 1)
+
+    def test_dependency_on_closed_blocker_not_counted(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        db.close_issue(b.id)
+        db.add_dependency(a.id, b.id)
+        assert self._counts(db, a.id) == (0, 0)
+        db.remove_dependency(a.id, b.id)
+        assert self._counts(db, a.id) == (0, 0)
+
+    def test_create_issue_with_deps(self, db: FiligreeDB) -> None:
+        b = db.create_issue("B")
+        c = db.create_issue("C")
+        a = db.create_issue("A", deps=[b.id, c.id])
+        assert self._counts(db, a.id) == (2, 0)
+        assert db.get_issue(a.id).is_ready is False
+        db.close_issue(b.id)
+        assert self._counts(db, a.id) == (1, 0)
+
+    def test_rebuild_repairs_drift(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        db.add_dependency(a.id, b.id)
+        assert db.rebuild_blocker_counts() == 0
+        db.conn.execute("UPDATE issues SET open_blocker_count = 7, blocks_open_count = 3 WHERE id = ?", (a.id,))
+        db.conn.commit()
+        assert db.rebuild_blocker_counts() == 1
+        assert self._counts(db, a.id) == (1, 0)
+        assert self._counts(db, b.id) == (0, 1)
+
+    def test_ready_and_blocked_follow_counters(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        db.add_dependency(a.id, b.id)
+        assert a.id not in {i.id for i in db.get_ready()}
+        assert a.id in {i.id for i in db.get_blocked()}
+        stats = db.get_stats()
+        db.close_issue(b.id)
+        assert a.id in {i.id for i in db.get_ready()}
+        assert a.id not in {i.id for i in db.get_blocked()}
+        after = db.get_stats()
+        assert after["blocked_count"] == stats["blocked_count"] - 1
+
+    def test_status_categories_mirror_registry(self, db: FiligreeDB) -> None:
+        rows = db.conn.execute("SELECT category FROM status_categories WHERE type = 'task' AND status = 'closed'").fetchall()
+        assert [r["category"] for r in rows] == ["done"]
+        assert db._sync_status_categories() is False
+
+
+class TestDependencyGraphIndex:
+    """The cached in-memory graph behind cycle checks and critical path."""
+
+    def test_graph_reused_and_patched(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        graph = db.dependency_graph()
+        db.add_dependency(a.id, b.id)
+        assert db.dependency_graph() is graph
+        assert graph.has_edge(a.id, b.id)
+        db.remove_dependency(a.id, b.id)
+        assert db.dependency_graph() is graph
+        assert not graph.has_edge(a.id, b.id)
+
+    def test_warm_cycle_check_skips_edge_scan(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        c = db.create_issue("C")
+        db.add_dependency(a.id, b.id)
+        statements: list[str] = []
+        db.conn.set_trace_callback(statements.append)
+        try:
+            db.add_dependency(b.id, c.id)
+            with pytest.raises(ValueError, match="cycle"):
+                db.add_dependency(c.id, a.id)
+        finally:
+            db.conn.set_trace_callback(None)
+        assert not [s for s in statements if "FROM dependencies" in s and "WHERE" not in s]
+
+    def test_other_connection_write_invalidates(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        stale = db.dependency_graph()
+        other = sqlite3.connect(str(db.db_path))
+        try:
+            other.execute(
+                "INSERT INTO dependencies (issue_id, depends_on_id, type, created_at) VALUES (?, ?, 'blocks', '2026-01-01T00:00:00+00:00')",
+                (a.id, b.id),
+            )
+            other.commit()
+        finally:
+            other.close()
+        fresh = db.dependency_graph()
+        assert fresh is not stale
+        assert fresh.has_edge(a.id, b.id)
+        with pytest.raises(ValueError, match="cycle"):
+            db.add_dependency(b.id, a.id)
+
+    def test_failed_plan_leaves_no_phantom_edges(self, db: FiligreeDB) -> None:
+        before = len(db.dependency_graph())
+        with pytest.raises(ValueError, match="out of range"):
+            db.create_plan(
+                {"title": "Broken"},
+                [{"title": "P", "steps": [{"title": "S1"}, {"title": "S2", "deps": [0]}, {"title": "S3", "deps": [7]}]}],
+            )
+        assert len(db.dependency_graph()) == before
+        assert db.get_all_dependencies() == []
+
+    def test_plan_cycle_check_sees_earlier_plan_edges(self, db: FiligreeDB) -> None:
+        with pytest.raises(ValueError, match="cycle"):
+            db.create_plan(
+                {"title": "Loop"},
+                [{"title": "P", "steps": [{"title": "S1", "deps": [1]}, {"title": "S2", "deps": [0]}]}],
+            )
+        assert len(db.dependency_graph()) == 0
+
+    def test_undo_keeps_graph_in_step(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        graph = db.dependency_graph()
+        db.add_dependency(a.id, b.id)
+        db.undo_last(a.id)
+        assert not graph.has_edge(a.id, b.id)
+        db.add_dependency(b.id, a.id)  # would cycle if the undone edge lingered
+        assert db.dependency_graph().has_edge(b.id, a.id)
+
+
+class TestDependencyGraphStructure:
+    def test_neighbourhood_is_undirected_and_bounded(self) -> None:
+        graph = DependencyGraph([("a", "b", "blocks"), ("b", "c", "blocks"), ("d", "c", "blocks")])
+        assert graph.neighbourhood("a", 0) == {"a"}
+        assert graph.neighbourhood("a", 1) == {"a", "b"}
+        assert graph.neighbourhood("b", 2) == {"a", "b", "c", "d"}
+
+    def test_longest_chain_restricted_to_nodes(self) -> None:
+        graph = DependencyGraph([("c", "b", "blocks"), ("b", "a", "blocks"), ("x", "c", "blocks")])
+        assert graph.longest_chain(["a", "b", "c", "x"]) == ["a", "b", "c", "x"]
+        assert graph.longest_chain(["a", "b", "x"]) == ["a", "b"]
+        assert graph.longest_chain(["a", "x"]) == []
+
+    def test_forward_edge_accepted_without_search(self) -> None:
+        graph = DependencyGraph([("b", "a", "blocks")])
+        graph.add_edge("c", "b")
+        # "c" was ranked after "b" on first sight, so no region search runs
+        # and the rank stays topological.
+        assert graph._rank["a"] < graph._rank["b"] < graph._rank["c"]
+
+    def test_backward_edge_reranks_affected_region(self) -> None:
+        graph = DependencyGraph([("b", "a", "blocks"), ("d", "c", "blocks")])
+        assert not graph.would_create_cycle("c", "b")
+        graph.add_edge("c", "b")  # c now waits on b: a < b < c < d
+        assert graph._rank["a"] < graph._rank["b"] < graph._rank["c"] < graph._rank["d"]
+        assert graph.would_create_cycle("a", "d")
+        assert graph.longest_chain(["a", "b", "c", "d"]) == ["a", "b", "c", "d"]
+
+    def test_online_order_matches_reachability(self) -> None:
+        rng = random.Random(7)  # noqa: S311 - deterministic fuzz, not crypto
+        nodes = [f"n{i}" for i in range(40)]
+        graph = DependencyGraph()
+        for _ in range(400):
+            src, dst = rng.sample(nodes, 2)
+            expected = graph.reaches(dst, src)
+            assert graph.would_create_cycle(src, dst) is expected
+            if not expected:
+                graph.add_edge(src, dst)
+            if rng.random() < 0.1 and len(graph):
+                victim = rng.choice(list(graph.edges()))
+                graph.remove_edge(victim[0], victim[1])
+        for src, dst, _ in graph.edges():
+            assert graph._rank[dst] < graph._rank[src]
+
+    def test_cyclic_data_falls_back_to_search(self) -> None:
+        graph = DependencyGraph([("a", "b", "blocks"), ("b", "a", "blocks"), ("c", "d", "blocks")])
+        assert not graph._ranked
+        assert graph.would_create_cycle("d", "c")
+        assert not graph.would_create_cycle("c", "a")
+        assert graph.longest_chain(["c", "d"]) == ["d", "c"]
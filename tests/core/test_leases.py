@@ -0,0 +1,279 @@
+"""Tests for claim leases: the claim_leases table, the write-behind ``LeaseBuffer`` and expired-claim reaping."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from filigree.core import FiligreeDB
+from filigree.leases import DEFAULT_HEARTBEAT_FLUSH_SECONDS, ClaimReaper
+
+
+def _lease_rows(db: FiligreeDB) -> list[tuple[str, str]]:
+    return [(r["issue_id"], r["assignee"]) for r in db.conn.execute("SELECT issue_id, assignee FROM claim_leases").fetchall()]
+
+
+def _claimed(db: FiligreeDB, title: str = "Claimed", assignee: str = "agent-1") -> str:
+    issue = db.create_issue(title)
+    db.claim_issue(issue.id, assignee=assignee)
+    return issue.id
+
+
+class TestClaimLeases:
+    def test_heartbeat_leaves_issue_row_and_events_alone(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        row_before = dict(db.conn.execute("SELECT * FROM issues WHERE id = ?", (issue_id,)).fetchone())
+        events_before = len(db.get_issue_events(issue_id))
+
+        refreshed = db.heartbeat_work(issue_id, actor="agent-1")
+
+        assert dict(db.conn.execute("SELECT * FROM issues WHERE id = ?", (issue_id,)).fetchone()) == row_before
+        assert len(db.get_issue_events(issue_id)) == events_before
+        assert _lease_rows(db) == [(issue_id, "agent-1")]
+        assert refreshed.last_heartbeat_at is not None
+        assert refreshed.last_heartbeat_at > row_before["last_heartbeat_at"]
+        assert db.get_issue(issue_id).claim_expires_at == refreshed.claim_expires_at
+
+    def test_claim_change_supersedes_lease(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        db.heartbeat_work(issue_id, actor="agent-1", lease_hours=1)
+        db.release_claim(issue_id, actor="agent-1")
+
+        assert _lease_rows(db) == []
+        reclaimed = db.claim_issue(issue_id, assignee="agent-1")
+        assert reclaimed.last_heartbeat_at == reclaimed.claimed_at
+
+    def test_stale_claims_read_the_lease(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        past = (datetime.now(UTC) - timedelta(hours=1)).isoformat()
+        db.conn.execute("UPDATE issues SET last_heartbeat_at = ?, claim_expires_at = ? WHERE id = ?", (past, past, issue_id))
+        db.conn.commit()
+        assert [i.id for i in db.get_stale_claims()] == [issue_id]
+
+        db.heartbeat_work(issue_id, actor="agent-1")
+
+        assert db.get_stale_claims() == []
+
+    def test_export_carries_effective_lease(self, db: FiligreeDB, tmp_path: Path) -> None:
+        issue_id = _claimed(db)
+        refreshed = db.heartbeat_work(issue_id, actor="agent-1")
+        out = tmp_path / "export.jsonl"
+
+        db.export_jsonl(out)
+
+        records = [json.loads(line) for line in out.read_text().splitlines()]
+        (record,) = [r for r in records if r["_type"] == "issue" and r["id"] == issue_id]
+        assert record["last_heartbeat_at"] == refreshed.last_heartbeat_at
+        assert "lease_heartbeat_at" not in record
+
+
+class TestLeaseBuffer:
+    def test_buffered_heartbeat_is_visible_before_flush(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        db.enable_heartbeat_buffer(window=60)
+
+        refreshed = db.heartbeat_work(issue_id, actor="agent-1")
+
+        assert _lease_rows(db) == []
+        assert db.get_issue(issue_id).last_heartbeat_at == refreshed.last_heartbeat_at
+        assert db.flush_heartbeats() == 1
+        assert _lease_rows(db) == [(issue_id, "agent-1")]
+        assert db.get_issue(issue_id).last_heartbeat_at == refreshed.last_heartbeat_at
+
+    def test_heartbeats_coalesce_into_one_batch(self, db: FiligreeDB) -> None:
+        ids = [_claimed(db, f"Claimed {i}", f"agent-{i}") for i in range(3)]
+        db.enable_heartbeat_buffer(window=60)
+
+        for _ in range(4):
+            for i, issue_id in enumerate(ids):
+                db.heartbeat_work(issue_id, actor=f"agent-{i}")
+
+        assert db.flush_heartbeats() == 3
+        assert db._lease_buffer is not None
+        assert db._lease_buffer.flushes == 1
+        assert sorted(_lease_rows(db)) == sorted((issue_id, f"agent-{i}") for i, issue_id in enumerate(ids))
+
+    def test_flush_skips_heartbeat_from_a_released_holder(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        db.enable_heartbeat_buffer(window=60)
+        db.heartbeat_work(issue_id, actor="agent-1")
+        db.release_claim(issue_id, actor="agent-1")
+
+        assert db.get_issue(issue_id).last_heartbeat_at is None
+        db.flush_heartbeats()
+
+        assert _lease_rows(db) == []
+
+    def test_close_flushes_pending_heartbeats(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        db.enable_heartbeat_buffer(window=60)
+        refreshed = db.heartbeat_work(issue_id, actor="agent-1")
+        db_path = db.db_path
+
+        db.close()
+
+        peer = FiligreeDB(db_path, prefix="test")
+        try:
+            assert peer.get_issue(issue_id).last_heartbeat_at == refreshed.last_heartbeat_at
+        finally:
+            peer.close()
+
+    def test_zero_window_writes_through(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        db.enable_heartbeat_buffer(window=0)
+
+        db.heartbeat_work(issue_id, actor="agent-1")
+
+        assert _lease_rows(db) == [(issue_id, "agent-1")]
+
+
+def _expire(db: FiligreeDB, issue_id: str, hours_ago: int = 1) -> str:
+    past = (datetime.now(UTC) - timedelta(hours=hours_ago)).isoformat()
+    db.conn.execute("UPDATE issues SET claim_expires_at = ? WHERE id = ?", (past, issue_id))
+    db.conn.execute("UPDATE claim_leases SET claim_expires_at = ? WHERE issue_id = ?", (past, issue_id))
+    db.conn.commit()
+    return past
+
+
+class TestReapExpiredClaims:
+    def test_releases_expired_claims_with_events(self, db: FiligreeDB) -> None:
+        expired = _claimed(db, "Expired")
+        live = _claimed(db, "Live", "agent-2")
+        expires_at = _expire(db, expired)
+
+        reaped = db.reap_expired_claims()
+
+        assert [i.id for i in reaped] == [expired]
+        assert reaped[0].assignee == ""
+        assert reaped[0].claim_expires_at is None
+        assert db.get_issue(live).assignee == "agent-2"
+        event = db.get_issue_events(expired)[0]
+        assert event["event_type"] == "released"
+        assert event["actor"] == "claim-reaper"
+        assert event["old_value"] == "agent-1"
+        assert expires_at in event["comment"]
+
+    def test_claim_next_gets_reaped_work(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        _expire(db, issue_id)
+        assert db.claim_next("agent-2", type_filter="task") is None
+
+        db.reap_expired_claims()
+
+        claimed = db.claim_next("agent-2", type_filter="task")
+        assert claimed is not None
+        assert claimed.id == issue_id
+
+    def test_heartbeat_lease_keeps_claim_alive(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        _expire(db, issue_id)
+        db.enable_heartbeat_buffer(window=60)
+        db.heartbeat_work(issue_id, actor="agent-1")
+
+        assert db.reap_expired_claims() == []
+        assert db.get_issue(issue_id).assignee == "agent-1"
+
+    def test_expired_lease_overrides_issue_expiry(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        db.heartbeat_work(issue_id, actor="agent-1", lease_hours=1)
+        past = (datetime.now(UTC) - timedelta(minutes=5)).isoformat()
+        db.conn.execute("UPDATE claim_leases SET claim_expires_at = ? WHERE issue_id = ?", (past, issue_id))
+        db.conn.commit()
+
+        assert [i.id for i in db.reap_expired_claims()] == [issue_id]
+        assert _lease_rows(db) == []
+
+    def test_wip_issue_reverts_to_open(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        db.update_issue(issue_id, status="in_progress", actor="agent-1")
+        _expire(db, issue_id)
+
+        (reaped,) = db.reap_expired_claims()
+
+        assert reaped.status == "open"
+        assert issue_id in {i.id for i in db.get_ready()}
+
+    def test_limit_bounds_one_batch(self, db: FiligreeDB) -> None:
+        ids = [_claimed(db, f"Expired {i}") for i in range(3)]
+        for issue_id in ids:
+            _expire(db, issue_id)
+
+        assert len(db.reap_expired_claims(limit=2)) == 2
+        assert len(db.reap_expired_claims(limit=2)) == 1
+        assert db.reap_expired_claims(limit=2) == []
+
+    def test_done_issues_are_skipped(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        db.close_issue(issue_id, actor="agent-1")
+        _expire(db, issue_id)
+
+        assert db.reap_expired_claims() == []
+
+    def test_grace_covers_heartbeats_buffered_by_another_process(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        # Expired one flush window ago: a heartbeat accepted elsewhere may still be in that process's buffer.
+        just_expired = (datetime.now(UTC) - timedelta(seconds=DEFAULT_HEARTBEAT_FLUSH_SECONDS)).isoformat()
+        db.conn.execute("UPDATE issues SET claim_expires_at = ? WHERE id = ?", (just_expired, issue_id))
+        db.conn.commit()
+        other = FiligreeDB(db.db_path, prefix=db.prefix)
+        other.enable_heartbeat_buffer(window=60)
+        try:
+            other.heartbeat_work(issue_id, actor="agent-1")
+
+            assert db.reap_expired_claims() == []
+            other.flush_heartbeats()
+            assert db.reap_expired_claims(grace_seconds=0) == []
+            assert db.get_issue(issue_id).assignee == "agent-1"
+        finally:
+            other.close()
+
+    def test_zero_grace_releases_as_soon_as_expired(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        just_expired = (datetime.now(UTC) - timedelta(seconds=1)).isoformat()
+        db.conn.execute("UPDATE issues SET claim_expires_at = ? WHERE id = ?", (just_expired, issue_id))
+        db.conn.commit()
+
+        assert db.reap_expired_claims() == []
+        assert [i.id for i in db.reap_expired_claims(grace_seconds=0)] == [issue_id]
+
+
+class TestClaimReaper:
+    def test_run_once_drains_in_batches_and_records_stats(self) -> None:
+        batches = iter([2, 2, 1])
+        reaper = ClaimReaper(lambda limit: next(batches), interval=0, batch_size=2)
+
+        assert reaper.run_once() == 5
+        stats = reaper.stats()
+        assert stats["scans"] == 1
+        assert stats["reaped"] == 5
+        assert stats["failures"] == 0
+        assert stats["last_scan_ms"] is not None
+
+    def test_failed_scan_is_counted_not_raised(self) -> None:
+        def reap(limit: int) -> int:
+            raise sqlite3.OperationalError("database is locked")
+
+        reaper = ClaimReaper(reap, interval=0)
+
+        assert reaper.run_once() == 0
+        assert reaper.stats()["failures"] == 1
+
+    def test_enabled_reaper_releases_through_its_own_handle(self, db: FiligreeDB) -> None:
+        issue_id = _claimed(db)
+        _expire(db, issue_id)
+        db.enable_claim_reaper(interval=3600)
+        assert db._claim_reaper is not None
+
+        assert db._claim_reaper.run_once() == 1
+
+        assert db.get_issue(issue_id).assignee == ""
+        assert db.claim_reaper_stats()["reaped"] == 1  # type: ignore[index]
+        db.close()
+        assert db._claim_reaper is None
+
+    def test_zero_interval_disables(self, db: FiligreeDB) -> None:
+        db.enable_claim_reaper(interval=0)
+
+        assert db.claim_reaper_stats() is None
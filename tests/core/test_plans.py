@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 import pytest
 
 from filigree.core import FiligreeDB
@@ -423,3 +425,48 @@ class TestCreatePlanDepRefValidation:
             (p1_step0_id,),
         ).fetchall()
         assert [r["depends_on_id"] for r in rows] == [p0_step1_id]
+
+
+class TestTreeQueryCount:
+    """Plan and release trees load with a fixed number of queries, not one per node."""
+
+    @staticmethod
+    def _count_selects(db: FiligreeDB, fn: Callable[[], object]) -> int:
+        statements: list[str] = []
+        db.conn.set_trace_callback(statements.append)
+        try:
+            fn()
+        finally:
+            db.conn.set_trace_callback(None)
+        return sum(1 for sql in statements if sql.lstrip().upper().startswith(("SELECT", "WITH")))
+
+    def test_get_plan_query_count_independent_of_size(self, db: FiligreeDB) -> None:
+        small = db.create_plan({"title": "S"}, [{"title": "P", "steps": [{"title": "s"}]}])
+        big = db.create_plan({"title": "B"}, [{"title": f"P{i}", "steps": [{"title": "s"}] * 5} for i in range(8)])
+        small_n = self._count_selects(db, lambda: db.get_plan(small["milestone"]["id"]))
+        big_n = self._count_selects(db, lambda: db.get_plan(big["milestone"]["id"]))
+        assert big_n == small_n
+
+    def test_release_tree_query_count_independent_of_size(self, db: FiligreeDB) -> None:
+        small = db.create_issue("Small", type="release")
+        db.create_issue("leaf", parent_id=small.id)
+        big = db.create_issue("Big", type="release")
+        for i in range(4):
+            epic = db.create_issue(f"E{i}", type="epic", parent_id=big.id)
+            for j in range(4):
+                db.create_issue(f"t{i}.{j}", parent_id=epic.id)
+        small_n = self._count_selects(db, lambda: db.get_release_tree(small.id))
+        big_n = self._count_selects(db, lambda: db.get_release_tree(big.id))
+        assert big_n == small_n
+
+    def test_rollup_matches_progress_from_subtree(self, db: FiligreeDB) -> None:
+        release = db.create_issue("R", type="release")
+        epic = db.create_issue("E", type="epic", parent_id=release.id)
+        done = db.create_issue("done", parent_id=epic.id)
+        db.create_issue("open", parent_id=epic.id)
+        db.create_issue("loose", parent_id=release.id)
+        db.close_issue(done.id)
+        tree, progress = db._build_tree_with_progress(release.id)
+        assert progress == db._progress_from_subtree(tree)
+        assert progress == {"total": 3, "completed": 1, "in_progress": 0, "open": 2, "pct": 33}
+        assert tree[0]["progress"] == {"total": 2, "completed": 1, "in_progress": 0, "open": 1, "pct": 50}
@@ -33,6 +33,26 @@ class TestListAndSearch:
         assert len(results) == 1
         assert "auth" in results[0].title.lower()
 
+    def test_search_ranked_matches_search_order(self, db: FiligreeDB) -> None:
+        db.create_issue("auth auth auth")
+        db.create_issue("Fix auth flow in the login service handler")
+        ranked = db.search_issues_ranked("auth")
+        assert [i.id for i, _ in ranked] == [i.id for i in db.search_issues("auth")]
+        ranks = [rank for _, rank in ranked]
+        assert all(isinstance(rank, float) for rank in ranks)
+        assert ranks == sorted(ranks)
+
+    def test_search_ranked_like_fallback_has_no_rank(self, db: FiligreeDB) -> None:
+        db.create_issue("[cluster-foo] tagged")
+        assert [rank for _, rank in db.search_issues_ranked("[cluster-foo]")] == [None]
+
+    def test_get_ready_limit(self, db: FiligreeDB) -> None:
+        db.create_issue("Low", priority=3)
+        db.create_issue("High", priority=0)
+        ready = db.get_ready()
+        assert db.get_ready(limit=1) == ready[:1]
+        assert ready[0].title == "High"
+
 
 class TestListIssuesCategoryAliases:
     """M9: list_issues category aliases 'in_progress'→'wip' and 'closed'→'done'."""
@@ -175,6 +195,125 @@ class TestListIssuesBoundaries:
         assert results == []
 
 
+class TestListIssuesCursor:
+    """Keyset pagination via ``cursor`` / ``issue_list_cursor``."""
+
+    @staticmethod
+    def _walk(db: FiligreeDB, page_size: int, **kwargs: str) -> list[str]:
+        ids: list[str] = []
+        cursor: str | None = None
+        while True:
+            page = db.list_issues(limit=page_size, cursor=cursor, **kwargs)
+            ids.extend(i.id for i in page)
+            if len(page) < page_size:
+                return ids
+            cursor = db.issue_list_cursor(page[-1], **kwargs)
+
+    @pytest.mark.parametrize("sort_by", ["priority", "created_at", "updated_at"])
+    @pytest.mark.parametrize("direction", ["asc", "desc"])
+    def test_walk_matches_single_query(self, db: FiligreeDB, sort_by: str, direction: str) -> None:
+        for n in range(11):
+            db.create_issue(f"Issue {n}", priority=n % 3)
+        expected = [i.id for i in db.list_issues(sort_by=sort_by, direction=direction, limit=1000)]
+        assert self._walk(db, 3, sort_by=sort_by, direction=direction) == expected
+
+    def test_walk_applies_filters(self, db: FiligreeDB) -> None:
+        for n in range(5):
+            db.create_issue(f"Bug {n}", type="bug")
+            db.create_issue(f"Task {n}", type="task")
+        expected = [i.id for i in db.list_issues(type="bug", limit=1000)]
+        assert len(expected) == 5
+        ids: list[str] = []
+        cursor: str | None = None
+        while True:
+            page = db.list_issues(type="bug", limit=2, cursor=cursor)
+            ids.extend(i.id for i in page)
+            if len(page) < 2:
+                break
+            cursor = db.issue_list_cursor(page[-1])
+        assert ids == expected
+
+    def test_stable_under_concurrent_insert(self, db: FiligreeDB) -> None:
+        originals = [db.create_issue(f"Issue {n}", priority=2).id for n in range(6)]
+        first = db.list_issues(priority=2, limit=3)
+        db.create_issue("Jumps the queue", priority=2)
+        db.conn.execute("UPDATE issues SET created_at = '2000-01-01T00:00:00+00:00' WHERE title = 'Jumps the queue'")
+        db.conn.commit()
+        rest = db.list_issues(priority=2, limit=100, cursor=db.issue_list_cursor(first[-1]))
+        assert [i.id for i in first] + [i.id for i in rest] == originals
+
+    def test_cursor_and_offset_are_exclusive(self, db: FiligreeDB) -> None:
+        issue = db.create_issue("A")
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            db.list_issues(offset=1, cursor=db.issue_list_cursor(issue))
+
+    def test_rejects_cursor_for_other_sort(self, db: FiligreeDB) -> None:
+        issue = db.create_issue("A")
+        cursor = db.issue_list_cursor(issue, sort_by="updated_at", direction="desc")
+        with pytest.raises(ValueError, match="sort_by='updated_at'"):
+            db.list_issues(cursor=cursor)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "eyJzIjoicHJpb3JpdHkiLCJkIjoiYXNjIiwiayI6WzFdfQ"])
+    def test_rejects_malformed_cursor(self, db: FiligreeDB, cursor: str) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            db.list_issues(cursor=cursor)
+
+
+class TestIssueInclude:
+    """``include`` projection on list_issues / get_ready / search_issues."""
+
+    @staticmethod
+    def _seed(db: FiligreeDB) -> tuple[str, str]:
+        parent = db.create_issue("Parent", type="epic", labels=["core"], fields={"x": 1})
+        blocker = db.create_issue("Blocker", parent_id=parent.id)
+        db.add_dependency(parent.id, blocker.id)
+        return parent.id, blocker.id
+
+    def test_default_hydrates_everything(self, db: FiligreeDB) -> None:
+        parent_id, blocker_id = self._seed(db)
+        issue = next(i for i in db.list_issues() if i.id == parent_id)
+        assert issue.labels == ["core"]
+        assert issue.blocked_by == [blocker_id]
+        assert issue.children == [blocker_id]
+        assert issue.fields == {"x": 1}
+
+    def test_empty_include_skips_relation_queries(self, db: FiligreeDB) -> None:
+        parent_id, _ = self._seed(db)
+        statements: list[str] = []
+        db.conn.set_trace_callback(statements.append)
+        try:
+            issue = next(i for i in db.list_issues(include=()) if i.id == parent_id)
+        finally:
+            db.conn.set_trace_callback(None)
+        assert (issue.labels, issue.blocks, issue.blocked_by, issue.children, issue.fields) == ([], [], [], [], {})
+        assert not [sql for sql in statements if "FROM labels" in sql or "FROM dependencies" in sql]
+        assert issue.is_ready is False
+
+    def test_partial_include(self, db: FiligreeDB) -> None:
+        parent_id, blocker_id = self._seed(db)
+        issue = next(i for i in db.list_issues(include=["deps"]) if i.id == parent_id)
+        assert issue.blocked_by == [blocker_id]
+        assert issue.labels == []
+        assert issue.children == []
+
+    def test_get_ready_and_search_accept_include(self, db: FiligreeDB) -> None:
+        _, blocker_id = self._seed(db)
+        ready = next(i for i in db.get_ready(include=()) if i.id == blocker_id)
+        assert ready.blocks == []
+        found = db.search_issues("Parent", include=("labels",))
+        assert [i.labels for i in found] == [["core"]]
+
+    def test_rejects_unknown_relation(self, db: FiligreeDB) -> None:
+        db.create_issue("A")
+        with pytest.raises(ValueError, match="include must be drawn from"):
+            db.list_issues(include=["comments"])
+
+    def test_rejects_bare_string(self, db: FiligreeDB) -> None:
+        db.create_issue("A")
+        with pytest.raises(ValueError, match="collection of relation names"):
+            db.list_issues(include="labels")
+
+
 class TestSanitizeFtsQuery:
     """Unit tests for _sanitize_fts_query — primary defense against FTS5 injection."""
 
@@ -401,6 +540,26 @@ class TestGetEventsSince:
             assert result[i]["created_at"] <= result[i + 1]["created_at"]
 
 
+class TestGetEventsAfterId:
+    def test_returns_newer_events_in_id_order(self, db: FiligreeDB) -> None:
+        issue = db.create_issue("Cursor source")
+        cursor = db.get_latest_event_id()
+        db.update_issue(issue.id, status="in_progress")
+        db.update_issue(issue.id, priority=0)
+        events = db.get_events_after_id(cursor)
+        assert [e["event_type"] for e in events] == ["status_changed", "priority_changed"]
+        assert [e["id"] for e in events] == sorted(e["id"] for e in events)
+        assert events[-1]["id"] == db.get_latest_event_id()
+
+    def test_respects_limit(self, db: FiligreeDB) -> None:
+        for i in range(3):
+            db.create_issue(f"Issue {i}")
+        assert len(db.get_events_after_id(0, limit=2)) == 2
+
+    def test_nothing_after_latest(self, db: FiligreeDB) -> None:
+        assert db.get_events_after_id(db.get_latest_event_id()) == []
+
+
 class TestActorTracking:
     def test_actor_in_update_event(self, db: FiligreeDB) -> None:
         issue = db.create_issue("Track me")
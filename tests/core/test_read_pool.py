@@ -0,0 +1,89 @@
+"""Tests for the pooled read-only connections on ``FiligreeDB``."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from filigree.core import FiligreeDB
+
+
+class TestReadConnection:
+    def test_binds_pooled_connection_to_conn(self, db: FiligreeDB) -> None:
+        writer = db.conn
+        with db.read_connection() as reader:
+            assert reader is not writer
+            assert db.conn is reader
+        assert db.conn is writer
+
+    def test_sees_committed_writes(self, db: FiligreeDB) -> None:
+        issue = db.create_issue("Visible to readers")
+        with db.read_connection():
+            assert db.get_issue(issue.id).title == "Visible to readers"
+
+    def test_rejects_writes(self, db: FiligreeDB) -> None:
+        with db.read_connection(), pytest.raises(sqlite3.OperationalError, match="readonly"):
+            db.create_issue("Should not land")
+        assert db.search_issues("Should not land") == []
+
+    def test_connection_is_returned_to_pool(self, db: FiligreeDB) -> None:
+        with db.read_connection() as first:
+            pass
+        with db.read_connection() as second:
+            assert second is first
+
+    def test_nested_reuses_outer_connection(self, db: FiligreeDB) -> None:
+        with db.read_connection() as outer, db.read_connection() as inner:
+            assert inner is outer
+
+    def test_pool_is_bounded(self, tmp_path: Path) -> None:
+        d = FiligreeDB(tmp_path / "bounded.db", prefix="test", read_pool_size=1)
+        d.initialize()
+        try:
+            # Two concurrent borrowers force a second connection; only one is kept.
+            barrier = threading.Barrier(2)
+
+            def _borrow() -> None:
+                with d.read_connection():
+                    barrier.wait(timeout=5)
+
+            threads = [threading.Thread(target=_borrow) for _ in range(2)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=5)
+            assert len(d._read_pool) == 1
+        finally:
+            d.close()
+        assert d._read_pool == []
+
+    def test_concurrent_threads_get_distinct_connections(self, db: FiligreeDB) -> None:
+        expected = len(db.list_issues(limit=100))
+        seen: dict[str, sqlite3.Connection] = {}
+        barrier = threading.Barrier(2)
+
+        def _read(name: str) -> None:
+            with db.read_connection() as conn:
+                barrier.wait(timeout=5)
+                seen[name] = conn
+                assert len(db.list_issues(limit=100)) == expected
+
+        threads = [threading.Thread(target=_read, args=(n,)) for n in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+        assert seen["a"] is not seen["b"]
+
+    def test_in_memory_db_falls_back_to_writer(self) -> None:
+        d = FiligreeDB(":memory:", prefix="test")
+        d.initialize()
+        try:
+            assert d.read_pool_enabled is False
+            with d.read_connection() as conn:
+                assert conn is d.conn
+        finally:
+            d.close()
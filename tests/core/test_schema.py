@@ -213,6 +213,203 @@ class TestEntityAssociationsSchema:
         conn.close()
 
 
+_V17_TRIGGERS = (
+    "deps_open_count_insert",
+    "deps_open_count_delete",
+    "issues_status_category_update",
+    "issues_status_category_insert",
+    "issues_open_count_delete",
+)
+
+
+def _strip_v17(conn: sqlite3.Connection) -> None:
+    """Remove everything v17 added on top of a fresh SCHEMA_SQL database."""
+    for trigger in _V17_TRIGGERS:
+        conn.execute(f"DROP TRIGGER {trigger}")
+    conn.execute("DROP INDEX idx_issues_status_category")
+    conn.execute("ALTER TABLE issues DROP COLUMN status_category")
+
+
+def _seed_blocked_pair(conn: sqlite3.Connection, *, blocker_status: str = "open") -> None:
+    now = "2026-01-01T00:00:00+00:00"
+    for issue_id, status in (("test-a", "open"), ("test-b", blocker_status)):
+        conn.execute(
+            "INSERT INTO issues (id, title, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (issue_id, issue_id, status, now, now),
+        )
+    conn.execute(
+        "INSERT INTO dependencies (issue_id, depends_on_id, created_at) VALUES ('test-a', 'test-b', ?)",
+        (now,),
+    )
+
+
+class TestOpenBlockerCountSchema:
+    """Verify the v16 open-blocker counter columns, mirror table and triggers."""
+
+    def test_migration_v15_to_v16_adds_counters(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "filigree.db"
+        conn = _make_db(tmp_path, "filigree.db")
+        conn.executescript(SCHEMA_SQL)
+        _strip_v17(conn)
+        conn.execute("DROP TABLE status_categories")
+        conn.execute("DROP INDEX idx_issues_open_blockers")
+        conn.execute("ALTER TABLE issues DROP COLUMN open_blocker_count")
+        conn.execute("ALTER TABLE issues DROP COLUMN blocks_open_count")
+        _seed_blocked_pair(conn)
+        conn.execute("PRAGMA user_version = 15")
+        conn.commit()
+        conn.close()
+
+        d = FiligreeDB(db_path, prefix="test")
+        d.initialize()
+        try:
+            assert d.get_schema_version() == CURRENT_SCHEMA_VERSION
+            assert "idx_issues_open_blockers" in _get_index_names(d.conn)
+            row = d.conn.execute("SELECT open_blocker_count FROM issues WHERE id = 'test-a'").fetchone()
+            assert row["open_blocker_count"] == 1
+            assert [i.id for i in d.get_blocked()] == ["test-a"]
+        finally:
+            d.close()
+
+
+class TestStatusCategorySchema:
+    """Verify the v17 materialised ``issues.status_category`` column."""
+
+    def test_migration_v16_to_v17_backfills_category(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "filigree.db"
+        conn = _make_db(tmp_path, "filigree.db")
+        conn.executescript(SCHEMA_SQL)
+        _strip_v17(conn)
+        _seed_blocked_pair(conn, blocker_status="closed")
+        conn.execute("PRAGMA user_version = 16")
+        conn.commit()
+        conn.close()
+
+        d = FiligreeDB(db_path, prefix="test")
+        d.initialize()
+        try:
+            assert d.get_schema_version() == CURRENT_SCHEMA_VERSION
+            assert "idx_issues_status_category" in _get_index_names(d.conn)
+            rows = dict(d.conn.execute("SELECT id, status_category FROM issues WHERE id IN ('test-a', 'test-b')").fetchall())
+            assert rows == {"test-a": "open", "test-b": "done"}
+            assert d.get_issue("test-a").is_ready
+        finally:
+            d.close()
+
+    def test_v17_triggers_present(self, db: FiligreeDB) -> None:
+        names = {r[0] for r in db.conn.execute("SELECT name FROM sqlite_master WHERE type='trigger'").fetchall()}
+        assert set(_V17_TRIGGERS) <= names
+
+
+class TestChangeCountersSchema:
+    """Verify the v19 change_counters table and its triggers."""
+
+    def test_counters_track_domains(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        b = db.create_issue("B")
+        before = db.get_change_counters()
+        db.add_dependency(a.id, b.id)
+        after_dep = db.get_change_counters()
+        assert after_dep["dependencies"] > before.get("dependencies", 0)
+        assert after_dep["events"] > before["events"]
+
+        db.claim_issue(a.id, assignee="agent")
+        before_hb = db.get_change_counters()
+        db.heartbeat_work(a.id, actor="agent")
+        after_hb = db.get_change_counters()
+        assert after_hb["issues"] == before_hb["issues"], "heartbeats must not bump the issues counter"
+        assert after_hb["issue_activity"] == before_hb["issue_activity"], "heartbeats must not touch updated_at"
+        assert after_hb["events"] == before_hb["events"], "heartbeats must not record events"
+        assert after_hb["claim_leases"] > before_hb.get("claim_leases", 0)
+
+        db.add_comment(a.id, "note")
+        assert db.get_change_counters()["issues"] == after_hb["issues"]
+
+    def test_label_and_comment_counters(self, db: FiligreeDB) -> None:
+        a = db.create_issue("A")
+        before = db.get_change_counters()
+        db.add_label(a.id, "urgent")
+        db.add_comment(a.id, "note")
+        after = db.get_change_counters()
+        assert after["labels"] > before.get("labels", 0)
+        assert after["comments"] > before.get("comments", 0)
+        assert after["issues"] == before["issues"]
+        db.remove_label(a.id, "urgent")
+        assert db.get_change_counters()["labels"] > after["labels"]
+
+    def test_migration_v18_to_v19_adds_counters(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "filigree.db"
+        conn = _make_db(tmp_path, "filigree.db")
+        conn.executescript(SCHEMA_SQL)
+        for (trigger,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND sql LIKE '%change_counters%'").fetchall():
+            conn.execute(f"DROP TRIGGER {trigger}")
+        conn.execute("DROP TABLE change_counters")
+        conn.execute("PRAGMA user_version = 18")
+        conn.commit()
+        conn.close()
+
+        d = FiligreeDB(db_path, prefix="test")
+        d.initialize()
+        try:
+            assert d.get_schema_version() == CURRENT_SCHEMA_VERSION
+            before = d.get_change_counters().get("issues", 0)
+            d.create_issue("After migration")
+            assert d.get_change_counters()["issues"] > before
+        finally:
+            d.close()
+
+    def test_migration_v19_to_v20_adds_label_and_comment_counters(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "filigree.db"
+        conn = _make_db(tmp_path, "filigree.db")
+        conn.executescript(SCHEMA_SQL)
+        for table in ("labels", "comments"):
+            for (trigger,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ? AND sql LIKE '%change_counters%'",
+                (table,),
+            ).fetchall():
+                conn.execute(f"DROP TRIGGER {trigger}")
+        conn.execute("PRAGMA user_version = 19")
+        conn.commit()
+        conn.close()
+
+        d = FiligreeDB(db_path, prefix="test")
+        d.initialize()
+        try:
+            assert d.get_schema_version() == CURRENT_SCHEMA_VERSION
+            issue = d.create_issue("After migration")
+            d.add_label(issue.id, "urgent")
+            d.add_comment(issue.id, "note")
+            counters = d.get_change_counters()
+            assert counters["labels"] == 1
+            assert counters["comments"] == 1
+        finally:
+            d.close()
+
+    def test_migration_v20_to_v21_adds_claim_leases(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "filigree.db"
+        conn = _make_db(tmp_path, "filigree.db")
+        conn.executescript(SCHEMA_SQL)
+        for (trigger,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'claim_leases_%'").fetchall():
+            conn.execute(f"DROP TRIGGER {trigger}")
+        conn.execute("DROP TABLE claim_leases")
+        conn.execute("PRAGMA user_version = 20")
+        conn.commit()
+        conn.close()
+
+        d = FiligreeDB(db_path, prefix="test")
+        d.initialize()
+        try:
+            assert d.get_schema_version() == CURRENT_SCHEMA_VERSION
+            issue = d.create_issue("After migration")
+            d.claim_issue(issue.id, assignee="agent")
+            d.heartbeat_work(issue.id, actor="agent")
+            assert d.get_change_counters()["claim_leases"] == 1
+            d.release_claim(issue.id, actor="agent")
+            assert d.conn.execute("SELECT COUNT(*) FROM claim_leases").fetchone()[0] == 0
+        finally:
+            d.close()
+
+
 # ---------------------------------------------------------------------------
 # Migration runner tests
 # ---------------------------------------------------------------------------
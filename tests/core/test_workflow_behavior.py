@@ -1782,7 +1782,7 @@ class TestInferStatusCategoryFallback:
 
         d2 = make_db(tmp_path, packs=["core", "planning"])
         try:
-            sql, params = d2._category_predicate_sql("done", type_col="type", status_col="status", include_archived=True)
+            sql, params = d2._category_predicate_sql("done", include_archived=True)
             row = d2.conn.execute(
                 f"SELECT id FROM issues WHERE id = ? AND ({sql})",  # noqa: S608 — sql/params come from _category_predicate_sql
                 [release.id, *params],
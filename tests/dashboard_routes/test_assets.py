@@ -0,0 +1,85 @@
+"""Tests for fingerprinted dashboard assets in dashboard_routes.assets."""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from filigree.dashboard_routes.assets import _accepted_encodings, build_manifest, load_manifest
+
+_HTML = """<html><head>
+<script src="/static/js/vendor/lib.js"></script>
+</head><body>
+<script type="module" src="/static/js/app.js"></script>
+</body></html>
+"""
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "static"
+    (root / "js" / "views").mkdir(parents=True)
+    (root / "js" / "vendor").mkdir()
+    (root / "dashboard.html").write_text(_HTML)
+    (root / "js" / "app.js").write_text('import { a } from "./api.js";\nimport {\n  b,\n} from "./views/b.js";\n')
+    (root / "js" / "api.js").write_text("export const a = 1;\n")
+    (root / "js" / "views" / "b.js").write_text('import { a } from "../api.js";\nexport const b = a;\n')
+    (root / "js" / "vendor" / "lib.js").write_text("window.lib = 1;\n")
+    return root
+
+
+def test_imports_rewritten_to_fingerprinted_urls(static_dir: Path) -> None:
+    manifest = build_manifest(static_dir)
+    app_js = manifest.assets[manifest.urls["js/app.js"].removeprefix("/static/")].body.decode()
+    assert f'from "{manifest.urls["js/api.js"]}"' in app_js
+    assert f'from "{manifest.urls["js/views/b.js"]}"' in app_js
+    b_js = manifest.assets[manifest.urls["js/views/b.js"].removeprefix("/static/")].body.decode()
+    assert f'from "{manifest.urls["js/api.js"]}"' in b_js
+
+
+def test_page_references_fingerprints_and_preloads_module_graph(static_dir: Path) -> None:
+    manifest = build_manifest(static_dir)
+    html = manifest.index.body.decode()
+    assert f'<script src="{manifest.urls["js/vendor/lib.js"]}">' in html
+    assert f'<script type="module" src="{manifest.urls["js/app.js"]}">' in html
+    for rel in ("js/app.js", "js/api.js", "js/views/b.js"):
+        assert f'<link rel="modulepreload" href="{manifest.urls[rel]}">' in html
+    assert f'href="{manifest.urls["js/vendor/lib.js"]}"' not in html
+
+
+def test_dependency_change_moves_importer_fingerprint(static_dir: Path) -> None:
+    before = build_manifest(static_dir).urls
+    (static_dir / "js" / "api.js").write_text("export const a = 2;\n")
+    after = build_manifest(static_dir).urls
+    assert after["js/api.js"] != before["js/api.js"]
+    assert after["js/app.js"] != before["js/app.js"]
+    assert after["js/views/b.js"] != before["js/views/b.js"]
+    assert after["js/vendor/lib.js"] == before["js/vendor/lib.js"]
+
+
+def test_gzip_variant_round_trips(static_dir: Path) -> None:
+    asset = build_manifest(static_dir).index
+    assert gzip.decompress(asset.encoded["gzip"]) == asset.body
+
+
+def test_load_manifest_reuses_until_a_file_changes(static_dir: Path) -> None:
+    first = load_manifest(static_dir)
+    assert load_manifest(static_dir) is first
+    (static_dir / "js" / "vendor" / "lib.js").write_text("window.lib = 22;\n")
+    assert load_manifest(static_dir) is not first
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", {"gzip", "deflate", "br"}),
+        ("br;q=0, gzip;q=0.5", {"gzip"}),
+        ("identity", {"identity"}),
+        ("*", {"*", "br", "gzip"}),
+        ("", set()),
+    ],
+)
+def test_accepted_encodings(header: str, expected: set[str]) -> None:
+    assert _accepted_encodings(header) == expected
@@ -63,6 +63,19 @@ class TestServerConfig:
         loaded = read_server_config()
         assert loaded.port == 9000
 
+    def test_project_store_limits_roundtrip(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        config_dir = tmp_path / ".config" / "filigree"
+        monkeypatch.setattr("filigree.server.SERVER_CONFIG_DIR", config_dir)
+        monkeypatch.setattr("filigree.server.SERVER_CONFIG_FILE", config_dir / "server.json")
+
+        write_server_config(ServerConfig(max_open_projects=4, project_idle_seconds=30, warm_projects=2))
+        loaded = read_server_config()
+        assert (loaded.max_open_projects, loaded.project_idle_seconds, loaded.warm_projects) == (4, 30.0, 2)
+
+    def test_negative_limit_raises(self) -> None:
+        with pytest.raises(ValueError, match="max_open_projects must be >= 0"):
+            ServerConfig(max_open_projects=-1)
+
     def test_read_missing_returns_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         config_dir = tmp_path / ".config" / "filigree"
         monkeypatch.setattr("filigree.server.SERVER_CONFIG_DIR", config_dir)
@@ -260,6 +273,14 @@ class TestConfigValidation:
         config = read_server_config()
         assert config.port == 8377
 
+    def test_invalid_project_store_limits_return_defaults(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        config_dir = self._setup(tmp_path, monkeypatch)
+        (config_dir / "server.json").write_text('{"max_open_projects": -3, "project_idle_seconds": "soon", "warm_projects": true}')
+        config = read_server_config()
+        assert config.max_open_projects == 32
+        assert config.project_idle_seconds == 900.0
+        assert config.warm_projects == 0
+
     def test_non_dict_projects_ignored(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         config_dir = self._setup(tmp_path, monkeypatch)
         (config_dir / "server.json").write_text('{"projects": "not-a-dict"}')
@@ -101,3 +101,39 @@ async def test_concurrent_mutations_both_persist(mcp_db: FiligreeDB) -> None:
     rows = mcp_db.conn.execute("SELECT title FROM issues WHERE title LIKE 'concurrent-%' ORDER BY title").fetchall()
     titles = [r["title"] for r in rows]
     assert titles == ["concurrent-A", "concurrent-B"], f"expected both concurrent issues to persist, got: {titles}"
+
+
+async def test_read_only_tool_not_queued_behind_writer_lock(mcp_db: FiligreeDB) -> None:
+    """Read-only tools run on the read pool and bypass the per-DB writer lock."""
+    from filigree.mcp_server import _lock_for, _read_only_tools
+
+    assert "get_ready" in _read_only_tools
+    assert "create_issue" not in _read_only_tools
+    mcp_db.create_issue("ready item")
+
+    async with _lock_for(mcp_db):
+        result = await asyncio.wait_for(call_tool("get_ready", {}), timeout=5)
+    assert "ready item" in result[0].text
+
+
+async def test_read_only_tool_uses_pooled_connection(mcp_db: FiligreeDB) -> None:
+    """Read-only handlers see a ``query_only`` connection, not the writer."""
+    import filigree.mcp_server as mcp_mod
+
+    seen: dict[str, Any] = {}
+
+    async def _probe(arguments: dict[str, Any]) -> list[TextContent]:
+        tracker = mcp_mod._get_db()
+        seen["conn"] = tracker.conn
+        seen["query_only"] = tracker.conn.execute("PRAGMA query_only").fetchone()[0]
+        return [TextContent(type="text", text="{}")]
+
+    original = mcp_mod._all_handlers["get_stats"]
+    mcp_mod._all_handlers["get_stats"] = _probe
+    try:
+        await call_tool("get_stats", {})
+    finally:
+        mcp_mod._all_handlers["get_stats"] = original
+
+    assert seen["conn"] is not mcp_db.conn
+    assert seen["query_only"] == 1
@@ -3,15 +3,20 @@
 Closes the gap where the agent guidance promised ``response_detail="full"``
 on every batch tool but only the dashboard HTTP routes implemented it.
 The matching CLI side lives in ``tests/cli/test_response_detail.py``.
+Also covers the ``ids``/``summary``/``full`` and ``fields`` projection on
+the high-volume list tools.
 """
 
 from __future__ import annotations
 
+from collections.abc import Collection
+from typing import Any
+
 import pytest
 
 from filigree.core import FiligreeDB
 from filigree.mcp_server import call_tool  # type: ignore[attr-defined]
-from filigree.types.api import ErrorCode, parse_response_detail
+from filigree.types.api import ErrorCode, parse_list_projection, parse_response_detail
 from tests._seeds import seed_file, seed_finding, seed_observations
 from tests.mcp._helpers import _parse
 
@@ -232,3 +237,131 @@ class TestObservationsBatchDetail:
         for item in data["succeeded"]:
             assert isinstance(item, dict)
             assert set(item.keys()) >= _FULL_ONLY_KEYS
+
+
+# ---------------------------------------------------------------------------
+# List tools (ids / summary / full, fields=[...])
+# ---------------------------------------------------------------------------
+
+
+class TestParseListProjection:
+    def _parse(self, detail: object = None, fields: object = None) -> object:
+        return parse_list_projection(detail, fields, id_key="id", summary=("id", "a"), full=("id", "a", "b"), default="full")
+
+    def test_levels(self) -> None:
+        assert self._parse("ids") == ("id",)
+        assert self._parse("summary") == ("id", "a")
+        assert self._parse("full") is None
+        assert self._parse() is None
+
+    def test_fields_override_detail_and_keep_id_first(self) -> None:
+        assert self._parse("ids", ["b", "id", "b"]) == ("id", "b")
+
+    @pytest.mark.parametrize(("detail", "fields"), [("slim", None), (None, ["c"]), (None, "a"), (None, [1])])
+    def test_invalid_returns_validation_error(self, detail: object, fields: object) -> None:
+        result = self._parse(detail, fields)
+        assert isinstance(result, dict)
+        assert result["code"] == ErrorCode.VALIDATION
+
+
+@pytest.fixture
+def hydrated(monkeypatch: pytest.MonkeyPatch) -> list[frozenset[str] | None]:
+    """Record the relations each ``_build_issues_batch`` call was asked to hydrate."""
+    calls: list[frozenset[str] | None] = []
+    original = FiligreeDB._build_issues_batch
+
+    def spy(self: FiligreeDB, issue_ids: list[str], *, include: Collection[str] | None = None) -> Any:
+        calls.append(None if include is None else frozenset(include))
+        return original(self, issue_ids, include=include)
+
+    monkeypatch.setattr(FiligreeDB, "_build_issues_batch", spy)
+    return calls
+
+
+@pytest.mark.asyncio
+class TestIssueListDetail:
+    async def test_list_issues_full_default(self, mcp_db: FiligreeDB, hydrated: list[frozenset[str] | None]) -> None:
+        mcp_db.create_issue("A", labels=["backend"])
+        hydrated.clear()
+        data = _parse(await call_tool("list_issues", {"type": "task"}))
+        assert set(data["items"][0]) >= _FULL_ONLY_KEYS
+        assert data["items"][0]["labels"] == ["backend"]
+        assert hydrated == [None]
+
+    @pytest.mark.parametrize(("detail", "keys"), [("ids", {"issue_id"}), ("summary", _SLIM_KEYS)])
+    async def test_list_issues_compact_skips_relations(
+        self, mcp_db: FiligreeDB, hydrated: list[frozenset[str] | None], detail: str, keys: set[str]
+    ) -> None:
+        mcp_db.create_issue("A", labels=["backend"])
+        hydrated.clear()
+        data = _parse(await call_tool("list_issues", {"type": "task", "response_detail": detail}))
+        assert [set(item) for item in data["items"]] == [keys]
+        assert hydrated == [frozenset()]
+
+    async def test_list_issues_fields_hydrate_only_what_they_need(self, mcp_db: FiligreeDB, hydrated: list[frozenset[str] | None]) -> None:
+        mcp_db.create_issue("A", labels=["backend"])
+        hydrated.clear()
+        data = _parse(await call_tool("list_issues", {"type": "task", "fields": ["labels", "title"]}))
+        assert list(data["items"][0]) == ["issue_id", "labels", "title"]
+        assert data["items"][0]["labels"] == ["backend"]
+        assert hydrated == [frozenset({"labels"})]
+
+    async def test_list_issues_fields_narrow_include(self, mcp_db: FiligreeDB, hydrated: list[frozenset[str] | None]) -> None:
+        mcp_db.create_issue("A")
+        hydrated.clear()
+        await call_tool("list_issues", {"include": ["labels", "deps"], "fields": ["blocks"]})
+        assert hydrated == [frozenset({"deps"})]
+
+    async def test_search_issues_summary_default_and_full(self, mcp_db: FiligreeDB, hydrated: list[frozenset[str] | None]) -> None:
+        mcp_db.create_issue("Searchable widget", labels=["backend"])
+        hydrated.clear()
+        data = _parse(await call_tool("search_issues", {"query": "widget"}))
+        assert set(data["items"][0]) == _SLIM_KEYS
+        data = _parse(await call_tool("search_issues", {"query": "widget", "response_detail": "full"}))
+        assert data["items"][0]["labels"] == ["backend"]
+        assert hydrated == [frozenset(), None]
+
+    async def test_get_ready_ids_with_context(self, mcp_db: FiligreeDB) -> None:
+        epic = mcp_db.create_issue("Epic", type="epic")
+        child = mcp_db.create_issue("Child", parent_id=epic.id)
+        data = _parse(await call_tool("get_ready", {"response_detail": "ids", "include_context": True}))
+        item = next(i for i in data["items"] if i["issue_id"] == child.id)
+        assert item == {"issue_id": child.id, "parent_issue_id": epic.id, "parent_title": "Epic"}
+
+    async def test_get_ready_summary_default(self, mcp_db: FiligreeDB) -> None:
+        mcp_db.create_issue("Ready")
+        data = _parse(await call_tool("get_ready", {}))
+        assert all(set(item) == _SLIM_KEYS for item in data["items"])
+
+    async def test_invalid_field_returns_validation(self, mcp_db: FiligreeDB) -> None:
+        data = _parse(await call_tool("get_ready", {"fields": ["comments"]}))
+        assert data["code"] == ErrorCode.VALIDATION
+        assert "comments" in data["error"]
+
+
+@pytest.mark.asyncio
+class TestChangesAndObservationsDetail:
+    async def test_get_changes_summary_keeps_cursors(self, mcp_db: FiligreeDB) -> None:
+        mcp_db.create_issue("A")
+        full = _parse(await call_tool("get_changes", {"since": "2000-01-01T00:00:00"}))
+        data = _parse(await call_tool("get_changes", {"since": "2000-01-01T00:00:00", "response_detail": "ids"}))
+        assert data["items"] == [{"event_id": item["event_id"]} for item in full["items"]]
+        assert data["next_since"] == full["next_since"]
+        assert data["next_event_id"] == full["next_event_id"]
+
+    async def test_get_changes_fields(self, mcp_db: FiligreeDB) -> None:
+        issue = mcp_db.create_issue("A")
+        data = _parse(await call_tool("get_changes", {"since": "2000-01-01T00:00:00", "fields": ["issue_id"]}))
+        assert {item["issue_id"] for item in data["items"]} == {issue.id}
+        assert all(set(item) == {"event_id", "issue_id"} for item in data["items"])
+
+    async def test_list_observations_summary(self, mcp_db: FiligreeDB) -> None:
+        ids = seed_observations(mcp_db, count=2)
+        data = _parse(await call_tool("list_observations", {"response_detail": "summary"}))
+        assert {item["observation_id"] for item in data["items"]} == set(ids)
+        assert all(set(item) == {"observation_id", "summary", "file_path", "line", "priority"} for item in data["items"])
+
+    async def test_list_observations_full_default(self, mcp_db: FiligreeDB) -> None:
+        seed_observations(mcp_db, count=1)
+        data = _parse(await call_tool("list_observations", {}))
+        assert {"observation_id", "detail", "expires_at"} <= set(data["items"][0])
@@ -288,6 +288,39 @@ class TestListPagination:
         assert data["has_more"] is False
         assert "next_offset" not in data
 
+    async def test_list_issues_cursor_walk(self, mcp_db: FiligreeDB) -> None:
+        """next_cursor resumes after the last item until has_more is False."""
+        for i in range(7):
+            mcp_db.create_issue(f"Issue {i}")
+        expected = [i.id for i in mcp_db.list_issues(limit=100)]
+        seen: list[str] = []
+        args: dict[str, Any] = {"limit": 3}
+        while True:
+            data = _parse(await call_tool("list_issues", args))
+            seen.extend(item["issue_id"] for item in data["items"])
+            if not data["has_more"]:
+                assert "next_cursor" not in data
+                break
+            args = {"limit": 3, "cursor": data["next_cursor"]}
+        assert seen == expected
+
+    async def test_list_issues_include_projection(self, mcp_db: FiligreeDB) -> None:
+        issue = mcp_db.create_issue("Labelled", labels=["mcp-label"])
+        data = _parse(await call_tool("list_issues", {"include": ["deps"]}))
+        item = next(i for i in data["items"] if i["issue_id"] == issue.id)
+        assert item["labels"] == []
+        data = _parse(await call_tool("list_issues", {"include": ["labels"]}))
+        item = next(i for i in data["items"] if i["issue_id"] == issue.id)
+        assert item["labels"] == ["mcp-label"]
+
+    async def test_list_issues_bad_include(self, mcp_db: FiligreeDB) -> None:
+        data = _parse(await call_tool("list_issues", {"include": ["comments"]}))
+        assert data["code"] == ErrorCode.VALIDATION
+
+    async def test_list_issues_bad_cursor(self, mcp_db: FiligreeDB) -> None:
+        data = _parse(await call_tool("list_issues", {"cursor": "bogus"}))
+        assert data["code"] == ErrorCode.VALIDATION
+
     async def test_list_issues_requested_limit_below_cap(self, mcp_db: FiligreeDB) -> None:
         """Explicit limit below _MAX_LIST_RESULTS is respected."""
         for i in range(10):
@@ -1137,6 +1170,96 @@ class TestBatchAddComment:
         assert data["failed"][0]["code"] == "VALIDATION"
 
 
+class TestExecuteBatch:
+    async def test_pipeline_with_back_references(self, mcp_db: FiligreeDB) -> None:
+        result = await call_tool(
+            "execute_batch",
+            {
+                "actor": "planner",
+                "operations": [
+                    {"tool": "create_issue", "ref": "api", "arguments": {"title": "Build API"}},
+                    {"tool": "create_issue", "ref": "ui", "arguments": {"title": "Build UI"}},
+                    {"tool": "add_dependency", "arguments": {"from_issue_id": "$ui", "to_issue_id": "$api"}},
+                    {"tool": "add_label", "arguments": {"issue_id": "$0", "label": "backend"}},
+                    {"tool": "add_comment", "arguments": {"issue_id": "$ui.issue_id", "text": "$$5 budget"}},
+                ],
+            },
+        )
+        data = _parse(result)
+
+        assert [r["tool"] for r in data["results"]] == ["create_issue", "create_issue", "add_dependency", "add_label", "add_comment"]
+        api_id = data["results"][0]["result"]["issue_id"]
+        ui_id = data["results"][1]["result"]["issue_id"]
+        assert data["results"][0]["ref"] == "api"
+        assert mcp_db.get_issue(ui_id).blocked_by == [api_id]
+        assert "backend" in mcp_db.get_issue(api_id).labels
+        comment = mcp_db.get_comments(ui_id)[0]
+        assert comment["text"] == "$5 budget"
+        assert comment["author"] == "planner"
+
+    async def test_failure_commits_nothing(self, mcp_db: FiligreeDB) -> None:
+        before = mcp_db.get_stats()
+        result = await call_tool(
+            "execute_batch",
+            {
+                "operations": [
+                    {"tool": "create_issue", "arguments": {"title": "Orphan"}},
+                    {"tool": "close_issue", "arguments": {"issue_id": "mcp-missing000"}},
+                ],
+            },
+        )
+        data = _parse(result)
+
+        assert data["code"] == ErrorCode.NOT_FOUND
+        assert data["details"] == {"index": 1, "tool": "close_issue"}
+        assert "nothing was committed" in data["error"]
+        assert mcp_db.get_stats() == before
+        assert not mcp_db.conn.in_transaction
+
+    async def test_partial_batch_tool_failure_aborts(self, mcp_db: FiligreeDB) -> None:
+        a = mcp_db.create_issue("A")
+        result = await call_tool(
+            "execute_batch",
+            {
+                "operations": [
+                    {"tool": "update_issue", "arguments": {"issue_id": a.id, "title": "Renamed"}},
+                    {"tool": "batch_add_label", "arguments": {"issue_ids": [a.id, "mcp-missing000"], "label": "x"}},
+                ],
+            },
+        )
+
+        assert _parse(result)["details"]["index"] == 1
+        assert mcp_db.get_issue(a.id).title == "A"
+
+    @pytest.mark.parametrize(
+        ("operations", "fragment"),
+        [
+            ([], "non-empty"),
+            ([{"tool": "get_issue", "arguments": {"issue_id": "x"}}], "cannot run in a batch"),
+            ([{"tool": "create_issue", "arguments": {"title": "A"}, "ref": "a"}, {"tool": "create_issue", "ref": "a"}], "already used"),
+            ([{"tool": "add_label", "arguments": {"issue_id": "$nope", "label": "x"}}], "does not name an earlier operation"),
+            ([{"tool": "create_issue", "arguments": {}}], "Missing required argument"),
+            ([{"tool": "create_issue", "arguments": {"title": "A", "bogus": 1}}], "bogus"),
+        ],
+    )
+    async def test_invalid_batches_are_rejected(self, mcp_db: FiligreeDB, operations: list[dict[str, Any]], fragment: str) -> None:
+        before = mcp_db.get_stats()
+        data = _parse(await call_tool("execute_batch", {"operations": operations}))
+
+        assert data["code"] == ErrorCode.VALIDATION
+        assert fragment in data["error"]
+        assert mcp_db.get_stats() == before
+
+    async def test_summary_refreshed_once(self, mcp_db: FiligreeDB) -> None:
+        with patch("filigree.mcp_server.write_summary") as write:
+            await call_tool(
+                "execute_batch",
+                {"operations": [{"tool": "create_issue", "arguments": {"title": f"Issue {i}"}} for i in range(5)]},
+            )
+
+        assert write.call_count == 1
+
+
 class TestStartWork:
     """MCP wrapper coverage for the D6 composed operations."""
 
@@ -2086,10 +2209,11 @@ class TestCoreReloadTemplates:
     def test_reload_clears_registry(self, mcp_db: FiligreeDB) -> None:
         # Access templates to load them
         _ = mcp_db.templates.list_types()
-        assert mcp_db._template_registry is not None
+        before = mcp_db._template_registry
+        assert before is not None
         mcp_db.reload_templates()
-        assert mcp_db._template_registry is None
-        # Should reload on next access
+        # Reload re-syncs status_categories, which materialises a fresh registry
+        assert mcp_db._template_registry is not before
         types = mcp_db.templates.list_types()
         assert len(types) >= 2
 
@@ -2440,6 +2564,59 @@ class TestRefreshSummaryErrorEscalation:
             mock_logger.error.assert_not_called()
 
 
+class TestRefreshSummaryDebounce:
+    """Long-running servers coalesce context.md regeneration off the write path."""
+
+    @pytest.fixture
+    def debounced(self, mcp_db: FiligreeDB, monkeypatch: pytest.MonkeyPatch) -> Path:
+        import filigree.mcp_server as mcp_mod
+
+        monkeypatch.setenv("FILIGREE_SUMMARY_DEBOUNCE_SECONDS", "60")
+        monkeypatch.setattr(mcp_mod, "_summary_schedulers", {})
+        monkeypatch.setattr(mcp_mod, "_summary_debounce", True)
+        filigree_dir = mcp_mod._get_filigree_dir()
+        assert filigree_dir is not None
+        return filigree_dir / SUMMARY_FILENAME
+
+    async def test_mutations_defer_until_flush(self, debounced: Path) -> None:
+        import filigree.mcp_server as mcp_mod
+
+        try:
+            for i in range(3):
+                await call_tool("create_issue", {"title": f"Deferred {i}"})
+            assert debounced.read_text() == "# test\n"
+            (scheduler,) = mcp_mod._summary_schedulers.values()
+        finally:
+            mcp_mod._flush_summaries()
+        assert scheduler.regenerations == 1
+        assert "Deferred 2" in debounced.read_text()
+        assert mcp_mod._summary_debounce is False
+
+    async def test_force_writes_immediately(self, debounced: Path) -> None:
+        import filigree.mcp_server as mcp_mod
+
+        try:
+            await call_tool("create_issue", {"title": "Pending"})
+            mcp_mod._refresh_summary(force=True)
+            assert "Pending" in debounced.read_text()
+        finally:
+            mcp_mod._flush_summaries()
+
+    async def test_failure_logged_from_scheduler(self, debounced: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import filigree.mcp_server as mcp_mod
+
+        mock_logger = MagicMock()
+        monkeypatch.setattr(mcp_mod, "_logger", mock_logger)
+        try:
+            await call_tool("create_issue", {"title": "Doomed"})
+            with patch("filigree.summary.write_summary", side_effect=OSError("disk full")):
+                mcp_mod._flush_summaries()
+        finally:
+            mcp_mod._flush_summaries()
+        mock_logger.warning.assert_called_once()
+        mock_logger.error.assert_not_called()
+
+
 class TestMCPTransactionSafety:
     """MCP-level safety net: no dirty transactions survive after failed tool calls."""
 
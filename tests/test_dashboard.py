@@ -518,6 +518,7 @@ class TestCreateApp:
         assert data["status"] == "ok"
         assert data["mode"] == "ethereal"
         assert "version" in data
+        assert "claim_reaper" in data
 
     async def test_server_mode_health_returns_server(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         config_dir = tmp_path / ".config" / "filigree"
@@ -0,0 +1,57 @@
+"""Tests for the shared timer debouncer."""
+
+from __future__ import annotations
+
+import threading
+
+from filigree.debounce import Debouncer
+
+
+class TestDebouncer:
+    def test_burst_runs_once_on_the_timer(self) -> None:
+        done = threading.Event()
+        runs: list[str] = []
+
+        def run() -> None:
+            runs.append(threading.current_thread().name)
+            done.set()
+
+        debouncer = Debouncer(run, window=0.05, name="test-debounce")
+        for _ in range(10):
+            debouncer.trigger()
+        assert done.wait(5)
+        assert runs == ["test-debounce"]
+        debouncer.close()
+
+    def test_flush_runs_now_and_returns_the_result(self) -> None:
+        calls: list[int] = []
+        debouncer = Debouncer(lambda: calls.append(1) or len(calls), window=60)
+        debouncer.trigger()
+        assert debouncer.flush() == 1
+        assert calls == [1]
+        debouncer.close()
+
+    def test_zero_window_and_closed_run_synchronously(self) -> None:
+        calls: list[int] = []
+        Debouncer(lambda: calls.append(1), window=0).trigger()
+        assert calls == [1]
+        debouncer = Debouncer(lambda: calls.append(2), window=60)
+        debouncer.close()
+        debouncer.trigger()
+        assert calls == [1, 2, 2]
+
+    def test_trigger_during_a_run_arms_a_new_timer(self) -> None:
+        debouncer: Debouncer[None]
+        triggered_inside = False
+
+        def run() -> None:
+            nonlocal triggered_inside
+            if not triggered_inside:
+                triggered_inside = True
+                debouncer.trigger()
+
+        debouncer = Debouncer(run, window=60)
+        debouncer.flush()
+        assert debouncer._timer is not None
+        debouncer.close()
+        assert debouncer._timer is None